@@ -0,0 +1,138 @@
+"""
+Strategies to combine the values of a metric/event in the launches into the value of the application.
+
+@date:      Jul 2021
+@version:   1.0
+"""
+
+import numpy as np
+import os, sys, inspect
+currentdir = os.path.dirname(os.path.abspath(inspect.getfile(inspect.currentframe())))
+parentdir = os.path.dirname(currentdir)
+sys.path.insert(0, parentdir)
+from parameters.aggregations_params import AggregationsParameters
+from errors.aggregations_errors import *
+
+def _weighted_mean(values : np.ndarray, weights : np.ndarray) -> float:
+    """ Mean of the values weighted by the fraction of the launch in the selected launches."""
+
+    return float(np.dot(values, weights))
+
+
+def _mean(values : np.ndarray, weights : np.ndarray) -> float:
+    """ Mean of the values (all launches weigh the same)."""
+
+    return float(values.mean()) if len(values) > 0 else 0.0
+
+
+def _sum(values : np.ndarray, weights : np.ndarray) -> float:
+    """ Sum of the values."""
+
+    return float(values.sum())
+
+
+class Aggregations:
+    """
+    Registry of the strategies used to combine the values of a metric/event in the selected launches
+    (roll-up of the application). Each strategy is a function (values, weights) -> float with the values
+    and the weights of the launches as numpy arrays, where weights are the fraction of each launch in
+    the selected launches (cycles, duration or instructions), or 'None' if it does not use them.
+    The strategy of each metric/event is declared in 'C_MEASURE_STRATEGIES'.
+
+    Attributes:
+        __strategies    : dict  ; name of strategy as key and tuple (function, kind of weights or 'None')
+                                  as value
+    """
+
+    __strategies : dict = {
+        AggregationsParameters.C_CYCLES_WEIGHTED_STRATEGY : (_weighted_mean, AggregationsParameters.C_CYCLES_WEIGHTS),
+        AggregationsParameters.C_DURATION_WEIGHTED_STRATEGY : (_weighted_mean, AggregationsParameters.C_DURATION_WEIGHTS),
+        AggregationsParameters.C_INSTRUCTIONS_WEIGHTED_STRATEGY : (_weighted_mean, AggregationsParameters.C_INSTRUCTIONS_WEIGHTS),
+        AggregationsParameters.C_MEAN_STRATEGY : (_mean, None),
+        AggregationsParameters.C_SUM_STRATEGY : (_sum, None)}
+
+    @staticmethod
+    def register(name : str, function, weights : str = None):
+        """
+        Register a strategy (or replace the one with the same name).
+
+        Args:
+            name        : str       ; name of the strategy
+
+            function    : function  ; function (values, weights) -> float which combines the values
+
+            weights     : str       ; kind of weights of the launches ('C_CYCLES_WEIGHTS', 'C_DURATION_WEIGHTS'
+                                      or 'C_INSTRUCTIONS_WEIGHTS'), or 'None' if they are not used
+        """
+
+        Aggregations.__strategies[name] = (function, weights)
+
+
+    @staticmethod
+    def strategies() -> list:
+        """ Returns names of the strategies registered."""
+
+        return list(Aggregations.__strategies.keys())
+
+
+    @staticmethod
+    def strategy(measure_name : str, default : str) -> str:
+        """
+        Get strategy of a metric/event.
+
+        Args:
+            measure_name    : str   ; name of the metric/event
+
+            default         : str   ; strategy if the metric/event has not strategy declared
+
+        Returns:
+            String with the name of the strategy
+        """
+
+        return AggregationsParameters.C_MEASURE_STRATEGIES.get(measure_name, default)
+
+
+    @staticmethod
+    def weights(strategy : str) -> str:
+        """
+        Get kind of weights used by a strategy.
+
+        Args:
+            strategy    : str   ; name of the strategy
+
+        Returns:
+            String with the kind of weights, or 'None' if the strategy does not use them
+
+        Raises:
+            AggregationStrategyError    ; strategy is not registered
+        """
+
+        if not strategy in Aggregations.__strategies:
+            raise AggregationStrategyError(strategy)
+        return Aggregations.__strategies[strategy][1]
+
+
+    @staticmethod
+    def aggregate(strategy : str, values : list, weights : list = None) -> float:
+        """
+        Combine values of the selected launches with a strategy.
+
+        Args:
+            strategy    : str   ; name of the strategy
+
+            values      : list  ; values (float) of the selected launches
+
+            weights     : list  ; weights (fraction of the selected launches) of the launches of the values,
+                                  or 'None' if the strategy does not use them
+
+        Returns:
+            Float with the value of the application
+
+        Raises:
+            AggregationStrategyError    ; strategy is not registered
+        """
+
+        if not strategy in Aggregations.__strategies:
+            raise AggregationStrategyError(strategy)
+        return Aggregations.__strategies[strategy][0](np.asarray(values, dtype = float),
+            None if weights is None else np.asarray(weights, dtype = float))
@@ -0,0 +1,303 @@
+"""
+Database with the characteristics of the architectures of NVIDIA's GPUs.
+
+@date:      Jul 2021
+@version:   1.0
+"""
+
+import json
+import re
+import os, sys, inspect
+currentdir = os.path.dirname(os.path.abspath(inspect.getfile(inspect.currentframe())))
+parentdir = os.path.dirname(currentdir)
+sys.path.insert(0, parentdir)
+from parameters.architecture_params import ArchitectureParameters
+from errors.architecture_errors import *
+
+class Architecture:
+    """
+    Class with the characteristics of the architecture of a compute capability.
+
+    Attributes:
+        __compute_capability        : float ; compute capability
+
+        __name                      : str   ; name of the architecture (Ampere...)
+
+        __chip                      : str   ; name of the chip of reference (GA100...), or 'None'
+
+        __warp_schedulers_per_sm    : int   ; warp schedulers per SM
+
+        __issue_width               : int   ; instructions issued per cycle by each warp scheduler
+
+        __sm_count                  : int   ; SMs of the chip of reference, or 'None'
+
+        __memory_latency_cycles     : dict  ; level of the memory hierarchy ('l1', 'l2' or 'dram') as key and
+                                              approximate latency (cycles) of a request served by it as value
+
+        __metric_aliases            : dict  ; name of metric/event used by this program as key and name
+                                              of the metric/event in the architecture as value
+
+        __to_device_regex           : re.Pattern    ; regex which finds the names used by this program, or 'None'
+                                                      if there are no aliases
+
+        __from_device_regex         : re.Pattern    ; regex which finds the names of the architecture, or 'None'
+                                                      if there are no aliases
+
+        __from_device_names         : dict  ; name of metric/event in the architecture as key and name used
+                                              by this program as value
+    """
+
+    def __init__(self, compute_capability : float, name : str, chip : str, warp_schedulers_per_sm : int, issue_width : int,
+        sm_count : int = None, metric_aliases : dict = None, memory_latency_cycles : dict = None):
+        """
+        Set attributes with argument values.
+
+        Args:
+            compute_capability      : float ; compute capability
+
+            name                    : str   ; name of the architecture (Ampere...)
+
+            chip                    : str   ; name of the chip of reference (GA100...), or 'None'
+
+            warp_schedulers_per_sm  : int   ; warp schedulers per SM
+
+            issue_width             : int   ; instructions issued per cycle by each warp scheduler
+
+            sm_count                : int   ; SMs of the chip of reference, or 'None'
+
+            metric_aliases          : dict  ; name of metric/event used by this program as key and name
+                                              of the metric/event in the architecture as value, or 'None'
+
+            memory_latency_cycles   : dict  ; level of the memory hierarchy ('l1', 'l2' or 'dram') as key and
+                                              approximate latency (cycles) of a request served by it as value, or 'None'
+        """
+
+        self.__compute_capability : float = compute_capability
+        self.__name : str = name
+        self.__chip : str = chip
+        self.__warp_schedulers_per_sm : int = warp_schedulers_per_sm
+        self.__issue_width : int = issue_width
+        self.__sm_count : int = sm_count
+        self.__memory_latency_cycles : dict = dict() if memory_latency_cycles is None else {level : float(latency)
+            for level, latency in memory_latency_cycles.items()}
+        self.__metric_aliases : dict = dict() if metric_aliases is None else dict(metric_aliases)
+        self.__to_device_regex : re.Pattern = self.__names_regex(self.__metric_aliases.keys())
+        self.__from_device_regex : re.Pattern = self.__names_regex(self.__metric_aliases.values())
+        self.__from_device_names : dict = {alias : name for name, alias in self.__metric_aliases.items()}
+
+
+    def __names_regex(self, names) -> re.Pattern:
+        """ Get regex which finds whole names of metrics/events (longest first), or 'None' if there are no names."""
+
+        if not names:
+            return None
+        boundary : str = ArchitectureParameters.C_METRIC_NAME_BOUNDARY_REGEX
+        return re.compile("(?<!" + boundary + ")(" + "|".join(re.escape(name) for name in sorted(names, key = len, reverse = True)) +
+            ")(?!" + boundary + ")")
+
+
+    def compute_capability(self) -> float:
+        """ Returns compute capability."""
+
+        return self.__compute_capability
+
+
+    def name(self) -> str:
+        """ Returns name of the architecture (Ampere...)."""
+
+        return self.__name
+
+
+    def chip(self) -> str:
+        """ Returns name of the chip of reference (GA100...), or 'None'."""
+
+        return self.__chip
+
+
+    def warp_schedulers_per_sm(self) -> int:
+        """ Returns warp schedulers per SM."""
+
+        return self.__warp_schedulers_per_sm
+
+
+    def issue_width(self) -> int:
+        """ Returns instructions issued per cycle by each warp scheduler."""
+
+        return self.__issue_width
+
+
+    def sm_count(self) -> int:
+        """ Returns SMs of the chip of reference, or 'None'."""
+
+        return self.__sm_count
+
+
+    def memory_latency_cycles(self, level : str) -> float:
+        """
+        Get approximate latency of a request served by a level of the memory hierarchy.
+
+        Args:
+            level   : str   ; level of the memory hierarchy ('l1', 'l2' or 'dram')
+
+        Returns:
+            Float with the latency (cycles), or 'None' if it's not in the database
+        """
+
+        return self.__memory_latency_cycles.get(level)
+
+
+    def max_ipc(self) -> float:
+        """
+        Get max IPC (instructions per cycle of each SM) of the architecture.
+
+        Returns:
+            Float with the max IPC
+        """
+
+        return float(self.__warp_schedulers_per_sm*self.__issue_width)
+
+
+    def metric_name(self, name : str) -> str:
+        """
+        Get name of metric/event in the architecture.
+
+        Args:
+            name    : str   ; name of metric/event used by this program
+
+        Returns:
+            String with the name in the architecture (the same if it has no alias)
+        """
+
+        return self.__metric_aliases.get(name, name)
+
+
+    def to_device_names(self, text : str) -> str:
+        """
+        Replace the names of metrics/events used by this program with their names in the architecture.
+
+        Args:
+            text    : str   ; text (command of the scan tool...)
+
+        Returns:
+            String with the text replaced
+        """
+
+        if self.__to_device_regex is None:
+            return text
+        return self.__to_device_regex.sub(lambda match: self.__metric_aliases[match.group(1)], text)
+
+
+    def from_device_names(self, text : str) -> str:
+        """
+        Replace the names of metrics/events in the architecture with the names used by this program.
+
+        Args:
+            text    : str   ; text (results of the scan tool...)
+
+        Returns:
+            String with the text replaced
+        """
+
+        if self.__from_device_regex is None:
+            return text
+        return self.__from_device_regex.sub(lambda match: self.__from_device_names[match.group(1)], text)
+
+
+class ArchitectureDatabase:
+    """
+    Class with the database of architectures, shared by all the program. Database is read (the
+    one bundled with the program by default) only the first time an architecture is requested.
+
+    Attributes:
+        __file_str          : str   ; path to the database, or 'None' to use the one bundled with the program
+
+        __architectures     : dict  ; compute capability as key and Architecture as value, or 'None' if
+                                      database has not been read yet
+    """
+
+    __file_str          : str = None
+    __architectures     : dict = None
+
+    @staticmethod
+    def use(file_str : str):
+        """
+        Set database used by all the program. It's read the next time an architecture is requested.
+
+        Args:
+            file_str    : str   ; path to the database (JSON), or 'None' to use the one bundled with the program
+        """
+
+        ArchitectureDatabase.__file_str = file_str
+        ArchitectureDatabase.__architectures = None
+
+
+    @staticmethod
+    def file() -> str:
+        """
+        Returns path to the database in use.
+
+        Returns:
+            String with the path to the database
+        """
+
+        if ArchitectureDatabase.__file_str is None:
+            return os.path.join(currentdir, ArchitectureParameters.C_DATABASE_FILE_NAME)
+        return ArchitectureDatabase.__file_str
+
+
+    @staticmethod
+    def __load() -> dict:
+        """
+        Read database.
+
+        Returns:
+            Dictionary with the compute capability as key and Architecture as value
+
+        Raises:
+            ArchitectureDatabaseError   ; raised if database can't be read or an architecture is not valid
+        """
+
+        file_str : str = ArchitectureDatabase.file()
+        architectures : dict = dict()
+        try:
+            with open(file_str, "r") as f:
+                entries : list = json.load(f)[ArchitectureParameters.C_ARCHITECTURES_KEY]
+            for entry in entries:
+                if any(not key in entry for key in ArchitectureParameters.C_REQUIRED_KEYS):
+                    raise ArchitectureDatabaseError(file_str)
+                architectures[float(entry[ArchitectureParameters.C_COMPUTE_CAPABILITY_KEY])] = Architecture(
+                    float(entry[ArchitectureParameters.C_COMPUTE_CAPABILITY_KEY]), entry[ArchitectureParameters.C_NAME_KEY],
+                    entry.get(ArchitectureParameters.C_CHIP_KEY), int(entry[ArchitectureParameters.C_WARP_SCHEDULERS_PER_SM_KEY]),
+                    int(entry[ArchitectureParameters.C_ISSUE_WIDTH_KEY]), entry.get(ArchitectureParameters.C_SM_COUNT_KEY),
+                    entry.get(ArchitectureParameters.C_METRIC_ALIASES_KEY), entry.get(ArchitectureParameters.C_MEMORY_LATENCY_CYCLES_KEY))
+        except (OSError, ValueError, TypeError, KeyError, AttributeError):
+            raise ArchitectureDatabaseError(file_str)
+        return architectures
+
+
+    @staticmethod
+    def architecture(compute_capability : float) -> Architecture:
+        """
+        Get architecture of the compute capability. If it's not in the database, the architecture of the
+        highest compute capability with the same major version (and lower minor version) is used.
+
+        Args:
+            compute_capability  : float ; compute capability of the device
+
+        Returns:
+            Reference to Architecture
+
+        Raises:
+            ArchitectureNotFoundError   ; raised if there is no architecture of the major version
+        """
+
+        if ArchitectureDatabase.__architectures is None:
+            ArchitectureDatabase.__architectures = ArchitectureDatabase.__load()
+        architecture : Architecture = ArchitectureDatabase.__architectures.get(compute_capability)
+        if architecture is not None:
+            return architecture
+        candidates : list = [value for value in ArchitectureDatabase.__architectures if int(value) == int(compute_capability)
+            and value < compute_capability]
+        if not candidates:
+            raise ArchitectureNotFoundError(compute_capability)
+        return ArchitectureDatabase.__architectures[max(candidates)]
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Program that measures the time spent parsing results of the NVIDIA scan tools, computing
+the results of the TopDown methodology and building the report, with synthetic results.
+
+@date:      Jul 2021
+@version:   1.0
+"""
+
+import argparse
+import json
+import time
+import os, sys, inspect
+currentdir = os.path.dirname(os.path.abspath(inspect.getfile(inspect.currentframe())))
+parentdir = os.path.dirname(currentdir)
+sys.path.insert(0, parentdir)
+from measure_levels.level_execution import LevelExecution
+from measure_levels.level_factory import LevelFactory
+from profiler.synthetic_output import SyntheticOutput
+from parameters.synthetic_output_params import SyntheticOutputParameters
+from profiler.profiler_backend import ProfilerBackend
+from profiler.replay_profiler_backend import ReplayProfilerBackend
+from parameters.profiler_backend_params import ProfilerBackendParameters
+from parameters.topdown_params import TopDownParameters
+
+class ParseComputeBenchmark:
+    """
+    Class that measures, for each NVIDIA scan tool, level and number of kernels, the time spent in
+    'parse_results' (parse), 'topdown_results' (reductions of the measures of all kernels) and
+    'measures_table' (table of measures of the report). The best time of the repetitions is taken.
+
+    Attributes:
+        __tools         : list  ; formats of the NVIDIA scan tools ('nsight', 'nsight-csv' and/or 'nvprof')
+
+        __levels        : list  ; levels of the execution
+
+        __sizes         : list  ; numbers of kernels
+
+        __repeat        : int   ; number of repetitions of each measure
+    """
+
+    def __init__(self, tools : list, levels : list, sizes : list, repeat : int):
+        """Set attributes with argument values."""
+
+        self.__tools : list = tools
+        self.__levels : list = levels
+        self.__sizes : list = sizes
+        self.__repeat : int = repeat
+
+
+    def __create_level(self, tool : str, level_number : int) -> LevelExecution:
+        """ 
+        Create level of the execution (without results) of the tool indicated. The device is simulated
+        by a replay backend, so neither the NVIDIA tools nor a GPU are needed.
+        """
+
+        compute_capability : float = ProfilerBackendParameters.C_REPLAY_COMPUTE_CAPABILITY
+        if tool == SyntheticOutputParameters.C_NVPROF_FORMAT:
+            compute_capability = TopDownParameters.C_COMPUTE_CAPABILITY_NVPROF_MAX_VALUE
+        ProfilerBackend.use(ReplayProfilerBackend(compute_capability))
+        return LevelFactory.create(level_number, tool == SyntheticOutputParameters.C_NVPROF_FORMAT, SyntheticOutputParameters.C_PROGRAM,
+            None, None, None, True, True)
+
+
+    def __measure(self, tool : str, level_number : int, num_kernels : int) -> dict:
+        """
+        Measure times of the tool, level and number of kernels indicated.
+
+        Returns:
+            Dictionary with the configuration and the time (seconds) of each stage
+        """
+
+        output_str : str = SyntheticOutput(self.__create_level(tool, level_number)).generate(tool, num_kernels)
+        times : dict = {"parse" : None, "reductions" : None, "report" : None}
+        level : LevelExecution
+        start : float
+        stage_times : dict
+        for i in range(0, self.__repeat):
+            level = self.__create_level(tool, level_number)
+            start = time.perf_counter()
+            level.parse_results(output_str)
+            stage_times = {"parse" : time.perf_counter() - start}
+            start = time.perf_counter()
+            level.topdown_results()
+            stage_times["reductions"] = time.perf_counter() - start
+            start = time.perf_counter()
+            level.measures_table(list())
+            stage_times["report"] = time.perf_counter() - start
+            for stage in times:
+                if times[stage] is None or stage_times[stage] < times[stage]:
+                    times[stage] = stage_times[stage]
+        return {"tool" : tool, "level" : level_number, "kernels" : num_kernels, "lines" : output_str.count("\n"),
+            "seconds" : times}
+
+
+    def run(self) -> list:
+        """
+        Make all measures. Each one is shown when it finishes.
+
+        Returns:
+            List with the result of each measure
+        """
+
+        results : list = list()
+        result : dict
+        print("%-11s%7s%10s%12s%14s%14s%14s" % ("Tool", "Level", "Kernels", "Lines", "Parse (s)", "Reduce (s)", "Report (s)"))
+        for tool in self.__tools:
+            for level_number in self.__levels:
+                if tool == SyntheticOutputParameters.C_NVPROF_FORMAT and level_number > TopDownParameters.C_MAX_LEVEL_EXECUTION_NVPROF:
+                    continue
+                for num_kernels in self.__sizes:
+                    result = self.__measure(tool, level_number, num_kernels)
+                    results.append(result)
+                    print("%-11s%7d%10d%12d%14.4f%14.4f%14.4f" % (tool, level_number, num_kernels, result["lines"],
+                        result["seconds"]["parse"], result["seconds"]["reductions"], result["seconds"]["report"]), flush = True)
+        return results
+
+
+if __name__ == '__main__':
+    parser : argparse.ArgumentParser = argparse.ArgumentParser(description = "Benchmark of parse and computation of TopDown " +
+        "with synthetic results of NVIDIA scan tools")
+    parser.add_argument("-t", "--tools", nargs = '+', default = [SyntheticOutputParameters.C_NSIGHT_FORMAT,
+        SyntheticOutputParameters.C_NVPROF_FORMAT], choices = SyntheticOutputParameters.C_FORMATS, help = "formats of NVIDIA scan tools.")
+    parser.add_argument("-l", "--levels", nargs = '+', type = int, default = [1, 2, 3], choices = [1, 2, 3, 4], help = "levels of execution.")
+    parser.add_argument("-k", "--kernels", nargs = '+', type = int, default = [10, 1000], help = "numbers of kernels " +
+        "(defaults are quick enough to be a regression gate; add larger sizes such as 100000 to measure scaling).")
+    parser.add_argument("-r", "--repeat", type = int, default = 3, help = "repetitions of each measure (best time is shown).")
+    parser.add_argument("-j", "--json", default = None, help = "path to JSON file where results are written.")
+    args : argparse.Namespace = parser.parse_args()
+    results : list = ParseComputeBenchmark(args.tools, args.levels, args.kernels, args.repeat).run()
+    if not args.json is None:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent = 2)
@@ -0,0 +1,205 @@
+"""
+Program that computes the distribution of each measure across the launches of the execution.
+
+@date:      Jul 2021
+@version:   1.0
+"""
+
+import numpy as np
+import os, sys, inspect
+currentdir = os.path.dirname(os.path.abspath(inspect.getfile(inspect.currentframe())))
+parentdir = os.path.dirname(currentdir)
+sys.path.insert(0, parentdir)
+from measure_levels.level_execution import LevelExecution
+from measure_parts.metric_measure import MetricMeasure, MetricMeasureNvprof
+from parameters.metric_distributions_params import MetricDistributionsParameters
+from errors.level_execution_errors import *
+
+class MetricDistributions:
+    """
+    Class with the distribution of each measure (metric/event) across the selected launches, instead
+    of only its mean weighted by the cycles of each launch: min, max, percentiles weighted by the
+    cycles and histogram of the launches. So it can be seen if a mean comes from all the launches or
+    from a few outliers. With NVPROF each launch is a kernel, so min and max are the ones of its
+    invocations.
+
+    Attributes:
+        __level_execution   : LevelExecution    ; level of the execution ALREADY DONE
+
+        __distributions     : list              ; distribution of each measure, or 'None' if they have not
+                                                  been computed yet
+    """
+
+    def __init__(self, level_execution : LevelExecution):
+        """
+        Set attributes with argument values.
+
+        Args:
+            level_execution : LevelExecution    ; level of the execution ALREADY DONE
+        """
+
+        self.__level_execution : LevelExecution = level_execution
+        self.__distributions : list = None
+
+
+    def __to_floats(self, values : list, launches : list) -> np.ndarray:
+        """ Get values of the launches as floats ('nan' if they are not defined or they are not numbers)."""
+
+        floats : np.ndarray = np.full(len(launches), np.nan)
+        for i, launch in enumerate(launches):
+            if launch >= len(values):
+                continue
+            try:
+                floats[i] = self.__level_execution.measure_value_to_float(values[launch])
+            except (ValueError, TypeError):
+                pass
+        return floats
+
+
+    def __measures(self) -> list:
+        """
+        Get the measures (metrics and events) of the execution. If a measure is defined in more than
+        one part, it's only taken once.
+
+        Returns:
+            List of tuples (name, kind, part name, list of values, list of (min, max) in the invocations of
+            each launch or 'None')
+        """
+
+        measures : list = list()
+        names : set = set()
+        part : MetricMeasure
+        for part in self.__level_execution.measure_parts():
+            for name, values in part.metrics().items():
+                if not name in names:
+                    names.add(name)
+                    measures.append((name, MetricDistributionsParameters.C_METRIC_KIND, part.name(), values,
+                        part.get_metric_range(name) if isinstance(part, MetricMeasureNvprof) else None))
+            if isinstance(part, MetricMeasureNvprof):
+                for name, values in part.events().items():
+                    if not name in names:
+                        names.add(name)
+                        measures.append((name, MetricDistributionsParameters.C_EVENT_KIND, part.name(), values, None))
+        return measures
+
+
+    def __weighted_percentiles(self, values : np.ndarray, weights : np.ndarray) -> list:
+        """ Get percentiles of the values weighted by the weights (value where the cumulative weight reaches the percentile)."""
+
+        order : np.ndarray = np.argsort(values, kind = "stable")
+        cumulative_weights : np.ndarray = np.cumsum(weights[order])
+        if cumulative_weights[-1] <= 0:
+            cumulative_weights = np.arange(1, len(values) + 1, dtype = float)
+        positions : np.ndarray = np.searchsorted(cumulative_weights, np.asarray(MetricDistributionsParameters.C_PERCENTILES, dtype = float)/
+            100.0*cumulative_weights[-1], side = "left")
+        return values[order][np.minimum(positions, len(values) - 1)].tolist()
+
+
+    def __distribution(self, name : str, kind : str, part_name : str, values : np.ndarray, weights : np.ndarray,
+        ranges : np.ndarray) -> dict:
+        """ Get distribution of the values of a measure (see 'distributions')."""
+
+        defined : np.ndarray = ~np.isnan(values)
+        distribution : dict = {"name" : name, "kind" : kind, "part" : part_name, "launches" : int(np.count_nonzero(defined)),
+            "min" : None, "max" : None, "percentiles" : dict.fromkeys(MetricDistributionsParameters.C_PERCENTILES), "histogram" : list()}
+        if not defined.any():
+            return distribution
+        values = values[defined]
+        min_value : float = float(values.min())
+        max_value : float = float(values.max())
+        if ranges is not None:
+            ranges = ranges[defined]
+            if not np.isnan(ranges).all():
+                min_value = min(min_value, float(np.nanmin(ranges[:, 0])))
+                max_value = max(max_value, float(np.nanmax(ranges[:, 1])))
+        distribution["min"] = min_value
+        distribution["max"] = max_value
+        distribution["percentiles"] = dict(zip(MetricDistributionsParameters.C_PERCENTILES,
+            self.__weighted_percentiles(values, weights[defined])))
+        distribution["histogram"] = np.histogram(values, bins = MetricDistributionsParameters.C_HISTOGRAM_BINS,
+            range = (float(values.min()), float(values.max()) if values.max() > values.min() else float(values.min()) + 1.0))[0].tolist()
+        return distribution
+
+
+    def __compute(self) -> list:
+        """ Compute distribution of each measure in the selected launches."""
+
+        selected_launches : list = self.__level_execution.selected_launches()
+        launches : list = list(range(0, self.__level_execution.num_launches())) if selected_launches is None else selected_launches
+        weights : np.ndarray
+        try:
+            cycles : list = self.__level_execution.cycles_elapsed()
+            weights = np.array([cycles[i] if i < len(cycles) else 0.0 for i in launches], dtype = float)
+        except ElapsedCyclesError: # all launches weigh the same
+            weights = np.ones(len(launches))
+        distributions : list = list()
+        ranges : np.ndarray
+        for name, kind, part_name, values, value_ranges in self.__measures():
+            ranges = None
+            if value_ranges:
+                ranges = np.column_stack((self.__to_floats([value_range[0] for value_range in value_ranges], launches),
+                    self.__to_floats([value_range[1] for value_range in value_ranges], launches)))
+            distributions.append(self.__distribution(name, kind, part_name, self.__to_floats(values, launches), weights, ranges))
+        return distributions
+
+
+    def distributions(self) -> list:
+        """
+        Get the distribution of each measure in the selected launches. They are only computed the first time.
+
+        Returns:
+            List of dictionaries with the keys 'name', 'kind' ('metric' or 'event'), 'part' (name of the part
+            which measures it), 'launches' (number of launches with value), 'min', 'max', 'percentiles'
+            (percentile as key and value weighted by the cycles as value) and 'histogram' (number of launches
+            in each bin between min and max of the launches). Values are 'None' if there are no launches
+        """
+
+        if self.__distributions is None:
+            self.__distributions = self.__compute()
+        return self.__distributions
+
+
+    def __value_str(self, value : float, decimals : int) -> str:
+        """ Get value rounded, or 'C_NOT_AVAILABLE_VALUE' if it's 'None'."""
+
+        if value is None:
+            return MetricDistributionsParameters.C_NOT_AVAILABLE_VALUE
+        return str(round(value, decimals))
+
+
+    def __histogram_str(self, histogram : list) -> str:
+        """ Get histogram drawn with one character per bin."""
+
+        if not histogram or max(histogram) == 0:
+            return MetricDistributionsParameters.C_NOT_AVAILABLE_VALUE
+        characters : str = MetricDistributionsParameters.C_HISTOGRAM_CHARACTERS
+        levels : np.ndarray = np.ceil(np.asarray(histogram, dtype = float)/max(histogram)*(len(characters) - 1)).astype(int)
+        return "".join(characters[level] for level in levels)
+
+
+    def report_str(self, decimals : int) -> str:
+        """
+        Get table with the distribution of each measure.
+
+        Args:
+            decimals    : int   ; number of decimals of the values
+
+        Returns:
+            String with the table
+        """
+
+        titles : list = ([MetricDistributionsParameters.C_MEASURE_COLUMN_TITLE, MetricDistributionsParameters.C_LAUNCHES_COLUMN_TITLE,
+            MetricDistributionsParameters.C_MIN_COLUMN_TITLE] + [MetricDistributionsParameters.C_PERCENTILE_COLUMN_TITLE_FORMAT % percentile
+            for percentile in MetricDistributionsParameters.C_PERCENTILES] + [MetricDistributionsParameters.C_MAX_COLUMN_TITLE,
+            MetricDistributionsParameters.C_HISTOGRAM_COLUMN_TITLE])
+        rows : list = list()
+        for distribution in self.distributions():
+            rows.append([distribution["name"], str(distribution["launches"]), self.__value_str(distribution["min"], decimals)] +
+                [self.__value_str(distribution["percentiles"][percentile], decimals) for percentile in MetricDistributionsParameters.C_PERCENTILES] +
+                [self.__value_str(distribution["max"], decimals), self.__histogram_str(distribution["histogram"])])
+        lengths : list = [max([len(title) + 2, MetricDistributionsParameters.C_VALUE_COLUMN_MIN_LENGTH] + [len(row[i]) + 2 for row in rows])
+            for i, title in enumerate(titles)]
+        lines : list = ["".join("%-*s" % (lengths[i], title) for i, title in enumerate(titles))]
+        lines.append("-"*len(lines[0]))
+        lines += ["".join("%-*s" % (lengths[i], value) for i, value in enumerate(row)) for row in rows]
+        return "\n".join(lines)
@@ -0,0 +1,20 @@
+"""
+Mistakes launched by Aggregations class
+
+@date:      Jul 2021
+@version:   1.0
+"""
+
+class AggregationStrategyError(Exception):
+    """Exception raised when the aggregation strategy is not registered
+
+    Attributes:
+        strategy    : str   ; name of the strategy
+    """
+
+    C_ERROR_MESSAGE     : str = "Aggregation strategy not registered: "
+
+    def __init__(self, strategy : str):
+        """Show error message."""
+
+        super().__init__(self.C_ERROR_MESSAGE + str(strategy))
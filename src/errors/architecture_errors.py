@@ -0,0 +1,37 @@
+"""
+Mistakes launched by ArchitectureDatabase class
+
+@date:      Jul 2021
+@version:   1.0
+"""
+
+class ArchitectureNotFoundError(Exception):
+    """Exception raised when the compute capability of the device is not in the architecture database
+    
+    Attributes:
+        compute_capability  : float ; compute capability of the device
+    """
+    
+    C_ERROR_MESSAGE     : str = ("Compute capability not found in architecture database (add it to the database or " +
+                                    "indicate other database with '-adb'): ")
+
+    def __init__(self, compute_capability : float):
+        """Show error message."""
+        
+        super().__init__(self.C_ERROR_MESSAGE + str(compute_capability))
+        
+
+class ArchitectureDatabaseError(Exception):
+    """Exception raised when the architecture database can't be read or an architecture is not valid
+    
+    Attributes:
+        file_str    : str   ; path to file that produced the error
+    """
+    
+    C_ERROR_MESSAGE     : str = "Architecture database not valid: "
+
+    def __init__(self, file_str : str):
+        """Show error message."""
+        
+        super().__init__(self.C_ERROR_MESSAGE + file_str)
+        
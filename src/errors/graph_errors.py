@@ -0,0 +1,70 @@
+"""
+Mistakes launched by PieChart and StaticGraphRenderer classes
+
+@date:      Jul 2021
+@version:   1.0
+"""
+
+class GraphDependencyError(Exception):
+    """Exception raised when the library needed to render static images (kaleido) is not installed"""
+    
+    C_ERROR_MESSAGE     : str = "Static graphs (png/svg/pdf) require 'kaleido' module. Install it with 'pip install kaleido'"
+
+    def __init__(self):
+        """Show error message."""
+        
+        super().__init__(self.C_ERROR_MESSAGE)
+        
+
+class GraphFormatError(Exception):
+    """Exception raised when the format of the graph file is not supported
+    
+    Attributes:
+        file_str    : str   ; path to file that produced the error
+    """
+    
+    C_ERROR_MESSAGE     : str = "Format of graph file not supported (use .html/.htm, .png, .svg or .pdf): "
+
+    def __init__(self, file_str : str):
+        """Show error message."""
+        
+        super().__init__(self.C_ERROR_MESSAGE + file_str)
+        
+
+class GraphRenderError(Exception):
+    """Exception raised when a static graph can't be rendered by kaleido (its browser is missing or fails...)
+    
+    Attributes:
+        file_str    : str   ; path to file that produced the error
+
+        reason      : str   ; error reported by kaleido
+    """
+    
+    C_ERROR_MESSAGE     : str = "Static graph could not be rendered with 'kaleido' (it needs Google Chrome): "
+
+    def __init__(self, file_str : str, reason : str):
+        """Show error message."""
+        
+        self.file_str : str = file_str
+        self.reason : str = reason
+        super().__init__(self.C_ERROR_MESSAGE + file_str + " (" + reason.strip() + ")")
+
+    def __reduce__(self):
+        """Rebuild error with its arguments when it's sent from a process of the pool."""
+
+        return (GraphRenderError, (self.file_str, self.reason))
+        
+
+class HierarchyChartTypeError(Exception):
+    """Exception raised when the type of hierarchical graph is not supported
+    
+    Attributes:
+        chart_type  : str   ; type of graph that produced the error
+    """
+    
+    C_ERROR_MESSAGE     : str = "Type of hierarchical graph not supported (use 'sunburst' or 'treemap'): "
+
+    def __init__(self, chart_type : str):
+        """Show error message."""
+        
+        super().__init__(self.C_ERROR_MESSAGE + chart_type)
@@ -0,0 +1,20 @@
+"""
+Mistakes launched by HotKernels class
+
+@date:      Jul 2021
+@version:   1.0
+"""
+
+class HotKernelsShareError(Exception):
+    """Exception raised when the percentage of cycles covered by the hot kernels is not valid
+
+    Attributes:
+        share   : float ; percentage of the cycles of the execution
+    """
+
+    C_ERROR_MESSAGE     : str = "Percentage of cycles covered by the hot kernels must be greater than 0 and lower or equal than 100: "
+
+    def __init__(self, share : float):
+        """Show error message."""
+
+        super().__init__(self.C_ERROR_MESSAGE + str(share))
@@ -135,7 +135,7 @@ class ComputedAsAverageError(Exception):
         metric_name    : str   ; name of the event that produced the error"""
     
     C_ERROR_MESSAGE     : str = ("Following metric/event cannot be computed as average in each kernel"
-     + " because it's a percentage and must be computed as AVERAGE. Delete it from LevelExecutionParameters: ")
+     + " because it's a percentage and must be computed as AVERAGE. Change its strategy in AggregationsParameters: ")
 
     def __init__(self, metric_name : str):
         """Show error message."""
@@ -192,3 +192,41 @@ class GraphsTitleSizeError(Exception):
         super().__init__(self.C_ERROR_MESSAGE)
         
 
+
+class RooflineNotMeasuredError(Exception):
+    """Exception raised if results of the roofline model are requested but its part has not been measured"""
+    
+    C_ERROR_MESSAGE     : str = "Roofline part has not been measured"
+
+    def __init__(self):
+        """Show error message."""
+        
+        super().__init__(self.C_ERROR_MESSAGE)
+        
+
+
+class OccupancyNotMeasuredError(Exception):
+    """Exception raised if launch configuration and occupancy are requested but its part has not been measured"""
+    
+    C_ERROR_MESSAGE     : str = "Occupancy part has not been measured"
+
+    def __init__(self):
+        """Show error message."""
+        
+        super().__init__(self.C_ERROR_MESSAGE)
+        
+
+
+class InconsistentMeasuresError(Exception):
+    """Exception raised if values of the measures are impossible (more bank conflicts than wavefronts, hit rate above 100%...)
+    
+    Attributes:
+        measure_names   : str   ; names of the measures that produced the error
+    """
+    
+    C_ERROR_MESSAGE     : str = "Values of the following measures are impossible (check the results of the NVIDIA scan tool): "
+
+    def __init__(self, measure_names : str):
+        """Show error message."""
+        
+        super().__init__(self.C_ERROR_MESSAGE + measure_names)
@@ -0,0 +1,27 @@
+"""
+Mistakes launched by MetricAvailability class
+
+@date:      Jul 2021
+@version:   1.0
+"""
+
+class UnsupportedMeasuresError(Exception):
+    """Exception raised when the command of the scan tool has measures not supported by the device
+
+    Attributes:
+        names       : list  ; names of the measures not supported
+
+        cache_file  : str   ; path to file where supported measures are cached, or 'None'
+    """
+
+    C_ERROR_MESSAGE     : str = ("Measures not supported by the device with the NVIDIA scan tool (use '-mc prune' to don't " +
+                                "collect them or '-mc off' to don't check them): ")
+    C_CACHE_MESSAGE     : str = ". Supported measures are cached in: "
+
+    def __init__(self, names : list, cache_file : str):
+        """Show error message."""
+
+        message : str = self.C_ERROR_MESSAGE + ", ".join(names)
+        if cache_file is not None:
+            message += self.C_CACHE_MESSAGE + cache_file
+        super().__init__(message)
@@ -0,0 +1,32 @@
+"""
+Mistakes launched by MetricExporter class
+
+@date:      Jul 2021
+@version:   1.0
+"""
+
+class ExportDependencyError(Exception):
+    """Exception raised when the library needed to export results (pyarrow) is not installed"""
+    
+    C_ERROR_MESSAGE     : str = "Export of results requires 'pyarrow' module. Install it with 'pip install pyarrow'"
+
+    def __init__(self):
+        """Show error message."""
+        
+        super().__init__(self.C_ERROR_MESSAGE)
+        
+
+class ExportFormatError(Exception):
+    """Exception raised when the format of the export file is not supported
+    
+    Attributes:
+        file_str    : str   ; path to file that produced the error
+    """
+    
+    C_ERROR_MESSAGE     : str = "Format of export file not supported (use .parquet/.pq or .arrow/.feather/.ipc): "
+
+    def __init__(self, file_str : str):
+        """Show error message."""
+        
+        super().__init__(self.C_ERROR_MESSAGE + file_str)
+        
@@ -0,0 +1,21 @@
+"""
+Mistakes launched by MpiRanks class
+
+@date:      Jul 2021
+@version:   1.0
+"""
+
+class RankFilesNotFoundError(Exception):
+    """Exception raised when there are no results of the ranks of the MPI job in the directory
+
+    Attributes:
+        directory   : str   ; path to directory with the results of each rank
+    """
+
+    C_ERROR_MESSAGE     : str = ("No results of ranks ('rank_<N>.txt') in directory (check the environment variable " +
+                                "with the rank of each process, '-mpv'): ")
+
+    def __init__(self, directory : str):
+        """Show error message."""
+
+        super().__init__(self.C_ERROR_MESSAGE + directory)
@@ -0,0 +1,20 @@
+"""
+Mistakes launched by ProfilerBackend classes
+
+@date:      Jul 2021
+@version:   1.0
+"""
+
+class ReplayFileError(Exception):
+    """Exception raised when the file with the results to replay cannot be read
+    
+    Attributes:
+        file_str    : str   ; path to file that produced the error
+    """
+    
+    C_ERROR_MESSAGE     : str = "Results to replay cannot be read from file: "
+
+    def __init__(self, file_str : str):
+        """Show error message."""
+        
+        super().__init__(self.C_ERROR_MESSAGE + file_str)
@@ -0,0 +1,20 @@
+"""
+Mistakes launched by Repetitions class
+
+@date:      Jul 2021
+@version:   1.0
+"""
+
+class RepetitionsNumberError(Exception):
+    """Exception raised when the number of runs is not valid
+
+    Attributes:
+        max_runs    : int   ; max number of runs
+    """
+
+    C_ERROR_MESSAGE     : str = "Number of runs must be greater than 0: "
+
+    def __init__(self, max_runs : int):
+        """Show error message."""
+
+        super().__init__(self.C_ERROR_MESSAGE + str(max_runs))
@@ -0,0 +1,20 @@
+"""
+Mistakes launched by SyntheticOutput class
+
+@date:      Jul 2021
+@version:   1.0
+"""
+
+class SyntheticOutputFormatError(Exception):
+    """Exception raised when the format of the synthetic results is not supported
+    
+    Attributes:
+        output_format   : str   ; format that produced the error
+    """
+    
+    C_ERROR_MESSAGE     : str = "Format of synthetic results not supported (use 'nsight', 'nsight-csv' or 'nvprof'): "
+
+    def __init__(self, output_format : str):
+        """Show error message."""
+        
+        super().__init__(self.C_ERROR_MESSAGE + str(output_format))
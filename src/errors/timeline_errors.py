@@ -0,0 +1,32 @@
+"""
+Mistakes launched by Timeline class
+
+@date:      Jul 2021
+@version:   1.0
+"""
+
+class TimelineFormatError(Exception):
+    """Exception raised when the format of the timeline file is not supported
+    
+    Attributes:
+        file_str    : str   ; path to file that produced the error
+    """
+    
+    C_ERROR_MESSAGE     : str = "Format of timeline file not supported (use .csv or .json): "
+
+    def __init__(self, file_str : str):
+        """Show error message."""
+        
+        super().__init__(self.C_ERROR_MESSAGE + file_str)
+        
+
+class TimelineWindowsError(Exception):
+    """Exception raised when the sliding windows of the timeline are not valid"""
+    
+    C_ERROR_MESSAGE     : str = "Number of windows of timeline must be greater than 0 and their width must be in (0, 100] %"
+
+    def __init__(self):
+        """Show error message."""
+        
+        super().__init__(self.C_ERROR_MESSAGE)
+        
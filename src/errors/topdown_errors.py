@@ -20,6 +20,40 @@ class ComputeCapabilityNumberError(Exception):
         super().__init__(self.C_ERROR_MESSAGE)
         
 
+class NvtxNvprofError(Exception):
+    """Exception raised when NVTX filters are indicated but the execution is done with NVPROF"""
+    
+    C_ERROR_MESSAGE     : str = "NVTX filters ('-nvi/--nvtx-include', '-nve/--nvtx-exclude') are only supported by NSIGHT (ncu)"
+
+    def __init__(self):
+        """Show error message."""
+        
+        super().__init__(self.C_ERROR_MESSAGE)
+        
+
+class RegionNvprofError(Exception):
+    """Exception raised when launches per profiled region are indicated but the execution is done with NVPROF"""
+    
+    C_ERROR_MESSAGE     : str = ("Results per profiled region ('-prl/--profiler-region-launches') are only supported by NSIGHT (ncu), " +
+        "NVPROF groups the launches of each kernel")
+
+    def __init__(self):
+        """Show error message."""
+        
+        super().__init__(self.C_ERROR_MESSAGE)
+        
+
+class ProfilerRegionLaunchesError(Exception):
+    """Exception raised when the number of launches per profiled region is not valid"""
+    
+    C_ERROR_MESSAGE     : str = "Number of launches per profiled region must be greater than 0"
+
+    def __init__(self):
+        """Show error message."""
+        
+        super().__init__(self.C_ERROR_MESSAGE)
+        
+
 class ModeExecutionError(Exception):
     """Exception raised when compute capability of (current) device cannot be obtained
     
@@ -34,4 +68,29 @@ class ModeExecutionError(Exception):
         
         super().__init__(self.C_ERROR_MESSAGE)
         
+        
 
+class ProcessesNotFoundError(Exception):
+    """Exception raised when no kernel has been launched by the processes selected
+    
+    Attributes:
+        processes   : list  ; PID or part of the command of each process selected
+    """
+    
+    C_ERROR_MESSAGE     : str = "No kernel has been launched by the processes indicated: "
+
+    def __init__(self, processes : list):
+        """Show error message."""
+        
+        super().__init__(self.C_ERROR_MESSAGE + ", ".join(processes))
+        
+
+class LevelNvprofError(Exception):
+    """Exception raised when the level indicated is not supported by NVPROF"""
+    
+    C_ERROR_MESSAGE     : str = "Following level is only supported by NSIGHT (ncu): "
+
+    def __init__(self, level : int):
+        """Show error message."""
+        
+        super().__init__(self.C_ERROR_MESSAGE + str(level))
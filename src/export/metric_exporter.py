@@ -0,0 +1,232 @@
+"""
+Program that exports the measurements of the execution.
+
+@date:      Jul 2021
+@version:   1.0
+"""
+
+import json
+import os, sys, inspect
+currentdir = os.path.dirname(os.path.abspath(inspect.getfile(inspect.currentframe())))
+parentdir = os.path.dirname(currentdir)
+sys.path.insert(0, parentdir) 
+from measure_levels.level_execution import LevelExecution
+from measure_parts.metric_measure import MetricMeasure, MetricMeasureNvprof
+from distributions.metric_distributions import MetricDistributions
+from parameters.metric_exporter_params import MetricExporterParameters
+from errors.metric_exporter_errors import *
+
+class MetricExporter:
+    """
+    Class that exports the per-launch matrix of the execution (kernel name, launch index, 
+    tags of the launch (process, NVTX range...), each metric/event measured as a typed column and the results of the TopDown methodology 
+    in each launch) to Parquet or Arrow IPC file. Columns are written in chunks of launches, so
+    profiles with a large number of launches can be exported. With distributions, the min/max of the
+    metrics in the invocations of each launch (NVPROF) are also exported as columns and the distribution
+    of each measure as metadata of the file.
+
+    Attributes:
+        __level_execution       : LevelExecution    ; level of the execution ALREADY DONE
+
+        __launches_per_chunk    : int               ; launches written in each row group/record batch
+
+        __distributions         : bool              ; True to export the distributions of the measures
+                                                      or False if not
+    """
+
+    def __init__(self, level_execution : LevelExecution, 
+        launches_per_chunk : int = MetricExporterParameters.C_NUM_LAUNCHES_PER_CHUNK, distributions : bool = False):
+        """
+        Set attributes with argument values.
+
+        Args:
+            level_execution     : LevelExecution    ; level of the execution ALREADY DONE
+
+            launches_per_chunk  : int               ; launches written in each row group/record batch
+
+            distributions       : bool              ; True to export the distributions of the measures
+                                                      or False if not
+        """
+
+        self.__level_execution : LevelExecution = level_execution
+        self.__launches_per_chunk : int = launches_per_chunk
+        self.__distributions : bool = distributions
+        
+
+    def __columns(self) -> list:
+        """
+        Get the measures (metrics and events) of the execution. If a measure is defined
+        in more than one part, it's only taken once. With distributions, the min and max of
+        the metrics of NVPROF are added after each metric.
+
+        Returns:
+            List of tuples (name, kind, part name, description, list of values)
+        """
+
+        columns : list = list()
+        names : set = set()
+        part : MetricMeasure
+        measures : list
+        for part in self.__level_execution.measure_parts():
+            measures = [(MetricExporterParameters.C_METRIC_KIND, part.metrics(), part.metrics_description())]
+            if isinstance(part, MetricMeasureNvprof):
+                measures.append((MetricExporterParameters.C_EVENT_KIND, part.events(), part.events_description()))
+            for kind, dict_values, dict_desc in measures:
+                for name in dict_values:
+                    if name in names:
+                        continue
+                    names.add(name)
+                    description = dict_desc.get(name)
+                    if not isinstance(description, str):
+                        description = ""
+                    columns.append((name, kind, part.name(), description.strip(), dict_values[name]))
+                    if self.__distributions and kind == MetricExporterParameters.C_METRIC_KIND and isinstance(part, MetricMeasureNvprof):
+                        ranges = part.get_metric_range(name)
+                        if ranges:
+                            columns.append((name + MetricExporterParameters.C_MIN_COLUMN_SUFFIX, kind, part.name(), 
+                                description.strip(), [value_range[0] for value_range in ranges]))
+                            columns.append((name + MetricExporterParameters.C_MAX_COLUMN_SUFFIX, kind, part.name(), 
+                                description.strip(), [value_range[1] for value_range in ranges]))
+        return columns
+        
+
+    def __schema(self, pa, columns : list, topdown_names : list, results : dict):
+        """
+        Build schema of the file.
+
+        Args:
+            pa              : module    ; pyarrow module
+
+            columns         : list      ; measures of the execution
+
+            topdown_names   : list      ; names of the results of the TopDown methodology
+
+            results         : dict      ; results of the TopDown methodology of the whole application
+
+        Returns:
+            pyarrow.Schema with the columns of the file
+        """
+
+        fields : list = [pa.field(MetricExporterParameters.C_KERNEL_COLUMN_NAME, pa.string()),
+            pa.field(MetricExporterParameters.C_LAUNCH_COLUMN_NAME, pa.int64())]
+        for kind in self.__level_execution.launch_tag_kinds():
+            fields.append(pa.field(MetricExporterParameters.C_TAG_COLUMN_PREFIX + kind, pa.string()))
+        for name, kind, part_name, description, values in columns:
+            fields.append(pa.field(name, pa.float64(), metadata = {MetricExporterParameters.C_PART_METADATA_KEY : part_name, 
+                MetricExporterParameters.C_KIND_METADATA_KEY : kind, MetricExporterParameters.C_DESCRIPTION_METADATA_KEY : description}))
+        for name in topdown_names:
+            fields.append(pa.field(MetricExporterParameters.C_TOPDOWN_COLUMN_PREFIX + name, pa.float64(), 
+                metadata = {MetricExporterParameters.C_KIND_METADATA_KEY : MetricExporterParameters.C_TOPDOWN_KIND}))
+        metadata : dict = {MetricExporterParameters.C_LEVEL_METADATA_KEY : type(self.__level_execution).__name__,
+            MetricExporterParameters.C_PROGRAM_METADATA_KEY : str(self.__level_execution.program()),
+            MetricExporterParameters.C_COMPUTE_CAPABILITY_METADATA_KEY : str(self.__level_execution.compute_capability()),
+            MetricExporterParameters.C_RESULTS_METADATA_KEY : json.dumps(results)}
+        if self.__distributions:
+            metadata[MetricExporterParameters.C_DISTRIBUTIONS_METADATA_KEY] = json.dumps(
+                MetricDistributions(self.__level_execution).distributions())
+        return pa.schema(fields, metadata = metadata)
+        
+
+    def __to_float(self, values : list, launch : int) -> float:
+        """
+        Get value of measure in launch as float.
+
+        Args:
+            values  : list  ; values of the measure in each launch
+
+            launch  : int   ; index of launch
+
+        Returns:
+            Float with the value or 'None' if it is not defined or it is not a number
+        """
+
+        if launch >= len(values):
+            return None
+        try:
+            return self.__level_execution.measure_value_to_float(values[launch])
+        except ValueError:
+            return None
+        
+
+    def __chunk(self, pa, schema, columns : list, topdown_names : list, first_launch : int, last_launch : int):
+        """
+        Build record batch with the launches in the interval [first_launch, last_launch).
+
+        Args:
+            pa              : module            ; pyarrow module
+
+            schema          : pyarrow.Schema    ; schema of the file
+
+            columns         : list              ; measures of the execution
+
+            topdown_names   : list              ; names of the results of the TopDown methodology
+
+            first_launch    : int               ; first launch of the chunk
+
+            last_launch     : int               ; last launch (not included) of the chunk
+
+        Returns:
+            pyarrow.RecordBatch with the chunk
+        """
+
+        launches : range = range(first_launch, last_launch)
+        kernels : list = self.__level_execution.kernels()
+        arrays : list = [pa.array([kernels[i] if i < len(kernels) else None for i in launches], pa.string()),
+            pa.array(launches, pa.int64())]
+        tags : list
+        for kind in self.__level_execution.launch_tag_kinds():
+            tags = self.__level_execution.launch_tags(kind)
+            arrays.append(pa.array([tags[i] if i < len(tags) else None for i in launches], pa.string()))
+        for name, kind, part_name, description, values in columns:
+            arrays.append(pa.array([self.__to_float(values, i) for i in launches], pa.float64()))
+        topdown_values : dict = self.__level_execution.topdown_results_per_launch(list(launches))
+        for name in topdown_names:
+            arrays.append(pa.array(topdown_values[name], pa.float64()))
+        return pa.RecordBatch.from_arrays(arrays, schema = schema)
+        
+
+    def export(self, file_str : str):
+        """
+        Export measures of the execution to file indicated as argument. Format (Parquet or Arrow IPC)
+        is obtained from the extension of the file.
+
+        Args:
+            file_str    : str   ; path to output file
+
+        Raises:
+            ExportFormatError       ; format of the file is not supported
+
+            ExportDependencyError   ; pyarrow is not installed
+        """
+
+        extension : str = os.path.splitext(file_str)[1].lower()
+        is_parquet : bool = extension in MetricExporterParameters.C_PARQUET_FILE_EXTENSIONS
+        if not (is_parquet or extension in MetricExporterParameters.C_ARROW_IPC_FILE_EXTENSIONS):
+            raise ExportFormatError(file_str)
+        try:
+            import pyarrow as pa
+            if is_parquet:
+                import pyarrow.parquet as pq
+        except ImportError:
+            raise ExportDependencyError
+
+        results : dict = self.__level_execution.topdown_results()
+        topdown_names : list = list(results.keys())
+        columns : list = self.__columns()
+        schema = self.__schema(pa, columns, topdown_names, results)
+        num_launches : int = self.__level_execution.num_launches()
+        if is_parquet:
+            writer = pq.ParquetWriter(file_str, schema, compression = MetricExporterParameters.C_PARQUET_COMPRESSION)
+        else:
+            writer = pa.ipc.new_file(file_str, schema)
+        try:
+            for first_launch in range(0, num_launches, self.__launches_per_chunk):
+                batch = self.__chunk(pa, schema, columns, topdown_names, first_launch, 
+                    min(first_launch + self.__launches_per_chunk, num_launches))
+                if is_parquet:
+                    writer.write_table(pa.Table.from_batches([batch], schema = schema))
+                else:
+                    writer.write_batch(batch)
+        finally:
+            writer.close()
+        
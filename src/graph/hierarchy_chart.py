@@ -0,0 +1,160 @@
+"""
+Class that represents a hierarchical (sunburst or treemap) graph.
+
+@date:      Jul 2021
+@version:   1.0
+"""
+
+import plotly.graph_objects as go
+import os, sys, inspect
+currentdir = os.path.dirname(os.path.abspath(inspect.getfile(inspect.currentframe())))
+parentdir = os.path.dirname(currentdir)
+sys.path.insert(0, parentdir)
+from graph.static_graph_renderer import write_figure
+from parameters.graph_params import GraphParameters
+from errors.graph_errors import *
+
+class HierarchyChart:
+    """
+    Class which defines a hierarchical graph (sunburst or treemap). The value of each node is
+    its TOTAL value (including its children).
+
+    Attributes:
+        __title         : str   ; title name of diagram
+
+        __chart_type    : str   ; type of graph ('sunburst' or 'treemap')
+
+        __ids           : list  ; identifier of each node
+
+        __parents       : list  ; identifier of the parent of each node ("" in root nodes)
+
+        __labels        : list  ; label of each node
+
+        __values        : list  ; total value of each node
+    """
+
+    def __init__(self, title : str, chart_type : str = GraphParameters.C_HIERARCHY_CHART_TYPE_DEFAULT):
+        """
+        Set attributes as arguments.
+
+        Raises:
+            HierarchyChartTypeError     ; raised if type of graph is not supported
+        """
+
+        if not chart_type in GraphParameters.C_HIERARCHY_CHART_TYPES:
+            raise HierarchyChartTypeError(chart_type)
+        self.__title : str = title
+        self.__chart_type : str = chart_type
+        self.__ids : list = list()
+        self.__parents : list = list()
+        self.__labels : list = list()
+        self.__values : list = list()
+
+
+    def add_node(self, node_id : str, parent_id : str, label : str, value : float):
+        """
+        Add node to graph.
+
+        Args:
+            node_id     : str   ; identifier of the node (unique in the graph)
+
+            parent_id   : str   ; identifier of the parent node ("" in root nodes)
+
+            label       : str   ; label of the node
+
+            value       : float ; total value of the node ('None' is taken as 0)
+        """
+
+        if value is None or value < 0:
+            value = 0.0
+        self.__ids.append(node_id)
+        self.__parents.append(parent_id)
+        self.__labels.append(label)
+        self.__values.append(value)
+
+
+    def add_tree(self, parent_id : str, tree : list, scale : float = 1.0):
+        """
+        Add the hierarchy of TopDown parts below a node.
+
+        Args:
+            parent_id   : str   ; identifier of the node where tree is added ("" to add it as root)
+
+            tree        : list  ; list of tuples (name of part, name of parent part or "", value)
+
+            scale       : float ; factor applied to the values of the tree
+        """
+
+        name : str
+        parent_name : str
+        value : float
+        for name, parent_name, value in tree:
+            if not value is None:
+                value *= scale
+            self.add_node(self.__node_id(parent_id, name), self.__node_id(parent_id, parent_name) if parent_name != ""
+                else parent_id, name.split(GraphParameters.C_HIERARCHY_PART_NAME_SEPARATOR)[-1], value)
+
+
+    def __node_id(self, parent_id : str, name : str) -> str:
+        """ Get identifier of node with the name indicated below node indicated."""
+
+        if parent_id == "":
+            return name
+        return parent_id + GraphParameters.C_HIERARCHY_ID_SEPARATOR + name
+
+
+    def __remainder_values(self) -> list:
+        """
+        Get the value of each node without the value of its children. Children of a
+        node don't always sum its total, so nodes are drawn in 'remainder' mode.
+
+        Returns:
+            List with the value of each node
+        """
+
+        values : list = list(self.__values)
+        index : dict = {node_id : i for i, node_id in enumerate(self.__ids)}
+        i : int
+        for i in range(0, len(self.__ids)):
+            if self.__parents[i] in index:
+                values[index[self.__parents[i]]] -= self.__values[i]
+        return [max(value, 0.0) for value in values]
+
+
+    def __figure(self) -> go.Figure:
+        """ Create plotly's figure of graph."""
+
+        trace_type = go.Sunburst if self.__chart_type == "sunburst" else go.Treemap
+        fig : go.Figure = go.Figure(trace_type(ids = self.__ids, parents = self.__parents, labels = self.__labels,
+            values = self.__remainder_values(), branchvalues = "remainder", customdata = self.__values,
+            hovertemplate = GraphParameters.C_HIERARCHY_HOVER_TEMPLATE))
+        fig.update_layout(title = {'text' : self.__title, 'x' : 0.5, 'xanchor': 'center'},
+            font = dict(size = 12, color = "Black"), margin = dict(t = 60, l = 0, r = 0, b = 0))
+        return fig
+
+
+    def show(self):
+        """ Show Graph."""
+
+        self.__figure().show()
+
+
+    def save(self, file_str : str):
+        """ Save figure in file indicated as argument. Format (html, png, svg or pdf)
+        is obtained from the extension of the file.
+
+        Params:
+            file_str    : str   ; path to file where save figure
+        """
+
+        write_figure(self.__figure(), file_str)
+
+
+    def to_json(self) -> str:
+        """ Get figure in JSON format, so it can be rendered in other process.
+
+        Returns:
+            String with figure in JSON format
+        """
+
+        return self.__figure().to_json()
@@ -1,6 +1,11 @@
 import matplotlib.pyplot as plt
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
+import os, sys, inspect
+currentdir = os.path.dirname(os.path.abspath(inspect.getfile(inspect.currentframe())))
+parentdir = os.path.dirname(currentdir)
+sys.path.insert(0, parentdir)
+from graph.static_graph_renderer import write_figure
 
 class PieChart:
     """
@@ -60,6 +65,17 @@ class PieChart:
         self.__current_title_index += 1
         return True
         pass
+
+    def set_title(self, title : str):
+        """ Set title name of diagram.
+
+        Params:
+            title       : str   ; title name of diagram
+        """
+
+        self.__title = title
+        pass
+
     def __set_features(self):
         """ Set some features."""
         
@@ -77,12 +93,24 @@ class PieChart:
         pass
 
     def save(self, file_str : str):
-        """ Save figure in file indicated as argument.
+        """ Save figure in file indicated as argument. Format (html, png, svg or pdf)
+        is obtained from the extension of the file.
 
         Params:
             file_str    : str   ; path to file where save figure
         """
         
         self.__set_features()
-        self.__fig.write_html(file_str)
+        write_figure(self.__fig, file_str)
+        pass
+
+    def to_json(self) -> str:
+        """ Get figure in JSON format, so it can be rendered in other process.
+
+        Returns:
+            String with figure in JSON format
+        """
+
+        self.__set_features()
+        return self.__fig.to_json()
         pass
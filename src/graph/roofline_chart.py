@@ -0,0 +1,126 @@
+"""
+Class that represents a roofline graph (achieved percentage of the peaks of the device).
+
+@date:      Jul 2021
+@version:   1.0
+"""
+
+import plotly.graph_objects as go
+import os, sys, inspect
+currentdir = os.path.dirname(os.path.abspath(inspect.getfile(inspect.currentframe())))
+parentdir = os.path.dirname(currentdir)
+sys.path.insert(0, parentdir)
+from graph.static_graph_renderer import write_figure
+
+class RooflineChart:
+    """
+    Class which defines a roofline graph normalized to the peaks of the device: each point is a
+    kernel, with the achieved percentage of the peak memory bandwidth in the X axis and the achieved
+    percentage of the peak FLOP rate in the Y axis. Points of the same class are drawn in the same
+    series, and the threshold below which kernels are latency-bound is drawn as a box.
+
+    Attributes:
+        __title             : str   ; title name of diagram
+
+        __x_title           : str   ; title of X axis
+
+        __y_title           : str   ; title of Y axis
+
+        __threshold         : float ; percentage of the peaks below which kernels are latency-bound
+
+        __hover_template    : str   ; plotly's template of the information shown with each point, or 'None'
+
+        __min_size          : float ; size of the marker of the point with the lowest weight
+
+        __max_size          : float ; size of the marker of the point with the highest weight
+
+        __points            : dict  ; class as key and list of tuples (name, x, y, weight, custom data) as value
+    """
+
+    def __init__(self, title : str, x_title : str, y_title : str, threshold : float, hover_template : str = None,
+        min_size : float = 8.0, max_size : float = 40.0):
+        """
+        Set attributes as arguments.
+
+        Args:
+            title           : str   ; title name of diagram
+
+            x_title         : str   ; title of X axis
+
+            y_title         : str   ; title of Y axis
+
+            threshold       : float ; percentage of the peaks below which kernels are latency-bound
+
+            hover_template  : str   ; plotly's template of the information shown with each point, or 'None'
+
+            min_size        : float ; size of the marker of the point with the lowest weight
+
+            max_size        : float ; size of the marker of the point with the highest weight
+        """
+
+        self.__title : str = title
+        self.__x_title : str = x_title
+        self.__y_title : str = y_title
+        self.__threshold : float = threshold
+        self.__hover_template : str = hover_template
+        self.__min_size : float = min_size
+        self.__max_size : float = max_size
+        self.__points : dict = dict()
+
+
+    def add_point(self, class_name : str, name : str, x_value : float, y_value : float, weight : float, customdata : list = None):
+        """
+        Add point to graph.
+
+        Args:
+            class_name  : str   ; class of the point (series where it's drawn)
+
+            name        : str   ; name of the point
+
+            x_value     : float ; value of X axis
+
+            y_value     : float ; value of Y axis
+
+            weight      : float ; weight of the point (size of the marker)
+
+            customdata  : list  ; data shown with the point, or 'None'
+        """
+
+        self.__points.setdefault(class_name, list()).append((name, x_value, y_value, weight, customdata))
+
+
+    def __figure(self) -> go.Figure:
+        """ Create plotly's figure of graph."""
+
+        weights : list = [point[3] for points in self.__points.values() for point in points]
+        max_weight : float = max(weights) if weights and max(weights) > 0.0 else 1.0
+        fig : go.Figure = go.Figure()
+        for class_name, points in self.__points.items():
+            fig.add_trace(go.Scatter(x = [point[1] for point in points], y = [point[2] for point in points], name = class_name,
+                mode = "markers", text = [point[0] for point in points], customdata = [point[4] for point in points],
+                hovertemplate = self.__hover_template, marker = dict(size = [self.__min_size + (self.__max_size - self.__min_size)*
+                (point[3]/max_weight) for point in points], opacity = 0.7, line = dict(width = 1))))
+        fig.add_shape(type = "rect", x0 = 0.0, y0 = 0.0, x1 = self.__threshold, y1 = self.__threshold, line = dict(dash = "dash"))
+        fig.add_shape(type = "line", x0 = 0.0, y0 = 0.0, x1 = 100.0, y1 = 100.0, line = dict(dash = "dot"))
+        fig.update_xaxes(title_text = self.__x_title, range = [0.0, 105.0])
+        fig.update_yaxes(title_text = self.__y_title, range = [0.0, 105.0])
+        fig.update_layout(title = {'text' : self.__title, 'x' : 0.5, 'xanchor': 'center'},
+            font = dict(size = 12, color = "Black"))
+        return fig
+
+
+    def show(self):
+        """ Show Graph."""
+
+        self.__figure().show()
+
+
+    def save(self, file_str : str):
+        """ Save figure in file indicated as argument. Format (html, png, svg or pdf)
+        is obtained from the extension of the file.
+
+        Params:
+            file_str    : str   ; path to file where save figure
+        """
+
+        write_figure(self.__figure(), file_str)
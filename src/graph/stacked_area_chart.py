@@ -0,0 +1,103 @@
+"""
+Class that represents a graph of stacked areas.
+
+@date:      Jul 2021
+@version:   1.0
+"""
+
+import plotly.graph_objects as go
+from plotly.subplots import make_subplots
+import os, sys, inspect
+currentdir = os.path.dirname(os.path.abspath(inspect.getfile(inspect.currentframe())))
+parentdir = os.path.dirname(currentdir)
+sys.path.insert(0, parentdir)
+from graph.static_graph_renderer import write_figure
+
+class StackedAreaChart:
+    """
+    Class which defines a graph of stacked areas with one or more rows (which share the
+    X axis). Series of the same row are stacked.
+
+    Attributes:
+        __title             : str   ; title name of diagram
+
+        __x_title           : str   ; title of X axis
+
+        __row_titles        : list  ; title of each row
+
+        __hover_template    : str   ; plotly's template of the information shown with each value, or 'None'
+
+        __series            : list  ; tuples (row, name, values of X axis, values of Y axis, custom data)
+                                      of the series added
+    """
+
+    def __init__(self, title : str, x_title : str, row_titles : list, hover_template : str = None):
+        """
+        Set attributes as arguments.
+
+        Args:
+            title           : str   ; title name of diagram
+
+            x_title         : str   ; title of X axis
+
+            row_titles      : list  ; title of each row
+
+            hover_template  : str   ; plotly's template of the information shown with each value, or 'None'
+        """
+
+        self.__title : str = title
+        self.__x_title : str = x_title
+        self.__row_titles : list = row_titles
+        self.__hover_template : str = hover_template
+        self.__series : list = list()
+
+
+    def add_series(self, row : int, name : str, x_values : list, y_values : list, customdata : list = None):
+        """
+        Add series to graph.
+
+        Args:
+            row         : int   ; index of the row (from 0) where the series is stacked
+
+            name        : str   ; name of the series
+
+            x_values    : list  ; values of X axis
+
+            y_values    : list  ; values of Y axis ('None' is taken as 0)
+
+            customdata  : list  ; data shown with each value, or 'None'
+        """
+
+        self.__series.append((row, name, x_values, [0.0 if value is None else value for value in y_values], customdata))
+
+
+    def __figure(self) -> go.Figure:
+        """ Create plotly's figure of graph."""
+
+        fig : go.Figure = make_subplots(rows = len(self.__row_titles), cols = 1, shared_xaxes = True,
+            subplot_titles = self.__row_titles, vertical_spacing = 0.08)
+        for row, name, x_values, y_values, customdata in self.__series:
+            fig.add_trace(go.Scatter(x = x_values, y = y_values, name = name, mode = "lines", line = dict(width = 0.5),
+                stackgroup = "row%d" % row, customdata = customdata, hovertemplate = self.__hover_template,
+                legendgroup = "row%d" % row), row = row + 1, col = 1)
+        fig.update_xaxes(title_text = self.__x_title, row = len(self.__row_titles), col = 1)
+        fig.update_layout(title = {'text' : self.__title, 'x' : 0.5, 'xanchor': 'center'},
+            font = dict(size = 12, color = "Black"), hovermode = "x unified")
+        return fig
+
+
+    def show(self):
+        """ Show Graph."""
+
+        self.__figure().show()
+
+
+    def save(self, file_str : str):
+        """ Save figure in file indicated as argument. Format (html, png, svg or pdf)
+        is obtained from the extension of the file.
+
+        Params:
+            file_str    : str   ; path to file where save figure
+        """
+
+        write_figure(self.__figure(), file_str)
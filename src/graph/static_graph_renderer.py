@@ -0,0 +1,140 @@
+"""
+Program that renders graphs to files (html, png, svg or pdf) without display.
+
+@date:      Jul 2021
+@version:   1.0
+"""
+
+import importlib.util
+from concurrent.futures import ProcessPoolExecutor
+import plotly.io as pio
+import os, sys, inspect
+currentdir = os.path.dirname(os.path.abspath(inspect.getfile(inspect.currentframe())))
+parentdir = os.path.dirname(currentdir)
+sys.path.insert(0, parentdir)
+from parameters.graph_params import GraphParameters
+from errors.graph_errors import *
+
+def graph_format(file_str : str) -> str:
+    """
+    Get the format of the graph from the extension of the file.
+
+    Args:
+        file_str    : str   ; path to graph file
+
+    Returns:
+        String with the format ('html', 'png', 'svg' or 'pdf')
+
+    Raises:
+        GraphFormatError    ; raised if the extension of the file is not supported
+    """
+
+    extension : str = os.path.splitext(file_str)[1].lower()
+    if extension in GraphParameters.C_HTML_FILE_EXTENSIONS:
+        return "html"
+    if extension in GraphParameters.C_STATIC_FILE_EXTENSIONS:
+        if importlib.util.find_spec("kaleido") is None:
+            raise GraphDependencyError
+        return extension[1:]
+    raise GraphFormatError(file_str)
+
+
+def write_figure(fig, file_str : str):
+    """
+    Write plotly's figure in file indicated as argument. Static formats are rendered
+    with kaleido, so they don't need a browser or a display.
+
+    Args:
+        fig         : Figure    ; plotly's figure
+
+        file_str    : str       ; path to graph file
+
+    Raises:
+        GraphRenderError    ; raised if kaleido fails rendering a static format
+    """
+
+    file_format : str = graph_format(file_str)
+    if file_format == "html":
+        fig.write_html(file_str)
+    else:
+        try:
+            fig.write_image(file_str, format = file_format, width = GraphParameters.C_STATIC_IMAGE_WIDTH,
+                height = GraphParameters.C_STATIC_IMAGE_HEIGHT)
+        except (RuntimeError, ValueError) as error:
+            raise GraphRenderError(file_str, str(error))
+
+
+def _render_figure_json(figure_json : str, file_str : str) -> str:
+    """
+    Render figure (in JSON format) to file. Executed in the processes of the pool.
+
+    Args:
+        figure_json : str   ; plotly's figure in JSON format
+
+        file_str    : str   ; path to graph file
+
+    Returns:
+        String with the path to graph file
+    """
+
+    write_figure(pio.from_json(figure_json), file_str)
+    return file_str
+
+
+class StaticGraphRenderer:
+    """
+    Class that renders a set of graphs concurrently in a pool of processes.
+
+    Attributes:
+        __max_workers   : int   ; max number of processes of the pool ('None' to use all CPUs)
+
+        __graphs        : list  ; list of tuples (figure in JSON format, path to graph file) to be rendered
+    """
+
+    def __init__(self, max_workers : int = GraphParameters.C_MAX_RENDER_WORKERS):
+        """
+        Set attributes with argument values.
+
+        Args:
+            max_workers     : int   ; max number of processes of the pool ('None' to use all CPUs)
+        """
+
+        self.__max_workers : int = max_workers
+        self.__graphs : list = list()
+
+
+    def add(self, figure_json : str, file_str : str):
+        """
+        Add a graph to be rendered.
+
+        Args:
+            figure_json : str   ; plotly's figure in JSON format
+
+            file_str    : str   ; path to graph file
+
+        Raises:
+            GraphFormatError        ; raised if the extension of the file is not supported
+
+            GraphDependencyError    ; raised if the format is static and kaleido is not installed
+        """
+
+        graph_format(file_str) # check format before rendering
+        self.__graphs.append((figure_json, file_str))
+
+
+    def render(self) -> list:
+        """
+        Render all graphs added. If there are more than one, they are rendered
+        in a pool of processes.
+
+        Returns:
+            List with the paths to graph files written
+        """
+
+        graphs : list = self.__graphs
+        self.__graphs = list()
+        if len(graphs) <= 1 or self.__max_workers == 1:
+            return [_render_figure_json(figure_json, file_str) for figure_json, file_str in graphs]
+        with ProcessPoolExecutor(max_workers = self.__max_workers) as executor:
+            return list(executor.map(_render_figure_json, *zip(*graphs)))
+
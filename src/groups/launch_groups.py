@@ -0,0 +1,208 @@
+"""
+Program that computes the results of the TopDown methodology per group of launches.
+
+@date:      Jul 2021
+@version:   1.0
+"""
+
+import os, sys, inspect
+currentdir = os.path.dirname(os.path.abspath(inspect.getfile(inspect.currentframe())))
+parentdir = os.path.dirname(currentdir)
+sys.path.insert(0, parentdir)
+from measure_levels.level_one import LevelOne
+from parameters.launch_groups_params import LaunchGroupsParameters
+
+class LaunchGroups:
+    """
+    Class that groups the launches of the execution by their tag of the kind indicated (NVTX
+    range...) and computes the results of the TopDown methodology in each group, so there is a
+    breakdown of the bottleneck per phase of the application. Groups keep the order of their
+    first launch.
+
+    Attributes:
+        __level_execution       : LevelOne  ; level of the execution ALREADY DONE
+
+        __kind                  : str       ; kind of tag which groups the launches
+
+        __groups                : list      ; results of each group, or 'None' if they have not
+                                              been computed yet
+    """
+
+    def __init__(self, level_execution : LevelOne, kind : str):
+        """
+        Set attributes with argument values.
+
+        Args:
+            level_execution     : LevelOne  ; level of the execution ALREADY DONE
+
+            kind                : str       ; kind of tag which groups the launches
+        """
+
+        self.__level_execution : LevelOne = level_execution
+        self.__kind : str = kind
+        self.__groups : list = None
+
+
+    def is_empty(self) -> bool:
+        """
+        Check if launches are tagged with the kind of tag.
+
+        Returns:
+            True if no launch has a tag of the kind or False if not
+        """
+
+        tags : list = self.__level_execution.launch_tags(self.__kind)
+        return tags is None or all(tag is None for tag in tags)
+
+
+    def num_tags(self) -> int:
+        """
+        Get the number of different tags of the kind in the selected launches.
+
+        Returns:
+            Integer with the number of tags (launches without tag are not counted)
+        """
+
+        tags : list = self.__level_execution.launch_tags(self.__kind)
+        if tags is None:
+            return 0
+        selected_launches : list = self.__level_execution.selected_launches()
+        return len({tags[i] for i in (range(0, len(tags)) if selected_launches is None else selected_launches)
+            if i < len(tags) and not tags[i] is None})
+
+
+    def __bottleneck(self, tree : list) -> str:
+        """
+        Get the path of the parts with the highest IPC degradation: the part of level one and, below it,
+        the part (of the next level) with the highest degradation, and so on.
+
+        Args:
+            tree    : list  ; list of tuples (name of part, name of parent part or "", value)
+
+        Returns:
+            String with the name of the deepest part of the path, or 'None' if there are no parts
+        """
+
+        retire_name : str = self.__level_execution.retire().name()
+        parent_name : str = ""
+        bottleneck : str = None
+        children : list = [(value, name) for name, parent, value in tree if parent == parent_name and name != retire_name
+            and not value is None]
+        while children:
+            bottleneck = max(children)[1]
+            parent_name = bottleneck
+            children = [(value, name) for name, parent, value in tree if parent == parent_name and not value is None]
+        return bottleneck
+
+
+    def __compute(self) -> list:
+        """
+        Compute results of each group. A group without stalls/cycles has no results.
+
+        Returns:
+            List of dictionaries with the name, launches, percentage of cycles, parts of level one
+            and bottleneck of each group
+        """
+
+        tags : list = self.__level_execution.launch_tags(self.__kind)
+        if tags is None:
+            tags = list()
+        selected_launches : list = self.__level_execution.selected_launches()
+        launches_of_group : dict = dict()
+        i : int
+        for i in (range(0, self.__level_execution.num_launches()) if selected_launches is None else selected_launches):
+            launches_of_group.setdefault(tags[i] if i < len(tags) and not tags[i] is None
+                else LaunchGroupsParameters.C_UNTAGGED_GROUP_NAME, list()).append(i)
+        cycles : list = self.__level_execution.cycles_elapsed()
+        total_cycles : float = sum(cycles[i] for launches in launches_of_group.values() for i in launches if i < len(cycles))
+        groups : list = list()
+        tree : list
+        try:
+            for name, launches in launches_of_group.items():
+                self.__level_execution.select_launches(launches)
+                try:
+                    tree = self.__level_execution.topdown_tree()
+                except ZeroDivisionError: # group without stalls/cycles
+                    tree = list()
+                groups.append({"name" : name, "launches" : len(launches),
+                    "cycles" : (sum(cycles[i] for i in launches if i < len(cycles))/total_cycles)*100.0 if total_cycles > 0 else None,
+                    "parts" : [(part_name, value) for part_name, parent_name, value in tree if parent_name == ""],
+                    "bottleneck" : self.__bottleneck(tree)})
+        finally:
+            self.__level_execution.select_launches(selected_launches)
+        return groups
+
+
+    def groups(self) -> list:
+        """
+        Get the results of each group. They are only computed the first time.
+
+        Returns:
+            List of dictionaries with the keys 'name', 'launches' (number of launches), 'cycles'
+            (% of the cycles of the launches), 'parts' (list of tuples (name, value) of the parts of
+            level one) and 'bottleneck' (name of the deepest part with the highest degradation)
+        """
+
+        if self.__groups is None:
+            self.__groups = self.__compute()
+        return self.__groups
+
+
+    def imbalance(self) -> tuple:
+        """
+        Get the load imbalance between the groups: how much the cycles of the group with most cycles
+        exceed the mean of the groups (e.g. the ranks of an MPI job wait for the slowest one).
+
+        Returns:
+            Tuple (percentage of the mean exceeded, name of the group with most cycles), or 'None' if
+            there are less than two groups with cycles
+        """
+
+        groups : list = [group for group in self.groups() if not group["cycles"] is None]
+        if len(groups) < 2:
+            return None
+        mean : float = sum(group["cycles"] for group in groups)/len(groups)
+        slowest : dict = max(groups, key = lambda group: group["cycles"])
+        if mean <= 0:
+            return None
+        return ((slowest["cycles"]/mean - 1.0)*100.0, slowest["name"])
+
+
+    def report_str(self, decimals : int) -> str:
+        """
+        Get table with the results of each group.
+
+        Args:
+            decimals    : int   ; number of decimals of the values
+
+        Returns:
+            String with the table
+        """
+
+        groups : list = self.groups()
+        names : list = list()
+        for group in groups:
+            names += [name for name, value in group["parts"] if not name in names]
+        titles : list = ([LaunchGroupsParameters.C_GROUP_COLUMN_TITLE, LaunchGroupsParameters.C_LAUNCHES_COLUMN_TITLE,
+            LaunchGroupsParameters.C_CYCLES_COLUMN_TITLE] + names + [LaunchGroupsParameters.C_BOTTLENECK_COLUMN_TITLE])
+        rows : list = list()
+        values : dict
+        for group in groups:
+            values = dict(group["parts"])
+            rows.append([group["name"][:LaunchGroupsParameters.C_GROUP_NAME_MAX_LENGTH], str(group["launches"]),
+                self.__value_str(group["cycles"], decimals)] + [self.__value_str(values.get(name), decimals) for name in names] +
+                [LaunchGroupsParameters.C_NOT_AVAILABLE_VALUE if group["bottleneck"] is None else group["bottleneck"]])
+        lengths : list = [max([len(title) + 2, LaunchGroupsParameters.C_VALUE_COLUMN_MIN_LENGTH] + [len(row[i]) + 2 for row in rows])
+            for i, title in enumerate(titles)]
+        lines : list = ["".join("%-*s" % (lengths[i], title) for i, title in enumerate(titles))]
+        lines.append("-"*len(lines[0]))
+        lines += ["".join("%-*s" % (lengths[i], value) for i, value in enumerate(row)) for row in rows]
+        return "\n".join(lines)
+
+
+    def __value_str(self, value : float, decimals : int) -> str:
+        """ Get value rounded as string, or not available mark if it's 'None'."""
+
+        if value is None:
+            return LaunchGroupsParameters.C_NOT_AVAILABLE_VALUE
+        return str(round(value, decimals))
@@ -6,16 +6,32 @@ Class that represents the levels of the execution.
 """
 
 import locale
+import re
+import shlex
+import numpy as np
 from abc import ABC, abstractmethod # abstract class
 import os, sys, inspect
 currentdir = os.path.dirname(os.path.abspath(inspect.getfile(inspect.currentframe())))
 parentdir = os.path.dirname(currentdir)
 sys.path.insert(0, parentdir)  
-from shell.shell import Shell # launch shell arguments
+from profiler.profiler_backend import ProfilerBackend # NVIDIA tools (or stand-in)
+from profiler.metric_availability import MetricAvailability
+from profiler.mpi_ranks import MpiRanks
+from architecture.architecture_database import Architecture, ArchitectureDatabase
 from parameters.level_execution_params import LevelExecutionParameters # parameters of program
+from parameters.metric_availability_params import MetricAvailabilityParameters
 from errors.level_execution_errors import *
+from errors.metric_availability_errors import *
 from parameters.topdown_params import TopDownParameters 
 from graph.pie_chart import PieChart
+from timings.timings import Timings
+from parameters.timings_params import TimingsParameters
+from graph.static_graph_renderer import StaticGraphRenderer
+from graph.hierarchy_chart import HierarchyChart
+from parameters.graph_params import GraphParameters
+from measure_parts.metric_measure import MetricMeasure, MetricMeasureNvprof
+from aggregation.aggregations import Aggregations
+from parameters.aggregations_params import AggregationsParameters
 
 class LevelExecution(ABC):
     """ 
@@ -37,6 +53,51 @@ class LevelExecution(ABC):
 
         _compute_capability     : float         ; Compute Capbility of the execution
 
+        _architecture           : Architecture  ; architecture of the device (max IPC, names of metrics...)
+
+        _kernels                : list          ; names of the kernels launched, in launch order. Each
+                                                  launch is an index of dictionaries used by this program
+
+        _selected_launches      : list          ; indexes of the launches taken into account when results
+                                                  are computed, or 'None' to use all of them
+
+        _cycles_elapsed         : list          ; cycles elapsed (float) in each launch. 'None' if they
+                                                  have not been computed yet
+
+        _total_cycles_elapsed   : float         ; cycles elapsed in the selected launches. 'None' if they
+                                                  have not been computed yet
+
+        _profiler_options       : list          ; extra options (arguments) of the NVIDIA scan tool
+
+        _launch_tags            : dict          ; kind of tag (NVTX range...) as key and list with the tag of
+                                                  each launch ('None' if launch has no tag) as value
+
+        _optional_parts         : list          ; parts measured on demand which are not part of the TopDown
+                                                  hierarchy (Roofline...)
+
+        _metrics_check          : str           ; what is done with the measures not supported by the device
+                                                  before launching the scan tool ('reject', 'prune' or 'off')
+
+        _mpi_ranks              : MpiRanks      ; ranks of the MPI job measured (each one with its own scan tool),
+                                                  or 'None' if the program is not an MPI job
+
+        _skipped_parts          : list          ; parts whose measures are not collected (branches of the TopDown
+                                                  hierarchy which don't matter). Their results are 'None'
+
+        _collected_measures     : set           ; names of the only measures (metrics/events) collected, or 'None'
+                                                  to collect all of them (e.g. a cheap pass with cycles and IPC)
+
+        _pruned_measures        : list          ; names (in the device) of the measures not collected because they
+                                                  are not supported by the device
+
+        _measure_arrays         : dict          ; id of the list of values of a metric/event as key and tuple (list,
+                                                  numpy array with its values as float) as value. Values are converted once
+
+        _selection_arrays       : dict          ; arrays of the selected launches (indexes and weights), computed
+                                                  once per selection
+
+        _column_launches        : np.ndarray    ; launches whose results are computed column-wise (each value is
+                                                  an array with the value in each launch), or 'None'
     """
     
     def __init__(self, program : str, input_file : str, output_file : str, output_scan_file : str, collect_metrics : bool):
@@ -45,12 +106,27 @@ class LevelExecution(ABC):
         self._collect_metrics : bool = collect_metrics
         self._input_file : str = input_file
         self._output_scan_file : str = output_scan_file
-        shell : Shell = Shell()
-        compute_capability_str : str = shell.launch_command_show_all("nvcc $DIR_UNTIL_TOPDOWN/TopDownNvidia/src/measure_parts/compute_capability.cu --run", None)
-        shell.launch_command("rm -f $DIR_UNTIL_TOPDOWN/TopDownNvidia/src/measure_parts/a.out", None) # delete 'a.out' generated
-        if not compute_capability_str:
+        with Timings.span(TimingsParameters.C_SPAN_DEVICE_PROBE):
+            compute_capability : float = ProfilerBackend.current().compute_capability()
+        if compute_capability is None:
             raise ComputeCapabilityError
-        self._compute_capability : float = float(compute_capability_str)
+        self._compute_capability : float = compute_capability
+        self._architecture : Architecture = ArchitectureDatabase.architecture(compute_capability)
+        self._kernels : list = list()
+        self._selected_launches : list = None
+        self._cycles_elapsed : list = None
+        self._total_cycles_elapsed : float = None
+        self._profiler_options : list = list()
+        self._launch_tags : dict = dict()
+        self._optional_parts : list = list()
+        self._metrics_check : str = MetricAvailabilityParameters.C_CHECK_MODE_DEFAULT
+        self._mpi_ranks : MpiRanks = None
+        self._skipped_parts : list = list()
+        self._collected_measures : set = None
+        self._pruned_measures : list = list()
+        self._measure_arrays : dict = dict()
+        self._selection_arrays : dict = dict()
+        self._column_launches : np.ndarray = None
 
     @abstractmethod
     def _generate_command(self) -> str:
@@ -88,9 +164,71 @@ class LevelExecution(ABC):
         pass
         
 
+    @abstractmethod
+    def _metric_availability(self) -> MetricAvailability:
+        """
+        Get measures supported by the device with the NVIDIA scan tool.
+
+        Returns:
+            Reference to MetricAvailability of the scan tool
+        """
+
+        pass
+        
+
+    def set_metrics_check(self, mode : str):
+        """
+        Set what is done with the measures not supported by the device before launching the scan tool.
+
+        Args:
+            mode    : str   ; 'reject' (error), 'prune' (they are not collected) or 'off' (not checked)
+        """
+
+        self._metrics_check = mode
+        
+
+    def metrics_check(self) -> str:
+        """
+        Returns what is done with the measures not supported by the device before launching the scan tool.
+
+        Returns:
+            String with the mode ('reject', 'prune' or 'off')
+        """
+
+        return self._metrics_check
+        
+
+    def _check_measures(self, command : str) -> str:
+        """
+        Check that the measures of the command are supported by the device, so the scan tool doesn't
+        fail after running the whole application. Pruned measures are kept (see 'pruned_measures').
+
+        Args:
+            command : str   ; command of the scan tool (with names of measures of the device)
+
+        Returns:
+            String with the command, without the measures not supported if they must be pruned
+
+        Raises:
+            UnsupportedMeasuresError    ; raised if some measure is not supported and they must be rejected
+        """
+
+        if self._metrics_check == MetricAvailabilityParameters.C_CHECK_MODE_OFF:
+            return command
+        with Timings.span(TimingsParameters.C_SPAN_METRICS_CHECK):
+            availability : MetricAvailability = self._metric_availability()
+            unsupported : list = availability.unsupported(command)
+        if not unsupported:
+            return command
+        if self._metrics_check == MetricAvailabilityParameters.C_CHECK_MODE_PRUNE:
+            self._pruned_measures += [name for name in unsupported if not name in self._pruned_measures]
+            return availability.prune(command)
+        raise UnsupportedMeasuresError(unsupported, availability.cache_file())
+        
+
     def _launch(self, command : str) -> str:
         """ 
-        Launch NVIDIA scan tool.
+        Launch NVIDIA scan tool. Measures of the command are checked before.
         
         Args:
             command : str ; String with command
@@ -99,16 +237,355 @@ class LevelExecution(ABC):
             String with results.
 
         Raises:
-            ProfilingError  ; raised in case of error reading results from NVIDIA scan tool
+            ProfilingError              ; raised in case of error reading results from NVIDIA scan tool
+
+            UnsupportedMeasuresError    ; raised if some measure is not supported by the device (and
+                                          they must be rejected)
         """
 
-        shell : Shell = Shell()
-        output_command : str = shell.launch_command_redirect(command, LevelExecutionParameters.C_INFO_MESSAGE_EXECUTION, self.output_scan_file(), True)
+        command = self._check_measures(self._architecture.to_device_names(self._skip_measures(command)))
+        if self._mpi_ranks is not None:
+            command = self._mpi_ranks.command(command)
+        with Timings.span(TimingsParameters.C_SPAN_PROFILER):
+            output_command : str = ProfilerBackend.current().launch(self, command, self.output_scan_file())
         if output_command is None:
             raise ProfilingError
         return output_command  
         
     
+    def skip_branches(self, names : list):
+        """
+        Don't collect the measures of the parts below the parts indicated in the TopDown hierarchy (e.g.
+        'BACK-END.MEMORY-BOUND' and 'BACK-END.CORE-BOUND' below 'BACK-END'). Parts computed with the
+        measures of their parent (without measures of their own) are not skipped.
+
+        Args:
+            names   : list  ; names of the parts (FRONT-END...) whose branch is not measured
+        """
+
+        separator : str = GraphParameters.C_HIERARCHY_PART_NAME_SEPARATOR
+        self._skipped_parts = [part for part in self.measure_parts() if any(part.name().startswith(name + separator)
+            for name in names) and (part.metrics() or (isinstance(part, MetricMeasureNvprof) and part.events()))]
+        
+
+    def skipped_parts(self) -> list:
+        """
+        Returns the parts whose measures are not collected.
+
+        Returns:
+            List with references to the parts, in order of 'measure_parts'
+        """
+
+        return self._skipped_parts
+        
+
+    def _is_skipped(self, part : MetricMeasure) -> bool:
+        """
+        Check if measures of the part are not collected.
+
+        Args:
+            part    : MetricMeasure ; part of the execution
+
+        Returns:
+            True if measures of the part are not collected or False if not
+        """
+
+        return any(part is skipped_part for skipped_part in self._skipped_parts)
+        
+
+    def collect_only(self, names : set):
+        """
+        Only collect the measures indicated, so the NVIDIA scan tool is cheaper to run. Results of the
+        parts which need other measures can't be computed.
+
+        Args:
+            names   : set   ; names of the metrics/events collected, or 'None' to collect all of them
+        """
+
+        self._collected_measures = names
+        
+
+    def pruned_measures(self) -> list:
+        """
+        Get the measures not collected because they are not supported by the device (with
+        '--metrics-check prune').
+
+        Returns:
+            List with the names of the metrics/events in the device
+        """
+
+        return self._pruned_measures
+        
+
+    def not_collected_measures(self) -> set:
+        """
+        Get the measures of the parts which are not collected: the ones of the skipped parts (if they are
+        not used by other parts) and the ones which are not in the measures to collect.
+
+        Returns:
+            Set with the names of the metrics/events
+        """
+
+        used_names : set = set()
+        not_collected_names : set = set()
+        names : set
+        for part in self.measure_parts():
+            names = set(part.metrics().keys())
+            if isinstance(part, MetricMeasureNvprof):
+                names |= set(part.events().keys())
+            if self._is_skipped(part):
+                not_collected_names |= names
+            else:
+                used_names |= names
+        not_collected_names -= used_names
+        if self._collected_measures is not None:
+            not_collected_names |= used_names - self._collected_measures
+        return not_collected_names
+        
+
+    def _skip_measures(self, command : str) -> str:
+        """
+        Remove the measures which are not collected (see 'not_collected_measures') from the command of
+        the NVIDIA scan tool.
+
+        Args:
+            command : str   ; command of the scan tool
+
+        Returns:
+            String with the command without the measures not collected
+        """
+
+        if not self._skipped_parts and self._collected_measures is None:
+            return command
+        not_collected_names : set = self.not_collected_measures()
+        for option in [MetricAvailabilityParameters.C_METRICS_OPTION, MetricAvailabilityParameters.C_EVENTS_OPTION]:
+            command = re.sub(LevelExecutionParameters.C_MEASURES_OPTION_REGEX_FORMAT % re.escape(option), lambda match: 
+                match.group(1) + ",".join(name for name in match.group(2).split(",") if name == "" or not name in not_collected_names), 
+                command)
+        return command
+        
+
+    def set_mpi_ranks(self, mpi_ranks : MpiRanks):
+        """
+        Set ranks of the MPI job measured. Results of each rank are read from its own file. If the
+        ranks are launched, options of the scan tool to write those files must be added too.
+
+        Args:
+            mpi_ranks   : MpiRanks  ; ranks of the MPI job, or 'None' if the program is not an MPI job
+        """
+
+        self._mpi_ranks = mpi_ranks
+        
+
+    def mpi_ranks(self) -> MpiRanks:
+        """
+        Returns ranks of the MPI job measured.
+
+        Returns:
+            Reference to MpiRanks, or 'None' if the program is not an MPI job
+        """
+
+        return self._mpi_ranks
+        
+
+    def add_profiler_options(self, options : list):
+        """
+        Add options (arguments) to the command of the NVIDIA scan tool.
+
+        Args:
+            options : list  ; arguments of the scan tool, in order (e.g. ['--nvtx-include', 'forward/'])
+        """
+
+        self._profiler_options += options
+        
+
+    def _profiler_flags(self) -> str:
+        """
+        Get extra options of the NVIDIA scan tool, ready to be inserted in the command.
+
+        Returns:
+            String with the options (quoted if necessary) followed by a space, or "" if there are no options
+        """
+
+        if not self._profiler_options:
+            return ""
+        return " ".join(shlex.quote(option) for option in self._profiler_options) + " "
+        
+
+    def _prepare_results(self, output_command : str) -> str:
+        """
+        Prepare results of NVIDIA scan tool before parsing them. By default, names of metrics/events
+        of the architecture of the device are replaced with the names used by this program.
+
+        Args:
+            output_command  : str   ; results of NVIDIA scan tool
+
+        Returns:
+            String with the results which are parsed
+        """
+
+        return self._architecture.from_device_names(output_command)
+        
+
+    def parse_results(self, output_command : str):
+        """
+        Set results of execution ALREADY DONE from the raw results of NVIDIA scan tool: results are
+        prepared (see '_prepare_results') before they are set.
+
+        Args:
+            output_command  : str   ; results of NVIDIA scan tool
+        """
+
+        self.set_results(self._prepare_results(output_command))
+        
+
+    def set_launch_tags(self, kind : str, tags : list):
+        """
+        Set the tag of each launch.
+
+        Args:
+            kind    : str   ; kind of tag (NVTX range...)
+
+            tags    : list  ; tag of each launch, in launch order ('None' if launch has no tag)
+        """
+
+        self._launch_tags[kind] = tags
+        
+
+    def launch_tags(self, kind : str) -> list:
+        """
+        Returns the tag of each launch.
+
+        Args:
+            kind    : str   ; kind of tag (NVTX range...)
+
+        Returns:
+            List with the tag of each launch ('None' if launch has no tag), or 'None' if
+            launches have not been tagged with that kind
+        """
+
+        return self._launch_tags.get(kind)
+        
+
+    def launch_tag_kinds(self) -> list:
+        """
+        Returns the kinds of tag (NVTX range...) of the launches.
+
+        Returns:
+            List with the kinds of tag, in the order they were set
+        """
+
+        return list(self._launch_tags.keys())
+        
+
+    def process_launches(self, processes : list) -> list:
+        """
+        Get the launches of the processes indicated.
+
+        Args:
+            processes   : list  ; PID (only digits) or part of the command of each process
+
+        Returns:
+            List with the indexes of the launches (in launch order)
+        """
+
+        tags : list = self.launch_tags(LevelExecutionParameters.C_PROCESS_TAG)
+        if tags is None:
+            return list()
+        launches : list = list()
+        for i, tag in enumerate(tags):
+            if tag is None:
+                continue
+            for process in processes:
+                if process.isdigit(): # PID, not part of the command ('12' in 'train12.py')
+                    if tag.startswith(LevelExecutionParameters.C_PROCESS_TAG_FORMAT % (process, "")):
+                        launches.append(i)
+                        break
+                elif process in tag[tag.find("] ") + 2:]:
+                    launches.append(i)
+                    break
+        return launches
+        
+
+    def add_launches(self, level_execution, tags : dict):
+        """
+        Append the launches of other execution of the same level (rank of an MPI job...) with their
+        values, kernels and tags, after the launches of this execution.
+
+        Args:
+            level_execution : LevelExecution    ; execution ALREADY DONE of the same class (and parts)
+
+            tags            : dict              ; kind of tag as key and tag of all the launches appended as value
+        """
+
+        num_launches : int = self.num_launches()
+        num_new_launches : int = level_execution.num_launches()
+        merged_parts : set = set()
+        for part, new_part in zip(self.measure_parts(), level_execution.measure_parts()):
+            if not id(part) in merged_parts: # a part may be returned more than once
+                merged_parts.add(id(part))
+                part.add_values(new_part)
+        self._kernels += level_execution.kernels()
+        kinds : list = self.launch_tag_kinds() + [kind for kind in level_execution.launch_tag_kinds() + list(tags.keys())
+            if not kind in self._launch_tags]
+        launch_tags : list
+        new_tags : list
+        for kind in kinds:
+            launch_tags = list(self._launch_tags.get(kind, list()))[:num_launches]
+            launch_tags += [None]*(num_launches - len(launch_tags))
+            if kind in tags:
+                new_tags = [tags[kind]]*num_new_launches
+            else:
+                new_tags = list(level_execution.launch_tags(kind) or list())[:num_new_launches]
+                new_tags += [None]*(num_new_launches - len(new_tags))
+            self._launch_tags[kind] = launch_tags + new_tags
+        self._cycles_elapsed = None
+        self._total_cycles_elapsed = None
+        self._measure_arrays = dict()
+        self._selection_arrays = dict()
+        
+
+    def add_optional_part(self, part : MetricMeasure):
+        """
+        Add part which is not part of the TopDown hierarchy (Roofline...). Its measures are collected
+        with the measures of the level. It must be added before running the level.
+
+        Args:
+            part    : MetricMeasure ; part of the same NVIDIA scan tool as the level
+        """
+
+        self._optional_parts.append(part)
+        
+
+    def optional_part(self, part_class : type) -> MetricMeasure:
+        """
+        Returns the optional part of the class indicated.
+
+        Args:
+            part_class  : type  ; class of the part (Roofline...)
+
+        Returns:
+            Reference to the part, or 'None' if it has not been added
+        """
+
+        part : MetricMeasure
+        for part in self._optional_parts:
+            if isinstance(part, part_class):
+                return part
+        return None
+        
+
+    def _optional_metrics_str(self) -> str:
+        """
+        Get metrics of the optional parts, ready to be appended to the metrics of the command.
+
+        Returns:
+            String with the metrics, each one preceded by a comma, or "" if there are no metrics
+        """
+
+        return "".join("," + part.metrics_str() for part in self._optional_parts if part.metrics_str() != "")
+        
+
     @abstractmethod
     def _get_results(self, lst_output):
         """ 
@@ -121,6 +598,18 @@ class LevelExecution(ABC):
         pass
         
 
+    def measures_table(self, lst_output : list):
+        """
+        Add the tables of the measures (metrics/events) of the selected launches, shown with '-m'/'-e',
+        to the list.
+
+        Args:
+            lst_output  : list  ; OUTPUT list with results
+        """
+
+        self._get_results(lst_output)
+        
+
     def get_device_max_ipc(self) -> float:
         """
         Get Max IPC of device.
@@ -129,16 +618,41 @@ class LevelExecution(ABC):
             Float with the max IPC supported by GPU
         """
 
-        dict_warps_schedulers_per_cc : dict = dict({3.0: 4, 3.2: 4, 3.5: 4, 3.7: 4, 5.0: 4, 5.2: 4, 5.3: 4, 
-            6.0: 2, 6.1: 4, 6.2: 4, 7.0: 4, 7.2: 4, 7.5: 4, 8.0: 1}) 
-        dict_ins_per_cycle : dict = dict({3.0: 2, 3.2: 2, 3.5: 2, 3.7: 2, 5.0: 2, 5.2: 2, 5.3: 2, 
-            6.0: 2, 6.1: 2, 6.2: 2, 7.0: 1, 7.2: 1, 7.5: 1, 8.0: 1})
-        return dict_warps_schedulers_per_cc.get(self._compute_capability)*dict_ins_per_cycle.get(self._compute_capability)
+        return self._architecture.max_ipc()
+        
+
+    def architecture(self) -> Architecture:
+        """
+        Returns architecture of the device.
+
+        Returns:
+            Reference to Architecture of the device
+        """
+
+        return self._architecture
         
     
+    def measure_value_to_float(self, value_str : str) -> float:
+        """
+        Convert value of metric/event (as it is written by NVIDIA scan tool) to float.
+
+        Args:
+            value_str   : str   ; value of metric/event
+
+        Returns:
+            Float with the value
+        """
+
+        if value_str[len(value_str) - 1] == "%":
+            return float(value_str[0:len(value_str) - 1])
+        if self._compute_capability > TopDownParameters.C_COMPUTE_CAPABILITY_NVPROF_MAX_VALUE:
+            return locale.atof(value_str)
+        return float(value_str)
+        
+
     def _get_total_value_of_list(self, list_values, computed_as_average : bool) -> float:
         """
-        Get total value of list of metric/event.
+        Get total value of list of metric/event. Only the selected launches are taken into account.
     
         Args:
             list_values         : list ; list to be computed
@@ -151,26 +665,244 @@ class LevelExecution(ABC):
             Float with total value of the list
         """
         
-        i : int = 0
+        return self._aggregate_list(list_values, AggregationsParameters.C_CYCLES_WEIGHTED_STRATEGY if computed_as_average
+            else AggregationsParameters.C_SUM_STRATEGY)
+        
+
+    def _get_measure_total_value(self, name : str, list_values, default_strategy : str) -> float:
+        """
+        Get total value of list of metric/event with the strategy declared for it in 'C_MEASURE_STRATEGIES'.
+        Only the selected launches are taken into account.
+    
+        Args:
+            name                : str   ; name of the metric/event
+
+            list_values         : list  ; list to be computed
+
+            default_strategy    : str   ; strategy used if the metric/event has not strategy declared
+
+        Returns:
+            Float with total value of the list
+        """
+
+        return self._aggregate_list(list_values, Aggregations.strategy(name, default_strategy))
+        
+
+    def _aggregate_list(self, list_values, strategy : str) -> float:
+        """
+        Combine values of list of metric/event in the selected launches with the strategy indicated.
+    
+        Args:
+            list_values     : list  ; list to be computed
+
+            strategy        : str   ; name of the strategy (registered in Aggregations)
+
+        Returns:
+            Float with total value of the list
+
+        Raises:
+            AggregationStrategyError    ; strategy is not registered
+
+            ElapsedCyclesError          ; cycles elapsed of a launch cannot be obtained
+        """
+
+        if not self._column_launches is None: # value of each launch (any strategy of one launch)
+            return self.__column_values(self._measure_array(list_values))
+        weights_kind : str = Aggregations.weights(strategy)
+        return Aggregations.aggregate(strategy, self._measure_array(list_values)[self._launches_array(len(list_values))], 
+            None if weights_kind is None else self._launch_weights(weights_kind, len(list_values)))
+        
+
+    def __column_values(self, values : np.ndarray) -> np.ndarray:
+        """ Get values of the launches computed column-wise (0 in launches without value, as an empty selection)."""
+
+        column : np.ndarray = np.zeros(len(self._column_launches))
+        in_range : np.ndarray = self._column_launches < len(values)
+        column[in_range] = values[self._column_launches[in_range]]
+        return column
+        
+
+    def _ratio(self, numerator, denominator):
+        """
+        Get numerator/denominator, or 0 where denominator is not positive. Values are floats or arrays with
+        the value in each launch (see 'topdown_results_per_launch').
+        """
+
+        positive = np.asarray(denominator) > 0.0
+        return np.where(positive, np.asarray(numerator)/np.where(positive, denominator, 1.0), 0.0)[()]
+        
+
+    def topdown_results_per_launch(self, launches : list) -> dict:
+        """
+        Get the results of the TopDown methodology in each launch indicated, computed column-wise: each
+        metric/event is taken as the array of its values in the launches, so results are computed once for
+        all the launches instead of once per launch selected.
+
+        Args:
+            launches    : list  ; indexes of the launches
+
+        Returns:
+            Dictionary with the name of the result as key and list with its value (float) in each launch as value,
+            'None' in launches without cycles elapsed or where the result is not defined (division by zero...)
+        """
+
+        self._column_launches = np.asarray(launches, dtype = np.intp)
+        try:
+            with np.errstate(divide = "ignore", invalid = "ignore"):
+                results : dict = self.topdown_results()
+        finally:
+            self._column_launches = None
+        cycles : np.ndarray = self._cycles_elapsed_array()
+        has_cycles : list = [i < len(cycles) and cycles[i] > 0.0 for i in launches]
+        launch_results : dict = dict()
+        values : np.ndarray
+        for name, value in results.items():
+            if value is None:
+                launch_results[name] = [None]*len(launches)
+                continue
+            values = np.broadcast_to(np.asarray(value, dtype = float), (len(launches),))
+            launch_results[name] = [float(values[i]) if has_cycles[i] and np.isfinite(values[i]) else None 
+                for i in range(0, len(launches))]
+        return launch_results
+        
+
+    def _measure_array(self, list_values) -> np.ndarray:
+        """
+        Get values of list of metric/event in each launch as a numpy array of floats. Values are
+        converted only the first time (until launches are added).
+
+        Args:
+            list_values : list  ; list of values (as they are written by NVIDIA scan tool)
+
+        Returns:
+            numpy array with the values
+
+        Raises:
+            ValueError  ; a value is not a number
+        """
+
+        cached : tuple = self._measure_arrays.get(id(list_values))
+        if cached is None or not cached[0] is list_values or len(cached[1]) != len(list_values):
+            cached = (list_values, np.array([self.measure_value_to_float(value) for value in list_values], dtype = float))
+            self._measure_arrays[id(list_values)] = cached
+        return cached[1]
+        
+
+    def _launches_array(self, num_values : int) -> np.ndarray:
+        """
+        Get the indexes of the selected launches in a list of values as a numpy array. It's only
+        computed once per selection of launches.
+
+        Args:
+            num_values  : int   ; number of values of the list
+
+        Returns:
+            numpy array with the indexes of the selected launches (lower than 'num_values')
+        """
+
+        key : tuple = ("indexes", num_values)
+        if not key in self._selection_arrays:
+            self._selection_arrays[key] = np.fromiter(self._launches_indexes(num_values), dtype = np.intp)
+        return self._selection_arrays[key]
+        
+
+    def _measure_floats(self, name : str) -> np.ndarray:
+        """
+        Get values (float) of metric/event in each launch.
+
+        Args:
+            name    : str   ; name of the metric/event
+
+        Returns:
+            numpy array with the values, or 'None' if the metric/event is not measured or a value is not a number
+        """
+
+        part : MetricMeasure
+        values : list
+        for part in self.measure_parts():
+            values = part.metrics().get(name)
+            if values is None and isinstance(part, MetricMeasureNvprof):
+                values = part.events().get(name)
+            if values is None:
+                continue
+            try:
+                return self._measure_array(values)
+            except ValueError:
+                return None
+        return None
+        
+
+    def _cycles_elapsed_array(self) -> np.ndarray:
+        """ Get cycles elapsed in each launch as a numpy array (see 'cycles_elapsed')."""
+
+        return self._measure_weights_array(AggregationsParameters.C_CYCLES_WEIGHTS, 
+            lambda: np.asarray(self.cycles_elapsed(), dtype = float))
+        
+
+    def _measure_weights_array(self, kind : str, compute) -> np.ndarray:
+        """ Get (and cache until launches are added) the values of each launch used as weights of a kind."""
+
+        key : tuple = ("weights", kind)
+        if not key in self._measure_arrays:
+            self._measure_arrays[key] = compute()
+        return self._measure_arrays[key]
+        
+
+    def _launch_weights(self, kind : str, num_values : int) -> np.ndarray:
+        """
+        Get weight of the selected launches in a list of values: fraction of their cycles, duration or 
+        instructions (IPC by cycles) in the selected launches. If duration or instructions are not measured,
+        cycles are used. They are only computed once per selection of launches.
+
+        Args:
+            kind        : str   ; kind of weights ('C_CYCLES_WEIGHTS', 'C_DURATION_WEIGHTS' or 'C_INSTRUCTIONS_WEIGHTS')
+
+            num_values  : int   ; number of values of the list
+
+        Returns:
+            numpy array with the weight (float) of each selected launch (lower than 'num_values')
+
+        Raises:
+            ElapsedCyclesError      ; cycles elapsed of a launch cannot be obtained
+
+            ZeroDivisionError       ; there are no cycles elapsed in the selected launches
+        """
+
+        key : tuple = (kind, num_values)
+        if key in self._selection_arrays:
+            return self._selection_arrays[key]
+        indexes : np.ndarray = self._launches_array(num_values)
+        launch_values : np.ndarray = None
+        if kind == AggregationsParameters.C_DURATION_WEIGHTS:
+            launch_values = self._measure_floats(AggregationsParameters.C_DURATION_METRIC_NAME_NSIGHT)
+        elif kind == AggregationsParameters.C_INSTRUCTIONS_WEIGHTS:
+            launch_values = self._measure_weights_array(kind, self.__instructions_array)
         total_value : float = 0.0
-        value_str : str = ""
-        value : float = 0.0
-        for value_str in list_values:
-            if value_str[len(value_str) - 1] == "%":
-                value = float(value_str[0:len(value_str) - 1])
-                if computed_as_average:
-                    value *= (self._percentage_time_kernel(i)/100.0)
-                total_value += value
-            else:
-                if self._compute_capability > TopDownParameters.C_COMPUTE_CAPABILITY_NVPROF_MAX_VALUE:
-                    value = locale.atof(value_str)
-                else:
-                    value = float(value_str)
-                if computed_as_average:
-                    value *= (self._percentage_time_kernel(i)/100.0)
-                total_value += value
-            i += 1
-        return total_value
+        if not launch_values is None and (len(indexes) == 0 or indexes.max() < len(launch_values)):
+            total_value = float(launch_values[self._launches_array(len(launch_values))].sum())
+        if total_value <= 0.0:
+            launch_values = self._cycles_elapsed_array()
+            if len(indexes) > 0 and indexes.max() >= len(launch_values):
+                raise ElapsedCyclesError
+            total_value = float(launch_values[self._launches_array(len(launch_values))].sum())
+            if len(indexes) > 0 and total_value == 0.0:
+                raise ZeroDivisionError # as the percentage of cycles of each launch
+        weights : np.ndarray = launch_values[indexes]/total_value if len(indexes) > 0 else np.zeros(0)
+        self._selection_arrays[key] = weights
+        return weights
+        
+
+    def __instructions_array(self) -> np.ndarray:
+        """ Get instructions (IPC by cycles elapsed) of each launch, or 'None' if IPC is not measured."""
+
+        ipc : np.ndarray = self._measure_floats(LevelExecutionParameters.C_IPC_METRIC_NAME_NSIGHT)
+        if ipc is None:
+            ipc = self._measure_floats(LevelExecutionParameters.C_IPC_METRIC_NAME_NVPROF)
+        if ipc is None:
+            return None
+        cycles : np.ndarray = self._cycles_elapsed_array()
+        num_values : int = min(len(ipc), len(cycles))
+        return ipc[:num_values]*cycles[:num_values]
         
 
     def _get_stalls_of_part(self, dict : dict) -> float:
@@ -186,7 +918,7 @@ class LevelExecution(ABC):
 
         total_value : float = 0.0
         for key in dict.keys():
-            total_value += self._get_total_value_of_list(dict.get(key), True)
+            total_value += self._get_measure_total_value(key, dict.get(key), AggregationsParameters.C_RATE_DEFAULT_STRATEGY)
         return total_value
         
     
@@ -203,10 +935,32 @@ class LevelExecution(ABC):
 
         total_value : float = 0.0
         for key in dict.keys():
-            total_value += self._get_total_value_of_list(dict.get(key), True)
+            total_value += self._get_measure_total_value(key, dict.get(key), AggregationsParameters.C_RATE_DEFAULT_STRATEGY)
         return total_value
         
 
+    def program(self) -> str:
+        """
+        Returns program of the execution.
+
+        Returns:
+            String with the program of the execution
+        """
+
+        return self._program
+        
+
+    def compute_capability(self) -> float:
+        """
+        Returns Compute Capability of the execution.
+
+        Returns:
+            Float with the Compute Capability
+        """
+
+        return self._compute_capability
+        
+
     def collect_metrics(self) -> bool:
         """
         Check if execution must collect NVIDIA's scan tool metrics.
@@ -250,21 +1004,188 @@ class LevelExecution(ABC):
         
         return self._output_scan_file
         
+
+    def set_output_scan_file(self, output_scan_file : str):
+        """
+        Set path to file where results of the NVIDIA scan tool are added.
+
+        Args:
+            output_scan_file    : str   ; path to output scan file, or 'None' to not save results
+        """
+
+        self._output_scan_file = output_scan_file
+        
  
+    def add_kernel(self, kernel_name : str):
+        """
+        Add kernel launched (in launch order).
+
+        Args:
+            kernel_name : str   ; name of the kernel
+        """
+
+        self._kernels.append(kernel_name)
+        self._cycles_elapsed = None
+        self._total_cycles_elapsed = None
+        self._measure_arrays = dict()
+        self._selection_arrays = dict()
+        
+
+    def kernels(self) -> list:
+        """
+        Returns the names of the kernels launched.
+
+        Returns:
+            List with the name of the kernel of each launch (in launch order)
+        """
+
+        return self._kernels
+        
+
+    def num_launches(self) -> int:
+        """
+        Returns the number of launches measured.
+
+        Returns:
+            Integer with the number of launches (the longest list of values of the measure parts)
+        """
+
+        num_launches : int = len(self._kernels)
+        part : MetricMeasure
+        for part in self.measure_parts():
+            for values in part.metrics().values():
+                if len(values) > num_launches:
+                    num_launches = len(values)
+            if isinstance(part, MetricMeasureNvprof):
+                for values in part.events().values():
+                    if len(values) > num_launches:
+                        num_launches = len(values)
+        return num_launches
+        
+
+    def select_launches(self, launches : list):
+        """
+        Select the launches taken into account when results are computed.
+
+        Args:
+            launches    : list  ; indexes of the launches, or 'None' to use all of them
+        """
+
+        self._selected_launches = launches
+        self._total_cycles_elapsed = None
+        self._selection_arrays = dict()
+        
+
+    def selected_launches(self) -> list:
+        """
+        Returns the launches taken into account when results are computed.
+
+        Returns:
+            List with the indexes of the launches or 'None' if all of them are used
+        """
+
+        return self._selected_launches
+        
+
+    def _launches_indexes(self, num_values : int):
+        """
+        Get the indexes of the selected launches in a list of values.
+
+        Args:
+            num_values  : int   ; number of values of the list
+
+        Returns:
+            Iterable with the indexes of the selected launches (lower than 'num_values')
+        """
+
+        if self._selected_launches is None:
+            return range(0, num_values)
+        return [i for i in self._selected_launches if i < num_values]
+        
+
+    @abstractmethod
+    def measure_parts(self) -> list:
+        """
+        Returns all the parts (FrontEnd, BackEnd...) measured in the execution.
+
+        Returns:
+            List with references to the parts of the execution
+        """
+
+        pass
+        
+    @abstractmethod
+    def topdown_results(self) -> dict:
+        """
+        Get the results of the TopDown methodology in the selected launches.
+
+        Returns:
+            Dictionary with the name of the result as key and its value (float) as value
+        """
+
+        pass
+        
     @abstractmethod
+    def topdown_tree(self) -> list:
+        """
+        Get the hierarchy of the parts of the TopDown methodology with their percentage of IPC 
+        (degradation or retired) in the selected launches.
+
+        Returns:
+            List of tuples (name of part, name of parent part or "" if it's a root part, value)
+        """
+
+        pass
+        
+    @abstractmethod
+    def _cycles_elapsed_per_kernel(self) -> list:
+        """ 
+        Get cycles elapsed in each Kernel based on cycles elapsed metric/event name.
+
+        Returns:
+            List with the cycles elapsed (float) in each kernel
+
+        Raises:
+            ElapsedCyclesError      ; cycles elapsed cannot be obtained
+        """
+        
+        pass
+        
+    def cycles_elapsed(self) -> list:
+        """ 
+        Get cycles elapsed in each launch (in launch order). They are only obtained the first time.
+
+        Returns:
+            List with the cycles elapsed (float) in each launch
+
+        Raises:
+            ElapsedCyclesError      ; cycles elapsed cannot be obtained
+        """
+
+        if self._cycles_elapsed is None:
+            self._cycles_elapsed = self._cycles_elapsed_per_kernel()
+        return self._cycles_elapsed
+        
+
     def _percentage_time_kernel(self, kernel_number : int) -> float:
         """ 
         Get time percentage in each Kernel based on cycles elapsed metric/event name
-        Each kernel measured is an index of dictionaries used by this program.
+        on the total of selected launches. Each kernel measured is an index of dictionaries 
+        used by this program.
 
         Args:
                 kernel_number                   : int   ; number of kernel
                 
-                cycles_elapsed_counter_name     : str   ; name of event/metric to obatin cycles elapsed in kernel
         Raises:
                 ElapsedCyclesError      ; cycles elapsed in 'kernel_number' cannot be obtained
         """
         
+        self.cycles_elapsed()
+        if self._total_cycles_elapsed is None:
+            self._total_cycles_elapsed = float(self._cycles_elapsed_array()[self._launches_array(len(self._cycles_elapsed))].sum())
+        if kernel_number >= len(self._cycles_elapsed):
+            raise ElapsedCyclesError
+        return (self._cycles_elapsed[kernel_number]/self._total_cycles_elapsed)*100.0
         
    
     @abstractmethod
@@ -294,9 +1215,10 @@ class LevelExecution(ABC):
     def showGraph(self):
         """Show graph to show results."""
         
-        graph : PieChart = self._create_graph()
-        self._add_graph_data(graph)
-        graph.show()
+        with Timings.span(TimingsParameters.C_SPAN_GRAPH_SHOW):
+            graph : PieChart = self._create_graph()
+            self._add_graph_data(graph)
+            graph.show()
         
 
     def saveGraph(self, file_str : str):
@@ -307,7 +1229,149 @@ class LevelExecution(ABC):
             file_str    : str   ; path to output file where save fig
         """
         
-        graph : PieChart = self._create_graph()
-        self._add_graph_data(graph)
-        graph.save(file_str)
+        with Timings.span(TimingsParameters.C_SPAN_GRAPH_SAVE):
+            graph : PieChart = self._create_graph()
+            self._add_graph_data(graph)
+            graph.save(file_str)
+        
+
+    def saveKernelGraphs(self, file_str : str, max_workers : int = GraphParameters.C_MAX_RENDER_WORKERS) -> list:
+        """ 
+        Save one graph per kernel, with the selected launches of the kernel grouped by its name (see 
+        '_kernel_groups'). Graphs are rendered concurrently in a pool of processes and each one is written in 
+        '<file_str without extension>_<rank>_<kernel><extension>', where rank 0 is the kernel with the most 
+        cycles elapsed. Format (html, png, svg or pdf) is obtained from the extension of the file.
+
+        Args:
+            file_str    : str   ; path to output file used as template of the name of each graph
+
+            max_workers : int   ; max number of processes which render graphs ('None' to use all CPUs)
+
+        Returns:
+            List with the paths to graph files written
+        """
+
+        with Timings.span(TimingsParameters.C_SPAN_GRAPH_KERNELS):
+            return self.__save_kernel_graphs(file_str, max_workers)
+        
+
+    def __save_kernel_graphs(self, file_str : str, max_workers : int) -> list:
+        """ Save one graph per kernel. See 'saveKernelGraphs'."""
+
+        root_str, extension = os.path.splitext(file_str)
+        renderer : StaticGraphRenderer = StaticGraphRenderer(max_workers)
+        selected_launches : list = self.selected_launches()
+        kernel_name : str
+        launches : list
+        graph : PieChart
+        try:
+            for i, (kernel_name, launches, percentage) in enumerate(self._kernel_groups()):
+                self.select_launches(launches)
+                graph = self._create_graph()
+                try:
+                    self._add_graph_data(graph)
+                except ZeroDivisionError: # kernel without stalls/cycles
+                    continue
+                graph.set_title(GraphParameters.C_KERNEL_GRAPH_TITLE % (i, kernel_name, len(launches)))
+                renderer.add(graph.to_json(), GraphParameters.C_KERNEL_GRAPH_FILE_FORMAT % (root_str, i, 
+                    re.sub(GraphParameters.C_KERNEL_GRAPH_NAME_INVALID_CHARS_REGEX, "_", 
+                    kernel_name)[:GraphParameters.C_KERNEL_GRAPH_NAME_MAX_LENGTH], extension))
+        finally:
+            self.select_launches(selected_launches)
+        return renderer.render()
+        
+
+    def _kernel_groups(self) -> list:
+        """
+        Group the selected launches by kernel's name.
+
+        Returns:
+            List of tuples (name of kernel, list with the indexes of its launches, % of cycles elapsed), 
+            from the biggest kernel (by percentage of cycles elapsed) to the smallest
+        """
+
+        kernels : list = self.kernels()
+        launches_of_kernel : dict = dict()
+        time_of_kernel : dict = dict()
+        kernel_name : str
+        for i in self._launches_indexes(self.num_launches()):
+            kernel_name = kernels[i] if i < len(kernels) else GraphParameters.C_HIERARCHY_UNKNOWN_KERNEL_NAME
+            launches_of_kernel.setdefault(kernel_name, list()).append(i)
+            time_of_kernel[kernel_name] = time_of_kernel.get(kernel_name, 0.0) + self._percentage_time_kernel(i)
+        return [(name, launches_of_kernel[name], time_of_kernel[name]) for name in 
+            sorted(time_of_kernel, key = lambda name: time_of_kernel[name], reverse = True)]
+        
+
+    def _create_hierarchy_graph(self, max_kernels : int, chart_type : str) -> HierarchyChart:
+        """ 
+        Create hierarchical graph with the TopDown parts. If 'max_kernels' is greater than 0, the tree
+        of the biggest 'max_kernels' kernels (by percentage of cycles elapsed, grouping launches by 
+        kernel's name) is drawn below one node per kernel and the rest of kernels are grouped in
+        one node, so the size of the graph doesn't depend on the number of kernels.
+
+        Args:
+            max_kernels : int   ; max number of kernels drawn, or 0 to draw the tree of the whole execution
+
+            chart_type  : str   ; type of graph ('sunburst' or 'treemap')
+
+        Returns:
+            Reference to HierarchyChart with graph
+        """
+
+        graph : HierarchyChart = HierarchyChart(GraphParameters.C_HIERARCHY_GRAPH_TITLE, chart_type)
+        if max_kernels <= 0:
+            graph.add_tree("", self.topdown_tree())
+            return graph
+        kernel_groups : list = self._kernel_groups()
+        groups : list = kernel_groups[:max_kernels]
+        if len(kernel_groups) > max_kernels:
+            groups.append((GraphParameters.C_HIERARCHY_OTHER_KERNELS_LABEL % (len(kernel_groups) - max_kernels), 
+                [i for name, launches, time_percentage in kernel_groups[max_kernels:] for i in launches],
+                sum(time_percentage for name, launches, time_percentage in kernel_groups[max_kernels:])))
+        selected_launches : list = self.selected_launches()
+        launches : list
+        time_percentage : float
+        try:
+            for kernel_name, launches, time_percentage in groups:
+                graph.add_node(kernel_name, "", kernel_name, time_percentage)
+                self.select_launches(launches)
+                try:
+                    graph.add_tree(kernel_name, self.topdown_tree(), time_percentage/100.0)
+                except ZeroDivisionError: # kernel without stalls/cycles
+                    pass
+        finally:
+            self.select_launches(selected_launches)
+        return graph
+        
+
+    def showHierarchyGraph(self, max_kernels : int = GraphParameters.C_HIERARCHY_MAX_KERNELS_DEFAULT,
+        chart_type : str = GraphParameters.C_HIERARCHY_CHART_TYPE_DEFAULT):
+        """
+        Show hierarchical graph with the TopDown parts.
+
+        Args:
+            max_kernels : int   ; max number of kernels drawn, or 0 to draw the tree of the whole execution
+
+            chart_type  : str   ; type of graph ('sunburst' or 'treemap')
+        """
+
+        with Timings.span(TimingsParameters.C_SPAN_GRAPH_HIERARCHY):
+            self._create_hierarchy_graph(max_kernels, chart_type).show()
+        
+
+    def saveHierarchyGraph(self, file_str : str, max_kernels : int = GraphParameters.C_HIERARCHY_MAX_KERNELS_DEFAULT,
+        chart_type : str = GraphParameters.C_HIERARCHY_CHART_TYPE_DEFAULT):
+        """ 
+        Save hierarchical graph with the TopDown parts in file indicated as argument. Format 
+        (html, png, svg or pdf) is obtained from the extension of the file.
+
+        Args:
+            file_str    : str   ; path to output file where save fig
+
+            max_kernels : int   ; max number of kernels drawn, or 0 to draw the tree of the whole execution
+
+            chart_type  : str   ; type of graph ('sunburst' or 'treemap')
+        """
 
+        with Timings.span(TimingsParameters.C_SPAN_GRAPH_HIERARCHY):
+            self._create_hierarchy_graph(max_kernels, chart_type).save(file_str)
@@ -5,7 +5,9 @@ Class that represents the execution level of nsight
 @version:   1.0
 """
 
+import csv
 import locale
+import re
 from abc import ABC, abstractmethod # abstract class
 import os, sys, inspect
 currentdir = os.path.dirname(os.path.abspath(inspect.getfile(inspect.currentframe())))
@@ -13,8 +15,13 @@ parentdir = os.path.dirname(currentdir)
 sys.path.insert(0, parentdir) 
 from parameters.level_execution_params import LevelExecutionParameters # parameters of program
 from errors.level_execution_errors import *
+from show_messages.message_format import MessageFormat
 from measure_levels.level_execution import LevelExecution
 from measure_parts.extra_measure import ExtraMeasureNsight
+from measure_parts.metric_measure import MetricMeasureNsight
+from profiler.metric_availability import MetricAvailabilityNsight
+from aggregation.aggregations import Aggregations
+from parameters.aggregations_params import AggregationsParameters
 
 class LevelExecutionNsight(LevelExecution, ABC):
     """ 
@@ -29,7 +36,13 @@ class LevelExecutionNsight(LevelExecution, ABC):
 
     def __init__(self, program : str, input_file : str, output_file : str, output_scan_file : str, collect_metrics : bool, 
         extra_measure : ExtraMeasureNsight):
-        locale.setlocale(locale.LC_ALL, 'es_ES.utf8')
+        locale_name : str
+        for locale_name in LevelExecutionParameters.C_NSIGHT_LOCALES:
+            try:
+                locale.setlocale(locale.LC_ALL, locale_name)
+                break
+            except locale.Error:
+                pass # locale not installed, try next one
         self._extra_measure : ExtraMeasureNsight = extra_measure
         super().__init__(program, input_file, output_file, output_scan_file, collect_metrics)
         
@@ -45,6 +58,211 @@ class LevelExecutionNsight(LevelExecution, ABC):
         return self._extra_measure
         
 
+    def _metric_availability(self) -> MetricAvailabilityNsight:
+        """
+        Get measures supported by the device with nsight scan tool.
+
+        Returns:
+            Reference to MetricAvailabilityNsight
+        """
+
+        return MetricAvailabilityNsight(self)
+        
+
+    def _set_optional_parts_metric(self, metric_name : str, metric_value : str, metric_unit : str) -> bool:
+        """
+        Set value and unit of metric in the optional parts (Roofline...) where it's measured.
+
+        Args:
+            metric_name     : str   ; name of the metric
+
+            metric_value    : str   ; value of the metric
+
+            metric_unit     : str   ; unit of the metric
+
+        Returns:
+            True if metric is measured in some optional part or False if not
+        """
+
+        has_found : bool = False
+        for part in self._optional_parts:
+            if part.set_metric_value(metric_name, metric_value):
+                part.set_metric_unit(metric_name, metric_unit)
+                has_found = True
+        return has_found
+        
+
+    def _add_optional_parts_results(self, lst_output : list):
+        """
+        Add results of the optional parts (Roofline...) to list indicated by argument.
+
+        Parameters:
+            lst_output              : list     ; OUTPUT list with results
+        """
+
+        converter : MessageFormat = MessageFormat()
+        for part in self._optional_parts:
+            if self._collect_metrics and part.metrics_str() != "":
+                lst_output.append(converter.underlined_str(part.name()))
+                self._add_result_part_to_lst(part.metrics(), part.metrics_description(), lst_output)
+        
+
+    def _optional_part_value(self, part : MetricMeasureNsight, metric_name : str, launch : int) -> float:
+        """
+        Get value (in base units: byte, second...) of metric of optional part in the launch indicated.
+
+        Args:
+            part        : MetricMeasureNsight   ; optional part (Roofline...)
+
+            metric_name : str                   ; name of the metric
+
+            launch      : int                   ; index of the launch
+
+        Returns:
+            Float with the value, or 'None' if it has not been measured in the launch
+        """
+
+        values : list = part.get_metric_value(metric_name)
+        if values is None or launch >= len(values):
+            return None
+        unit : str = part.get_metric_unit(metric_name)
+        return self.measure_value_to_float(values[launch])*LevelExecutionParameters.C_UNIT_MULTIPLIERS_NSIGHT.get(
+            "" if unit is None else unit.split("/")[0], 1.0)
+        
+
+    def __tag_processes_and_devices(self, output_command : str) -> str:
+        """
+        Tag each launch with its process ('[pid] program') and its device ('device N', or 'None'
+        if device is not written in the kernel line). Lines of the processes are removed from results,
+        so the command of the process is not parsed as a metric.
+
+        Args:
+            output_command  : str   ; results of NVIDIA scan tool
+
+        Returns:
+            String with the results without lines of the processes
+        """
+
+        lines : list = list()
+        process_tags : list = list()
+        device_tags : list = list()
+        process : str = None
+        can_read_results : bool = False
+        match : re.Match
+        line : str
+        for line in output_command.splitlines():
+            if not can_read_results:
+                can_read_results = line.startswith("==PROF== Disconnected")
+            else:
+                match = re.match(LevelExecutionParameters.C_PROCESS_LINE_REGEX_NSIGHT, line)
+                if match is not None:
+                    process = LevelExecutionParameters.C_PROCESS_TAG_FORMAT % (match.group("pid"), match.group("program"))
+                    continue
+                if re.match(LevelExecutionParameters.C_KERNEL_LINE_REGEX_NSIGHT, line) is not None:
+                    process_tags.append(process)
+                    match = re.search(LevelExecutionParameters.C_DEVICE_REGEX_NSIGHT, line)
+                    device_tags.append(None if match is None else LevelExecutionParameters.C_DEVICE_TAG_FORMAT_NSIGHT % 
+                        match.group("device"))
+            lines.append(line)
+        self.set_launch_tags(LevelExecutionParameters.C_PROCESS_TAG, process_tags)
+        self.set_launch_tags(LevelExecutionParameters.C_DEVICE_TAG, device_tags)
+        return "\n".join(lines)
+        
+
+    def __csv_to_text(self, output_command : str) -> str:
+        """
+        Convert results of NSIGHT in CSV format ('--csv') to the text layout which is parsed: a kernel line
+        (and a process line when it changes) per launch, followed by a line per metric. Results in text
+        are not changed.
+
+        Args:
+            output_command  : str   ; results of NVIDIA scan tool
+
+        Returns:
+            String with the results in text layout
+        """
+
+        lines : list = output_command.splitlines()
+        header_index : int = next((i for i, line in enumerate(lines) if line.startswith(LevelExecutionParameters.C_CSV_HEADER_PREFIX_NSIGHT)), 
+            None)
+        if header_index is None:
+            return output_command
+        text_lines : list = list()
+        launch : str = None
+        process : str = None
+        row : dict
+        for row in csv.DictReader(lines[header_index:]):
+            if row[LevelExecutionParameters.C_CSV_ID_COLUMN_NSIGHT] != launch:
+                launch = row[LevelExecutionParameters.C_CSV_ID_COLUMN_NSIGHT]
+                if not text_lines:
+                    text_lines.append("==PROF== Disconnected from process " + row[LevelExecutionParameters.C_CSV_PID_COLUMN_NSIGHT])
+                if row[LevelExecutionParameters.C_CSV_PID_COLUMN_NSIGHT] != process:
+                    process = row[LevelExecutionParameters.C_CSV_PID_COLUMN_NSIGHT]
+                    text_lines.append("[%s] %s@%s" % (process, row[LevelExecutionParameters.C_CSV_PROCESS_COLUMN_NSIGHT], 
+                        row[LevelExecutionParameters.C_CSV_HOST_COLUMN_NSIGHT]))
+                text_lines.append("  %s, Context %s, Stream %s" % (row[LevelExecutionParameters.C_CSV_KERNEL_COLUMN_NSIGHT], 
+                    row[LevelExecutionParameters.C_CSV_CONTEXT_COLUMN_NSIGHT], row[LevelExecutionParameters.C_CSV_STREAM_COLUMN_NSIGHT]) + 
+                    ("" if not row.get(LevelExecutionParameters.C_CSV_DEVICE_COLUMN_NSIGHT) else 
+                    ", Device " + row[LevelExecutionParameters.C_CSV_DEVICE_COLUMN_NSIGHT]))
+            text_lines.append("    %s %s %s" % (row[LevelExecutionParameters.C_CSV_METRIC_NAME_COLUMN_NSIGHT], 
+                row[LevelExecutionParameters.C_CSV_METRIC_UNIT_COLUMN_NSIGHT], row[LevelExecutionParameters.C_CSV_METRIC_VALUE_COLUMN_NSIGHT]))
+        return "\n".join(text_lines)
+        
+
+    def _prepare_results(self, output_command : str) -> str:
+        """
+        Convert results in CSV format to text (see '__csv_to_text'). Tag each launch with its process and device, removing lines of the processes. Remove the NVTX context of each launch (printed 
+        by NSIGHT with '--nvtx') from results, so they can be parsed, and tag each launch with its NVTX 
+        range ('domain@range/subrange', or only 'range/subrange' in the default domain).
+
+        Args:
+            output_command  : str   ; results of NVIDIA scan tool
+
+        Returns:
+            String with the results without lines of the processes and NVTX context
+        """
+
+        output_command = self.__tag_processes_and_devices(super()._prepare_results(self.__csv_to_text(output_command)))
+        if re.search(LevelExecutionParameters.C_NVTX_BLOCK_REGEX_NSIGHT, output_command, re.MULTILINE) is None:
+            return output_command
+        lines : list = list()
+        tags : list = list()
+        can_read_results : bool = False
+        in_nvtx_block : bool = False
+        domain : str = None
+        ranges : list = list()
+        name : re.Match
+        line : str
+        for line in output_command.splitlines():
+            if not can_read_results:
+                can_read_results = line.startswith("==PROF== Disconnected")
+            elif re.match(LevelExecutionParameters.C_KERNEL_LINE_REGEX_NSIGHT, line) is not None:
+                in_nvtx_block = False
+                tags.append(None)
+            elif re.match(LevelExecutionParameters.C_NVTX_BLOCK_REGEX_NSIGHT, line) is not None:
+                in_nvtx_block = True
+                domain = None
+                ranges = list()
+                continue
+            elif in_nvtx_block:
+                if line.strip() != "" and not LevelExecutionParameters.C_NVTX_SECTION_WORD_NSIGHT in line:
+                    name = re.match(LevelExecutionParameters.C_NVTX_NAME_REGEX_NSIGHT, line)
+                    if name is not None:
+                        if domain is None:
+                            domain = name.group("name")
+                        else:
+                            ranges.append(name.group("name"))
+                    continue
+                in_nvtx_block = False
+                if ranges and tags and tags[-1] is None:
+                    tags[-1] = LevelExecutionParameters.C_NVTX_RANGE_SEPARATOR.join(ranges)
+                    if domain != LevelExecutionParameters.C_NVTX_DEFAULT_DOMAIN_NSIGHT:
+                        tags[-1] = domain + LevelExecutionParameters.C_NVTX_DOMAIN_SEPARATOR + tags[-1]
+            lines.append(line)
+        self.set_launch_tags(LevelExecutionParameters.C_NVTX_TAG, tags)
+        return "\n".join(lines)
+        
+
     @abstractmethod
     def run(self, lst_output : list):
         """
@@ -109,79 +327,69 @@ class LevelExecutionNsight(LevelExecution, ABC):
                                           not supported or does not exist in the NVIDIA analysis tool
         """
 
-        # metrics_events_not_average : list = LevelExecutionParameters.C_METRICS_AND_EVENTS_NOT_AVERAGE_COMPUTED.split(",")
         name_max_length : int = len("Metric Name")
         metric_unit_title : str = "Metric Unit"
         unit_max_length : int = len(metric_unit_title)
         metric_value_title : str = "Metric Value"
-        for key_value,key_unit in zip(dict_values, dict_desc):
+        metric_unit : str
+        for key_value in dict_values:
             if len(key_value) > name_max_length:
                 name_max_length = len(key_value)
-            if len(key_value[0]) > unit_max_length:
-                unit_max_length = key_value[0]
+            metric_unit = dict_desc.get(key_value)
+            if isinstance(metric_unit, str) and len(metric_unit) > unit_max_length:
+                unit_max_length = len(metric_unit)
         metric_name_length : int = name_max_length + 10
         metric_unit_length : int = unit_max_length + 10
         metric_value_length : int = len(metric_value_title) 
-        description : str  = ("\t\t\t%-*s" % (metric_name_length , "Metric Name"))
-        description += ("%-*s" % (metric_unit_length , metric_unit_title))
-        description += ("%-*s" % (metric_value_length, metric_value_title))
+        description : str  = "".join(["\t\t\t%-*s" % (metric_name_length , "Metric Name"), 
+            "%-*s" % (metric_unit_length , metric_unit_title), "%-*s" % (metric_value_length, metric_value_title)])
         line_length : int = len(description) 
         
-        metrics_events_not_average : list  = LevelExecutionParameters.C_METRICS_AND_EVENTS_NOT_AVERAGE_COMPUTED.split(",")
         total_value : float = 0.0
         value_str : str
-        total_value_str : str = ""
+        rows : list = list()
         metric_name : str
-        metric_unit : str
-        i : int = 0 
-        for key_value, key_unit in zip(dict_values, dict_desc):
-            total_value = round(self._get_total_value_of_list(dict_values[key_value], False),
+        strategy : str
+        for key_value in dict_values:
+            strategy = Aggregations.strategy(key_value, AggregationsParameters.C_METRIC_DEFAULT_STRATEGY_NSIGHT)
+            total_value = round(self._aggregate_list(dict_values[key_value], strategy),
              LevelExecutionParameters.C_MAX_NUM_RESULTS_DECIMALS)
             if total_value.is_integer():
                 total_value = int(total_value)
             value_metric_str = str(total_value)
             metric_name = key_value
-            metric_unit = dict_desc.get(key_unit)
+            metric_unit = dict_desc.get(key_value)
             if not metric_unit:
                 metric_unit = "-"
             elif metric_unit == "%":
                 # In NVIDIA scan tool, the percentages in each kernel are calculated on the total of
                 # each kernel and not on the total of the application
-                if key_value in metrics_events_not_average:
-                    raise ComputedAsAverageError(key_unit)
-            value_str = "\t\t\t%-*s" % (metric_name_length, metric_name)
-            value_str += "%-*s" % (metric_unit_length, metric_unit)
-            value_str += "%-*s" % (len(metric_value_title), value_metric_str) 
+                if strategy == AggregationsParameters.C_SUM_STRATEGY and key_value in AggregationsParameters.C_MEASURE_STRATEGIES:
+                    raise ComputedAsAverageError(key_value)
+            value_str = "".join(["\t\t\t%-*s" % (metric_name_length, metric_name), "%-*s" % (metric_unit_length, metric_unit),
+                "%-*s" % (metric_value_length, value_metric_str)])
             if len(value_str) > line_length:
                 line_length = len(value_str)
-            if i != len(dict_values) - 1:
-                value_str += "\n"
-            total_value_str += value_str
-            i += 1
+            rows.append(value_str)
         spaces_length : int = len("\t\t\t")
         line_str : str = "\t\t\t" + f'{"-" * (line_length - spaces_length)}'
         lst_to_add.append("\n" + line_str)
         lst_to_add.append(description)
         lst_to_add.append(line_str)
-        lst_to_add.append(total_value_str)
+        lst_to_add.append("\n".join(rows))
         lst_to_add.append(line_str + "\n")
         
 
-    def _percentage_time_kernel(self, kernel_number : int) -> float:
+    def _cycles_elapsed_per_kernel(self) -> list:
         """ 
-        Get time percentage in each Kernel.
+        Get cycles elapsed in each Kernel.
         Each kernel measured is an index of dictionaries used by this program.
 
-        Args:
-            kernel_number   : int   ; number of kernel
+        Returns:
+            List with the cycles elapsed (float) in each kernel
         """
 
         value_lst : list = self._extra_measure.get_metric_value(LevelExecutionParameters.C_CYCLES_ELAPSED_METRIC_NAME_NSIGHT)
         if value_lst is None:
             raise ElapsedCyclesError
-        value_str : str
-        total_value : float = 0.0
-        for value_str in value_lst:
-            total_value += locale.atof(value_str)
-        return (locale.atof(value_lst[kernel_number])/total_value)*100.0
-        
+        return [locale.atof(value_str) for value_str in value_lst]
@@ -5,6 +5,7 @@ Class that represents the execution level of nvprof.
 @version:   1.0
 """
 
+import re
 from abc import ABC, abstractmethod # abstract class
 import os, sys, inspect
 currentdir = os.path.dirname(os.path.abspath(inspect.getfile(inspect.currentframe())))
@@ -12,8 +13,13 @@ parentdir = os.path.dirname(currentdir)
 sys.path.insert(0, parentdir) 
 from parameters.level_execution_params import LevelExecutionParameters # parameters of program
 from errors.level_execution_errors import *
+from show_messages.message_format import MessageFormat
 from measure_levels.level_execution import LevelExecution 
 from measure_parts.extra_measure import ExtraMeasureNvprof
+from measure_parts.metric_measure import MetricMeasureNvprof
+from profiler.metric_availability import MetricAvailabilityNvprof
+from aggregation.aggregations import Aggregations
+from parameters.aggregations_params import AggregationsParameters
 
 class LevelExecutionNvprof(LevelExecution, ABC):
     """ 
@@ -55,6 +61,155 @@ class LevelExecutionNvprof(LevelExecution, ABC):
         return self._extra_measure
         
 
+    def _optional_events_str(self) -> str:
+        """
+        Get events of the optional parts, ready to be appended to the events of the command.
+
+        Returns:
+            String with the events, each one preceded by a comma, or "" if there are no events
+        """
+
+        return "".join("," + part.events_str() for part in self._optional_parts if part.events_str() != "")
+        
+
+    def _metric_availability(self) -> MetricAvailabilityNvprof:
+        """
+        Get measures supported by the device with nvprof scan tool.
+
+        Returns:
+            Reference to MetricAvailabilityNvprof
+        """
+
+        return MetricAvailabilityNvprof(self)
+        
+
+    def _set_optional_parts_metric(self, metric_name : str, metric_value : str, metric_description : str) -> bool:
+        """
+        Set value and description of metric in the optional parts (Roofline...) where it's measured.
+
+        Args:
+            metric_name         : str   ; name of the metric
+
+            metric_value        : str   ; value of the metric
+
+            metric_description  : str   ; description of the metric
+
+        Returns:
+            True if metric is measured in some optional part or False if not
+        """
+
+        has_found : bool = False
+        for part in self._optional_parts:
+            if part.set_metric_value(metric_name, metric_value):
+                part.set_metric_description(metric_name, metric_description)
+                has_found = True
+        return has_found
+        
+
+    def _set_optional_parts_event(self, event_name : str, event_value : str) -> bool:
+        """
+        Set value of event in the optional parts (Roofline...) where it's measured.
+
+        Args:
+            event_name      : str   ; name of the event
+
+            event_value     : str   ; value of the event
+
+        Returns:
+            True if event is measured in some optional part or False if not
+        """
+
+        has_found : bool = False
+        for part in self._optional_parts:
+            if part.set_event_value(event_name, event_value):
+                has_found = True
+        return has_found
+        
+
+    def _add_optional_parts_results(self, lst_output : list):
+        """
+        Add results of the optional parts (Roofline...) to list indicated by argument.
+
+        Parameters:
+            lst_output              : list     ; OUTPUT list with results
+        """
+
+        converter : MessageFormat = MessageFormat()
+        for part in self._optional_parts:
+            if (self._collect_metrics and part.metrics_str() != "" or 
+                self._collect_events and part.events_str() != ""):
+                lst_output.append(converter.underlined_str(part.name()))
+            if self._collect_metrics and part.metrics_str() != "":
+                self._add_result_part_to_lst(part.metrics(), part.metrics_description(), lst_output, True)
+            if self._collect_events and part.events_str() != "":
+                self._add_result_part_to_lst(part.events(), part.events_description(), lst_output, False)
+        
+
+    def _optional_part_value(self, part : MetricMeasureNvprof, metric_name : str, launch : int) -> float:
+        """
+        Get value of metric of optional part in the launch (kernel) indicated.
+
+        Args:
+            part        : MetricMeasureNvprof   ; optional part (Roofline...)
+
+            metric_name : str                   ; name of the metric
+
+            launch      : int                   ; index of the launch
+
+        Returns:
+            Float with the value, or 'None' if it has not been measured in the launch
+        """
+
+        values : list = part.get_metric_value(metric_name)
+        if values is None or launch >= len(values):
+            return None
+        return self.measure_value_to_float(values[launch])
+        
+
+    def _prepare_results(self, output_command : str) -> str:
+        """
+        Tag each launch with its process ('[pid] program') and its device (name written by NVPROF), 
+        in the order kernels are parsed: the kernels of the first result (events or metrics) with kernels.
+
+        Args:
+            output_command  : str   ; results of NVIDIA scan tool
+
+        Returns:
+            String with the results which are parsed
+        """
+
+        output_command = super()._prepare_results(output_command)
+        process_tags : list = list()
+        device_tags : list = list()
+        process : str = None
+        device : str = None
+        num_result : int = 0
+        tagged_result : int = None
+        match : re.Match
+        line : str
+        for line in output_command.splitlines():
+            match = re.match(LevelExecutionParameters.C_PROCESS_LINE_REGEX_NVPROF, line)
+            if match is not None:
+                process = LevelExecutionParameters.C_PROCESS_TAG_FORMAT % (match.group("pid"), match.group("program"))
+                continue
+            if re.match(LevelExecutionParameters.C_RESULT_LINE_REGEX_NVPROF, line) is not None:
+                num_result += 1
+                device = None
+                continue
+            match = re.match(LevelExecutionParameters.C_DEVICE_LINE_REGEX_NVPROF, line)
+            if match is not None:
+                device = match.group("device")
+            elif line.startswith(" ") and line.lstrip().startswith(LevelExecutionParameters.C_KERNEL_LINE_WORD_NVPROF + " "):
+                if tagged_result is None:
+                    tagged_result = num_result
+                if num_result == tagged_result:
+                    process_tags.append(process)
+                    device_tags.append(device)
+        self.set_launch_tags(LevelExecutionParameters.C_PROCESS_TAG, process_tags)
+        self.set_launch_tags(LevelExecutionParameters.C_DEVICE_TAG, device_tags)
+        return output_command
+        
+
     @abstractmethod
     def run(self, lst_output : list):
         """
@@ -130,31 +285,27 @@ class LevelExecutionNvprof(LevelExecution, ABC):
                 measure_name_title_max_length = len(key_value)
         measure_name_title_max_length += 10
         measure_desc_title_max_length += 10
-        description = "\t\t\t%-*s" % (measure_name_title_max_length , measure_name_title)
-        description += "%-*s" % (measure_desc_title_max_length, measure_desc_title)
-        description += "%-*s" % (measure_value_title_max_length, measure_value_title)
+        description : str = "".join(["\t\t\t%-*s" % (measure_name_title_max_length , measure_name_title),
+            "%-*s" % (measure_desc_title_max_length, measure_desc_title), "%-*s" % (measure_value_title_max_length, measure_value_title)])
         line_length : int = len(description) 
-        metrics_events_not_average  = LevelExecutionParameters.C_METRICS_AND_EVENTS_NOT_AVERAGE_COMPUTED.split(",")
         total_value : float = 0.0
         value_str : str
-        total_value_str : str = ""
+        rows : list = list()
         value_measure_str : str
-        i : int = 0
         if isMetric:
             metric_name : str
             metric_desc : str
             is_percentage : bool = False
-            is_computed_as_average : bool
-            total_value_str : str
+            strategy : str
             for key_value in dict_values:
+                strategy = Aggregations.strategy(key_value, AggregationsParameters.C_METRIC_DEFAULT_STRATEGY_NVPROF)
                 if dict_values[key_value][0][len(dict_values[key_value][0]) - 1] == "%":
                     is_percentage = True
                     # In NVIDIA scan tool, the percentages in each kernel are calculated on the total of
                     # each kernel and not on the total of the application
-                    if key_value in metrics_events_not_average:
+                    if strategy == AggregationsParameters.C_SUM_STRATEGY:
                         raise ComputedAsAverageError(key_value)
-                is_computed_as_average = not (key_value in metrics_events_not_average)
-                total_value = round(self._get_total_value_of_list(dict_values[key_value], is_computed_as_average),
+                total_value = round(self._aggregate_list(dict_values[key_value], strategy),
                     LevelExecutionParameters.C_MAX_NUM_RESULTS_DECIMALS)
                 if total_value.is_integer():
                     total_value = int(total_value)
@@ -164,58 +315,46 @@ class LevelExecutionNvprof(LevelExecution, ABC):
                     is_percentage = False
                 metric_name = key_value
                 metric_desc = dict_desc.get(key_value)
-                value_str = "\t\t\t%-*s" % (measure_name_title_max_length , metric_name)
-                value_str += "%-*s" % (measure_desc_title_max_length , metric_desc)
-                value_str += "%-*s" % (len(value_measure_str), value_measure_str)
+                value_str = "".join(["\t\t\t%-*s" % (measure_name_title_max_length , metric_name),
+                    "%-*s" % (measure_desc_title_max_length , metric_desc), value_measure_str])
                 if len(value_str) > line_length:
                     line_length = len(value_str)
-                if i != len(dict_values) - 1:
-                    value_str += "\n"
-                total_value_str += value_str
-                i += 1
+                rows.append(value_str)
         else:
             event_name : str
             for key_value in dict_values:
-                total_value = round(self._get_total_value_of_list(dict_values[key_value], False),
+                total_value = round(self._get_measure_total_value(key_value, dict_values[key_value], 
+                    AggregationsParameters.C_EVENT_DEFAULT_STRATEGY_NVPROF),
                     LevelExecutionParameters.C_MAX_NUM_RESULTS_DECIMALS)
                 if total_value.is_integer():
                     total_value = int(total_value)
                 value_measure_str = str(total_value)
                 event_name = key_value
-                value_str = "\t\t\t%-*s" % (measure_name_title_max_length , event_name)
-                value_str += "%-*s" % (measure_desc_title_max_length , "-")
-                value_str += "%-*s" % (len(value_measure_str), value_measure_str)
+                value_str = "".join(["\t\t\t%-*s" % (measure_name_title_max_length , event_name),
+                    "%-*s" % (measure_desc_title_max_length , "-"), value_measure_str])
                 if len(value_str) > line_length:
                     line_length = len(value_str)
-                if i != len(dict_values) - 1:
-                    value_str += "\n"
-                total_value_str += value_str
-                i += 1     
+                rows.append(value_str)
         spaces_length : int = len("\t\t\t")
         line_str : str = "\t\t\t" + f'{"-" * (line_length - spaces_length)}'
         lst_to_add.append("\n" + line_str)
         lst_to_add.append(description)
         lst_to_add.append(line_str)
-        lst_to_add.append(total_value_str)
+        lst_to_add.append("\n".join(rows))
         lst_to_add.append(line_str + "\n")
             
 
-    def _percentage_time_kernel(self, kernel_number : int) -> float:
+    def _cycles_elapsed_per_kernel(self) -> list:
         """ 
-        Get time percentage in each Kernel.
+        Get cycles elapsed in each Kernel.
         Each kernel measured is an index of dictionaries used by this program.
 
-        Args:
-            kernel_number   : int   ; number of kernel
+        Returns:
+            List with the cycles elapsed (float) in each kernel
         """
         
         value_lst : list = self._extra_measure.get_event_value(LevelExecutionParameters.C_CYCLES_ELAPSED_EVENT_NAME_NVPROF)
         if value_lst is None:
             raise ElapsedCyclesError
-        value_str : str
-        total_value : float = 0.0
-        for value_str in value_lst:
-            total_value += float(value_str)
-        return (float(value_lst[kernel_number])/total_value)*100.0
+        return [float(value_str) for value_str in value_lst]
         
-
@@ -0,0 +1,250 @@
+"""
+Class that creates the level of the execution with its parts.
+
+@date:      Jul 2021
+@version:   1.0
+"""
+
+import os, sys, inspect
+currentdir = os.path.dirname(os.path.abspath(inspect.getfile(inspect.currentframe())))
+parentdir = os.path.dirname(currentdir)
+sys.path.insert(0, parentdir)
+from measure_levels.level_execution import LevelExecution
+from measure_levels.level_one_nvprof import LevelOneNvprof
+from measure_levels.level_one_nsight import LevelOneNsight
+from measure_levels.level_two_nvprof import LevelTwoNvprof
+from measure_levels.level_two_nsight import LevelTwoNsight
+from measure_levels.level_three_nsight import LevelThreeNsight
+from measure_levels.level_three_nvprof import LevelThreeNvprof
+from measure_levels.level_four_nsight import LevelFourNsight
+from measure_parts.front_end import FrontEndNsight, FrontEndNvprof
+from measure_parts.back_end import BackEndNsight, BackEndNvprof
+from measure_parts.divergence import DivergenceNsight, DivergenceNvprof
+from measure_parts.retire import RetireNsight, RetireNvprof
+from measure_parts.extra_measure import ExtraMeasureNsight, ExtraMeasureNvprof
+from measure_parts.front_decode import  FrontDecodeNsight, FrontDecodeNvprof
+from measure_parts.front_fetch import FrontFetchNsight, FrontFetchNvprof
+from measure_parts.back_core_bound import BackCoreBoundNsight, BackCoreBoundNvprof
+from measure_parts.back_memory_bound import BackMemoryBoundNsight, BackMemoryBoundNvprof
+from measure_parts.roofline import RooflineNsight, RooflineNvprof
+from measure_parts.occupancy import OccupancyNsight, OccupancyNvprof
+from parameters.front_end_params import FrontEndParameters
+from parameters.back_end_params import BackEndParameters
+from parameters.divergence_params import DivergenceParameters
+from parameters.retire_params import RetireParameters
+from parameters.extra_measure_params import ExtraMeasureParameters
+from parameters.front_fetch_params import FrontFetchParameters
+from parameters.front_decode_params import FrontDecodeParameters
+from parameters.back_memory_bound_params import BackMemoryBoundParameters
+from parameters.back_core_bound_params import BackCoreBoundParameters
+from parameters.roofline_params import RooflineParameters
+from parameters.occupancy_params import OccupancyParameters
+from parameters.level_execution_params import LevelExecutionParameters
+
+class LevelFactory:
+    """ 
+    Class that creates the level of the execution (with the parts measured in it) 
+    depending on the number of level and the NVIDIA scan tool used.
+    """
+
+    @staticmethod
+    def create(level_number : int, nvprof_mode : bool, program : str, input_file : str, output_file : str, 
+        output_scan_file : str, show_metrics : bool, show_events : bool, roofline : bool = False, 
+        occupancy : bool = False) -> LevelExecution:
+        """
+        Create level of the execution.
+
+        Args:
+            level_number        : int   ; number of level (1, 2, 3 or 4, only with NSIGHT)
+
+            nvprof_mode         : bool  ; True if the execution is done with NVPROF scan tool or False if 
+                                          it's done with NSIGHT scan tool
+
+            program             : str   ; program of the execution
+
+            input_file          : str   ; path to input file with results. 'None' if we must do the analysis
+
+            output_file         : str   ; path to output file with results. 'None' to don't use output file
+
+            output_scan_file    : str   ; path to output scan file. 'None' to don't use output scan file
+
+            show_metrics        : bool  ; True if the execution must collect the metrics or False if not
+
+            show_events         : bool  ; True if the execution must collect the events (NVPROF only) or False if not
+
+            roofline            : bool  ; True if the execution must measure the Roofline part or False if not
+
+            occupancy           : bool  ; True if the execution must measure the Occupancy part or False if not
+
+        Returns:
+            Reference to the level of the execution
+        """
+
+        if nvprof_mode:
+            front_end : FrontEndNvprof
+            back_end : BackEndNvprof
+            divergence : DivergenceNvprof
+            retire : RetireNvprof
+            extra_measure : ExtraMeasureNvprof
+            if level_number == 1:
+                front_end = FrontEndNvprof(FrontEndParameters.C_FRONT_END_NAME, FrontEndParameters.C_FRONT_END_DESCRIPTION,
+                    FrontEndParameters.C_FRONT_END_NVPROF_L1_METRICS, FrontEndParameters.C_FRONT_END_NVPROF_L1_EVENTS)
+                back_end = BackEndNvprof(BackEndParameters.C_BACK_END_NAME, BackEndParameters.C_BACK_END_DESCRIPTION, 
+                    BackEndParameters.C_BACK_END_NVPROF_L1_METRICS, BackEndParameters.C_BACK_END_NVPROF_L1_EVENTS)
+                divergence = DivergenceNvprof(DivergenceParameters.C_DIVERGENCE_NAME, DivergenceParameters.C_DIVERGENCE_DESCRIPTION,
+                    DivergenceParameters.C_DIVERGENCE_NVPROF_L1_METRICS, DivergenceParameters.C_DIVERGENCE_NVPROF_L1_EVENTS)
+                retire = RetireNvprof(RetireParameters.C_RETIRE_NAME, RetireParameters.C_RETIRE_DESCRIPTION,
+                    RetireParameters.C_RETIRE_NVPROF_L1_METRICS, RetireParameters.C_RETIRE_NVPROF_L1_EVENTS)
+                extra_measure = ExtraMeasureNvprof(ExtraMeasureParameters.C_EXTRA_MEASURE_NAME, ExtraMeasureParameters.C_EXTRA_MEASURE_DESCRIPTION,
+                    ExtraMeasureParameters.C_EXTRA_MEASURE_NVPROF_L1_METRICS, ExtraMeasureParameters.C_EXTRA_MEASURE_NVPROF_L1_EVENTS)
+                level : LevelOneNvprof = LevelOneNvprof(program, input_file, output_file, output_scan_file, show_metrics, show_events, 
+                front_end, back_end, divergence, retire, extra_measure)
+            elif level_number == 2:
+                front_end = FrontEndNvprof(FrontEndParameters.C_FRONT_END_NAME, FrontEndParameters.C_FRONT_END_DESCRIPTION,
+                    FrontEndParameters.C_FRONT_END_NVPROF_L2_METRICS, FrontEndParameters.C_FRONT_END_NVPROF_L2_EVENTS)
+                back_end = BackEndNvprof(BackEndParameters.C_BACK_END_NAME, BackEndParameters.C_BACK_END_DESCRIPTION, 
+                    BackEndParameters.C_BACK_END_NVPROF_L2_METRICS, BackEndParameters.C_BACK_END_NVPROF_L2_EVENTS)
+                divergence = DivergenceNvprof(DivergenceParameters.C_DIVERGENCE_NAME, DivergenceParameters.C_DIVERGENCE_DESCRIPTION,
+                    DivergenceParameters.C_DIVERGENCE_NVPROF_L2_METRICS, DivergenceParameters.C_DIVERGENCE_NVPROF_L2_EVENTS)
+                retire = RetireNvprof(RetireParameters.C_RETIRE_NAME, RetireParameters.C_RETIRE_DESCRIPTION,
+                    RetireParameters.C_RETIRE_NVPROF_L2_METRICS, RetireParameters.C_RETIRE_NVPROF_L2_EVENTS)
+                extra_measure = ExtraMeasureNvprof(ExtraMeasureParameters.C_EXTRA_MEASURE_NAME, ExtraMeasureParameters.C_EXTRA_MEASURE_DESCRIPTION,
+                    ExtraMeasureParameters.C_EXTRA_MEASURE_NVPROF_L2_METRICS, ExtraMeasureParameters.C_EXTRA_MEASURE_NVPROF_L2_EVENTS)
+                front_decode : FrontDecodeNvprof = FrontDecodeNvprof(FrontDecodeParameters.C_FRONT_DECODE_NAME, 
+                    FrontDecodeParameters.C_FRONT_DECODE_DESCRIPTION, FrontDecodeParameters.C_FRONT_DECODE_NVPROF_L2_METRICS, 
+                    FrontDecodeParameters.C_FRONT_DECODE_NVPROF_L2_EVENTS)
+                front_fetch : FrontFetchNvprof = FrontFetchNvprof(FrontFetchParameters.C_FRONT_FETCH_NAME, 
+                    FrontFetchParameters.C_FRONT_FETCH_DESCRIPTION, FrontFetchParameters.C_FRONT_FETCH_NVPROF_L2_METRICS, 
+                    FrontFetchParameters.C_FRONT_FETCH_NVPROF_L2_EVENTS)
+                back_memory_bound : BackMemoryBoundNvprof = BackMemoryBoundNvprof(BackMemoryBoundParameters.C_BACK_MEMORY_BOUND_NAME, 
+                    BackMemoryBoundParameters.C_BACK_MEMORY_BOUND_DESCRIPTION, BackMemoryBoundParameters.C_BACK_MEMORY_BOUND_NVPROF_L2_METRICS, 
+                    BackMemoryBoundParameters.C_BACK_MEMORY_BOUND_NVPROF_L2_EVENTS)
+                back_core_bound : BackCoreBoundNvprof = BackCoreBoundNvprof(BackCoreBoundParameters.C_BACK_CORE_BOUND_NAME, 
+                    BackCoreBoundParameters.C_BACK_CORE_BOUND_DESCRIPTION, BackCoreBoundParameters.C_BACK_CORE_BOUND_NVPROF_L2_METRICS, 
+                    BackCoreBoundParameters.C_BACK_CORE_BOUND_NVPROF_L2_EVENTS)
+                level : LevelTwoNvprof = LevelTwoNvprof(program, input_file, output_file, output_scan_file, show_metrics, show_events, 
+                front_end, back_end, divergence, retire, extra_measure, front_fetch, front_decode, back_core_bound, back_memory_bound) 
+            elif level_number == 3:
+                front_end = FrontEndNvprof(FrontEndParameters.C_FRONT_END_NAME, FrontEndParameters.C_FRONT_END_DESCRIPTION,
+                    FrontEndParameters.C_FRONT_END_NVPROF_L3_METRICS, FrontEndParameters.C_FRONT_END_NVPROF_L3_EVENTS)
+                back_end = BackEndNvprof(BackEndParameters.C_BACK_END_NAME, BackEndParameters.C_BACK_END_DESCRIPTION, 
+                    BackEndParameters.C_BACK_END_NVPROF_L3_METRICS, BackEndParameters.C_BACK_END_NVPROF_L3_EVENTS)
+                divergence = DivergenceNvprof(DivergenceParameters.C_DIVERGENCE_NAME, DivergenceParameters.C_DIVERGENCE_DESCRIPTION,
+                    DivergenceParameters.C_DIVERGENCE_NVPROF_L3_METRICS, DivergenceParameters.C_DIVERGENCE_NVPROF_L3_EVENTS)
+                retire = RetireNvprof(RetireParameters.C_RETIRE_NAME, RetireParameters.C_RETIRE_DESCRIPTION,
+                    RetireParameters.C_RETIRE_NVPROF_L3_METRICS, RetireParameters.C_RETIRE_NVPROF_L3_EVENTS)
+                extra_measure = ExtraMeasureNvprof(ExtraMeasureParameters.C_EXTRA_MEASURE_NAME, ExtraMeasureParameters.C_EXTRA_MEASURE_DESCRIPTION,
+                    ExtraMeasureParameters.C_EXTRA_MEASURE_NVPROF_L3_METRICS, ExtraMeasureParameters.C_EXTRA_MEASURE_NVPROF_L3_EVENTS)
+                front_decode : FrontDecodeNvprof = FrontDecodeNvprof(FrontDecodeParameters.C_FRONT_DECODE_NAME, 
+                    FrontDecodeParameters.C_FRONT_DECODE_DESCRIPTION, FrontDecodeParameters.C_FRONT_DECODE_NVPROF_L3_METRICS, 
+                    FrontDecodeParameters.C_FRONT_DECODE_NVPROF_L3_EVENTS)
+                front_fetch : FrontFetchNvprof = FrontFetchNvprof(FrontFetchParameters.C_FRONT_FETCH_NAME, 
+                    FrontFetchParameters.C_FRONT_FETCH_DESCRIPTION, FrontFetchParameters.C_FRONT_FETCH_NVPROF_L3_METRICS, 
+                    FrontFetchParameters.C_FRONT_FETCH_NVPROF_L3_EVENTS)
+                back_memory_bound : BackMemoryBoundNvprof = BackMemoryBoundNvprof(BackMemoryBoundParameters.C_BACK_MEMORY_BOUND_NAME, 
+                    BackMemoryBoundParameters.C_BACK_MEMORY_BOUND_DESCRIPTION, BackMemoryBoundParameters.C_BACK_MEMORY_BOUND_NVPROF_L3_METRICS, 
+                    BackMemoryBoundParameters.C_BACK_MEMORY_BOUND_NVPROF_L3_EVENTS)
+                back_core_bound : BackCoreBoundNvprof = BackCoreBoundNvprof(BackCoreBoundParameters.C_BACK_CORE_BOUND_NAME, 
+                    BackCoreBoundParameters.C_BACK_CORE_BOUND_DESCRIPTION, BackCoreBoundParameters.C_BACK_CORE_BOUND_NVPROF_L3_METRICS, 
+                    BackCoreBoundParameters.C_BACK_CORE_BOUND_NVPROF_L3_EVENTS)
+                level : LevelThreeNvprof = LevelThreeNvprof(program, input_file, output_file, output_scan_file, show_metrics, show_events, 
+                front_end, back_end, divergence, retire, extra_measure, front_fetch, front_decode, back_core_bound, back_memory_bound)        
+        else:
+            front_end : FrontEndNsight
+            back_end : BackEndNsight
+            divergence : DivergenceNsight
+            retire : RetireNsight
+            extra_measure : ExtraMeasureNsight
+            if level_number == 1:
+                front_end = FrontEndNsight(FrontEndParameters.C_FRONT_END_NAME, FrontEndParameters.C_FRONT_END_DESCRIPTION,
+                    FrontEndParameters.C_FRONT_END_NSIGHT_L1_METRICS)
+                back_end = BackEndNsight(BackEndParameters.C_BACK_END_NAME, BackEndParameters.C_BACK_END_DESCRIPTION,
+                    BackEndParameters.C_BACK_END_NSIGHT_L1_METRICS)
+                divergence = DivergenceNsight(DivergenceParameters.C_DIVERGENCE_NAME, DivergenceParameters.C_DIVERGENCE_DESCRIPTION,
+                    DivergenceParameters.C_DIVERGENCE_NSIGHT_L1_METRICS)
+                retire = RetireNsight(RetireParameters.C_RETIRE_NAME, RetireParameters.C_RETIRE_DESCRIPTION,
+                    RetireParameters.C_RETIRE_NSIGHT_L1_METRICS)
+                extra_measure = ExtraMeasureNsight(ExtraMeasureParameters.C_EXTRA_MEASURE_NAME, ExtraMeasureParameters.C_EXTRA_MEASURE_DESCRIPTION,
+                    ExtraMeasureParameters.C_EXTRA_MEASURE_NSIGHT_L1_METRICS)
+                level : LevelOneNsight = LevelOneNsight(program, input_file, output_file, output_scan_file, show_metrics, front_end, 
+                back_end, divergence, retire, extra_measure)
+            elif level_number == 2:
+                front_end = FrontEndNsight(FrontEndParameters.C_FRONT_END_NAME, FrontEndParameters.C_FRONT_END_DESCRIPTION,
+                    FrontEndParameters.C_FRONT_END_NSIGHT_L2_METRICS)
+                back_end = BackEndNsight(BackEndParameters.C_BACK_END_NAME, BackEndParameters.C_BACK_END_DESCRIPTION,
+                    BackEndParameters.C_BACK_END_NSIGHT_L2_METRICS)
+                divergence = DivergenceNsight(DivergenceParameters.C_DIVERGENCE_NAME, DivergenceParameters.C_DIVERGENCE_DESCRIPTION,
+                    DivergenceParameters.C_DIVERGENCE_NSIGHT_L2_METRICS)
+                retire = RetireNsight(RetireParameters.C_RETIRE_NAME, RetireParameters.C_RETIRE_DESCRIPTION,
+                    RetireParameters.C_RETIRE_NSIGHT_L2_METRICS)
+                extra_measure = ExtraMeasureNsight(ExtraMeasureParameters.C_EXTRA_MEASURE_NAME, ExtraMeasureParameters.C_EXTRA_MEASURE_DESCRIPTION,
+                    ExtraMeasureParameters.C_EXTRA_MEASURE_NSIGHT_L2_METRICS)
+                front_decode : FrontDecodeNsight =  FrontDecodeNsight(FrontDecodeParameters.C_FRONT_DECODE_NAME, 
+                    FrontDecodeParameters.C_FRONT_DECODE_DESCRIPTION, FrontDecodeParameters.C_FRONT_DECODE_NSIGHT_L2_METRICS)
+                front_fetch : FrontFetchNsight =  FrontFetchNsight(FrontFetchParameters.C_FRONT_FETCH_NAME, 
+                    FrontFetchParameters.C_FRONT_FETCH_DESCRIPTION, FrontFetchParameters.C_FRONT_FETCH_NSIGHT_L2_METRICS)
+                back_memory_bound : BackMemoryBoundNsight =  BackMemoryBoundNsight(BackMemoryBoundParameters.C_BACK_MEMORY_BOUND_NAME, 
+                    BackMemoryBoundParameters.C_BACK_MEMORY_BOUND_DESCRIPTION, BackMemoryBoundParameters.C_BACK_MEMORY_BOUND_NSIGHT_L2_METRICS)
+                back_core_bound : BackCoreBoundNsight = BackCoreBoundNsight (BackCoreBoundParameters.C_BACK_CORE_BOUND_NAME, 
+                    BackCoreBoundParameters.C_BACK_CORE_BOUND_DESCRIPTION, BackCoreBoundParameters.C_BACK_CORE_BOUND_NSIGHT_L2_METRICS) 
+                level : LevelTwoNsight = LevelTwoNsight(program, input_file, output_file, output_scan_file, show_metrics, front_end, 
+                back_end, divergence, retire, extra_measure, front_decode, front_fetch, back_core_bound, back_memory_bound) 
+            elif level_number == 3:
+                front_end = FrontEndNsight(FrontEndParameters.C_FRONT_END_NAME, FrontEndParameters.C_FRONT_END_DESCRIPTION,
+                    FrontEndParameters.C_FRONT_END_NSIGHT_L3_METRICS)
+                back_end = BackEndNsight(BackEndParameters.C_BACK_END_NAME, BackEndParameters.C_BACK_END_DESCRIPTION,
+                    BackEndParameters.C_BACK_END_NSIGHT_L3_METRICS)
+                divergence = DivergenceNsight(DivergenceParameters.C_DIVERGENCE_NAME, DivergenceParameters.C_DIVERGENCE_DESCRIPTION,
+                    DivergenceParameters.C_DIVERGENCE_NSIGHT_L3_METRICS)
+                retire = RetireNsight(RetireParameters.C_RETIRE_NAME, RetireParameters.C_RETIRE_DESCRIPTION,
+                    RetireParameters.C_RETIRE_NSIGHT_L3_METRICS)
+                extra_measure = ExtraMeasureNsight(ExtraMeasureParameters.C_EXTRA_MEASURE_NAME, ExtraMeasureParameters.C_EXTRA_MEASURE_DESCRIPTION,
+                    ExtraMeasureParameters.C_EXTRA_MEASURE_NSIGHT_L3_METRICS)
+                front_decode : FrontDecodeNsight = FrontDecodeNsight(FrontDecodeParameters.C_FRONT_DECODE_NAME, 
+                    FrontDecodeParameters.C_FRONT_DECODE_DESCRIPTION, FrontDecodeParameters.C_FRONT_DECODE_NSIGHT_L3_METRICS)
+                front_fetch : FrontFetchNsight =  FrontFetchNsight(FrontFetchParameters.C_FRONT_FETCH_NAME, 
+                    FrontFetchParameters.C_FRONT_FETCH_DESCRIPTION, FrontFetchParameters.C_FRONT_FETCH_NSIGHT_L3_METRICS)
+                back_memory_bound : BackMemoryBoundNsight = BackMemoryBoundNsight(BackMemoryBoundParameters.C_BACK_MEMORY_BOUND_NAME, 
+                    BackMemoryBoundParameters.C_BACK_MEMORY_BOUND_DESCRIPTION, BackMemoryBoundParameters.C_BACK_MEMORY_BOUND_NSIGHT_L3_METRICS)
+                back_core_bound : BackCoreBoundNsight = BackCoreBoundNsight(BackCoreBoundParameters.C_BACK_CORE_BOUND_NAME, 
+                    BackCoreBoundParameters.C_BACK_CORE_BOUND_DESCRIPTION, BackCoreBoundParameters.C_BACK_CORE_BOUND_NSIGHT_L3_METRICS) 
+                level : LevelThreeNsight = LevelThreeNsight(program, input_file, output_file, output_scan_file, show_metrics, front_end, 
+                back_end, divergence, retire, extra_measure, front_decode, front_fetch, back_core_bound, back_memory_bound)
+            elif level_number == 4: # parts of level three (level four only adds parts below them)
+                front_end = FrontEndNsight(FrontEndParameters.C_FRONT_END_NAME, FrontEndParameters.C_FRONT_END_DESCRIPTION,
+                    FrontEndParameters.C_FRONT_END_NSIGHT_L3_METRICS)
+                back_end = BackEndNsight(BackEndParameters.C_BACK_END_NAME, BackEndParameters.C_BACK_END_DESCRIPTION,
+                    BackEndParameters.C_BACK_END_NSIGHT_L3_METRICS)
+                divergence = DivergenceNsight(DivergenceParameters.C_DIVERGENCE_NAME, DivergenceParameters.C_DIVERGENCE_DESCRIPTION,
+                    DivergenceParameters.C_DIVERGENCE_NSIGHT_L3_METRICS)
+                retire = RetireNsight(RetireParameters.C_RETIRE_NAME, RetireParameters.C_RETIRE_DESCRIPTION,
+                    RetireParameters.C_RETIRE_NSIGHT_L3_METRICS)
+                extra_measure = ExtraMeasureNsight(ExtraMeasureParameters.C_EXTRA_MEASURE_NAME, ExtraMeasureParameters.C_EXTRA_MEASURE_DESCRIPTION,
+                    ExtraMeasureParameters.C_EXTRA_MEASURE_NSIGHT_L4_METRICS)
+                front_decode : FrontDecodeNsight = FrontDecodeNsight(FrontDecodeParameters.C_FRONT_DECODE_NAME, 
+                    FrontDecodeParameters.C_FRONT_DECODE_DESCRIPTION, FrontDecodeParameters.C_FRONT_DECODE_NSIGHT_L3_METRICS)
+                front_fetch : FrontFetchNsight =  FrontFetchNsight(FrontFetchParameters.C_FRONT_FETCH_NAME, 
+                    FrontFetchParameters.C_FRONT_FETCH_DESCRIPTION, FrontFetchParameters.C_FRONT_FETCH_NSIGHT_L3_METRICS)
+                back_memory_bound : BackMemoryBoundNsight = BackMemoryBoundNsight(BackMemoryBoundParameters.C_BACK_MEMORY_BOUND_NAME, 
+                    BackMemoryBoundParameters.C_BACK_MEMORY_BOUND_DESCRIPTION, BackMemoryBoundParameters.C_BACK_MEMORY_BOUND_NSIGHT_L3_METRICS)
+                back_core_bound : BackCoreBoundNsight = BackCoreBoundNsight(BackCoreBoundParameters.C_BACK_CORE_BOUND_NAME, 
+                    BackCoreBoundParameters.C_BACK_CORE_BOUND_DESCRIPTION, BackCoreBoundParameters.C_BACK_CORE_BOUND_NSIGHT_L3_METRICS) 
+                level : LevelFourNsight = LevelFourNsight(program, input_file, output_file, output_scan_file, show_metrics, front_end, 
+                back_end, divergence, retire, extra_measure, front_decode, front_fetch, back_core_bound, back_memory_bound)
+        if roofline:
+            if nvprof_mode:
+                level.add_optional_part(RooflineNvprof(RooflineParameters.C_ROOFLINE_NAME, RooflineParameters.C_ROOFLINE_DESCRIPTION,
+                    RooflineParameters.C_ROOFLINE_NVPROF_METRICS, RooflineParameters.C_ROOFLINE_NVPROF_EVENTS))
+            else:
+                level.add_optional_part(RooflineNsight(RooflineParameters.C_ROOFLINE_NAME, RooflineParameters.C_ROOFLINE_DESCRIPTION,
+                    RooflineParameters.C_ROOFLINE_NSIGHT_METRICS))
+        if occupancy:
+            if nvprof_mode:
+                level.add_optional_part(OccupancyNvprof(OccupancyParameters.C_OCCUPANCY_NAME, OccupancyParameters.C_OCCUPANCY_DESCRIPTION,
+                    OccupancyParameters.C_OCCUPANCY_NVPROF_METRICS, OccupancyParameters.C_OCCUPANCY_NVPROF_EVENTS))
+            else:
+                level.add_optional_part(OccupancyNsight(OccupancyParameters.C_OCCUPANCY_NAME, OccupancyParameters.C_OCCUPANCY_DESCRIPTION,
+                    OccupancyParameters.C_OCCUPANCY_NSIGHT_METRICS))
+        if (roofline or occupancy) and not nvprof_mode:
+            level.add_profiler_options(LevelExecutionParameters.C_BASE_UNITS_PROFILER_OPTIONS_NSIGHT)
+        return level
@@ -0,0 +1,547 @@
+"""
+Class that represents the level four of the execution based
+on NSIGHT scan tool.
+
+@date:      Jul 2021
+@version:   1.0
+"""
+
+import re
+import os, sys, inspect
+import numpy as np
+currentdir = os.path.dirname(os.path.abspath(inspect.getfile(inspect.currentframe())))
+parentdir = os.path.dirname(currentdir)
+sys.path.insert(1, parentdir)
+from measure_levels.level_three_nsight import LevelThreeNsight
+from measure_parts.back_core_bound import BackCoreBoundNsight
+from measure_parts.back_memory_bound import BackMemoryBoundNsight
+from measure_parts.front_decode import FrontDecodeNsight
+from measure_parts.front_fetch import FrontFetchNsight
+from measure_parts.front_end import FrontEndNsight
+from measure_parts.back_end import BackEndNsight
+from measure_parts.divergence import DivergenceNsight
+from measure_parts.retire import RetireNsight
+from measure_parts.extra_measure import ExtraMeasureNsight
+from measure_parts.metric_measure import MetricMeasureNsight
+from measure_parts.memory_l1_cache import MemoryL1CacheNsight
+from measure_parts.memory_l2_cache import MemoryL2CacheNsight
+from measure_parts.memory_dram import MemoryDramNsight
+from measure_parts.memory_shared_bank_conflicts import MemorySharedBankConflictsNsight
+from show_messages.message_format import MessageFormat
+from parameters.memory_l1_cache_params import MemoryL1CacheParameters
+from parameters.memory_l2_cache_params import MemoryL2CacheParameters
+from parameters.memory_dram_params import MemoryDramParameters
+from parameters.memory_shared_bank_conflicts_params import MemorySharedBankConflictsParameters
+from parameters.architecture_params import ArchitectureParameters
+from errors.level_execution_errors import *
+from timings.timings import Timings
+from parameters.timings_params import TimingsParameters
+from parameters.aggregations_params import AggregationsParameters
+
+class LevelFourNsight(LevelThreeNsight):
+    """
+    Class with level four of the execution based on Nsight scan tool. It breaks down the memory
+    hierarchy below BackEnd.MemoryBound.L1Bound (L1 cache, L2 cache and device memory) and
+    BackEnd.MemoryBound.MioThrottle (bank conflicts of shared memory).
+
+    The IPC degradation of BackEnd.MemoryBound.L1Bound is shared among L1, L2 and DRAM by the
+    time spent waiting on each of them: fraction of the requests served by the level (from the hit
+    rates of L1 and L2) by the approximate latency of the level.
+
+    Atributes:
+        __memory_l1_cache               : MemoryL1CacheNsight               ; L1 cache part
+
+        __memory_l2_cache               : MemoryL2CacheNsight               ; L2 cache part
+
+        __memory_dram                   : MemoryDramNsight                  ; device memory part
+
+        __memory_shared_bank_conflicts  : MemorySharedBankConflictsNsight   ; bank conflicts of shared memory part
+    """
+
+    def __init__(self, program : str, input_file : str, output_file : str, output_scan_file : str, collect_metrics : bool,
+        front_end : FrontEndNsight, back_end : BackEndNsight, divergence : DivergenceNsight, retire : RetireNsight,
+        extra_measure : ExtraMeasureNsight, front_decode : FrontDecodeNsight, front_fetch : FrontFetchNsight,
+        back_core_bound : BackCoreBoundNsight, back_memory_bound : BackMemoryBoundNsight):
+
+        self.__memory_l1_cache : MemoryL1CacheNsight = MemoryL1CacheNsight(
+            MemoryL1CacheParameters.C_MEMORY_L1_CACHE_NAME,
+            MemoryL1CacheParameters.C_MEMORY_L1_CACHE_DESCRIPTION,
+            MemoryL1CacheParameters.C_MEMORY_L1_CACHE_NSIGHT_METRICS)
+
+        self.__memory_l2_cache : MemoryL2CacheNsight = MemoryL2CacheNsight(
+            MemoryL2CacheParameters.C_MEMORY_L2_CACHE_NAME,
+            MemoryL2CacheParameters.C_MEMORY_L2_CACHE_DESCRIPTION,
+            MemoryL2CacheParameters.C_MEMORY_L2_CACHE_NSIGHT_METRICS)
+
+        self.__memory_dram : MemoryDramNsight = MemoryDramNsight(
+            MemoryDramParameters.C_MEMORY_DRAM_NAME,
+            MemoryDramParameters.C_MEMORY_DRAM_DESCRIPTION,
+            MemoryDramParameters.C_MEMORY_DRAM_NSIGHT_METRICS)
+
+        self.__memory_shared_bank_conflicts : MemorySharedBankConflictsNsight = MemorySharedBankConflictsNsight(
+            MemorySharedBankConflictsParameters.C_MEMORY_SHARED_BANK_CONFLICTS_NAME,
+            MemorySharedBankConflictsParameters.C_MEMORY_SHARED_BANK_CONFLICTS_DESCRIPTION,
+            MemorySharedBankConflictsParameters.C_MEMORY_SHARED_BANK_CONFLICTS_NSIGHT_METRICS)
+
+        super().__init__(program, input_file, output_file, output_scan_file, collect_metrics, front_end, back_end, divergence,
+        retire, extra_measure, front_decode, front_fetch, back_core_bound, back_memory_bound)
+        
+
+    def memory_l1_cache(self) -> MemoryL1CacheNsight:
+        """
+        Return MemoryL1CacheNsight part of the execution.
+
+        Returns:
+            reference to MemoryL1CacheNsight part of the execution
+        """
+
+        return self.__memory_l1_cache
+        
+
+    def memory_l2_cache(self) -> MemoryL2CacheNsight:
+        """
+        Return MemoryL2CacheNsight part of the execution.
+
+        Returns:
+            reference to MemoryL2CacheNsight part of the execution
+        """
+
+        return self.__memory_l2_cache
+        
+
+    def memory_dram(self) -> MemoryDramNsight:
+        """
+        Return MemoryDramNsight part of the execution.
+
+        Returns:
+            reference to MemoryDramNsight part of the execution
+        """
+
+        return self.__memory_dram
+        
+
+    def memory_shared_bank_conflicts(self) -> MemorySharedBankConflictsNsight:
+        """
+        Return MemorySharedBankConflictsNsight part of the execution.
+
+        Returns:
+            reference to MemorySharedBankConflictsNsight part of the execution
+        """
+
+        return self.__memory_shared_bank_conflicts
+        
+
+    def __level_four_parts(self) -> list:
+        """ Returns the parts added by level four."""
+
+        return [self.__memory_l1_cache, self.__memory_l2_cache, self.__memory_dram, self.__memory_shared_bank_conflicts]
+        
+
+    def _generate_command(self) -> str:
+        """
+        Generate command of execution with NVIDIA scan tool.
+
+        Returns:
+            String with command to be executed
+        """
+
+        command : str = ("ncu --target-processes all " + self._profiler_flags() + "--metrics " + self._front_end.metrics_str() +
+            "," + self._back_end.metrics_str() + "," + self._divergence.metrics_str() + "," +
+            self._extra_measure.metrics_str() + "," + self._retire.metrics_str() + "," +
+            self._front_decode.metrics_str() + "," + self._front_fetch.metrics_str() +
+            "," + self._back_core_bound.metrics_str() + "," + self._back_memory_bound.metrics_str() +
+            "," + self.memory_constant_memory_bound().metrics_str() + "," + self.memory_mio_throttle().metrics_str() + "," +
+            self.memory_l1_bound().metrics_str() + "," + self.core_math_pipe_throttle().metrics_str() + "," +
+            self.core_wait().metrics_str() + "," + self.core_pipe_utilization().metrics_str() + "".join("," + part.metrics_str()
+            for part in self.front_stall_reasons()) + "".join("," + part.metrics_str() for part in self.__level_four_parts()) +
+            self._optional_metrics_str() + " " + self._program)
+        return command
+        
+
+    def set_results(self,output_command : str):
+        """
+        Set results of execution ALREADY DONE. Results are in the argument.
+
+        Args:
+            output_command : str    ; str with results of execution.
+        """
+
+        with Timings.span(TimingsParameters.C_SPAN_PARSE_LEVEL_ONE):
+            self._set_front_back_divergence_retire_results(output_command) # level one results
+        with Timings.span(TimingsParameters.C_SPAN_PARSE_LEVEL_TWO):
+            self._set_memory_core_decode_fetch_results(output_command) # level two
+        with Timings.span(TimingsParameters.C_SPAN_PARSE_LEVEL_THREE):
+            self._set_memory_constant_memory_bound_mio_l1_bound_results(output_command) # level three
+        with Timings.span(TimingsParameters.C_SPAN_PARSE_LEVEL_FOUR):
+            self._set_memory_hierarchy_results(output_command) # level four
+
+        
+
+    def _get_results(self, lst_output : list):
+        """
+        Get results of the different parts.
+
+        Parameters:
+            lst_output              : list     ; OUTPUT list with results
+        """
+
+        #  Keep Results
+        converter : MessageFormat = MessageFormat()
+
+        if not self._collect_metrics:
+            return
+        parts : list = ([self._front_end, self._front_decode, self._front_fetch, self._back_end, self._back_core_bound,
+            self._back_memory_bound, self.memory_constant_memory_bound(), self.memory_mio_throttle(), self.memory_l1_bound(),
+            self.core_math_pipe_throttle(), self.core_wait(), self.core_pipe_utilization()] + self.front_stall_reasons() +
+            self.__level_four_parts() + [self._divergence, self._retire, self._extra_measure])
+        for part in parts:
+            if part.metrics_str() != "":
+                lst_output.append(converter.underlined_str(part.name()))
+                super()._add_result_part_to_lst(part.metrics(), part.metrics_description(), lst_output)
+        super()._add_optional_parts_results(lst_output)
+        lst_output.append("\n")
+        
+
+    def _set_memory_hierarchy_results(self, results_launch : str):
+        """
+        Set results of the level four parts (that are not level one, two or three).
+
+        Args:
+            results_launch : str   ; results generated by NVIDIA scan tool.
+
+        Raises:
+            MetricNotAsignedToPart ; raised if some metric is found don't assigned
+                                      to any measure part
+        """
+
+        metric_name : str
+        metric_unit : str
+        metric_value : str
+        line : str
+        list_words : list
+        value_has_found : bool
+        unit_has_found : bool
+        part : MetricMeasureNsight
+        can_read_results : bool = False
+        for line in str(results_launch).splitlines():
+            line = re.sub(' +', ' ', line) # delete more than one spaces and put only one
+            list_words = line.split(" ")
+            # Check if it's line of interest:
+            # ['', 'metric_name','metric_unit', 'metric_value']
+            if not can_read_results:
+                if list_words[0] == "==PROF==" and list_words[1] == "Disconnected":
+                        can_read_results = True
+                continue
+            if (len(list_words) == 4 or len(list_words) == 3) and list_words[1][0] != "-":
+                if len(list_words) == 3:
+                    metric_name = list_words[1]
+                    metric_unit = ""
+                    metric_value = list_words[2]
+                else:
+                    metric_name = list_words[1]
+                    metric_unit = list_words[2]
+                    metric_value = list_words[3]
+                value_has_found = False
+                unit_has_found = False
+                for part in self.__level_four_parts():
+                    value_has_found = part.set_metric_value(metric_name, metric_value) or value_has_found
+                    unit_has_found = part.set_metric_unit(metric_name, metric_unit) or unit_has_found
+                if not (value_has_found and unit_has_found) and not self._metricExists(metric_name):
+                    raise MetricNotAsignedToPart(metric_name)
+        
+
+    def measure_parts(self) -> list:
+        """
+        Returns all the parts (FrontEnd, BackEnd...) measured in the execution.
+
+        Returns:
+            List with references to the parts of the execution
+        """
+
+        return super().measure_parts() + self.__level_four_parts()
+        
+
+    def topdown_results(self) -> dict:
+        """
+        Get the results of the TopDown methodology in the selected launches.
+
+        Returns:
+            Dictionary with the name of the result as key and its value (float) as value
+        """
+
+        results : dict = super().topdown_results()
+        results.update({"memory_l1_cache_hit_rate" : self.memory_l1_cache_hit_rate(),
+            "memory_l1_cache_throughput" : self.memory_l1_cache_throughput(),
+            "memory_l1_cache_stall_on_l1_bound" : self.memory_l1_cache_stall_on_l1_bound(),
+            "memory_l1_cache_percentage_ipc_degradation" : self.memory_l1_cache_percentage_ipc_degradation(),
+            "memory_l2_cache_hit_rate" : self.memory_l2_cache_hit_rate(),
+            "memory_l2_cache_throughput" : self.memory_l2_cache_throughput(),
+            "memory_l2_cache_partition_imbalance" : self.memory_l2_cache_partition_imbalance(),
+            "memory_l2_cache_stall_on_l1_bound" : self.memory_l2_cache_stall_on_l1_bound(),
+            "memory_l2_cache_percentage_ipc_degradation" : self.memory_l2_cache_percentage_ipc_degradation(),
+            "memory_dram_throughput" : self.memory_dram_throughput(),
+            "memory_dram_bytes" : self.memory_dram_bytes(),
+            "memory_dram_stall_on_l1_bound" : self.memory_dram_stall_on_l1_bound(),
+            "memory_dram_percentage_ipc_degradation" : self.memory_dram_percentage_ipc_degradation(),
+            "memory_shared_bank_conflicts_rate" : self.memory_shared_bank_conflicts_rate(),
+            "memory_shared_bank_conflicts_percentage_ipc_degradation" : self.memory_shared_bank_conflicts_percentage_ipc_degradation()})
+        return results
+        
+
+    def topdown_tree(self) -> list:
+        """
+        Get the hierarchy of the parts of the TopDown methodology with their percentage of IPC
+        (degradation or retired) in the selected launches.
+
+        Returns:
+            List of tuples (name of part, name of parent part or "" if it's a root part, value)
+        """
+
+        return super().topdown_tree() + [
+            (self.__memory_l1_cache.name(), self.memory_l1_bound().name(), self.memory_l1_cache_percentage_ipc_degradation()),
+            (self.__memory_l2_cache.name(), self.memory_l1_bound().name(), self.memory_l2_cache_percentage_ipc_degradation()),
+            (self.__memory_dram.name(), self.memory_l1_bound().name(), self.memory_dram_percentage_ipc_degradation()),
+            (self.__memory_shared_bank_conflicts.name(), self.memory_mio_throttle().name(),
+            self.memory_shared_bank_conflicts_percentage_ipc_degradation())]
+        
+
+    def __metric_total_value(self, part : MetricMeasureNsight, metric_name : str, computed_as_average : bool = True) -> float:
+        """
+        Get total value of a metric of a level four part in the selected launches.
+
+        Args:
+            part                : MetricMeasureNsight   ; part which measures the metric
+
+            metric_name         : str                   ; name of the metric
+
+            computed_as_average : bool                  ; True if the metric is a rate (average weighted by the cycles
+                                                          by default) or False if it's a count (sum by default). The
+                                                          strategy declared for the metric is used if there is one
+
+        Returns:
+            Float with the total value, or 'None' if the metric is not measured
+        """
+
+        values : list = part.get_metric_value(metric_name)
+        if self._is_skipped(part) or not values:
+            return None
+        return self._get_measure_total_value(metric_name, values, AggregationsParameters.C_RATE_DEFAULT_STRATEGY if computed_as_average 
+            else AggregationsParameters.C_COUNT_DEFAULT_STRATEGY)
+        
+
+    def memory_l1_cache_hit_rate(self) -> float:
+        """ Returns hit rate (%) of the L1 cache, or 'None' if it's not measured."""
+
+        return self.__metric_total_value(self.__memory_l1_cache, MemoryL1CacheParameters.C_L1_HIT_RATE_METRIC_NAME_NSIGHT)
+        
+
+    def memory_l1_cache_throughput(self) -> float:
+        """ Returns throughput of the L1 cache (% of the peak), or 'None' if it's not measured."""
+
+        return self.__metric_total_value(self.__memory_l1_cache, MemoryL1CacheParameters.C_L1_THROUGHPUT_METRIC_NAME_NSIGHT)
+        
+
+    def memory_l2_cache_hit_rate(self) -> float:
+        """ Returns hit rate (%) of the L2 cache, or 'None' if it's not measured."""
+
+        return self.__metric_total_value(self.__memory_l2_cache, MemoryL2CacheParameters.C_L2_HIT_RATE_METRIC_NAME_NSIGHT)
+        
+
+    def memory_l2_cache_throughput(self) -> float:
+        """ Returns throughput of the L2 cache (% of the peak), or 'None' if it's not measured."""
+
+        return self.__metric_total_value(self.__memory_l2_cache, MemoryL2CacheParameters.C_L2_THROUGHPUT_METRIC_NAME_NSIGHT)
+        
+
+    def memory_l2_cache_partition_imbalance(self) -> float:
+        """
+        Get imbalance between the partitions of the L2 cache: sectors accessed in the busiest partition
+        on the mean of the partitions (1 if accesses are balanced).
+
+        Returns:
+            Float with the imbalance, or 'None' if it's not measured
+        """
+
+        sectors_max : float = self.__metric_total_value(self.__memory_l2_cache, MemoryL2CacheParameters.C_L2_SECTORS_MAX_METRIC_NAME_NSIGHT,
+            False)
+        sectors_avg : float = self.__metric_total_value(self.__memory_l2_cache, MemoryL2CacheParameters.C_L2_SECTORS_AVG_METRIC_NAME_NSIGHT,
+            False)
+        if sectors_max is None or sectors_avg is None or np.all(sectors_avg == 0.0): # launches without sectors are 'None'
+            return None
+        return sectors_max/sectors_avg
+        
+
+    def memory_dram_throughput(self) -> float:
+        """ Returns bandwidth utilization of the device memory (% of the peak), or 'None' if it's not measured."""
+
+        return self.__metric_total_value(self.__memory_dram, MemoryDramParameters.C_DRAM_THROUGHPUT_METRIC_NAME_NSIGHT)
+        
+
+    def memory_dram_bytes(self) -> float:
+        """ Returns bytes read and written in the device memory (traffic between L2 and DRAM), or 'None' if it's not measured."""
+
+        bytes_read : float = self.__metric_total_value(self.__memory_dram, MemoryDramParameters.C_DRAM_BYTES_READ_METRIC_NAME_NSIGHT, False)
+        bytes_write : float = self.__metric_total_value(self.__memory_dram, MemoryDramParameters.C_DRAM_BYTES_WRITE_METRIC_NAME_NSIGHT, False)
+        if bytes_read is None or bytes_write is None:
+            return None
+        return bytes_read + bytes_write
+        
+
+    def __memory_hierarchy_shares(self) -> dict:
+        """
+        Get share of the stalls of BackEnd.MemoryBound.L1Bound due to each level of the memory hierarchy:
+        fraction of the requests served by the level by its latency, on the total.
+
+        Returns:
+            Dictionary with the part (L1 cache, L2 cache and DRAM) as key and its share (between 0 and 1) as
+            value, or 'None' if hit rates are not measured or latencies are not in the database of architectures
+
+        Raises:
+            InconsistentMeasuresError   ; raised if a hit rate is not between 0 and 100%
+        """
+
+        l1_hit_rate : float = self.memory_l1_cache_hit_rate()
+        l2_hit_rate : float = self.memory_l2_cache_hit_rate()
+        l1_latency : float = self._architecture.memory_latency_cycles(ArchitectureParameters.C_L1_CACHE_LATENCY_KEY)
+        l2_latency : float = self._architecture.memory_latency_cycles(ArchitectureParameters.C_L2_CACHE_LATENCY_KEY)
+        dram_latency : float = self._architecture.memory_latency_cycles(ArchitectureParameters.C_DRAM_LATENCY_KEY)
+        if l1_hit_rate is None or l2_hit_rate is None or l1_latency is None or l2_latency is None or dram_latency is None:
+            return None
+        if np.any((l1_hit_rate < 0.0) | (l1_hit_rate > 100.0)):
+            raise InconsistentMeasuresError(MemoryL1CacheParameters.C_L1_HIT_RATE_METRIC_NAME_NSIGHT)
+        if np.any((l2_hit_rate < 0.0) | (l2_hit_rate > 100.0)):
+            raise InconsistentMeasuresError(MemoryL2CacheParameters.C_L2_HIT_RATE_METRIC_NAME_NSIGHT)
+        l1_hit_rate = l1_hit_rate/100.0
+        l2_hit_rate = l2_hit_rate/100.0
+        waits : dict = {self.__memory_l1_cache : l1_hit_rate*l1_latency,
+            self.__memory_l2_cache : (1.0 - l1_hit_rate)*l2_hit_rate*l2_latency,
+            self.__memory_dram : (1.0 - l1_hit_rate)*(1.0 - l2_hit_rate)*dram_latency}
+        total_wait : float = sum(waits.values())
+        return {part : wait/total_wait for part, wait in waits.items()}
+        
+
+    def __memory_hierarchy_stall_on_l1_bound(self, part : MetricMeasureNsight) -> float:
+        """ Get percentage of stalls of BackEnd.MemoryBound.L1Bound due to a level of the memory hierarchy (see '__memory_hierarchy_shares')."""
+
+        shares : dict = self.__memory_hierarchy_shares()
+        if self._is_skipped(part) or shares is None:
+            return None
+        return shares[part]*100.0
+        
+
+    def __memory_hierarchy_percentage_ipc_degradation(self, part : MetricMeasureNsight) -> float:
+        """ Get percentage of IPC degradation due to a level of the memory hierarchy (see '__memory_hierarchy_shares')."""
+
+        l1_bound_ipc_degradation : float = self.memory_l1_bound_percentage_ipc_degradation()
+        stall_on_l1_bound : float = self.__memory_hierarchy_stall_on_l1_bound(part)
+        if l1_bound_ipc_degradation is None or stall_on_l1_bound is None:
+            return None
+        return l1_bound_ipc_degradation*(stall_on_l1_bound/100.0)
+        
+
+    def memory_l1_cache_stall_on_l1_bound(self) -> float:
+        """
+        Obtain the percentage of stalls of BackEnd.MemoryBound.L1Bound due to the requests served by
+        the L1 cache
+
+        Returns:
+            Float with the percentage, or 'None' if it's not measured
+        """
+
+        return self.__memory_hierarchy_stall_on_l1_bound(self.__memory_l1_cache)
+        
+
+    def memory_l1_cache_percentage_ipc_degradation(self) -> float:
+        """
+        Find percentage of IPC degradation due to BackEnd.MemoryBound.L1Bound.L1Cache part.
+
+        Returns:
+            Float with the percent of BackEnd.MemoryBound.L1Bound.L1Cache's IPC degradation
+        """
+
+        return self.__memory_hierarchy_percentage_ipc_degradation(self.__memory_l1_cache)
+        
+
+    def memory_l2_cache_stall_on_l1_bound(self) -> float:
+        """
+        Obtain the percentage of stalls of BackEnd.MemoryBound.L1Bound due to the requests served by
+        the L2 cache
+
+        Returns:
+            Float with the percentage, or 'None' if it's not measured
+        """
+
+        return self.__memory_hierarchy_stall_on_l1_bound(self.__memory_l2_cache)
+        
+
+    def memory_l2_cache_percentage_ipc_degradation(self) -> float:
+        """
+        Find percentage of IPC degradation due to BackEnd.MemoryBound.L1Bound.L2Cache part.
+
+        Returns:
+            Float with the percent of BackEnd.MemoryBound.L1Bound.L2Cache's IPC degradation
+        """
+
+        return self.__memory_hierarchy_percentage_ipc_degradation(self.__memory_l2_cache)
+        
+
+    def memory_dram_stall_on_l1_bound(self) -> float:
+        """
+        Obtain the percentage of stalls of BackEnd.MemoryBound.L1Bound due to the requests served by
+        the device memory
+
+        Returns:
+            Float with the percentage, or 'None' if it's not measured
+        """
+
+        return self.__memory_hierarchy_stall_on_l1_bound(self.__memory_dram)
+        
+
+    def memory_dram_percentage_ipc_degradation(self) -> float:
+        """
+        Find percentage of IPC degradation due to BackEnd.MemoryBound.L1Bound.Dram part.
+
+        Returns:
+            Float with the percent of BackEnd.MemoryBound.L1Bound.Dram's IPC degradation
+        """
+
+        return self.__memory_hierarchy_percentage_ipc_degradation(self.__memory_dram)
+        
+
+    def memory_shared_bank_conflicts_rate(self) -> float:
+        """
+        Get percentage of the wavefronts of shared memory due to bank conflicts.
+
+        Returns:
+            Float with the percentage, or 'None' if it's not measured
+
+        Raises:
+            InconsistentMeasuresError   ; raised if there are more bank conflicts than wavefronts
+        """
+
+        conflicts : float = self.__metric_total_value(self.__memory_shared_bank_conflicts,
+            MemorySharedBankConflictsParameters.C_SHARED_BANK_CONFLICTS_METRIC_NAME_NSIGHT, False)
+        wavefronts : float = self.__metric_total_value(self.__memory_shared_bank_conflicts,
+            MemorySharedBankConflictsParameters.C_SHARED_WAVEFRONTS_METRIC_NAME_NSIGHT, False)
+        if conflicts is None or wavefronts is None:
+            return None
+        if np.any(conflicts > wavefronts):
+            raise InconsistentMeasuresError(MemorySharedBankConflictsParameters.C_SHARED_BANK_CONFLICTS_METRIC_NAME_NSIGHT + ", " +
+                MemorySharedBankConflictsParameters.C_SHARED_WAVEFRONTS_METRIC_NAME_NSIGHT)
+        return self._ratio(conflicts, wavefronts)*100.0
+        
+
+    def memory_shared_bank_conflicts_percentage_ipc_degradation(self) -> float:
+        """
+        Find percentage of IPC degradation due to BackEnd.MemoryBound.MioThrottle.SharedBankConflicts part:
+        IPC degradation of BackEnd.MemoryBound.MioThrottle by the share of wavefronts due to bank conflicts.
+
+        Returns:
+            Float with the percent of BackEnd.MemoryBound.MioThrottle.SharedBankConflicts's IPC degradation
+        """
+
+        mio_throttle_ipc_degradation : float = self.memory_mio_throttle_percentage_ipc_degradation()
+        rate : float = self.memory_shared_bank_conflicts_rate()
+        if mio_throttle_ipc_degradation is None or rate is None:
+            return None
+        return mio_throttle_ipc_degradation*(rate/100.0)
@@ -6,6 +6,7 @@ Class that represents the level one of the execution.
 """
 
 import os, sys, inspect
+import numpy as np
 currentdir = os.path.dirname(os.path.abspath(inspect.getfile(inspect.currentframe())))
 parentdir = os.path.dirname(currentdir)
 sys.path.insert(1, parentdir) 
@@ -16,9 +17,17 @@ from measure_parts.front_end import FrontEnd
 from measure_parts.back_end import BackEnd
 from measure_parts.divergence import Divergence
 from measure_parts.retire import Retire
+from measure_parts.roofline import Roofline
 from abc import ABC, abstractmethod # abstract class
 from graph.pie_chart import PieChart
+from graph.roofline_chart import RooflineChart
 from pathlib import Path
+from timings.timings import Timings
+from parameters.timings_params import TimingsParameters
+from parameters.roofline_params import RooflineParameters
+from measure_parts.occupancy import Occupancy
+from parameters.occupancy_params import OccupancyParameters
+from parameters.aggregations_params import AggregationsParameters
 
 class LevelOne(LevelExecution, ABC):
  
@@ -52,19 +61,29 @@ class LevelOne(LevelExecution, ABC):
             output_command : str    ; str with results of execution.
         """
         
-        self._set_front_back_divergence_retire_results(output_command)
+        with Timings.span(TimingsParameters.C_SPAN_PARSE_LEVEL_ONE):
+            self._set_front_back_divergence_retire_results(output_command)
         
     
     def run(self, lst_output : list):
         """Run execution."""
         
         output_command : str
-        if super().input_file() is None: 
-            output_command = super()._launch(self._generate_command())
+        if self._mpi_ranks is not None: # results of each rank in its own file
+            if super().input_file() is None:
+                self._mpi_ranks.clean()
+                super()._launch(self._generate_command())
+            with Timings.span(TimingsParameters.C_SPAN_PARSE_MPI_RANKS):
+                self._mpi_ranks.set_results(self)
         else:
-            output_command = Path(super().input_file()).read_text()      
-        self.set_results(output_command)
-        self._get_results(lst_output)
+            if super().input_file() is None: 
+                output_command = super()._launch(self._generate_command())
+            else:
+                with Timings.span(TimingsParameters.C_SPAN_READ_INPUT):
+                    output_command = Path(super().input_file()).read_text()      
+            self.parse_results(output_command)
+        with Timings.span(TimingsParameters.C_SPAN_MEASURES_TABLE):
+            self._get_results(lst_output)
         
     
     def _get_ipc(self, ipc_metric_name : str) -> float:
@@ -85,7 +104,7 @@ class LevelOne(LevelExecution, ABC):
         ipc_list : list = self._retire.get_metric_value(ipc_metric_name)
         if ipc_list is None:
             raise IpcMetricNotDefined
-        total_ipc : float = self._get_total_value_of_list(ipc_list, True)
+        total_ipc : float = self._get_measure_total_value(ipc_metric_name, ipc_list, AggregationsParameters.C_RATE_DEFAULT_STRATEGY)
         return total_ipc
         
 
@@ -115,7 +134,8 @@ class LevelOne(LevelExecution, ABC):
         warp_execution_efficiency_list : list = self._divergence.get_metric_value(warp_exec_efficiency_name)
         if warp_execution_efficiency_list is None:
             raise RetireIpcMetricNotDefined
-        total_warp_execution_efficiency : float = self._get_total_value_of_list(warp_execution_efficiency_list, True)
+        total_warp_execution_efficiency : float = self._get_measure_total_value(warp_exec_efficiency_name, warp_execution_efficiency_list, 
+            AggregationsParameters.C_RATE_DEFAULT_STRATEGY)
         return self.ipc()*(total_warp_execution_efficiency/100.0)
         
 
@@ -175,6 +195,422 @@ class LevelOne(LevelExecution, ABC):
 
         pass
 
+    def roofline(self) -> Roofline:
+        """
+        Return Roofline part of the execution.
+
+        Returns:
+            reference to Roofline part of the execution, or 'None' if it's not measured
+        """
+
+        return super().optional_part(Roofline)
+        
+
+    @abstractmethod
+    def _roofline_launch_values(self, launch : int) -> dict:
+        """
+        Get the measures of the roofline model in the launch indicated.
+
+        Args:
+            launch  : int   ; index of the launch
+
+        Returns:
+            Dictionary with the keys 'flop' (dictionary with the precision as key and the number of floating
+            point operations as value), 'seconds' (duration), 'dram_bytes', 'l2_bytes', 'compute' (% of the
+            peak FLOP rate of the device) and 'memory' (% of the peak DRAM bandwidth of the device). Values which
+            cannot be obtained are 'None'
+        """
+
+        pass
+
+    def _roofline_class(self, compute : float, memory : float) -> str:
+        """
+        Classify execution based on the percentages of the peaks of the device it achieves.
+
+        Args:
+            compute     : float ; % of the peak FLOP rate, or 'None'
+
+            memory      : float ; % of the peak DRAM bandwidth, or 'None'
+
+        Returns:
+            String with the class (memory-bound, compute-bound or latency-bound), or 'None' if
+            there are no percentages
+        """
+
+        values : list = [value for value in (compute, memory) if not value is None]
+        if not values:
+            return None
+        if max(values) < RooflineParameters.C_LATENCY_BOUND_THRESHOLD:
+            return RooflineParameters.C_LATENCY_BOUND_CLASS
+        if memory is None or (not compute is None and compute >= memory):
+            return RooflineParameters.C_COMPUTE_BOUND_CLASS
+        return RooflineParameters.C_MEMORY_BOUND_CLASS
+        
+
+    def roofline_results(self) -> dict:
+        """
+        Get the results of the roofline model in the selected launches. Counts are added and
+        percentages of the peaks are averaged as a function of the time executed.
+
+        Returns:
+            Dictionary with the keys 'flop' and 'gflops' (dictionaries with the precision as key and
+            the number of floating point operations or GFLOP/s as value), 'arithmetic_intensity_dram' and
+            'arithmetic_intensity_l2' (FLOP/byte), 'compute' and 'memory' (% of the peaks of the device)
+            and 'class'. Values which cannot be obtained are 'None'
+
+        Raises:
+            RooflineNotMeasuredError    ; raised if Roofline part has not been measured
+        """
+
+        if self.roofline() is None:
+            raise RooflineNotMeasuredError
+        flop : dict = dict.fromkeys(RooflineParameters.C_PRECISIONS, 0.0)
+        seconds : float = 0.0
+        dram_bytes : float = 0.0
+        l2_bytes : float = 0.0
+        weighted_values : dict = {"compute" : 0.0, "memory" : 0.0}
+        weights : dict = {"compute" : 0.0, "memory" : 0.0}
+        values : dict
+        weight : float
+        for i in self._launches_indexes(self.num_launches()):
+            values = self._roofline_launch_values(i)
+            weight = self._percentage_time_kernel(i)/100.0
+            for precision in RooflineParameters.C_PRECISIONS:
+                if not values["flop"].get(precision) is None:
+                    flop[precision] += values["flop"][precision]
+            seconds = None if seconds is None or values["seconds"] is None else seconds + values["seconds"]
+            dram_bytes = None if dram_bytes is None or values["dram_bytes"] is None else dram_bytes + values["dram_bytes"]
+            l2_bytes = None if l2_bytes is None or values["l2_bytes"] is None else l2_bytes + values["l2_bytes"]
+            for key in weighted_values:
+                if not values[key] is None:
+                    weighted_values[key] += values[key]*weight
+                    weights[key] += weight
+        total_flop : float = sum(flop.values())
+        compute : float = weighted_values["compute"]/weights["compute"] if weights["compute"] > 0.0 else None
+        memory : float = weighted_values["memory"]/weights["memory"] if weights["memory"] > 0.0 else None
+        return {"flop" : flop, "gflops" : {precision : (flop[precision]/seconds)/1e9 if seconds else None for precision in flop},
+            "arithmetic_intensity_dram" : total_flop/dram_bytes if dram_bytes else None,
+            "arithmetic_intensity_l2" : total_flop/l2_bytes if l2_bytes else None,
+            "compute" : compute, "memory" : memory, "class" : self._roofline_class(compute, memory)}
+        
+
+    def roofline_per_kernel(self) -> list:
+        """
+        Get the results of the roofline model of each kernel (launches grouped by kernel's name)
+        in the selected launches, from the biggest kernel (by percentage of cycles elapsed) to the smallest.
+
+        Returns:
+            List of dictionaries with the keys 'kernel', 'launches' (number of launches), 'cycles' (% of the
+            cycles elapsed) and the keys of 'roofline_results' ('None' values if kernel has no cycles)
+
+        Raises:
+            RooflineNotMeasuredError    ; raised if Roofline part has not been measured
+        """
+
+        if self.roofline() is None:
+            raise RooflineNotMeasuredError
+        results : list = list()
+        selected_launches : list = self.selected_launches()
+        kernel_name : str
+        launches : list
+        time_percentage : float
+        try:
+            for kernel_name, launches, time_percentage in self._kernel_groups():
+                self.select_launches(launches)
+                try:
+                    results.append(dict(self.roofline_results(), kernel = kernel_name, 
+                        launches = len(launches), cycles = time_percentage))
+                except ZeroDivisionError: # kernel without cycles
+                    results.append({"kernel" : kernel_name, "launches" : len(launches),
+                        "cycles" : time_percentage, "flop" : dict.fromkeys(RooflineParameters.C_PRECISIONS),
+                        "gflops" : dict.fromkeys(RooflineParameters.C_PRECISIONS), "arithmetic_intensity_dram" : None,
+                        "arithmetic_intensity_l2" : None, "compute" : None, "memory" : None, "class" : None})
+        finally:
+            self.select_launches(selected_launches)
+        return results
+        
+
+    def roofline_report_str(self, decimals : int) -> str:
+        """
+        Get table with the results of the roofline model of each kernel.
+
+        Args:
+            decimals    : int   ; number of decimals of the values
+
+        Returns:
+            String with the table
+        """
+
+        titles : list = ([RooflineParameters.C_KERNEL_COLUMN_TITLE, RooflineParameters.C_LAUNCHES_COLUMN_TITLE,
+            RooflineParameters.C_CYCLES_COLUMN_TITLE] + [RooflineParameters.C_GFLOPS_COLUMN_TITLE % 
+            RooflineParameters.C_PRECISION_TITLES[precision] for precision in RooflineParameters.C_PRECISIONS] +
+            [RooflineParameters.C_AI_DRAM_COLUMN_TITLE, RooflineParameters.C_AI_L2_COLUMN_TITLE, RooflineParameters.C_COMPUTE_COLUMN_TITLE,
+            RooflineParameters.C_MEMORY_COLUMN_TITLE, RooflineParameters.C_CLASS_COLUMN_TITLE])
+        rows : list = [[kernel["kernel"][:RooflineParameters.C_KERNEL_NAME_MAX_LENGTH], str(kernel["launches"]), 
+            self.__roofline_value_str(kernel["cycles"], decimals)] + [self.__roofline_value_str(kernel["gflops"][precision], decimals) 
+            for precision in RooflineParameters.C_PRECISIONS] + [self.__roofline_value_str(kernel[key], decimals) for key in 
+            ["arithmetic_intensity_dram", "arithmetic_intensity_l2", "compute", "memory"]] + 
+            [RooflineParameters.C_NOT_AVAILABLE_VALUE if kernel["class"] is None else kernel["class"]]
+            for kernel in self.roofline_per_kernel()]
+        lengths : list = [max([len(title) + 2, RooflineParameters.C_VALUE_COLUMN_MIN_LENGTH] + [len(row[i]) + 2 for row in rows])
+            for i, title in enumerate(titles)]
+        lines : list = ["".join("%-*s" % (lengths[i], title) for i, title in enumerate(titles))]
+        lines.append("-"*len(lines[0]))
+        lines += ["".join("%-*s" % (lengths[i], value) for i, value in enumerate(row)) for row in rows]
+        return "\n".join(lines)
+        
+
+    def __roofline_value_str(self, value : float, decimals : int) -> str:
+        """ Get value rounded as string, or not available mark if it's 'None'."""
+
+        if value is None:
+            return RooflineParameters.C_NOT_AVAILABLE_VALUE
+        return str(round(value, decimals))
+        
+
+    def _create_roofline_graph(self) -> RooflineChart:
+        """ 
+        Create roofline graph with one point per kernel (size of the point is its percentage of cycles).
+
+        Returns:
+            Reference to RooflineChart with graph
+        """
+
+        graph : RooflineChart = RooflineChart(RooflineParameters.C_GRAPH_TITLE, RooflineParameters.C_GRAPH_X_AXIS_TITLE,
+            RooflineParameters.C_GRAPH_Y_AXIS_TITLE, RooflineParameters.C_LATENCY_BOUND_THRESHOLD, RooflineParameters.C_GRAPH_HOVER_TEMPLATE,
+            RooflineParameters.C_GRAPH_MIN_MARKER_SIZE, RooflineParameters.C_GRAPH_MAX_MARKER_SIZE)
+        for kernel in self.roofline_per_kernel():
+            if kernel["class"] is None:
+                continue
+            graph.add_point(kernel["class"], kernel["kernel"], 0.0 if kernel["memory"] is None else kernel["memory"],
+                0.0 if kernel["compute"] is None else kernel["compute"], kernel["cycles"], [kernel["cycles"], 
+                RooflineParameters.C_NOT_AVAILABLE_VALUE if kernel["arithmetic_intensity_dram"] is None else 
+                "%.3f" % kernel["arithmetic_intensity_dram"]])
+        return graph
+        
+
+    def showRooflineGraph(self):
+        """Show roofline graph with one point per kernel."""
+
+        with Timings.span(TimingsParameters.C_SPAN_GRAPH_ROOFLINE):
+            self._create_roofline_graph().show()
+        
+
+    def saveRooflineGraph(self, file_str : str):
+        """ 
+        Save roofline graph with one point per kernel in file indicated as argument. Format 
+        (html, png, svg or pdf) is obtained from the extension of the file.
+
+        Args:
+            file_str    : str   ; path to output file where save fig
+        """
+
+        with Timings.span(TimingsParameters.C_SPAN_GRAPH_ROOFLINE):
+            self._create_roofline_graph().save(file_str)
+        
+
+    def occupancy(self) -> Occupancy:
+        """
+        Return Occupancy part of the execution.
+
+        Returns:
+            reference to Occupancy part of the execution, or 'None' if it's not measured
+        """
+
+        return super().optional_part(Occupancy)
+        
+
+    @abstractmethod
+    def _occupancy_launch_values(self, launch : int) -> dict:
+        """
+        Get the launch configuration and occupancy of the launch indicated.
+
+        Args:
+            launch  : int   ; index of the launch
+
+        Returns:
+            Dictionary with the keys 'block_size', 'grid_size', 'registers' (per thread), 'shared_memory' 
+            (bytes per block), 'theoretical' and 'achieved' (% of occupancy) and 'limiter' (resource which 
+            limits the theoretical occupancy). Values which cannot be obtained are 'None'
+        """
+
+        pass
+
+    def _occupancy_diagnosis(self, theoretical : float, achieved : float, limiter : str, bottleneck : str) -> str:
+        """
+        Check if low occupancy explains the stalls of the execution: the BackEnd is the bottleneck (there
+        are not enough warps to hide the latency of the stalls) and the occupancy is low.
+
+        Args:
+            theoretical : float ; % of theoretical occupancy, or 'None'
+
+            achieved    : float ; % of achieved occupancy, or 'None'
+
+            limiter     : str   ; resource which limits the theoretical occupancy, or 'None'
+
+            bottleneck  : str   ; name of the part of level one with the highest IPC degradation, or 'None'
+
+        Returns:
+            String with the diagnosis, or 'None' if low occupancy doesn't explain the stalls
+        """
+
+        if achieved is None or bottleneck != self._back_end.name():
+            return None
+        if not theoretical is None and theoretical < OccupancyParameters.C_LOW_OCCUPANCY_THRESHOLD:
+            if limiter is None:
+                return OccupancyParameters.C_LOW_OCCUPANCY_DIAGNOSIS
+            return OccupancyParameters.C_LOW_THEORETICAL_DIAGNOSIS % limiter
+        if achieved >= OccupancyParameters.C_LOW_OCCUPANCY_THRESHOLD:
+            return None
+        if theoretical and achieved/theoretical < OccupancyParameters.C_ACHIEVED_THEORETICAL_RATIO_THRESHOLD:
+            return OccupancyParameters.C_LOW_ACHIEVED_DIAGNOSIS
+        return OccupancyParameters.C_LOW_OCCUPANCY_DIAGNOSIS
+        
+
+    def occupancy_per_kernel(self) -> list:
+        """
+        Get the launch configuration and occupancy of each kernel (launches grouped by kernel's name) in
+        the selected launches, joined to its results of level one, from the biggest kernel (by percentage of 
+        cycles elapsed) to the smallest. Launch configuration is the one of the launch with more cycles, and 
+        occupancies are averaged as a function of the time executed.
+
+        Returns:
+            List of dictionaries with the keys 'kernel', 'launches' (number of launches), 'cycles' (% of the
+            cycles elapsed), the keys of '_occupancy_launch_values', 'bottleneck' (name of the part of level 
+            one with the highest IPC degradation), 'back_end' (% of IPC degradation of BackEnd) and 'diagnosis'.
+            Values which cannot be obtained are 'None'
+
+        Raises:
+            OccupancyNotMeasuredError   ; raised if Occupancy part has not been measured
+        """
+
+        if self.occupancy() is None:
+            raise OccupancyNotMeasuredError
+        cycles : list = self.cycles_elapsed()
+        retire_name : str = self.retire().name()
+        results : list = list()
+        selected_launches : list = self.selected_launches()
+        kernel_name : str
+        launches : list
+        time_percentage : float
+        result : dict
+        values : dict
+        weight : float
+        weighted_value : float
+        total_weight : float
+        degradations : list
+        try:
+            for kernel_name, launches, time_percentage in self._kernel_groups():
+                self.select_launches(launches)
+                result = dict(self._occupancy_launch_values(max(launches, key = lambda i: cycles[i] if i < len(cycles) else 0.0)),
+                    kernel = kernel_name, launches = len(launches), cycles = time_percentage, bottleneck = None, back_end = None)
+                for key in ["theoretical", "achieved"]:
+                    weighted_value = 0.0
+                    total_weight = 0.0
+                    for i in launches:
+                        values = self._occupancy_launch_values(i)
+                        if not values[key] is None:
+                            weight = self._percentage_time_kernel(i)/100.0
+                            weighted_value += values[key]*weight
+                            total_weight += weight
+                    result[key] = weighted_value/total_weight if total_weight > 0.0 else None
+                try:
+                    degradations = [(value, name) for name, parent_name, value in self.topdown_tree() 
+                        if parent_name == "" and name != retire_name and not value is None]
+                    result["bottleneck"] = max(degradations)[1] if degradations else None
+                    result["back_end"] = self.back_end_percentage_ipc_degradation()
+                except ZeroDivisionError: # kernel without stalls/cycles
+                    pass
+                result["diagnosis"] = self._occupancy_diagnosis(result["theoretical"], result["achieved"], result["limiter"],
+                    result["bottleneck"])
+                results.append(result)
+        finally:
+            self.select_launches(selected_launches)
+        return results
+        
+
+    def occupancy_report_str(self, decimals : int) -> str:
+        """
+        Get table with the launch configuration, occupancy and bottleneck of each kernel.
+
+        Args:
+            decimals    : int   ; number of decimals of the values
+
+        Returns:
+            String with the table
+        """
+
+        titles : list = [OccupancyParameters.C_KERNEL_COLUMN_TITLE, OccupancyParameters.C_LAUNCHES_COLUMN_TITLE,
+            OccupancyParameters.C_CYCLES_COLUMN_TITLE, OccupancyParameters.C_BLOCK_SIZE_COLUMN_TITLE, 
+            OccupancyParameters.C_GRID_SIZE_COLUMN_TITLE, OccupancyParameters.C_REGISTERS_COLUMN_TITLE,
+            OccupancyParameters.C_SHARED_MEMORY_COLUMN_TITLE, OccupancyParameters.C_THEORETICAL_COLUMN_TITLE,
+            OccupancyParameters.C_ACHIEVED_COLUMN_TITLE, OccupancyParameters.C_BOTTLENECK_COLUMN_TITLE,
+            OccupancyParameters.C_DIAGNOSIS_COLUMN_TITLE]
+        rows : list = [[kernel["kernel"][:OccupancyParameters.C_KERNEL_NAME_MAX_LENGTH], str(kernel["launches"]),
+            self.__occupancy_value_str(kernel["cycles"], decimals)] + [self.__occupancy_value_str(kernel[key], 0) for key in
+            ["block_size", "grid_size", "registers", "shared_memory"]] + [self.__occupancy_value_str(kernel[key], decimals) 
+            for key in ["theoretical", "achieved"]] + [OccupancyParameters.C_NOT_AVAILABLE_VALUE if kernel[key] is None 
+            else kernel[key] for key in ["bottleneck", "diagnosis"]] for kernel in self.occupancy_per_kernel()]
+        lengths : list = [max([len(title) + 2, OccupancyParameters.C_VALUE_COLUMN_MIN_LENGTH] + [len(row[i]) + 2 for row in rows])
+            for i, title in enumerate(titles)]
+        lines : list = ["".join("%-*s" % (lengths[i], title) for i, title in enumerate(titles))]
+        lines.append("-"*len(lines[0]))
+        lines += ["".join("%-*s" % (lengths[i], value) for i, value in enumerate(row)) for row in rows]
+        return "\n".join(lines)
+        
+
+    def __occupancy_value_str(self, value : float, decimals : int) -> str:
+        """ Get value rounded as string (integer if 'decimals' is 0), or not available mark if it's 'None'."""
+
+        if value is None:
+            return OccupancyParameters.C_NOT_AVAILABLE_VALUE
+        if decimals == 0:
+            return str(int(round(value)))
+        return str(round(value, decimals))
+        
+
+    def measure_parts(self) -> list:
+        """
+        Returns all the parts (FrontEnd, BackEnd...) measured in the execution.
+
+        Returns:
+            List with references to the parts of the execution
+        """
+
+        return [self._front_end, self._back_end, self._divergence, self._retire, self._extra_measure] + self._optional_parts
+        
+
+    def topdown_results(self) -> dict:
+        """
+        Get the results of the TopDown methodology in the selected launches.
+
+        Returns:
+            Dictionary with the name of the result as key and its value (float) as value
+        """
+
+        return dict({"ipc" : self.ipc(), "retire_ipc" : self.retire_ipc(), 
+            "retire_ipc_percentage" : self.retire_ipc_percentage(),
+            "front_end_stall" : self.front_end_stall(), "back_end_stall" : self.back_end_stall(),
+            "front_end_percentage_ipc_degradation" : self.front_end_percentage_ipc_degradation(),
+            "back_end_percentage_ipc_degradation" : self.back_end_percentage_ipc_degradation(),
+            "divergence_percentage_ipc_degradation" : self.divergence_percentage_ipc_degradation()})
+        
+
+    def topdown_tree(self) -> list:
+        """
+        Get the hierarchy of the parts of the TopDown methodology with their percentage of IPC 
+        (degradation or retired) in the selected launches.
+
+        Returns:
+            List of tuples (name of part, name of parent part or "" if it's a root part, value)
+        """
+
+        return [(self._front_end.name(), "", self.front_end_percentage_ipc_degradation()),
+            (self._back_end.name(), "", self.back_end_percentage_ipc_degradation()),
+            (self._divergence.name(), "", self.divergence_percentage_ipc_degradation()),
+            (self._retire.name(), "", self.retire_ipc_percentage())]
+        
+
     def total_front_back_stall(self) -> float:
         """
         Returns all percent of stalls due to FrontEnd and BackEnd part.
@@ -234,12 +670,11 @@ class LevelOne(LevelExecution, ABC):
         warp_execution_efficiency_list  : list = self._divergence.get_metric_value(warp_exec_efficiency_name)
         if warp_execution_efficiency_list is None:
             raise RetireIpcMetricNotDefined
-        total_warp_execution_efficiency : float = self._get_total_value_of_list(warp_execution_efficiency_list, True)
+        total_warp_execution_efficiency : float = self._get_measure_total_value(warp_exec_efficiency_name, warp_execution_efficiency_list, 
+            AggregationsParameters.C_RATE_DEFAULT_STRATEGY)
         issued_ipc_list : list = self._divergence.get_metric_value(issue_ipc_name)
-        total_issued_ipc : float = self._get_total_value_of_list(issued_ipc_list, True)
-        ipc_diference : float = float(total_issued_ipc) - ipc
-        if ipc_diference < 0.0:
-            ipc_diference = 0.0
+        total_issued_ipc : float = self._get_measure_total_value(issue_ipc_name, issued_ipc_list, AggregationsParameters.C_RATE_DEFAULT_STRATEGY)
+        ipc_diference : float = np.maximum(total_issued_ipc - ipc, 0.0)
         return ipc * (1.0 - (total_warp_execution_efficiency/100.0)) + ipc_diference
         
 
@@ -21,6 +21,10 @@ from measure_parts.extra_measure import ExtraMeasureNsight
 from show_messages.message_format import MessageFormat
 from errors.level_execution_errors import *
 from parameters.level_execution_params import LevelExecutionParameters
+from measure_parts.roofline import Roofline
+from parameters.roofline_params import RooflineParameters
+from measure_parts.occupancy import Occupancy
+from parameters.occupancy_params import OccupancyParameters
 
 class LevelOneNsight(LevelOne, LevelExecutionNsight):
     """ 
@@ -54,9 +58,9 @@ class LevelOneNsight(LevelOne, LevelExecutionNsight):
             String with command to be executed
         """
         
-        command : str = ("ncu --target-processes all --metrics " + self._front_end.metrics_str() + 
+        command : str = ("ncu --target-processes all " + self._profiler_flags() + "--metrics " + self._front_end.metrics_str() + 
             "," + self._back_end.metrics_str() + "," + self._divergence.metrics_str() + "," + self._extra_measure.metrics_str() +
-            "," + self._retire.metrics_str() + " "+  str(self._program))
+            "," + self._retire.metrics_str() + self._optional_metrics_str() + " " + str(self._program))
         return command
         
 
@@ -148,6 +152,7 @@ class LevelOneNsight(LevelOne, LevelExecutionNsight):
             lst_output.append(converter.underlined_str(self._extra_measure.name()))
             super()._add_result_part_to_lst(self._extra_measure.metrics(), 
                 self._extra_measure.metrics_description(), lst_output)
+        super()._add_optional_parts_results(lst_output)
         lst_output.append("\n")
         
 
@@ -179,6 +184,7 @@ class LevelOneNsight(LevelOne, LevelExecutionNsight):
         line : str
         i : int
         list_words : list
+        kernel_line : re.Match
         front_end_value_has_found : bool
         frond_end_unit_has_found : bool
         back_end_value_has_found : bool
@@ -189,6 +195,7 @@ class LevelOneNsight(LevelOne, LevelExecutionNsight):
         extra_measure_unit_has_found : bool
         retire_value_has_found : bool 
         retire_unit_has_found : bool
+        optional_part_has_found : bool
         can_read_results : bool = False
         for line in str(results_launch).splitlines():
             line = re.sub(' +', ' ', line) # delete more than one spaces and put only one
@@ -199,6 +206,11 @@ class LevelOneNsight(LevelOne, LevelExecutionNsight):
                 if list_words[0] == "==PROF==" and list_words[1] == "Disconnected":
                         can_read_results = True
                 continue
+            # check if it's kernel line
+            kernel_line = re.match(LevelExecutionParameters.C_KERNEL_LINE_REGEX_NSIGHT, line)
+            if kernel_line is not None:
+                super().add_kernel(kernel_line.group("kernel"))
+                continue
             if (len(list_words) == 4 or len(list_words) == 3) and list_words[1][0] != "-":
                 if len(list_words) == 3: 
                     metric_name = list_words[1]
@@ -219,13 +231,92 @@ class LevelOneNsight(LevelOne, LevelExecutionNsight):
                 extra_measure_unit_has_found = self._extra_measure.set_metric_unit(metric_name, metric_unit)
                 retire_value_has_found = self._retire.set_metric_value(metric_name, metric_value)
                 retire_unit_has_found = self._retire.set_metric_unit(metric_name, metric_unit)
-                if (not (front_end_value_has_found or back_end_value_has_found or divergence_value_has_found or 
+                optional_part_has_found = self._set_optional_parts_metric(metric_name, metric_value, metric_unit)
+                if not optional_part_has_found and (not (front_end_value_has_found or back_end_value_has_found or divergence_value_has_found or 
                     extra_measure_value_has_found or retire_value_has_found) or 
                     not(frond_end_unit_has_found or back_end_unit_has_found 
                     or divergence_unit_has_found or extra_measure_unit_has_found or retire_unit_has_found)):
                     raise MetricNotAsignedToPart(metric_name)
         
 
+    def _roofline_launch_values(self, launch : int) -> dict:
+        """
+        Get the measures of the roofline model in the launch indicated. Percentages of the peaks are computed
+        per cycle: operations per SM cycle on the peak operations per SM cycle (fma is two operations), and
+        DRAM bytes per DRAM cycle on the peak DRAM bytes per DRAM cycle.
+
+        Args:
+            launch  : int   ; index of the launch
+
+        Returns:
+            Dictionary with the keys 'flop', 'seconds', 'dram_bytes', 'l2_bytes', 'compute' and 'memory'
+            (see 'LevelOne._roofline_launch_values')
+        """
+
+        roofline : Roofline = self.roofline()
+
+        metric_names : dict = {"sp" : RooflineParameters.C_FLOP_SP_METRIC_NAMES_NSIGHT, "dp" : RooflineParameters.C_FLOP_DP_METRIC_NAMES_NSIGHT,
+            "hp" : RooflineParameters.C_FLOP_HP_METRIC_NAMES_NSIGHT}
+        peak_metric_names : dict = {"sp" : RooflineParameters.C_FLOP_SP_PEAK_METRIC_NAME_NSIGHT, 
+            "dp" : RooflineParameters.C_FLOP_DP_PEAK_METRIC_NAME_NSIGHT, "hp" : RooflineParameters.C_FLOP_HP_PEAK_METRIC_NAME_NSIGHT}
+        sm_cycles : float = self._optional_part_value(roofline, RooflineParameters.C_SM_CYCLES_METRIC_NAME_NSIGHT, launch)
+        flop : dict = dict()
+        compute : float = None
+        add_value : float
+        mul_value : float
+        fma_value : float
+        peak : float
+        for precision in RooflineParameters.C_PRECISIONS:
+            add_value, mul_value, fma_value = [self._optional_part_value(roofline, metric_name, launch) 
+                for metric_name in metric_names[precision]]
+            flop[precision] = None
+            if not (add_value is None or mul_value is None or fma_value is None):
+                flop[precision] = add_value + mul_value + 2.0*fma_value
+                peak = self._optional_part_value(roofline, peak_metric_names[precision], launch)
+                if sm_cycles and peak:
+                    compute = max(0.0 if compute is None else compute, (flop[precision]/(sm_cycles*2.0*peak))*100.0)
+        dram_bytes : float = self._optional_part_value(roofline, RooflineParameters.C_DRAM_BYTES_METRIC_NAME_NSIGHT, launch)
+        dram_peak : float = self._optional_part_value(roofline, RooflineParameters.C_DRAM_BYTES_PEAK_METRIC_NAME_NSIGHT, launch)
+        dram_cycles : float = self._optional_part_value(roofline, RooflineParameters.C_DRAM_CYCLES_METRIC_NAME_NSIGHT, launch)
+        memory : float = None
+        if not dram_bytes is None and dram_peak and dram_cycles:
+            memory = (dram_bytes/(dram_cycles*dram_peak))*100.0
+        return {"flop" : flop, "seconds" : self._optional_part_value(roofline, RooflineParameters.C_DURATION_METRIC_NAME_NSIGHT, launch),
+            "dram_bytes" : dram_bytes, "l2_bytes" : self._optional_part_value(roofline, RooflineParameters.C_L2_BYTES_METRIC_NAME_NSIGHT, launch),
+            "compute" : compute, "memory" : memory}
+        
+
+    def _occupancy_launch_values(self, launch : int) -> dict:
+        """
+        Get the launch configuration and occupancy of the launch indicated. The resource which limits the 
+        theoretical occupancy is the one which allows less blocks per SM.
+
+        Args:
+            launch  : int   ; index of the launch
+
+        Returns:
+            Dictionary with the keys 'block_size', 'grid_size', 'registers', 'shared_memory', 'theoretical', 
+            'achieved' and 'limiter' (see 'LevelOne._occupancy_launch_values')
+        """
+
+        occupancy : Occupancy = self.occupancy()
+        static_shared_memory : float = self._optional_part_value(occupancy, OccupancyParameters.C_STATIC_SHARED_MEMORY_METRIC_NAME_NSIGHT, 
+            launch)
+        dynamic_shared_memory : float = self._optional_part_value(occupancy, OccupancyParameters.C_DYNAMIC_SHARED_MEMORY_METRIC_NAME_NSIGHT, 
+            launch)
+        limits : list = [(self._optional_part_value(occupancy, metric_name, launch), resource) for resource, metric_name in 
+            OccupancyParameters.C_LIMIT_METRIC_NAMES_NSIGHT.items()]
+        limits = [(value, resource) for value, resource in limits if not value is None]
+        return {"block_size" : self._optional_part_value(occupancy, OccupancyParameters.C_BLOCK_SIZE_METRIC_NAME_NSIGHT, launch),
+            "grid_size" : self._optional_part_value(occupancy, OccupancyParameters.C_GRID_SIZE_METRIC_NAME_NSIGHT, launch),
+            "registers" : self._optional_part_value(occupancy, OccupancyParameters.C_REGISTERS_METRIC_NAME_NSIGHT, launch),
+            "shared_memory" : None if static_shared_memory is None or dynamic_shared_memory is None else 
+                static_shared_memory + dynamic_shared_memory,
+            "theoretical" : self._optional_part_value(occupancy, OccupancyParameters.C_THEORETICAL_OCCUPANCY_METRIC_NAME_NSIGHT, launch),
+            "achieved" : self._optional_part_value(occupancy, OccupancyParameters.C_ACHIEVED_OCCUPANCY_METRIC_NAME_NSIGHT, launch),
+            "limiter" : min(limits)[1] if limits else None}
+        
+
     def retire_ipc(self) -> float:
         """
         Get "RETIRE" IPC of execution.
@@ -18,6 +18,9 @@ from measure_parts.retire import RetireNvprof
 from measure_parts.extra_measure import ExtraMeasureNvprof
 from show_messages.message_format import MessageFormat
 from parameters.level_execution_params import LevelExecutionParameters
+from measure_parts.roofline import Roofline
+from parameters.roofline_params import RooflineParameters
+from parameters.occupancy_params import OccupancyParameters
 from errors.level_execution_errors import *
 
 class LevelOneNvprof(LevelOne, LevelExecutionNvprof):
@@ -65,14 +68,29 @@ class LevelOneNvprof(LevelOne, LevelExecutionNvprof):
             String with command to be executed
         """
         
-        command : str = ("nvprof --metrics " + self._front_end.metrics_str() + 
+        command : str = ("nvprof " + self._profiler_flags() + "--metrics " + self._front_end.metrics_str() + 
             "," + self._back_end.metrics_str() + "," + self._divergence.metrics_str() + "," + self._extra_measure.metrics_str()
-            + "," + self._retire.metrics_str() + "  --events " + self._front_end.events_str() + 
+            + "," + self._retire.metrics_str() + self._optional_metrics_str() + "  --events " + self._front_end.events_str() + 
             "," + self._back_end.events_str() + "," + self._divergence.events_str() +  "," + self._extra_measure.events_str() +
-             "," + self._retire.events_str() + " --unified-memory-profiling off " + self._program)
+             "," + self._retire.events_str() + self._optional_events_str() + " --unified-memory-profiling off " + self._program)
         return command
         
 
+    def __utilization_value(self, level_str : str) -> str:
+        """
+        Get value of utilization metric as percentage.
+
+        Args:
+            level_str   : str   ; level of the utilization ('(L)', from 0 to 10)
+
+        Returns:
+            String with the percentage
+        """
+
+        utilization_level : re.Match = re.match(LevelExecutionParameters.C_UTILIZATION_LEVEL_REGEX_NVPROF, level_str)
+        return "%.1f%%" % (int(utilization_level.group("level"))*LevelExecutionParameters.C_UTILIZATION_LEVEL_PERCENTAGE_NVPROF)
+        
+
     def _set_front_back_divergence_retire_results(self, results_launch : str):
         """ Get Results from FrontEnd, BanckEnd, Divergence and Retire parts.
         
@@ -90,9 +108,10 @@ class LevelOneNvprof(LevelOne, LevelExecutionNvprof):
         metric_name : str
         metric_description : str = ""
         metric_avg_value : str 
-        #metric_max_value : str 
-        #metric_min_value : str
+        metric_max_value : str 
+        metric_min_value : str
         has_read_all_events : bool = False
+        num_kernels_metrics : int = 0
         line : str
         i : int
         list_words : list
@@ -106,14 +125,21 @@ class LevelOneNvprof(LevelOne, LevelExecutionNvprof):
         extra_measure_description_has_found : bool
         retire_value_has_found : bool 
         retire_description_has_found : bool
+        optional_part_has_found : bool
+        utilization_level : re.Match
+        num_words_per_value : int
         for line in results_launch.splitlines():
             line = re.sub(' +', ' ', line) # delete more than one spaces and put only one
             list_words = line.split(" ")
             
             # check if it's kernel line
-            # line type: ['', 'Kernel:', "KERNEL_NAME"]
-            if len(list_words) == 3 and list_words[0] == '' and list_words[1] == "Kernel:":
-                super().add_kernel(list_words[2])
+            # line type: ['', 'Kernel:', "KERNEL_NAME", ...]. Kernels are listed in events and metrics results
+            if len(list_words) > 2 and list_words[0] == '' and list_words[1] == LevelExecutionParameters.C_KERNEL_LINE_WORD_NVPROF:
+                if not has_read_all_events or num_kernels_metrics >= len(super().kernels()):
+                    super().add_kernel(" ".join(list_words[2:]))
+                if has_read_all_events:
+                    num_kernels_metrics += 1
+                continue
             if not has_read_all_events:
                 # Check if it's line of interest:
                 # ['', 'X', 'event_name','Min', 'Max', 'Avg', 'Total']
@@ -133,7 +159,8 @@ class LevelOneNvprof(LevelOne, LevelExecutionNvprof):
                         #extra_measure_description_has_found = extra_measure.set_event_description(event_name, metric_description)
                         retire_value_has_found = self._retire.set_event_value(event_name, event_total_value)
                         #retire_description_has_found = extra_measure.set_event_description(event_name, metric_description)
-                        if (not (front_end_value_has_found or back_end_value_has_found or divergence_value_has_found or 
+                        optional_part_has_found = self._set_optional_parts_event(event_name, event_total_value)
+                        if not optional_part_has_found and (not (front_end_value_has_found or back_end_value_has_found or divergence_value_has_found or 
                             extra_measure_value_has_found or retire_value_has_found)): #or 
                             #not(frond_end_description_has_found or back_end_description_has_found 
                             #or divergence_description_has_found or extra_measure_description_has_found)):
@@ -141,16 +168,25 @@ class LevelOneNvprof(LevelOne, LevelExecutionNvprof):
             else: # metrics
                 # Check if it's line of interest:
                 # ['', 'X', 'NAME_COUNTER', ... , 'Min', 'Max', 'Avg' (Y%)] where X (int number), Y (int/float number)
-                if len(list_words) > 1 and list_words[0] == '' and list_words[len(list_words) - 1][0].isnumeric():
+                # or utilization metrics: [..., 'Min', '(L)', 'Max', '(L)', 'Avg', '(L)'] where L (level from 0 to 10)
+                utilization_level = re.match(LevelExecutionParameters.C_UTILIZATION_LEVEL_REGEX_NVPROF, list_words[len(list_words) - 1])
+                if (len(list_words) > 1 and list_words[0] == '' and (list_words[len(list_words) - 1][0].isnumeric() 
+                    or utilization_level is not None)):
                     metric_name = list_words[2]
                     metric_description = ""
-                    for i in range(3, len(list_words) - 3):
+                    num_words_per_value = 1 if utilization_level is None else 2
+                    for i in range(3, len(list_words) - 3*num_words_per_value):
                         metric_description += list_words[i] + " "     
-                    metric_avg_value = list_words[len(list_words) - 1]
-                    #metric_max_value = list_words[len(list_words) - 2]
-                    #metric_min_value = list_words[len(list_words) - 3]
-                    #if metric_avg_value != metric_max_value or metric_avg_value != metric_min_value:
-                        # Do Something. NOT USED
+                    if utilization_level is None:
+                        metric_avg_value = list_words[len(list_words) - 1]
+                        metric_max_value = list_words[len(list_words) - 2]
+                        metric_min_value = list_words[len(list_words) - 3]
+                    else:
+                        metric_avg_value = self.__utilization_value(list_words[len(list_words) - 1])
+                        metric_max_value = self.__utilization_value(list_words[len(list_words) - 3])
+                        metric_min_value = self.__utilization_value(list_words[len(list_words) - 5])
+                    for part in [self._front_end, self._back_end, self._divergence, self._extra_measure, self._retire]:
+                        part.set_metric_range(metric_name, metric_min_value, metric_max_value)
                     front_end_value_has_found = self._front_end.set_metric_value(metric_name, metric_avg_value)
                     frond_end_description_has_found = self._front_end.set_metric_description(metric_name, metric_description)
                     back_end_value_has_found = self._back_end.set_metric_value(metric_name, metric_avg_value)
@@ -161,7 +197,8 @@ class LevelOneNvprof(LevelOne, LevelExecutionNvprof):
                     extra_measure_description_has_found = self._extra_measure.set_metric_description(metric_name, metric_description)
                     retire_value_has_found = self._retire.set_metric_value(metric_name, metric_avg_value)
                     retire_description_has_found = self._retire.set_metric_description(metric_name, metric_description)
-                    if (not (front_end_value_has_found or back_end_value_has_found or divergence_value_has_found or 
+                    optional_part_has_found = self._set_optional_parts_metric(metric_name, metric_avg_value, metric_description)
+                    if not optional_part_has_found and (not (front_end_value_has_found or back_end_value_has_found or divergence_value_has_found or 
                         extra_measure_value_has_found or retire_value_has_found) or 
                         not(frond_end_description_has_found or back_end_description_has_found or divergence_description_has_found 
                         or extra_measure_description_has_found or retire_description_has_found)):
@@ -225,6 +262,59 @@ class LevelOneNvprof(LevelOne, LevelExecutionNvprof):
             LevelExecutionParameters.C_ISSUE_IPC_METRIC_NAME_NVPROF)
         
 
+    def _roofline_launch_values(self, launch : int) -> dict:
+        """
+        Get the measures of the roofline model in the launch (kernel) indicated. NVPROF gives the percentage
+        of the peak FLOP rate of each precision (the highest one is taken) and the utilization level of
+        DRAM (from 0 to 10), but not the duration of the kernel, so FLOP/s cannot be obtained.
+
+        Args:
+            launch  : int   ; index of the launch
+
+        Returns:
+            Dictionary with the keys 'flop', 'seconds', 'dram_bytes', 'l2_bytes', 'compute' and 'memory'
+            (see 'LevelOne._roofline_launch_values')
+        """
+
+        roofline : Roofline = self.roofline()
+
+        flop : dict = {"sp" : self._optional_part_value(roofline, RooflineParameters.C_FLOP_COUNT_SP_METRIC_NAME_NVPROF, launch),
+            "dp" : self._optional_part_value(roofline, RooflineParameters.C_FLOP_COUNT_DP_METRIC_NAME_NVPROF, launch),
+            "hp" : self._optional_part_value(roofline, RooflineParameters.C_FLOP_COUNT_HP_METRIC_NAME_NVPROF, launch)}
+        efficiencies : list = [value for value in [self._optional_part_value(roofline, metric_name, launch) for metric_name in 
+            [RooflineParameters.C_FLOP_SP_EFFICIENCY_METRIC_NAME_NVPROF, RooflineParameters.C_FLOP_DP_EFFICIENCY_METRIC_NAME_NVPROF,
+            RooflineParameters.C_FLOP_HP_EFFICIENCY_METRIC_NAME_NVPROF]] if not value is None]
+        dram_read_bytes : float = self._optional_part_value(roofline, RooflineParameters.C_DRAM_READ_BYTES_METRIC_NAME_NVPROF, launch)
+        dram_write_bytes : float = self._optional_part_value(roofline, RooflineParameters.C_DRAM_WRITE_BYTES_METRIC_NAME_NVPROF, launch)
+        l2_read_transactions : float = self._optional_part_value(roofline, RooflineParameters.C_L2_READ_TRANSACTIONS_METRIC_NAME_NVPROF, launch)
+        l2_write_transactions : float = self._optional_part_value(roofline, RooflineParameters.C_L2_WRITE_TRANSACTIONS_METRIC_NAME_NVPROF, launch)
+        return {"flop" : flop, "seconds" : None, 
+            "dram_bytes" : None if dram_read_bytes is None or dram_write_bytes is None else dram_read_bytes + dram_write_bytes,
+            "l2_bytes" : None if l2_read_transactions is None or l2_write_transactions is None else 
+                (l2_read_transactions + l2_write_transactions)*RooflineParameters.C_L2_TRANSACTION_BYTES_NVPROF,
+            "compute" : max(efficiencies) if efficiencies else None,
+            "memory" : self._optional_part_value(roofline, RooflineParameters.C_DRAM_UTILIZATION_METRIC_NAME_NVPROF, launch)}
+        
+
+    def _occupancy_launch_values(self, launch : int) -> dict:
+        """
+        Get the launch configuration and occupancy of the launch (kernel) indicated. NVPROF only gives 
+        the achieved occupancy as metric (launch configuration is only in its GPU trace).
+
+        Args:
+            launch  : int   ; index of the launch
+
+        Returns:
+            Dictionary with the keys 'block_size', 'grid_size', 'registers', 'shared_memory', 'theoretical', 
+            'achieved' and 'limiter' (see 'LevelOne._occupancy_launch_values')
+        """
+
+        achieved : float = self._optional_part_value(self.occupancy(), OccupancyParameters.C_ACHIEVED_OCCUPANCY_METRIC_NAME_NVPROF, launch)
+        return {"block_size" : None, "grid_size" : None, "registers" : None, "shared_memory" : None, "theoretical" : None,
+            "achieved" : None if achieved is None else achieved*OccupancyParameters.C_ACHIEVED_OCCUPANCY_MULTIPLIER_NVPROF,
+            "limiter" : None}
+        
+
     def _get_results(self, lst_output : list):
         """
         Get results of the different parts.
@@ -282,6 +372,7 @@ class LevelOneNvprof(LevelOne, LevelExecutionNvprof):
         if self._collect_events and self._extra_measure.events_str() != "":
                 super()._add_result_part_to_lst(self._extra_measure.events(), 
                 self._extra_measure.events_description(), lst_output, False)
+        super()._add_optional_parts_results(lst_output)
         lst_output.append("\n")
         
 
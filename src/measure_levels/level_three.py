@@ -14,6 +14,8 @@ from measure_levels.level_two import LevelTwo
 from measure_parts.memory_constant_memory_bound import MemoryConstantMemoryBound
 from errors.level_execution_errors import *
 from abc import abstractmethod # abstract class
+from timings.timings import Timings
+from parameters.timings_params import TimingsParameters
 
 class LevelThree(LevelTwo):
     """
@@ -51,9 +53,12 @@ class LevelThree(LevelTwo):
             output_command : str    ; str with results of execution.
         """
 
-        super()._set_front_back_divergence_retire_results(output_command) # level one results
-        super()._set_memory_core_decode_fetch_results(output_command) # level two
-        self._set_memory_constant_memory_bound_results(output_command) # level three
+        with Timings.span(TimingsParameters.C_SPAN_PARSE_LEVEL_ONE):
+            super()._set_front_back_divergence_retire_results(output_command) # level one results
+        with Timings.span(TimingsParameters.C_SPAN_PARSE_LEVEL_TWO):
+            super()._set_memory_core_decode_fetch_results(output_command) # level two
+        with Timings.span(TimingsParameters.C_SPAN_PARSE_LEVEL_THREE):
+            self._set_memory_constant_memory_bound_results(output_command) # level three
         pass
 
 
@@ -82,6 +87,46 @@ class LevelThree(LevelTwo):
 
         pass 
 
+    def measure_parts(self) -> list:
+        """
+        Returns all the parts (FrontEnd, BackEnd...) measured in the execution.
+
+        Returns:
+            List with references to the parts of the execution
+        """
+
+        return super().measure_parts() + [self.memory_constant_memory_bound()]
+        
+
+    def topdown_results(self) -> dict:
+        """
+        Get the results of the TopDown methodology in the selected launches.
+
+        Returns:
+            Dictionary with the name of the result as key and its value (float) as value
+        """
+
+        results : dict = super().topdown_results()
+        results.update({"memory_constant_memory_bound_stall" : self.memory_constant_memory_bound_stall(),
+            "memory_constant_memory_bound_stall_on_back" : self.memory_constant_memory_bound_stall_on_back(),
+            "memory_constant_memory_bound_stall_on_memory_bound" : self.memory_constant_memory_bound_stall_on_memory_bound(),
+            "memory_constant_memory_bound_percentage_ipc_degradation" : self.memory_constant_memory_bound_percentage_ipc_degradation()})
+        return results
+        
+
+    def topdown_tree(self) -> list:
+        """
+        Get the hierarchy of the parts of the TopDown methodology with their percentage of IPC 
+        (degradation or retired) in the selected launches.
+
+        Returns:
+            List of tuples (name of part, name of parent part or "" if it's a root part, value)
+        """
+
+        return super().topdown_tree() + [(self.memory_constant_memory_bound().name(), self._back_memory_bound.name(), 
+            self.memory_constant_memory_bound_percentage_ipc_degradation())]
+        
+
     def memory_constant_memory_bound_stall(self) -> float:
         """
         Returns percent of stalls due to BackEnd.MemoryBound.MemoryConstantMemoryBound part.
@@ -90,7 +135,9 @@ class LevelThree(LevelTwo):
             Float with percent of total stalls due to BackEnd.MemoryBound.Constant_Memory_Bound part
         """
 
-        return self._get_stalls_of_part(self.memory_constant_memory_bound().metrics())
+        if self._is_skipped(self.memory_constant_memory_bound()):
+            return None
+        return (self._get_stalls_of_part(self.memory_constant_memory_bound().metrics())/super().total_front_back_stall())*100.0
         pass
     
     def memory_constant_memory_bound_stall_on_back(self) -> float:
@@ -103,6 +150,8 @@ class LevelThree(LevelTwo):
             on the total BackEnd
         """
 
+        if self._is_skipped(self.memory_constant_memory_bound()):
+            return None
         return (self.memory_constant_memory_bound_stall()/super().back_end_stall())*100.0
 
     def memory_constant_memory_bound_stall_on_memory_bound(self) -> float:
@@ -115,6 +164,8 @@ class LevelThree(LevelTwo):
             on the total BackEnd.MemoryBound
         """
 
+        if self._is_skipped(self.memory_constant_memory_bound()):
+            return None
         return (self.memory_constant_memory_bound_stall()/super().back_memory_bound_stall())*100.0
         pass
 
@@ -126,5 +177,7 @@ class LevelThree(LevelTwo):
             Float with the percent of BackEnd.MemoryBound.MemoryConstantMemoryBound's IPC degradation
         """
 
+        if self._is_skipped(self.memory_constant_memory_bound()):
+            return None
         return (((self._stall_ipc()*(self.memory_constant_memory_bound_stall()/100.0))/self.get_device_max_ipc())*100.0)
         pass
@@ -25,11 +25,23 @@ from measure_parts.retire import RetireNsight
 from measure_parts.extra_measure import ExtraMeasureNsight
 from measure_parts.memory_mio_throttle import MemoryMioThrottleNsight
 from measure_parts.memory_l1_bound import MemoryL1BoundNsight
+from measure_parts.core_math_pipe_throttle import CoreMathPipeThrottleNsight
+from measure_parts.core_wait import CoreWaitNsight
+from measure_parts.core_pipe_utilization import CorePipeUtilizationNsight
+from measure_parts.front_stall_reason import FrontStallReasonNsight
 from show_messages.message_format import MessageFormat
 from parameters.memory_constant_memory_bound_params import MemoryConstantMemoryBoundParameters
 from parameters.memory_mio_throttle_params import MemoryMioThrottleParameters
 from parameters.memory_l1_bound_params import MemoryL1BoundParameters
+from parameters.core_math_pipe_throttle_params import CoreMathPipeThrottleParameters
+from parameters.core_wait_params import CoreWaitParameters
+from parameters.core_pipe_utilization_params import CorePipeUtilizationParameters
+from parameters.front_stall_reasons_params import FrontStallReasonsParameters
+from parameters.graph_params import GraphParameters
 from errors.level_execution_errors import *
+from timings.timings import Timings
+from parameters.timings_params import TimingsParameters
+from parameters.aggregations_params import AggregationsParameters
 
 class LevelThreeNsight(LevelThree, LevelTwoNsight):
     """
@@ -41,6 +53,15 @@ class LevelThreeNsight(LevelThree, LevelTwoNsight):
         __memory_mio_throttle               : MemoryMioThrottleNsight   ; mio throttle part
 
         __memory_l1_bound                   : MemoryL1BoundNsight       ; l1 bound part    
+
+        __core_math_pipe_throttle           : CoreMathPipeThrottleNsight; math pipe throttle part
+
+        __core_wait                         : CoreWaitNsight            ; wait (fixed latency dependencies) part
+
+        __core_pipe_utilization             : CorePipeUtilizationNsight ; utilization of the execution pipes
+
+        __front_stall_reasons               : list                      ; stall reason parts (FrontStallReasonNsight) below
+                                                                          FrontEnd.Fetch and FrontEnd.Decode
     """
 
     def __init__(self, program : str, input_file : str, output_file : str, output_scan_file : str, collect_metrics : bool,
@@ -63,6 +84,24 @@ class LevelThreeNsight(LevelThree, LevelTwoNsight):
             MemoryL1BoundParameters.C_MEMORY_L1_BOUND_DESCRIPTION, 
             MemoryL1BoundParameters.C_MEMORY_L1_BOUND_NSIGHT_METRICS)
 
+        self.__core_math_pipe_throttle : CoreMathPipeThrottleNsight = CoreMathPipeThrottleNsight (
+            CoreMathPipeThrottleParameters.C_CORE_MATH_PIPE_THROTTLE_NAME, 
+            CoreMathPipeThrottleParameters.C_CORE_MATH_PIPE_THROTTLE_DESCRIPTION, 
+            CoreMathPipeThrottleParameters.C_CORE_MATH_PIPE_THROTTLE_NSIGHT_METRICS)
+
+        self.__core_wait : CoreWaitNsight = CoreWaitNsight (
+            CoreWaitParameters.C_CORE_WAIT_NAME, 
+            CoreWaitParameters.C_CORE_WAIT_DESCRIPTION, 
+            CoreWaitParameters.C_CORE_WAIT_NSIGHT_METRICS)
+
+        self.__core_pipe_utilization : CorePipeUtilizationNsight = CorePipeUtilizationNsight (
+            CorePipeUtilizationParameters.C_CORE_PIPE_UTILIZATION_NAME, 
+            CorePipeUtilizationParameters.C_CORE_PIPE_UTILIZATION_DESCRIPTION, 
+            CorePipeUtilizationParameters.C_CORE_PIPE_UTILIZATION_NSIGHT_METRICS)
+
+        self.__front_stall_reasons : list = [FrontStallReasonNsight(name, description, metrics, parent_name) 
+            for name, description, metrics, parent_name in FrontStallReasonsParameters.C_FRONT_STALL_REASONS_NSIGHT]
+
         super().__init__(program, input_file, output_file, output_scan_file, collect_metrics, front_end, back_end, divergence, 
         retire, extra_measure, front_decode, front_fetch, back_core_bound, back_memory_bound)
           
@@ -100,6 +139,50 @@ class LevelThreeNsight(LevelThree, LevelTwoNsight):
         return self.__memory_l1_bound
         
 
+    def core_math_pipe_throttle(self) -> CoreMathPipeThrottleNsight:
+        """
+        Return CoreMathPipeThrottleNsight part of the execution.
+
+        Returns:
+            reference to CoreMathPipeThrottleNsight part of the execution
+        """
+
+        return self.__core_math_pipe_throttle
+        
+
+    def core_wait(self) -> CoreWaitNsight:
+        """
+        Return CoreWaitNsight part of the execution.
+
+        Returns:
+            reference to CoreWaitNsight part of the execution
+        """
+
+        return self.__core_wait
+        
+
+    def core_pipe_utilization(self) -> CorePipeUtilizationNsight:
+        """
+        Return CorePipeUtilizationNsight part of the execution.
+
+        Returns:
+            reference to CorePipeUtilizationNsight part of the execution
+        """
+
+        return self.__core_pipe_utilization
+        
+
+    def front_stall_reasons(self) -> list:
+        """
+        Return stall reason parts below FrontEnd.Fetch and FrontEnd.Decode.
+
+        Returns:
+            List with references to the FrontStallReasonNsight parts of the execution
+        """
+
+        return self.__front_stall_reasons
+        
+
 
     def _generate_command(self) -> str:
         """ 
@@ -109,13 +192,16 @@ class LevelThreeNsight(LevelThree, LevelTwoNsight):
             String with command to be executed
         """
 
-        command : str = ("ncu --target-processes all --metrics " + self._front_end.metrics_str() +
+        command : str = ("ncu --target-processes all " + self._profiler_flags() + "--metrics " + self._front_end.metrics_str() +
             "," + self._back_end.metrics_str() + "," + self._divergence.metrics_str() + "," +
             self._extra_measure.metrics_str() + "," + self._retire.metrics_str() + "," + 
             self._front_decode.metrics_str() + "," + self._front_fetch.metrics_str() + 
             "," + self._back_core_bound.metrics_str() + "," + self._back_memory_bound.metrics_str() +
             "," + self.__memory_constant_memory_bound.metrics_str() + "," + self.__memory_mio_throttle.metrics_str() + "," + 
-            self.__memory_l1_bound.metrics_str() + " " + self._program)
+            self.__memory_l1_bound.metrics_str() + "," + self.__core_math_pipe_throttle.metrics_str() + "," + 
+            self.__core_wait.metrics_str() + "," + self.__core_pipe_utilization.metrics_str() + "".join("," + part.metrics_str() 
+            for part in self.__front_stall_reasons) + self._optional_metrics_str() + 
+            " " + self._program)
         return command
         
     
@@ -127,9 +213,12 @@ class LevelThreeNsight(LevelThree, LevelTwoNsight):
             output_command : str    ; str with results of execution.
         """
 
-        super()._set_front_back_divergence_retire_results(output_command) # level one results
-        super()._set_memory_core_decode_fetch_results(output_command) # level two
-        self._set_memory_constant_memory_bound_mio_l1_bound_results(output_command) # level three
+        with Timings.span(TimingsParameters.C_SPAN_PARSE_LEVEL_ONE):
+            super()._set_front_back_divergence_retire_results(output_command) # level one results
+        with Timings.span(TimingsParameters.C_SPAN_PARSE_LEVEL_TWO):
+            super()._set_memory_core_decode_fetch_results(output_command) # level two
+        with Timings.span(TimingsParameters.C_SPAN_PARSE_LEVEL_THREE):
+            self._set_memory_constant_memory_bound_mio_l1_bound_results(output_command) # level three
         
 
 
@@ -182,6 +271,22 @@ class LevelThreeNsight(LevelThree, LevelTwoNsight):
             lst_output.append(converter.underlined_str(self.__memory_l1_bound.name()))
             super()._add_result_part_to_lst(self.__memory_l1_bound.metrics(), 
                 self.__memory_l1_bound.metrics_description(), lst_output)
+        if  self._collect_metrics and self.__core_math_pipe_throttle.metrics_str() != "":
+            lst_output.append(converter.underlined_str(self.__core_math_pipe_throttle.name()))
+            super()._add_result_part_to_lst(self.__core_math_pipe_throttle.metrics(), 
+                self.__core_math_pipe_throttle.metrics_description(), lst_output)
+        if  self._collect_metrics and self.__core_wait.metrics_str() != "":
+            lst_output.append(converter.underlined_str(self.__core_wait.name()))
+            super()._add_result_part_to_lst(self.__core_wait.metrics(), 
+                self.__core_wait.metrics_description(), lst_output)
+        if  self._collect_metrics and self.__core_pipe_utilization.metrics_str() != "":
+            lst_output.append(converter.underlined_str(self.__core_pipe_utilization.name()))
+            super()._add_result_part_to_lst(self.__core_pipe_utilization.metrics(), 
+                self.__core_pipe_utilization.metrics_description(), lst_output)
+        for part in self.__front_stall_reasons:
+            if  self._collect_metrics and part.metrics_str() != "":
+                lst_output.append(converter.underlined_str(part.name()))
+                super()._add_result_part_to_lst(part.metrics(), part.metrics_description(), lst_output)
         if self._collect_metrics and self._divergence.metrics_str() != "":
             lst_output.append(converter.underlined_str(self._divergence.name()))
             super()._add_result_part_to_lst(self._divergence.metrics(), 
@@ -194,6 +299,7 @@ class LevelThreeNsight(LevelThree, LevelTwoNsight):
             lst_output.append(converter.underlined_str(self._extra_measure.name()))
             super()._add_result_part_to_lst(self._extra_measure.metrics(), 
                 self._extra_measure.metrics_description(), lst_output)
+        super()._add_optional_parts_results(lst_output)
         lst_output.append("\n")
         
     
@@ -256,6 +362,9 @@ class LevelThreeNsight(LevelThree, LevelTwoNsight):
         memory_mio_throttle_unit_has_found : bool
         memory_l1_bound_value_has_found: bool
         memory_l1_bound_unit_has_found : bool
+        core_value_has_found : bool
+        core_unit_has_found : bool
+        part : MetricMeasureNsight
         can_read_results : bool = False
         for line in str(results_launch).splitlines():
             line = re.sub(' +', ' ', line) # delete more than one spaces and put only one
@@ -287,12 +396,87 @@ class LevelThreeNsight(LevelThree, LevelTwoNsight):
                     metric_value)
                 memory_l1_bound_unit_has_found = self.__memory_l1_bound.set_metric_unit(metric_name, 
                     metric_unit)
-                if (not (memory_constant_memory_bound_value_has_found or memory_mio_throttle_value_has_found or memory_l1_bound_value_has_found) 
-                    or not (memory_constant_memory_bound_unit_has_found or memory_mio_throttle_unit_has_found or memory_l1_bound_unit_has_found)):
+                core_value_has_found = False
+                core_unit_has_found = False
+                for part in [self.__core_math_pipe_throttle, self.__core_wait, self.__core_pipe_utilization] + self.__front_stall_reasons:
+                    core_value_has_found = part.set_metric_value(metric_name, metric_value) or core_value_has_found
+                    core_unit_has_found = part.set_metric_unit(metric_name, metric_unit) or core_unit_has_found
+                if (not (memory_constant_memory_bound_value_has_found or memory_mio_throttle_value_has_found or memory_l1_bound_value_has_found
+                    or core_value_has_found) or not (memory_constant_memory_bound_unit_has_found or memory_mio_throttle_unit_has_found 
+                    or memory_l1_bound_unit_has_found or core_unit_has_found)):
                     if not self._metricExists(metric_name):
                         raise MetricNotAsignedToPart(metric_name)
         
 
+    def measure_parts(self) -> list:
+        """
+        Returns all the parts (FrontEnd, BackEnd...) measured in the execution.
+
+        Returns:
+            List with references to the parts of the execution
+        """
+
+        return super().measure_parts() + [self.__memory_mio_throttle, self.__memory_l1_bound, self.__core_math_pipe_throttle, 
+            self.__core_wait, self.__core_pipe_utilization] + self.__front_stall_reasons
+        
+
+    def topdown_results(self) -> dict:
+        """
+        Get the results of the TopDown methodology in the selected launches.
+
+        Returns:
+            Dictionary with the name of the result as key and its value (float) as value
+        """
+
+        results : dict = super().topdown_results()
+        results.update({"memory_mio_throttle_stall" : self.memory_mio_throttle_stall(),
+            "memory_mio_throttle_stall_on_back" : self.memory_mio_throttle_stall_on_back(),
+            "memory_mio_throttle_stall_on_memory_bound" : self.memory_mio_throttle_stall_on_memory_bound(),
+            "memory_mio_throttle_percentage_ipc_degradation" : self.memory_mio_throttle_percentage_ipc_degradation(),
+            "memory_l1_bound_stall" : self.memory_l1_bound_stall(),
+            "memory_l1_bound_stall_on_back" : self.memory_l1_bound_stall_on_back(),
+            "memory_l1_bound_stall_on_memory_bound" : self.memory_l1_bound_stall_on_memory_bound(),
+            "memory_l1_bound_percentage_ipc_degradation" : self.memory_l1_bound_percentage_ipc_degradation(),
+            "core_math_pipe_throttle_stall" : self.core_math_pipe_throttle_stall(),
+            "core_math_pipe_throttle_stall_on_back" : self.core_math_pipe_throttle_stall_on_back(),
+            "core_math_pipe_throttle_stall_on_core_bound" : self.core_math_pipe_throttle_stall_on_core_bound(),
+            "core_math_pipe_throttle_percentage_ipc_degradation" : self.core_math_pipe_throttle_percentage_ipc_degradation(),
+            "core_wait_stall" : self.core_wait_stall(),
+            "core_wait_stall_on_back" : self.core_wait_stall_on_back(),
+            "core_wait_stall_on_core_bound" : self.core_wait_stall_on_core_bound(),
+            "core_wait_percentage_ipc_degradation" : self.core_wait_percentage_ipc_degradation()})
+        for pipe in CorePipeUtilizationParameters.C_CORE_PIPES_NSIGHT:
+            results["core_pipe_" + pipe.lower() + "_utilization"] = self.core_pipe_utilization_value(pipe)
+            results["core_pipe_" + pipe.lower() + "_percentage_ipc_degradation"] = self.core_pipe_percentage_ipc_degradation(pipe)
+        key : str
+        for part in self.__front_stall_reasons:
+            key = part.name().lower().replace("-end.", "_").replace(".", "_").replace("-", "_")
+            results.update({key + "_stall" : self.front_stall_reason_stall(part),
+                key + "_stall_on_front" : self.front_stall_reason_stall_on_front(part),
+                key + "_stall_on_parent" : self.front_stall_reason_stall_on_parent(part),
+                key + "_percentage_ipc_degradation" : self.front_stall_reason_percentage_ipc_degradation(part)})
+        return results
+        
+
+    def topdown_tree(self) -> list:
+        """
+        Get the hierarchy of the parts of the TopDown methodology with their percentage of IPC 
+        (degradation or retired) in the selected launches.
+
+        Returns:
+            List of tuples (name of part, name of parent part or "" if it's a root part, value)
+        """
+
+        return super().topdown_tree() + [
+            (self.__memory_mio_throttle.name(), self._back_memory_bound.name(), self.memory_mio_throttle_percentage_ipc_degradation()),
+            (self.__memory_l1_bound.name(), self._back_memory_bound.name(), self.memory_l1_bound_percentage_ipc_degradation()),
+            (self.__core_math_pipe_throttle.name(), self._back_core_bound.name(), self.core_math_pipe_throttle_percentage_ipc_degradation()),
+            (self.__core_wait.name(), self._back_core_bound.name(), self.core_wait_percentage_ipc_degradation())] + [
+            (self.core_pipe_name(pipe), self.__core_math_pipe_throttle.name(), self.core_pipe_percentage_ipc_degradation(pipe)) 
+            for pipe in CorePipeUtilizationParameters.C_CORE_PIPES_NSIGHT] + [
+            (part.name(), part.parent_name(), self.front_stall_reason_percentage_ipc_degradation(part)) for part in self.__front_stall_reasons]
+        
+
     def memory_mio_throttle_stall(self) -> float:
         """
         Returns percent of stalls due to BackEnd.MemoryBound.MioThrottle part.
@@ -301,7 +485,9 @@ class LevelThreeNsight(LevelThree, LevelTwoNsight):
             Float with percent of total stalls due to BackEnd.MemoryBound.MioThrottle part
         """
 
-        return self._get_stalls_of_part(self.memory_mio_throttle().metrics())
+        if self._is_skipped(self.__memory_mio_throttle):
+            return None
+        return (self._get_stalls_of_part(self.memory_mio_throttle().metrics())/super().total_front_back_stall())*100.0
         
 
     def memory_mio_throttle_stall_on_back(self) -> float:
@@ -314,6 +500,8 @@ class LevelThreeNsight(LevelThree, LevelTwoNsight):
             on the total BackEnd
         """
 
+        if self._is_skipped(self.__memory_mio_throttle):
+            return None
         return (self.memory_mio_throttle_stall()/super().back_end_stall())*100.0
 
     def memory_mio_throttle_stall_on_memory_bound(self) -> float:
@@ -326,6 +514,8 @@ class LevelThreeNsight(LevelThree, LevelTwoNsight):
             on the total BackEnd.MemoryBound
         """
 
+        if self._is_skipped(self.__memory_mio_throttle):
+            return None
         return (self.memory_mio_throttle_stall()/super().back_memory_bound_stall())*100.0
         
 
@@ -337,6 +527,8 @@ class LevelThreeNsight(LevelThree, LevelTwoNsight):
             Float with the percent of BackEnd.MemoryBound.MioThrottle's IPC degradation
         """
 
+        if self._is_skipped(self.__memory_mio_throttle):
+            return None
         return (((self._stall_ipc()*(self.memory_mio_throttle_stall()/100.0))/self.get_device_max_ipc())*100.0)
         
     
@@ -348,7 +540,9 @@ class LevelThreeNsight(LevelThree, LevelTwoNsight):
             Float with percent of total stalls due to BackEnd.MemoryBound.L1Bound part
         """
 
-        return self._get_stalls_of_part(self.memory_l1_bound().metrics())
+        if self._is_skipped(self.__memory_l1_bound):
+            return None
+        return (self._get_stalls_of_part(self.memory_l1_bound().metrics())/super().total_front_back_stall())*100.0
         
 
     def memory_l1_bound_stall_on_back(self) -> float:
@@ -361,6 +555,8 @@ class LevelThreeNsight(LevelThree, LevelTwoNsight):
             on the total BackEnd
         """
 
+        if self._is_skipped(self.__memory_l1_bound):
+            return None
         return (self.memory_l1_bound_stall()/super().back_end_stall())*100.0
 
     def memory_l1_bound_stall_on_memory_bound(self) -> float:
@@ -373,6 +569,8 @@ class LevelThreeNsight(LevelThree, LevelTwoNsight):
             on the total BackEnd.MemoryBound
         """
 
+        if self._is_skipped(self.__memory_l1_bound):
+            return None
         return (self.memory_l1_bound_stall()/super().back_memory_bound_stall())*100.0
         
 
@@ -384,6 +582,237 @@ class LevelThreeNsight(LevelThree, LevelTwoNsight):
             Float with the percent of BackEnd.MemoryBound.MemoryL1Bound's IPC degradation
         """
 
+        if self._is_skipped(self.__memory_l1_bound):
+            return None
         return (((self._stall_ipc()*(self.memory_l1_bound_stall()/100.0))/self.get_device_max_ipc())*100.0)
         
 
+    def core_math_pipe_throttle_stall(self) -> float:
+        """
+        Returns percent of stalls due to BackEnd.CoreBound.MathPipeThrottle part.
+
+        Returns:
+            Float with percent of total stalls due to BackEnd.CoreBound.MathPipeThrottle part
+        """
+
+        if self._is_skipped(self.__core_math_pipe_throttle):
+            return None
+        return (self._get_stalls_of_part(self.__core_math_pipe_throttle.metrics())/super().total_front_back_stall())*100.0
+        
+
+    def core_math_pipe_throttle_stall_on_back(self) -> float:
+        """ 
+        Obtain the percentage of stalls due to BackEnd.CoreBound.MathPipeThrottle
+        on the total BackEnd
+
+        Returns:
+            Float the percentage of stalls due to BackEnd.CoreBound.MathPipeThrottle
+            on the total BackEnd
+        """
+
+        if self._is_skipped(self.__core_math_pipe_throttle):
+            return None
+        return (self.core_math_pipe_throttle_stall()/super().back_end_stall())*100.0
+
+    def core_math_pipe_throttle_stall_on_core_bound(self) -> float:
+        """ 
+        Obtain the percentage of stalls due to BackEnd.CoreBound.MathPipeThrottle
+        on the total BackEnd.CoreBound
+
+        Returns:
+            Float the percentage of stalls due to BackEnd.CoreBound.MathPipeThrottle
+            on the total BackEnd.CoreBound
+        """
+
+        if self._is_skipped(self.__core_math_pipe_throttle):
+            return None
+        return (self.core_math_pipe_throttle_stall()/super().back_core_bound_stall())*100.0
+        
+
+    def core_math_pipe_throttle_percentage_ipc_degradation(self) -> float:
+        """
+        Find percentage of IPC degradation due to BackEnd.CoreBound.MathPipeThrottle part.
+
+        Returns:
+            Float with the percent of BackEnd.CoreBound.MathPipeThrottle's IPC degradation
+        """
+
+        if self._is_skipped(self.__core_math_pipe_throttle):
+            return None
+        return (((self._stall_ipc()*(self.core_math_pipe_throttle_stall()/100.0))/self.get_device_max_ipc())*100.0)
+        
+
+    def core_wait_stall(self) -> float:
+        """
+        Returns percent of stalls due to BackEnd.CoreBound.Wait part.
+
+        Returns:
+            Float with percent of total stalls due to BackEnd.CoreBound.Wait part
+        """
+
+        if self._is_skipped(self.__core_wait):
+            return None
+        return (self._get_stalls_of_part(self.__core_wait.metrics())/super().total_front_back_stall())*100.0
+        
+
+    def core_wait_stall_on_back(self) -> float:
+        """ 
+        Obtain the percentage of stalls due to BackEnd.CoreBound.Wait
+        on the total BackEnd
+
+        Returns:
+            Float the percentage of stalls due to BackEnd.CoreBound.Wait
+            on the total BackEnd
+        """
+
+        if self._is_skipped(self.__core_wait):
+            return None
+        return (self.core_wait_stall()/super().back_end_stall())*100.0
+
+    def core_wait_stall_on_core_bound(self) -> float:
+        """ 
+        Obtain the percentage of stalls due to BackEnd.CoreBound.Wait
+        on the total BackEnd.CoreBound
+
+        Returns:
+            Float the percentage of stalls due to BackEnd.CoreBound.Wait
+            on the total BackEnd.CoreBound
+        """
+
+        if self._is_skipped(self.__core_wait):
+            return None
+        return (self.core_wait_stall()/super().back_core_bound_stall())*100.0
+        
+
+    def core_wait_percentage_ipc_degradation(self) -> float:
+        """
+        Find percentage of IPC degradation due to BackEnd.CoreBound.Wait part.
+
+        Returns:
+            Float with the percent of BackEnd.CoreBound.Wait's IPC degradation
+        """
+
+        if self._is_skipped(self.__core_wait):
+            return None
+        return (((self._stall_ipc()*(self.core_wait_stall()/100.0))/self.get_device_max_ipc())*100.0)
+        
+
+    def core_pipe_name(self, pipe : str) -> str:
+        """
+        Get name of an execution pipe in the TopDown hierarchy (below BackEnd.CoreBound.MathPipeThrottle).
+
+        Args:
+            pipe    : str   ; pipe (key of 'C_CORE_PIPES_NSIGHT')
+
+        Returns:
+            String with the name of the pipe
+        """
+
+        return self.__core_math_pipe_throttle.name() + GraphParameters.C_HIERARCHY_PART_NAME_SEPARATOR + pipe
+        
+
+    def core_pipe_utilization_value(self, pipe : str) -> float:
+        """
+        Returns utilization of an execution pipe (percentage of the peak).
+
+        Args:
+            pipe    : str   ; pipe (key of 'C_CORE_PIPES_NSIGHT')
+
+        Returns:
+            Float with the utilization of the pipe, or 'None' if it's not measured
+        """
+
+        values : list = self.__core_pipe_utilization.get_metric_value(CorePipeUtilizationParameters.C_CORE_PIPES_NSIGHT[pipe])
+        if self._is_skipped(self.__core_pipe_utilization) or not values:
+            return None
+        return self._get_measure_total_value(CorePipeUtilizationParameters.C_CORE_PIPES_NSIGHT[pipe], values, 
+            AggregationsParameters.C_RATE_DEFAULT_STRATEGY)
+        
+
+    def core_pipe_percentage_ipc_degradation(self, pipe : str) -> float:
+        """
+        Find percentage of IPC degradation due to an execution pipe: IPC degradation of 
+        BackEnd.CoreBound.MathPipeThrottle shared among the pipes by their utilization.
+
+        Args:
+            pipe    : str   ; pipe (key of 'C_CORE_PIPES_NSIGHT')
+
+        Returns:
+            Float with the percent of the pipe's IPC degradation, or 'None' if it's not measured
+        """
+
+        math_pipe_throttle_ipc_degradation : float = self.core_math_pipe_throttle_percentage_ipc_degradation()
+        utilization : float = self.core_pipe_utilization_value(pipe)
+        if math_pipe_throttle_ipc_degradation is None or utilization is None:
+            return None
+        total_utilization : float = sum(value for value in [self.core_pipe_utilization_value(name) for name in 
+            CorePipeUtilizationParameters.C_CORE_PIPES_NSIGHT] if not value is None)
+        return math_pipe_throttle_ipc_degradation*self._ratio(utilization, total_utilization)
+        
+
+    def front_stall_reason_stall(self, part : FrontStallReasonNsight) -> float:
+        """
+        Returns percent of stalls due to a stall reason below FrontEnd.Fetch or FrontEnd.Decode.
+
+        Args:
+            part    : FrontStallReasonNsight    ; stall reason part (see 'front_stall_reasons')
+
+        Returns:
+            Float with percent of total stalls due to the stall reason
+        """
+
+        if self._is_skipped(part):
+            return None
+        return (self._get_stalls_of_part(part.metrics())/super().total_front_back_stall())*100.0
+        
+
+    def front_stall_reason_stall_on_front(self, part : FrontStallReasonNsight) -> float:
+        """ 
+        Obtain the percentage of stalls due to a stall reason below FrontEnd.Fetch or FrontEnd.Decode
+        on the total FrontEnd
+
+        Args:
+            part    : FrontStallReasonNsight    ; stall reason part (see 'front_stall_reasons')
+
+        Returns:
+            Float the percentage of stalls due to the stall reason on the total FrontEnd
+        """
+
+        if self._is_skipped(part):
+            return None
+        return (self.front_stall_reason_stall(part)/super().front_end_stall())*100.0
+        
+
+    def front_stall_reason_stall_on_parent(self, part : FrontStallReasonNsight) -> float:
+        """ 
+        Obtain the percentage of stalls due to a stall reason on the total of its parent part
+        (FrontEnd.Fetch or FrontEnd.Decode)
+
+        Args:
+            part    : FrontStallReasonNsight    ; stall reason part (see 'front_stall_reasons')
+
+        Returns:
+            Float the percentage of stalls due to the stall reason on the total of its parent part
+        """
+
+        if self._is_skipped(part):
+            return None
+        parent_stall : float = (super().front_fetch_stall() if part.parent_name() == self._front_fetch.name() 
+            else super().front_decode_stall())
+        return (self.front_stall_reason_stall(part)/parent_stall)*100.0
+        
+
+    def front_stall_reason_percentage_ipc_degradation(self, part : FrontStallReasonNsight) -> float:
+        """
+        Find percentage of IPC degradation due to a stall reason below FrontEnd.Fetch or FrontEnd.Decode.
+
+        Args:
+            part    : FrontStallReasonNsight    ; stall reason part (see 'front_stall_reasons')
+
+        Returns:
+            Float with the percent of the stall reason's IPC degradation
+        """
+
+        if self._is_skipped(part):
+            return None
+        return (((self._stall_ipc()*(self.front_stall_reason_stall(part)/100.0))/self.get_device_max_ipc())*100.0)
@@ -13,6 +13,8 @@ parentdir = os.path.dirname(currentdir)
 sys.path.insert(1, parentdir) 
 from measure_levels.level_two_nvprof import LevelTwoNvprof
 from measure_parts.memory_constant_memory_bound import MemoryConstantMemoryBoundNvprof
+from measure_parts.memory_mio_throttle import MemoryMioThrottleNvprof
+from measure_parts.memory_l1_bound import MemoryL1BoundNvprof
 from measure_parts.back_core_bound import BackCoreBoundNvprof
 from measure_parts.back_memory_bound import BackMemoryBoundNvprof
 from measure_parts.front_decode import FrontDecodeNvprof
@@ -22,9 +24,13 @@ from measure_parts.back_end import BackEndNvprof
 from measure_parts.divergence import DivergenceNvprof
 from measure_parts.retire import RetireNvprof
 from measure_parts.extra_measure import ExtraMeasureNvprof
+from measure_parts.metric_measure import MetricMeasureNvprof
 from measure_levels.level_three import LevelThree
 from show_messages.message_format import MessageFormat
 from parameters.memory_constant_memory_bound_params import MemoryConstantMemoryBoundParameters
+from parameters.memory_mio_throttle_params import MemoryMioThrottleParameters
+from parameters.memory_l1_bound_params import MemoryL1BoundParameters
+from parameters.aggregations_params import AggregationsParameters
 
 class LevelThreeNvprof(LevelThree, LevelTwoNvprof):
     """
@@ -32,6 +38,10 @@ class LevelThreeNvprof(LevelThree, LevelTwoNvprof):
     
     Atributes:
         __memory_constant_memory_bound     : MemoryConstantMemoryBoundNvprof   ; constant cache part
+
+        __memory_mio_throttle              : MemoryMioThrottleNvprof           ; mio (memory) throttle part
+
+        __memory_l1_bound                  : MemoryL1BoundNvprof               ; l1 bound (memory dependency) part
     """
     
     def __init__(self, program : str, input_file : str, output_file : str, output_scan_file : str, collect_metrics : bool, collect_events : bool,
@@ -44,6 +54,16 @@ class LevelThreeNvprof(LevelThree, LevelTwoNvprof):
             MemoryConstantMemoryBoundParameters.C_MEMORY_CONSTANT_MEMORY_BOUND_NVPROF_METRICS,
             MemoryConstantMemoryBoundParameters.C_MEMORY_CONSTANT_MEMORY_BOUND_NVPROF_EVENTS)
 
+        self.__memory_mio_throttle = MemoryMioThrottleNvprof(
+            MemoryMioThrottleParameters.C_MEMORY_MIO_THROTTLE_NAME, MemoryMioThrottleParameters.C_MEMORY_MIO_THROTTLE_DESCRIPTION,
+            MemoryMioThrottleParameters.C_MEMORY_MIO_THROTTLE_NVPROF_METRICS,
+            MemoryMioThrottleParameters.C_MEMORY_MIO_THROTTLE_NVPROF_EVENTS)
+
+        self.__memory_l1_bound = MemoryL1BoundNvprof(
+            MemoryL1BoundParameters.C_MEMORY_L1_BOUND_NAME, MemoryL1BoundParameters.C_MEMORY_L1_BOUND_DESCRIPTION,
+            MemoryL1BoundParameters.C_MEMORY_L1_BOUND_NVPROF_METRICS,
+            MemoryL1BoundParameters.C_MEMORY_L1_BOUND_NVPROF_EVENTS)
+
         super().__init__(program, input_file, output_file, output_scan_file, collect_metrics, collect_events, front_end, back_end, divergence, retire,
             extra_measure, front_decode, front_fetch, back_core_bound, back_memory_bound)
         
@@ -57,6 +77,29 @@ class LevelThreeNvprof(LevelThree, LevelTwoNvprof):
         """
 
         return self.__memory_constant_memory_bound
+        
+
+    def memory_mio_throttle(self) -> MemoryMioThrottleNvprof:
+        """
+        Return MemoryMioThrottleNvprof part of the execution.
+
+        Returns:
+            reference to MemoryMioThrottleNvprof part of the execution
+        """
+
+        return self.__memory_mio_throttle
+        
+
+    def memory_l1_bound(self) -> MemoryL1BoundNvprof:
+        """
+        Return MemoryL1BoundNvprof part of the execution.
+
+        Returns:
+            reference to MemoryL1BoundNvprof part of the execution
+        """
+
+        return self.__memory_l1_bound
+        
 
     def _generate_command(self) -> str:
         """ 
@@ -66,16 +109,17 @@ class LevelThreeNvprof(LevelThree, LevelTwoNvprof):
             String with command to be executed
         """
         
-        command : str = ("nvprof --metrics " + self._front_end.metrics_str() + 
+        command : str = ("nvprof " + self._profiler_flags() + "--metrics " + self._front_end.metrics_str() + 
             "," + self._back_end.metrics_str() + "," + self._divergence.metrics_str() + "," + self._extra_measure.metrics_str()
             + "," + self._retire.metrics_str() + "," + self._front_decode.metrics_str() + "," + 
             self._front_fetch.metrics_str() + "," + self._back_core_bound.metrics_str() + "," + 
-            self._back_memory_bound.metrics_str() + "," + self.__memory_constant_memory_bound.metrics_str() + "  --events " + 
+            self._back_memory_bound.metrics_str() + "," + self.__memory_constant_memory_bound.metrics_str() + "," + 
+            self.__memory_mio_throttle.metrics_str() + "," + self.__memory_l1_bound.metrics_str() + self._optional_metrics_str() + "  --events " + 
             self._front_end.events_str() + "," + self._back_end.events_str() + "," + self._divergence.events_str() +  "," + 
             self._extra_measure.events_str() + "," + self._retire.events_str() + "," +  self._front_decode.events_str() + 
-            "," + self._front_fetch.events_str() + self._back_core_bound.events_str() + "," + 
-            self._back_memory_bound.events_str() +  "," + self.__memory_constant_memory_bound.events_str() + 
-            " --unified-memory-profiling off " + self._program)
+            "," + self._front_fetch.events_str() + "," + self._back_core_bound.events_str() + "," + 
+            self._back_memory_bound.events_str() +  "," + self.__memory_constant_memory_bound.events_str() + "," + 
+            self.__memory_mio_throttle.events_str() + "," + self.__memory_l1_bound.events_str() + self._optional_events_str() + " --unified-memory-profiling off " + self._program)
         return command
         
 
@@ -154,6 +198,13 @@ class LevelThreeNvprof(LevelThree, LevelTwoNvprof):
         if  self._collect_events and self.__memory_constant_memory_bound.events_str() != "":
                 super()._add_result_part_to_lst(self.__memory_constant_memory_bound.events(), 
                 self.__memory_constant_memory_bound.events_description(), lst_output, False)
+        for part in [self.__memory_mio_throttle, self.__memory_l1_bound]:
+            if (self._collect_metrics and part.metrics_str() != "" or self._collect_events and part.events_str() != ""):
+                lst_output.append(converter.underlined_str(part.name()))
+            if self._collect_metrics and part.metrics_str() != "":
+                super()._add_result_part_to_lst(part.metrics(), part.metrics_description(), lst_output, True)
+            if self._collect_events and part.events_str() != "":
+                super()._add_result_part_to_lst(part.events(), part.events_description(), lst_output, False)
         if (self._collect_metrics and self._divergence.metrics_str() != "" or 
             self._collect_events and self._divergence.events_str() != ""):
             lst_output.append(converter.underlined_str(self._divergence.name()))
@@ -181,6 +232,7 @@ class LevelThreeNvprof(LevelThree, LevelTwoNvprof):
         if self._collect_events and self._extra_measure.events_str() != "":
                 super()._add_result_part_to_lst(self._extra_measure.events(), 
                 self._extra_measure.events_description(), lst_output, False)
+        super()._add_optional_parts_results(lst_output)
         lst_output.append("\n")
         
 
@@ -267,9 +319,12 @@ class LevelThreeNvprof(LevelThree, LevelTwoNvprof):
                                 to any measure part
         """
 
+        metric_max_value : str
+        metric_min_value : str
         has_read_all_events : bool = False
         constant_memory_bound_value_has_found : bool 
         constant_memory_bound_description_has_found : bool
+        part : MetricMeasureNvprof
         for line in results_launch.splitlines():
             line = re.sub(' +', ' ', line) # delete more than one spaces and put only one
             list_words = line.split(" ")
@@ -283,6 +338,9 @@ class LevelThreeNvprof(LevelThree, LevelTwoNvprof):
                         event_name = list_words[2]
                         event_total_value = list_words[len(list_words) - 1]     
                         constant_memory_bound_value_has_found = self.__memory_constant_memory_bound.set_event_value(event_name, event_total_value)
+                        for part in [self.__memory_mio_throttle, self.__memory_l1_bound]:
+                            constant_memory_bound_value_has_found = (part.set_event_value(event_name, event_total_value) or 
+                                constant_memory_bound_value_has_found)
                         #constant_memory_bound_description_has_found = self.__memory_constant_memory_bound.set_event_description(event_name, metric_description)
                         if not constant_memory_bound_value_has_found:
                             #or #not constant_memory_bound_description_has_found: 
@@ -297,13 +355,214 @@ class LevelThreeNvprof(LevelThree, LevelTwoNvprof):
                     for i in range(3, len(list_words) - 3):
                         metric_description += list_words[i] + " "     
                     metric_avg_value = list_words[len(list_words) - 1]
-                    #metric_max_value = list_words[len(list_words) - 2]
-                    #metric_min_value = list_words[len(list_words) - 3]
-                    #if metric_avg_value != metric_max_value or metric_avg_value != metric_min_value:
-                        # Do Something. NOT USED
+                    metric_max_value = list_words[len(list_words) - 2]
+                    metric_min_value = list_words[len(list_words) - 3]
+                    self.__memory_constant_memory_bound.set_metric_range(metric_name, metric_min_value, metric_max_value)
                     constant_memory_bound_value_has_found = self.__memory_constant_memory_bound.set_metric_value(metric_name, metric_avg_value)
                     constant_memory_bound_description_has_found = self.__memory_constant_memory_bound.set_metric_description(metric_name, metric_description)     
+                    for part in [self.__memory_mio_throttle, self.__memory_l1_bound]:
+                        part.set_metric_range(metric_name, metric_min_value, metric_max_value)
+                        constant_memory_bound_value_has_found = part.set_metric_value(metric_name, metric_avg_value) or constant_memory_bound_value_has_found
+                        constant_memory_bound_description_has_found = (part.set_metric_description(metric_name, metric_description) or 
+                            constant_memory_bound_description_has_found)
                     if not constant_memory_bound_value_has_found or not constant_memory_bound_description_has_found:
                         if not self._metricExists(metric_name):
                             raise MetricNotAsignedToPart(metric_name)
-         
+        
+
+    def measure_parts(self) -> list:
+        """
+        Returns all the parts (FrontEnd, BackEnd...) measured in the execution.
+
+        Returns:
+            List with references to the parts of the execution
+        """
+
+        return super().measure_parts() + [self.__memory_mio_throttle, self.__memory_l1_bound]
+        
+
+    def topdown_results(self) -> dict:
+        """
+        Get the results of the TopDown methodology in the selected launches.
+
+        Returns:
+            Dictionary with the name of the result as key and its value (float) as value
+        """
+
+        results : dict = super().topdown_results()
+        results.update({"memory_mio_throttle_stall" : self.memory_mio_throttle_stall(),
+            "memory_mio_throttle_stall_on_back" : self.memory_mio_throttle_stall_on_back(),
+            "memory_mio_throttle_stall_on_memory_bound" : self.memory_mio_throttle_stall_on_memory_bound(),
+            "memory_mio_throttle_percentage_ipc_degradation" : self.memory_mio_throttle_percentage_ipc_degradation(),
+            "memory_mio_throttle_shared_load_transactions_per_request" : self.memory_mio_throttle_shared_load_transactions_per_request(),
+            "memory_mio_throttle_shared_store_transactions_per_request" : self.memory_mio_throttle_shared_store_transactions_per_request(),
+            "memory_l1_bound_stall" : self.memory_l1_bound_stall(),
+            "memory_l1_bound_stall_on_back" : self.memory_l1_bound_stall_on_back(),
+            "memory_l1_bound_stall_on_memory_bound" : self.memory_l1_bound_stall_on_memory_bound(),
+            "memory_l1_bound_percentage_ipc_degradation" : self.memory_l1_bound_percentage_ipc_degradation(),
+            "memory_l1_bound_global_hit_rate" : self.memory_l1_bound_global_hit_rate()})
+        return results
+        
+
+    def topdown_tree(self) -> list:
+        """
+        Get the hierarchy of the parts of the TopDown methodology with their percentage of IPC 
+        (degradation or retired) in the selected launches.
+
+        Returns:
+            List of tuples (name of part, name of parent part or "" if it's a root part, value)
+        """
+
+        return super().topdown_tree() + [
+            (self.__memory_mio_throttle.name(), self._back_memory_bound.name(), self.memory_mio_throttle_percentage_ipc_degradation()),
+            (self.__memory_l1_bound.name(), self._back_memory_bound.name(), self.memory_l1_bound_percentage_ipc_degradation())]
+        
+
+    def __stall_metrics(self, part : MetricMeasureNvprof, stall_metrics : str) -> dict:
+        """ Get metrics of the part which are stalls (the rest are not added to the stalls of the part)."""
+
+        names : list = stall_metrics.split(",")
+        return {name : values for name, values in part.metrics().items() if name in names}
+        
+
+    def __metric_total_value(self, part : MetricMeasureNvprof, metric_name : str) -> float:
+        """ Get value of a metric of the part in the selected launches, or 'None' if it's not measured."""
+
+        values : list = part.get_metric_value(metric_name)
+        if self._is_skipped(part) or not values:
+            return None
+        return self._get_measure_total_value(metric_name, values, AggregationsParameters.C_RATE_DEFAULT_STRATEGY)
+        
+
+    def memory_mio_throttle_stall(self) -> float:
+        """
+        Returns percent of stalls due to BackEnd.MemoryBound.MioThrottle part.
+
+        Returns:
+            Float with percent of total stalls due to BackEnd.MemoryBound.MioThrottle part
+        """
+
+        if self._is_skipped(self.__memory_mio_throttle):
+            return None
+        return (self._get_stalls_of_part(self.__stall_metrics(self.__memory_mio_throttle, 
+            MemoryMioThrottleParameters.C_MEMORY_MIO_THROTTLE_NVPROF_STALL_METRICS))/super().total_front_back_stall())*100.0
+        
+
+    def memory_mio_throttle_stall_on_back(self) -> float:
+        """ 
+        Obtain the percentage of stalls due to BackEnd.MemoryBound.MioThrottle
+        on the total BackEnd
+
+        Returns:
+            Float the percentage of stalls due to BackEnd.MemoryBound.MioThrottle
+            on the total BackEnd
+        """
+
+        if self._is_skipped(self.__memory_mio_throttle):
+            return None
+        return (self.memory_mio_throttle_stall()/super().back_end_stall())*100.0
+        
+
+    def memory_mio_throttle_stall_on_memory_bound(self) -> float:
+        """ 
+        Obtain the percentage of stalls due to BackEnd.MemoryBound.MioThrottle
+        on the total BackEnd.MemoryBound
+
+        Returns:
+            Float the percentage of stalls due to BackEnd.MemoryBound.MioThrottle
+            on the total BackEnd.MemoryBound
+        """
+
+        if self._is_skipped(self.__memory_mio_throttle):
+            return None
+        return (self.memory_mio_throttle_stall()/super().back_memory_bound_stall())*100.0
+        
+
+    def memory_mio_throttle_percentage_ipc_degradation(self) -> float: 
+        """
+        Find percentage of IPC degradation due to BackEnd.MemoryBound.MioThrottle part.
+
+        Returns:
+            Float with the percent of BackEnd.MemoryBound.MioThrottle's IPC degradation
+        """
+
+        if self._is_skipped(self.__memory_mio_throttle):
+            return None
+        return (((self._stall_ipc()*(self.memory_mio_throttle_stall()/100.0))/self.get_device_max_ipc())*100.0)
+        
+
+    def memory_mio_throttle_shared_load_transactions_per_request(self) -> float:
+        """ Returns transactions of shared memory per load request (1 without bank conflicts), or 'None' if it's not measured."""
+
+        return self.__metric_total_value(self.__memory_mio_throttle, 
+            MemoryMioThrottleParameters.C_SHARED_LOAD_TRANSACTIONS_PER_REQUEST_METRIC_NAME_NVPROF)
+        
+
+    def memory_mio_throttle_shared_store_transactions_per_request(self) -> float:
+        """ Returns transactions of shared memory per store request (1 without bank conflicts), or 'None' if it's not measured."""
+
+        return self.__metric_total_value(self.__memory_mio_throttle, 
+            MemoryMioThrottleParameters.C_SHARED_STORE_TRANSACTIONS_PER_REQUEST_METRIC_NAME_NVPROF)
+        
+
+    def memory_l1_bound_stall(self) -> float:
+        """
+        Returns percent of stalls due to BackEnd.MemoryBound.L1Bound part.
+
+        Returns:
+            Float with percent of total stalls due to BackEnd.MemoryBound.L1Bound part
+        """
+
+        if self._is_skipped(self.__memory_l1_bound):
+            return None
+        return (self._get_stalls_of_part(self.__stall_metrics(self.__memory_l1_bound, 
+            MemoryL1BoundParameters.C_MEMORY_L1_BOUND_NVPROF_STALL_METRICS))/super().total_front_back_stall())*100.0
+        
+
+    def memory_l1_bound_stall_on_back(self) -> float:
+        """ 
+        Obtain the percentage of stalls due to BackEnd.MemoryBound.L1Bound
+        on the total BackEnd
+
+        Returns:
+            Float the percentage of stalls due to BackEnd.MemoryBound.L1Bound
+            on the total BackEnd
+        """
+
+        if self._is_skipped(self.__memory_l1_bound):
+            return None
+        return (self.memory_l1_bound_stall()/super().back_end_stall())*100.0
+        
+
+    def memory_l1_bound_stall_on_memory_bound(self) -> float:
+        """ 
+        Obtain the percentage of stalls due to BackEnd.MemoryBound.L1Bound
+        on the total BackEnd.MemoryBound
+
+        Returns:
+            Float the percentage of stalls due to BackEnd.MemoryBound.L1Bound
+            on the total BackEnd.MemoryBound
+        """
+
+        if self._is_skipped(self.__memory_l1_bound):
+            return None
+        return (self.memory_l1_bound_stall()/super().back_memory_bound_stall())*100.0
+        
+
+    def memory_l1_bound_percentage_ipc_degradation(self) -> float:
+        """
+        Find percentage of IPC degradation due to BackEnd.MemoryBound.L1Bound part.
+
+        Returns:
+            Float with the percent of BackEnd.MemoryBound.L1Bound's IPC degradation
+        """
+
+        if self._is_skipped(self.__memory_l1_bound):
+            return None
+        return (((self._stall_ipc()*(self.memory_l1_bound_stall()/100.0))/self.get_device_max_ipc())*100.0)
+        
+
+    def memory_l1_bound_global_hit_rate(self) -> float:
+        """ Returns hit rate (%) of global accesses in the unified L1/texture cache, or 'None' if it's not measured."""
+
+        return self.__metric_total_value(self.__memory_l1_bound, MemoryL1BoundParameters.C_GLOBAL_HIT_RATE_METRIC_NAME_NVPROF)
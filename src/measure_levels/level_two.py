@@ -7,6 +7,7 @@ Class that represents the level two of the execution.
 
 import re
 import os, sys, inspect
+import numpy as np
 currentdir = os.path.dirname(os.path.abspath(inspect.getfile(inspect.currentframe())))
 parentdir = os.path.dirname(currentdir)
 sys.path.insert(0, parentdir) 
@@ -23,6 +24,9 @@ from parameters.level_execution_params import LevelExecutionParameters
 from measure_parts.divergence_replay import DivergenceReplay
 from measure_parts.divergence_branch import DivergenceBranch
 from pathlib import Path
+from timings.timings import Timings
+from parameters.timings_params import TimingsParameters
+from parameters.aggregations_params import AggregationsParameters
 
 class LevelTwo(LevelOne, ABC):
     """
@@ -158,10 +162,66 @@ class LevelTwo(LevelOne, ABC):
             output_command : str    ; str with results of execution.
         """
 
-        super()._set_front_back_divergence_retire_results(output_command)
-        self._set_memory_core_decode_fetch_results(output_command)
+        with Timings.span(TimingsParameters.C_SPAN_PARSE_LEVEL_ONE):
+            super()._set_front_back_divergence_retire_results(output_command)
+        with Timings.span(TimingsParameters.C_SPAN_PARSE_LEVEL_TWO):
+            self._set_memory_core_decode_fetch_results(output_command)
         pass
 
+    def measure_parts(self) -> list:
+        """
+        Returns all the parts (FrontEnd, BackEnd...) measured in the execution.
+
+        Returns:
+            List with references to the parts of the execution
+        """
+
+        return super().measure_parts() + [self._front_decode, self._front_fetch, self._back_core_bound, 
+            self._back_memory_bound, self._branch_divergence, self._replay_divergence]
+        
+
+    def topdown_results(self) -> dict:
+        """
+        Get the results of the TopDown methodology in the selected launches.
+
+        Returns:
+            Dictionary with the name of the result as key and its value (float) as value
+        """
+
+        results : dict = super().topdown_results()
+        results.update({"front_decode_stall" : self.front_decode_stall(), "front_fetch_stall" : self.front_fetch_stall(),
+            "back_core_bound_stall" : self.back_core_bound_stall(), "back_memory_bound_stall" : self.back_memory_bound_stall(),
+            "front_decode_stall_on_front" : self.front_decode_stall_on_front(), 
+            "front_fetch_stall_on_front" : self.front_fetch_stall_on_front(),
+            "back_core_bound_stall_on_back" : self.back_core_bound_stall_on_back(),
+            "back_memory_bound_stall_on_back" : self.back_memory_bound_stall_on_back(),
+            "front_decode_percentage_ipc_degradation" : self.front_decode_percentage_ipc_degradation(),
+            "front_fetch_percentage_ipc_degradation" : self.front_fetch_percentage_ipc_degradation(),
+            "back_core_bound_percentage_ipc_degradation" : self.back_core_bound_percentage_ipc_degradation(),
+            "back_memory_bound_percentage_ipc_degradation" : self.back_memory_bound_percentage_ipc_degradation(),
+            "branch_divergence_percentage_ipc_degradation" : self.branch_divergence_percentage_ipc_degradation(),
+            "replay_divergence_percentage_ipc_degradation" : self.replay_divergence_percentage_ipc_degradation()})
+        return results
+        
+
+    def topdown_tree(self) -> list:
+        """
+        Get the hierarchy of the parts of the TopDown methodology with their percentage of IPC 
+        (degradation or retired) in the selected launches.
+
+        Returns:
+            List of tuples (name of part, name of parent part or "" if it's a root part, value)
+        """
+
+        return super().topdown_tree() + [
+            (self._front_decode.name(), self._front_end.name(), self.front_decode_percentage_ipc_degradation()),
+            (self._front_fetch.name(), self._front_end.name(), self.front_fetch_percentage_ipc_degradation()),
+            (self._back_core_bound.name(), self._back_end.name(), self.back_core_bound_percentage_ipc_degradation()),
+            (self._back_memory_bound.name(), self._back_end.name(), self.back_memory_bound_percentage_ipc_degradation()),
+            (self._branch_divergence.name(), self._divergence.name(), self.branch_divergence_percentage_ipc_degradation()),
+            (self._replay_divergence.name(), self._divergence.name(), self.replay_divergence_percentage_ipc_degradation())]
+        
+
     def back_core_bound_percentage_ipc_degradation(self) -> float:
         """
         Find percentage of IPC degradation due to BackEnd.Core_Bound part.
@@ -170,6 +230,8 @@ class LevelTwo(LevelOne, ABC):
             Float with the percent of BackEnd.Core_Bound's IPC degradation
         """
 
+        if self._is_skipped(self._back_core_bound):
+            return None
         return (((self._stall_ipc()*(self.back_core_bound_stall()/100.0))/super().get_device_max_ipc())*100.0)
         pass
 
@@ -181,6 +243,8 @@ class LevelTwo(LevelOne, ABC):
             Float with the percent of BackEnd.Memory_Bound's IPC degradation
         """
 
+        if self._is_skipped(self._back_memory_bound):
+            return None
         return (((self._stall_ipc()*(self.back_memory_bound_stall()/100.0))/super().get_device_max_ipc())*100.0)
         pass
 
@@ -192,6 +256,8 @@ class LevelTwo(LevelOne, ABC):
             Float with the percent of FrontEnd.Decode's IPC degradation
         """
 
+        if self._is_skipped(self._front_decode):
+            return None
         return (((self._stall_ipc()*(self.front_decode_stall()/100.0))/super().get_device_max_ipc())*100.0)
         pass
 
@@ -203,6 +269,8 @@ class LevelTwo(LevelOne, ABC):
             Float with the percent of FrontEnd.Fetch's IPC degradation
         """
 
+        if self._is_skipped(self._front_fetch):
+            return None
         return (((self._stall_ipc()*(self.front_fetch_stall()/100.0))/super().get_device_max_ipc())*100.0)
         pass
 
@@ -240,6 +308,8 @@ class LevelTwo(LevelOne, ABC):
             Float with percent of total stalls due to BackEnd.Memory_Bound
         """
         
+        if self._is_skipped(self._back_memory_bound):
+            return None
         return (super()._get_stalls_of_part(self._back_memory_bound.metrics())/super().total_front_back_stall())*100.0
         pass
 
@@ -251,6 +321,8 @@ class LevelTwo(LevelOne, ABC):
             Float with percent of total stalls due to BackEnd.Core_Bound
         """
 
+        if self._is_skipped(self._back_core_bound):
+            return None
         return (super()._get_stalls_of_part(self._back_core_bound.metrics())/super().total_front_back_stall())*100.0
         pass
 
@@ -262,6 +334,8 @@ class LevelTwo(LevelOne, ABC):
             Float with percent of total stalls due to FrontEnd.Band_width part
         """
 
+        if self._is_skipped(self._front_decode):
+            return None
         return (super()._get_stalls_of_part(self._front_decode.metrics())/super().total_front_back_stall())*100.0
         pass
 
@@ -273,6 +347,8 @@ class LevelTwo(LevelOne, ABC):
             Float with percent of total stalls due to FrontEnd.Fetch part
         """
 
+        if self._is_skipped(self._front_fetch):
+            return None
         return (super()._get_stalls_of_part(self._front_fetch.metrics())/super().total_front_back_stall())*100.0
         pass
 
@@ -286,6 +362,8 @@ class LevelTwo(LevelOne, ABC):
             on the total BackEnd
         """
 
+        if self._is_skipped(self._back_memory_bound):
+            return None
         return (super()._get_stalls_of_part(self._back_memory_bound.metrics())/self.total_core_memory_stall())*100.0 
 
     def back_core_bound_stall_on_back(self) -> float:
@@ -298,6 +376,8 @@ class LevelTwo(LevelOne, ABC):
             on the total BackEnd
         """
 
+        if self._is_skipped(self._back_core_bound):
+            return None
         return (super()._get_stalls_of_part(self._back_core_bound.metrics())/self.total_core_memory_stall())*100.0 
 
     def front_decode_stall_on_front(self) -> float:
@@ -310,6 +390,8 @@ class LevelTwo(LevelOne, ABC):
             on the total FrontEnd
         """
 
+        if self._is_skipped(self._front_decode):
+            return None
         return (super()._get_stalls_of_part(self._front_decode.metrics())/self.total_fetch_decode_stall())*100.0 
         pass
 
@@ -324,6 +406,8 @@ class LevelTwo(LevelOne, ABC):
         """
 
         
+        if self._is_skipped(self._front_fetch):
+            return None
         return (super()._get_stalls_of_part(self._front_fetch.metrics())/self.total_fetch_decode_stall())*100.0 
         pass
 
@@ -367,7 +451,8 @@ class LevelTwo(LevelOne, ABC):
         warp_execution_efficiency_list  : list = self._divergence.get_metric_value(warp_exec_efficiency_name)
         if warp_execution_efficiency_list is None:
             raise RetireIpcMetricNotDefined
-        total_warp_execution_efficiency : float = self._get_total_value_of_list(warp_execution_efficiency_list, True)        
+        total_warp_execution_efficiency : float = self._get_measure_total_value(warp_exec_efficiency_name, warp_execution_efficiency_list, 
+            AggregationsParameters.C_RATE_DEFAULT_STRATEGY)        
         return ipc * (1.0 - (total_warp_execution_efficiency/100.0))
         pass
 
@@ -386,10 +471,8 @@ class LevelTwo(LevelOne, ABC):
 
         ipc : float = self.ipc()
         issued_ipc_list : list = self._divergence.get_metric_value(issue_ipc_name)
-        total_issued_ipc : float = self._get_total_value_of_list(issued_ipc_list, True)
-        ipc_diference : float = float(total_issued_ipc) - ipc
-        if ipc_diference < 0.0:
-            ipc_diference = 0.0
+        total_issued_ipc : float = self._get_measure_total_value(issue_ipc_name, issued_ipc_list, AggregationsParameters.C_RATE_DEFAULT_STRATEGY)
+        ipc_diference : float = np.maximum(total_issued_ipc - ipc, 0.0)
         return ipc_diference
         pass
 
@@ -134,12 +134,12 @@ class LevelTwoNsight(LevelTwo, LevelOneNsight):
             String with command to be executed
         """
         
-        command : str = ("ncu --target-processes all --metrics " + self._front_end.metrics_str() +
+        command : str = ("ncu --target-processes all " + self._profiler_flags() + "--metrics " + self._front_end.metrics_str() +
             "," + self._back_end.metrics_str() + "," + self._divergence.metrics_str() + "," +
             self._extra_measure.metrics_str() + "," + self._retire.metrics_str() + "," +
             self._front_decode.metrics_str() + "," + self._front_fetch.metrics_str() +
             "," + self._back_core_bound.metrics_str() + "," + self._back_memory_bound.metrics_str() +
-             " " + self._program)
+            self._optional_metrics_str() + " " + self._program)
         return command
         
 
@@ -191,6 +191,7 @@ class LevelTwoNsight(LevelTwo, LevelOneNsight):
             lst_output.append(converter.underlined_str(self._extra_measure.name()))
             super()._add_result_part_to_lst(self._extra_measure.metrics(), 
                 self._extra_measure.metrics_description(), lst_output)
+        super()._add_optional_parts_results(lst_output)
         lst_output.append("\n")
         
     
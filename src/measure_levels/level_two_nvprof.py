@@ -135,14 +135,14 @@ class LevelTwoNvprof(LevelTwo, LevelOneNvprof):
         Returns:
             String with command to be executed
         """
-        command : str = ("nvprof --metrics " + self._front_end.metrics_str() + "," + self._back_end.metrics_str() + 
+        command : str = ("nvprof " + self._profiler_flags() + "--metrics " + self._front_end.metrics_str() + "," + self._back_end.metrics_str() + 
             "," + self._divergence.metrics_str() + "," + self._extra_measure.metrics_str() + "," + self._retire.metrics_str() + 
             "," + self._front_decode.metrics_str() + "," + self._front_fetch.metrics_str() + "," + 
-            self._back_core_bound.metrics_str() + "," + self._back_memory_bound.metrics_str() + "  --events " + 
+            self._back_core_bound.metrics_str() + "," + self._back_memory_bound.metrics_str() + self._optional_metrics_str() + "  --events " + 
             self._front_end.events_str() + "," + self._back_end.events_str() + "," + self._divergence.events_str() +  "," + 
             self._extra_measure.events_str() + "," + self._retire.events_str() + "," +  self._front_decode.events_str() + 
             "," + self._front_fetch.events_str() + "," + self._back_core_bound.events_str() + "," + self._back_memory_bound.events_str() + 
-            " --unified-memory-profiling off " + self._program)
+            self._optional_events_str() + " --unified-memory-profiling off " + self._program)
         return command
         
 
@@ -240,6 +240,7 @@ class LevelTwoNvprof(LevelTwo, LevelOneNvprof):
         if self._collect_events and self._extra_measure.events_str() != "":
                 super()._add_result_part_to_lst(self._extra_measure.events(), 
                 self._extra_measure.events_description(), lst_output, False)
+        super()._add_optional_parts_results(lst_output)
         lst_output.append("\n")
         
     
@@ -263,6 +264,8 @@ class LevelTwoNvprof(LevelTwo, LevelOneNvprof):
         metric_name : str
         metric_description : str
         metric_avg_value : str
+        metric_max_value : str
+        metric_min_value : str
         has_read_all_events : bool = False
         back_core_bound_value_has_found : bool 
         back_core_bound_description_has_found : bool
@@ -307,10 +310,10 @@ class LevelTwoNvprof(LevelTwo, LevelOneNvprof):
                     for i in range(3, len(list_words) - 3):
                         metric_description += list_words[i] + " "     
                     metric_avg_value = list_words[len(list_words) - 1]
-                    #metric_max_value = list_words[len(list_words) - 2]
-                    #metric_min_value = list_words[len(list_words) - 3]
-                    #if metric_avg_value != metric_max_value or metric_avg_value != metric_min_value:
-                        # Do Something. NOT USED
+                    metric_max_value = list_words[len(list_words) - 2]
+                    metric_min_value = list_words[len(list_words) - 3]
+                    for part in [self._back_core_bound, self._back_memory_bound, self._front_decode, self._front_fetch]:
+                        part.set_metric_range(metric_name, metric_min_value, metric_max_value)
                     back_core_bound_value_has_found = self._back_core_bound.set_metric_value(metric_name, metric_avg_value)
                     back_core_bound_description_has_found = self._back_core_bound.set_metric_description(metric_name, metric_description)
                     back_memory_bound_value_has_found = self._back_memory_bound.set_metric_value(metric_name, metric_avg_value)
@@ -0,0 +1,38 @@
+"""
+Measurements made by the TopDown methodology in (core) wait.
+
+@date:      Jul 2021
+@version:   1.0
+"""
+
+import os, sys, inspect
+currentdir = os.path.dirname(os.path.abspath(inspect.getfile(inspect.currentframe())))
+parentdir = os.path.dirname(currentdir)
+sys.path.insert(0, parentdir) 
+from measure_parts.back_core_bound import BackCoreBound
+from measure_parts.metric_measure import MetricMeasureNsight
+ 
+class CoreWait(BackCoreBound):
+    """Class that defines the Wait (sub-part of CoreBound) part."""
+
+    pass
+ 
+class CoreWaitNsight(MetricMeasureNsight, CoreWait):
+    """Class that defines the Core-Bound.Wait part with nsight scan tool."""
+
+    def __init__(self, name : str, description : str, metrics : str):
+        """ 
+        Set attributtes with argument values.
+        
+        Args:
+            
+            name                : str   ;   measure name.
+        
+            description         : str   ;   description with information.
+        
+            metrics             : str   ;   string with the metrics
+         
+        """
+
+        super().__init__(name, description, metrics)
+        
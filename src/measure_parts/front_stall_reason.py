@@ -0,0 +1,52 @@
+"""
+Measurements made by the TopDown methodology in a stall reason of (front-end) fetch or decode.
+
+@date:      Jul 2021
+@version:   1.0
+"""
+
+import os, sys, inspect
+currentdir = os.path.dirname(os.path.abspath(inspect.getfile(inspect.currentframe())))
+parentdir = os.path.dirname(currentdir)
+sys.path.insert(0, parentdir) 
+from measure_parts.front_end import FrontEnd
+from measure_parts.metric_measure import MetricMeasureNsight
+ 
+class FrontStallReason(FrontEnd):
+    """Class that defines a stall reason (sub-part of Fetch or Decode) part."""
+
+    pass
+ 
+class FrontStallReasonNsight(MetricMeasureNsight, FrontStallReason):
+    """
+    Class that defines a FrontEnd stall reason part with nsight scan tool.
+
+    Attributes:
+        __parent_name   : str   ; name of the parent part (FrontEnd.Fetch or FrontEnd.Decode)
+    """
+
+    def __init__(self, name : str, description : str, metrics : str, parent_name : str):
+        """ 
+        Set attributtes with argument values.
+        
+        Args:
+            
+            name                : str   ;   measure name.
+        
+            description         : str   ;   description with information.
+        
+            metrics             : str   ;   string with the metrics
+
+            parent_name         : str   ;   name of the parent part (FrontEnd.Fetch or FrontEnd.Decode)
+         
+        """
+
+        super().__init__(name, description, metrics)
+        self.__parent_name : str = parent_name
+        
+
+    def parent_name(self) -> str:
+        """ Returns name of the parent part (FrontEnd.Fetch or FrontEnd.Decode)."""
+
+        return self.__parent_name
+        
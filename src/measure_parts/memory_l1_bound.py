@@ -11,7 +11,7 @@ parentdir = os.path.dirname(currentdir)
 sys.path.insert(0, parentdir) 
 from measure_parts.back_memory_bound import BackMemoryBound
 from measure_parts.back_memory_bound import BackMemoryBound
-from measure_parts.metric_measure import MetricMeasureNsight
+from measure_parts.metric_measure import MetricMeasureNsight, MetricMeasureNvprof
  
 class MemoryL1Bound(BackMemoryBound):
     """Class that defines the L1 Bound (sub-part of MemoryBound) part."""
@@ -37,4 +37,24 @@ class MemoryL1BoundNsight(MetricMeasureNsight, MemoryL1Bound):
 
         super().__init__(name, description, metrics)
         
-  
+
+class MemoryL1BoundNvprof(MetricMeasureNvprof, MemoryL1Bound):
+    """Class that defines the Memory-Bound.L1Bound part with nvprof scan tool."""
+
+    def __init__(self, name : str, description : str, metrics : str, events : str):
+        """ 
+        Set attributtes with argument values.
+        
+        Args:
+            
+            name                : str   ;   measure name.
+        
+            description         : str   ;   description with information.
+        
+            metrics             : str   ;   string with the metrics
+        
+            events              : str   ;   string with events
+        """
+
+        super().__init__(name, description, metrics, events)
+        
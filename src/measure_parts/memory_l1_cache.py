@@ -0,0 +1,38 @@
+"""
+Measurements made by the TopDown methodology in (memory) L1 cache.
+
+@date:      Jul 2021
+@version:   1.0
+"""
+
+import os, sys, inspect
+currentdir = os.path.dirname(os.path.abspath(inspect.getfile(inspect.currentframe())))
+parentdir = os.path.dirname(currentdir)
+sys.path.insert(0, parentdir) 
+from measure_parts.memory_l1_bound import MemoryL1Bound
+from measure_parts.metric_measure import MetricMeasureNsight
+ 
+class MemoryL1Cache(MemoryL1Bound):
+    """Class that defines the L1 Cache (sub-part of L1Bound) part."""
+
+    pass
+ 
+class MemoryL1CacheNsight(MetricMeasureNsight, MemoryL1Cache):
+    """Class that defines the Memory-Bound.L1Bound.L1Cache part with nsight scan tool."""
+
+    def __init__(self, name : str, description : str, metrics : str):
+        """ 
+        Set attributtes with argument values.
+        
+        Args:
+            
+            name                : str   ;   measure name.
+        
+            description         : str   ;   description with information.
+        
+            metrics             : str   ;   string with the metrics
+         
+        """
+
+        super().__init__(name, description, metrics)
+        
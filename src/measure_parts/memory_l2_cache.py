@@ -0,0 +1,38 @@
+"""
+Measurements made by the TopDown methodology in (memory) L2 cache.
+
+@date:      Jul 2021
+@version:   1.0
+"""
+
+import os, sys, inspect
+currentdir = os.path.dirname(os.path.abspath(inspect.getfile(inspect.currentframe())))
+parentdir = os.path.dirname(currentdir)
+sys.path.insert(0, parentdir) 
+from measure_parts.memory_l1_bound import MemoryL1Bound
+from measure_parts.metric_measure import MetricMeasureNsight
+ 
+class MemoryL2Cache(MemoryL1Bound):
+    """Class that defines the L2 Cache (sub-part of L1Bound) part."""
+
+    pass
+ 
+class MemoryL2CacheNsight(MetricMeasureNsight, MemoryL2Cache):
+    """Class that defines the Memory-Bound.L1Bound.L2Cache part with nsight scan tool."""
+
+    def __init__(self, name : str, description : str, metrics : str):
+        """ 
+        Set attributtes with argument values.
+        
+        Args:
+            
+            name                : str   ;   measure name.
+        
+            description         : str   ;   description with information.
+        
+            metrics             : str   ;   string with the metrics
+         
+        """
+
+        super().__init__(name, description, metrics)
+        
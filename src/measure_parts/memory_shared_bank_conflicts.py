@@ -0,0 +1,38 @@
+"""
+Measurements made by the TopDown methodology in (memory) shared bank conflicts.
+
+@date:      Jul 2021
+@version:   1.0
+"""
+
+import os, sys, inspect
+currentdir = os.path.dirname(os.path.abspath(inspect.getfile(inspect.currentframe())))
+parentdir = os.path.dirname(currentdir)
+sys.path.insert(0, parentdir) 
+from measure_parts.memory_mio_throttle import MemoryMioThrottle
+from measure_parts.metric_measure import MetricMeasureNsight
+ 
+class MemorySharedBankConflicts(MemoryMioThrottle):
+    """Class that defines the Shared Bank Conflicts (sub-part of MioThrottle) part."""
+
+    pass
+ 
+class MemorySharedBankConflictsNsight(MetricMeasureNsight, MemorySharedBankConflicts):
+    """Class that defines the Memory-Bound.MioThrottle.SharedBankConflicts part with nsight scan tool."""
+
+    def __init__(self, name : str, description : str, metrics : str):
+        """ 
+        Set attributtes with argument values.
+        
+        Args:
+            
+            name                : str   ;   measure name.
+        
+            description         : str   ;   description with information.
+        
+            metrics             : str   ;   string with the metrics
+         
+        """
+
+        super().__init__(name, description, metrics)
+        
@@ -199,6 +199,22 @@ class MetricMeasure(ABC):
         return self._metrics_str
         
 
+    def add_values(self, part):
+        """
+        Append the values of the metrics of other part of the same class (measured in other
+        launches), in launch order. Descriptions are taken from the other part if this part has none.
+
+        Args:
+            part    : MetricMeasure ; part whose values are appended
+        """
+
+        for metric_name, values in part.metrics().items():
+            if metric_name in self._metrics:
+                self._metrics[metric_name] += values
+                if not self._metrics_desc.get(metric_name):
+                    self._metrics_desc[metric_name] = part.metrics_description().get(metric_name)
+        
+
 class MetricMeasureNsight(MetricMeasure):
     """
     Class that implements the metrics used 
@@ -273,6 +289,10 @@ class MetricMeasureNvprof(MetricMeasure):
                                         and description of events as value.
                                         
         __events_str        : str   ;   string with the events
+
+        __metrics_range     : dict  ;   dictionary with metric name as key, and list with the
+                                        (min, max) of the metric in the invocations of each
+                                        launch (kernel) as value.
     """
 
     def __init__(self, name : str, description : str, metrics : str, events : str):
@@ -293,6 +313,9 @@ class MetricMeasureNvprof(MetricMeasure):
         super().__init__(name, description, metrics)
         self.__init_dictionaries(events)
         self.__check_data_structures() # check dictionaries defined correctly
+        self.__metrics_range : dict = dict()
+        for key_metrics in self._metrics:
+            self.__metrics_range[key_metrics] = list()
         
     
     def __init_dictionaries(self, events : str):
@@ -404,6 +427,52 @@ class MetricMeasureNvprof(MetricMeasure):
         return True
         
 
+    def set_metric_range(self, metric_name : str, min_value : str, max_value : str) -> bool:
+        """
+        Add the min and max values of metric with key 'metric_name' in the invocations of the
+        launch (kernel) if 'metric_name' exists.
+
+        Args:
+            metric_name     : str   ; name of the metric
+            min_value       : str   ; min value of the metric
+            max_value       : str   ; max value of the metric
+
+        Returns:
+            True if the operation was perfomed succesfully or False if not because 'metric_name'
+            does not correspond to any metric
+        """
+
+        if not metric_name in self.__metrics_range:
+            return False
+        self.__metrics_range[metric_name].append((min_value, max_value))
+        return True
+        
+
+    def get_metric_range(self, metric_name : str) -> list:
+        """
+        Get the min and max values of 'metric_name' in the invocations of each launch (kernel).
+
+        Args:
+            metric_name  : str   ; name of the metric
+
+        Returns:
+            List of tuples (min, max) or 'None' if 'metric_name' doesn't exist or it's not a metric
+        """
+
+        return self.__metrics_range.get(metric_name)
+        
+
+    def metrics_range(self) -> dict:
+        """
+        Returns dictionary with the min and max values of the metrics in the invocations of each launch.
+
+        Returns:
+            Dictionary with metric name as key and list of tuples (min, max) as value
+        """
+
+        return self.__metrics_range
+        
+
     def is_event(self, event_name : str) -> bool:
         """
         Check if argument it's an event or not
@@ -492,3 +561,22 @@ class MetricMeasureNvprof(MetricMeasure):
 
         return self.__events_str
         
+
+    def add_values(self, part):
+        """
+        Append the values of the metrics and events of other part of the same class (measured in
+        other launches), in launch order. Descriptions are taken from the other part if this part has none.
+
+        Args:
+            part    : MetricMeasureNvprof   ; part whose values are appended
+        """
+
+        super().add_values(part)
+        for metric_name, ranges in part.metrics_range().items():
+            if metric_name in self.__metrics_range:
+                self.__metrics_range[metric_name] += ranges
+        for event_name, values in part.events().items():
+            if event_name in self.__events:
+                self.__events[event_name] += values
+                if not self.__events_desc.get(event_name):
+                    self.__events_desc[event_name] = part.events_description().get(event_name)
@@ -0,0 +1,54 @@
+"""
+Class with all params of Aggregations class
+and their subclasses
+
+@date:      Jul 2021
+@version:   1.0
+"""
+
+import os, sys, inspect
+currentdir = os.path.dirname(os.path.abspath(inspect.getfile(inspect.currentframe())))
+parentdir = os.path.dirname(currentdir)
+sys.path.insert(0, parentdir) 
+from parameters.level_execution_params import LevelExecutionParameters
+from parameters.memory_l1_cache_params import MemoryL1CacheParameters
+from parameters.memory_l2_cache_params import MemoryL2CacheParameters
+from parameters.memory_dram_params import MemoryDramParameters
+
+class AggregationsParameters:
+
+    # strategies to combine the values of a metric/event in the selected launches into the value of the
+    # application: means weighted by the cycles, duration or instructions of each launch, mean (all
+    # launches weigh the same) and sum
+    C_CYCLES_WEIGHTED_STRATEGY                  : str       = "cycles_weighted"
+    C_DURATION_WEIGHTED_STRATEGY                : str       = "duration_weighted"
+    C_INSTRUCTIONS_WEIGHTED_STRATEGY            : str       = "instructions_weighted"
+    C_MEAN_STRATEGY                             : str       = "mean"
+    C_SUM_STRATEGY                              : str       = "sum"
+
+    # weights of the launches used by the strategies
+    C_CYCLES_WEIGHTS                            : str       = "cycles"
+    C_DURATION_WEIGHTS                          : str       = "duration"
+    C_INSTRUCTIONS_WEIGHTS                      : str       = "instructions"
+
+    # strategy of each metric/event (name as key). Add here the metrics and events which are not
+    # combined with the default strategy of their kind. Threads per instruction weigh by the instructions
+    # of each launch, and utilization of the peak along the time by the duration of each launch
+    C_MEASURE_STRATEGIES                        : dict      = {"inst_issued" : C_SUM_STRATEGY,
+        LevelExecutionParameters.C_WARP_EXECUTION_EFFICIENCY_METRIC_NAME_NVPROF : C_INSTRUCTIONS_WEIGHTED_STRATEGY,
+        LevelExecutionParameters.C_WARP_EXECUTION_EFFICIENCY_METRIC_NAME_NSIGHT : C_INSTRUCTIONS_WEIGHTED_STRATEGY,
+        MemoryL1CacheParameters.C_L1_THROUGHPUT_METRIC_NAME_NSIGHT : C_DURATION_WEIGHTED_STRATEGY,
+        MemoryL2CacheParameters.C_L2_THROUGHPUT_METRIC_NAME_NSIGHT : C_DURATION_WEIGHTED_STRATEGY,
+        MemoryDramParameters.C_DRAM_THROUGHPUT_METRIC_NAME_NSIGHT : C_DURATION_WEIGHTED_STRATEGY}
+
+    # default strategies of metrics and events without strategy
+    C_METRIC_DEFAULT_STRATEGY_NVPROF            : str       = C_CYCLES_WEIGHTED_STRATEGY
+    C_EVENT_DEFAULT_STRATEGY_NVPROF             : str       = C_SUM_STRATEGY
+    C_METRIC_DEFAULT_STRATEGY_NSIGHT            : str       = C_SUM_STRATEGY
+    # default strategies of the measures used by the results of the TopDown methodology: rates (stalls, IPC,
+    # efficiencies, percentages...) and counts (bytes, wavefronts...)
+    C_RATE_DEFAULT_STRATEGY                     : str       = C_CYCLES_WEIGHTED_STRATEGY
+    C_COUNT_DEFAULT_STRATEGY                    : str       = C_SUM_STRATEGY
+
+    # duration of each launch (if it's not measured, cycles are used as duration)
+    C_DURATION_METRIC_NAME_NSIGHT               : str       = "gpu__time_duration.sum"
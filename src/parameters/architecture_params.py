@@ -0,0 +1,31 @@
+"""
+Class with all params of Architecture and ArchitectureDatabase classes
+
+@date:      Jul 2021
+@version:   1.0
+"""
+
+class ArchitectureParameters:
+
+    # database bundled with the program (same directory as the module)
+    C_DATABASE_FILE_NAME                        : str       = "architectures.json"
+
+    # keys of the database
+    C_ARCHITECTURES_KEY                         : str       = "architectures"
+    C_COMPUTE_CAPABILITY_KEY                    : str       = "compute_capability"
+    C_NAME_KEY                                  : str       = "name"
+    C_CHIP_KEY                                  : str       = "chip"
+    C_WARP_SCHEDULERS_PER_SM_KEY                : str       = "warp_schedulers_per_sm"
+    C_ISSUE_WIDTH_KEY                           : str       = "issue_width"
+    C_SM_COUNT_KEY                              : str       = "sm_count"
+    C_METRIC_ALIASES_KEY                        : str       = "metric_aliases"
+    C_MEMORY_LATENCY_CYCLES_KEY                 : str       = "memory_latency_cycles"
+    C_REQUIRED_KEYS                             : list      = ["compute_capability", "name", "warp_schedulers_per_sm", "issue_width"]
+
+    # levels of the memory hierarchy in 'memory_latency_cycles' (approximate latency, in cycles, of a request served by the level)
+    C_L1_CACHE_LATENCY_KEY                      : str       = "l1"
+    C_L2_CACHE_LATENCY_KEY                      : str       = "l2"
+    C_DRAM_LATENCY_KEY                          : str       = "dram"
+
+    # characters which can't be next to a metric/event name (so 'a.sum' doesn't match 'a.sum.peak_sustained')
+    C_METRIC_NAME_BOUNDARY_REGEX                : str       = r"[\w.]"
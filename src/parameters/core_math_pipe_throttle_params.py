@@ -0,0 +1,16 @@
+"""
+Class with all params of BackEnd.CoreBound.MathPipeThrottle class
+and their subclasses
+
+@date:      Jul 2021
+@version:   1.0
+"""
+
+class CoreMathPipeThrottleParameters:
+
+    C_CORE_MATH_PIPE_THROTTLE_NAME                    : str        = "BACK-END.CORE-BOUND.MATH-PIPE-THROTTLE"
+    C_CORE_MATH_PIPE_THROTTLE_DESCRIPTION             : str        = ("Collects performance losses caused by execution pipes (ALU, FMA, FP64, Tensor...) " +
+                                                                        "which are not available for the next instruction.")
+    
+    # NSIGHT metrics
+    C_CORE_MATH_PIPE_THROTTLE_NSIGHT_METRICS          : str        = ("smsp__warp_issue_stalled_math_pipe_throttle_per_warp_active.pct")
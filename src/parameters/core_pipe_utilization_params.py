@@ -0,0 +1,27 @@
+"""
+Class with all params of BackEnd.CoreBound.MathPipeThrottle pipes class
+and their subclasses
+
+@date:      Jul 2021
+@version:   1.0
+"""
+
+class CorePipeUtilizationParameters:
+
+    C_CORE_PIPE_UTILIZATION_NAME                    : str        = "BACK-END.CORE-BOUND.PIPE-UTILIZATION"
+    C_CORE_PIPE_UTILIZATION_DESCRIPTION             : str        = ("Utilization of the execution pipes. The IPC degradation of " +
+                                                                    "BACK-END.CORE-BOUND.MATH-PIPE-THROTTLE is shared among the pipes by their utilization.")
+
+    # NSIGHT metrics (cycles each pipe is active, percentage of the peak)
+    C_CORE_PIPE_ALU_METRIC_NAME_NSIGHT              : str        = "sm__pipe_alu_cycles_active.avg.pct_of_peak_sustained_active"
+    C_CORE_PIPE_FMA_METRIC_NAME_NSIGHT              : str        = "sm__pipe_fma_cycles_active.avg.pct_of_peak_sustained_active"
+    C_CORE_PIPE_FP64_METRIC_NAME_NSIGHT             : str        = "sm__pipe_fp64_cycles_active.avg.pct_of_peak_sustained_active"
+    C_CORE_PIPE_TENSOR_METRIC_NAME_NSIGHT           : str        = "sm__pipe_tensor_cycles_active.avg.pct_of_peak_sustained_active"
+    C_CORE_PIPE_UTILIZATION_NSIGHT_METRICS          : str        = (C_CORE_PIPE_ALU_METRIC_NAME_NSIGHT + "," + C_CORE_PIPE_FMA_METRIC_NAME_NSIGHT + 
+                                                                    "," + C_CORE_PIPE_FP64_METRIC_NAME_NSIGHT + "," + C_CORE_PIPE_TENSOR_METRIC_NAME_NSIGHT)
+
+    # pipes (name as key and metric with its utilization as value), children of MATH-PIPE-THROTTLE in the hierarchy
+    C_CORE_PIPES_NSIGHT                             : dict       = {"ALU" : C_CORE_PIPE_ALU_METRIC_NAME_NSIGHT, 
+                                                                    "FMA" : C_CORE_PIPE_FMA_METRIC_NAME_NSIGHT,
+                                                                    "FP64" : C_CORE_PIPE_FP64_METRIC_NAME_NSIGHT, 
+                                                                    "TENSOR" : C_CORE_PIPE_TENSOR_METRIC_NAME_NSIGHT}
@@ -0,0 +1,16 @@
+"""
+Class with all params of BackEnd.CoreBound.Wait class
+and their subclasses
+
+@date:      Jul 2021
+@version:   1.0
+"""
+
+class CoreWaitParameters:
+
+    C_CORE_WAIT_NAME                    : str        = "BACK-END.CORE-BOUND.WAIT"
+    C_CORE_WAIT_DESCRIPTION             : str        = ("Collects performance losses caused by fixed latency dependencies between instructions " +
+                                                        "(registers written by the previous instructions).")
+    
+    # NSIGHT metrics
+    C_CORE_WAIT_NSIGHT_METRICS          : str        = ("smsp__warp_issue_stalled_wait_per_warp_active.pct")
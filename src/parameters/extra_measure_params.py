@@ -11,6 +11,13 @@ currentdir = os.path.dirname(os.path.abspath(inspect.getfile(inspect.currentfram
 parentdir = os.path.dirname(currentdir)
 sys.path.insert(0, parentdir) 
 from parameters.level_execution_params import LevelExecutionParameters
+from parameters.core_pipe_utilization_params import CorePipeUtilizationParameters
+from parameters.memory_l1_bound_params import MemoryL1BoundParameters
+from parameters.memory_mio_throttle_params import MemoryMioThrottleParameters
+from parameters.memory_l1_cache_params import MemoryL1CacheParameters
+from parameters.memory_l2_cache_params import MemoryL2CacheParameters
+from parameters.memory_dram_params import MemoryDramParameters
+from parameters.memory_shared_bank_conflicts_params import MemorySharedBankConflictsParameters
 
 class ExtraMeasureParameters:
 
@@ -24,11 +31,17 @@ class ExtraMeasureParameters:
     C_EXTRA_MEASURE_NVPROF_L2_METRICS          : str      = ("")
     C_EXTRA_MEASURE_NVPROF_L2_EVENTS           : str      = (LevelExecutionParameters.C_CYCLES_ELAPSED_EVENT_NAME_NVPROF)
 
-    C_EXTRA_MEASURE_NVPROF_L3_METRICS          : str      = ("")
+    C_EXTRA_MEASURE_NVPROF_L3_METRICS          : str      = (MemoryL1BoundParameters.C_GLOBAL_HIT_RATE_METRIC_NAME_NVPROF + "," + 
+                                                            MemoryMioThrottleParameters.C_SHARED_LOAD_TRANSACTIONS_PER_REQUEST_METRIC_NAME_NVPROF + "," +
+                                                            MemoryMioThrottleParameters.C_SHARED_STORE_TRANSACTIONS_PER_REQUEST_METRIC_NAME_NVPROF)
     C_EXTRA_MEASURE_NVPROF_L3_EVENTS           : str      = (LevelExecutionParameters.C_CYCLES_ELAPSED_EVENT_NAME_NVPROF)
     
     # NSIGHT metrics
     C_EXTRA_MEASURE_NSIGHT_L1_METRICS          : str      = (LevelExecutionParameters.C_CYCLES_ELAPSED_METRIC_NAME_NSIGHT)
     C_EXTRA_MEASURE_NSIGHT_L2_METRICS          : str      = (LevelExecutionParameters.C_CYCLES_ELAPSED_METRIC_NAME_NSIGHT)
-    C_EXTRA_MEASURE_NSIGHT_L3_METRICS          : str      = (LevelExecutionParameters.C_CYCLES_ELAPSED_METRIC_NAME_NSIGHT + ",sm__cycles_active.avg,sm__inst_executed.avg, sm__sass_average_branch_targets_threads_uniform.pct")
-
+    C_EXTRA_MEASURE_NSIGHT_L3_METRICS          : str      = (LevelExecutionParameters.C_CYCLES_ELAPSED_METRIC_NAME_NSIGHT + ",sm__cycles_active.avg,sm__inst_executed.avg, sm__sass_average_branch_targets_threads_uniform.pct," +
+                                                            CorePipeUtilizationParameters.C_CORE_PIPE_UTILIZATION_NSIGHT_METRICS)
+    C_EXTRA_MEASURE_NSIGHT_L4_METRICS          : str      = (C_EXTRA_MEASURE_NSIGHT_L3_METRICS + "," + MemoryL1CacheParameters.C_MEMORY_L1_CACHE_NSIGHT_METRICS +
+                                                            "," + MemoryL2CacheParameters.C_MEMORY_L2_CACHE_NSIGHT_METRICS + "," + 
+                                                            MemoryDramParameters.C_MEMORY_DRAM_NSIGHT_METRICS + "," + 
+                                                            MemorySharedBankConflictsParameters.C_MEMORY_SHARED_BANK_CONFLICTS_NSIGHT_METRICS)
@@ -0,0 +1,40 @@
+"""
+Class with all params of FrontEnd stall reasons (parts of level three
+below FrontEnd.Fetch and FrontEnd.Decode) class and their subclasses
+
+@date:      Jul 2021
+@version:   1.0
+"""
+
+import os, sys, inspect
+currentdir = os.path.dirname(os.path.abspath(inspect.getfile(inspect.currentframe())))
+parentdir = os.path.dirname(currentdir)
+sys.path.insert(0, parentdir) 
+from parameters.front_fetch_params import FrontFetchParameters
+from parameters.front_decode_params import FrontDecodeParameters
+
+class FrontStallReasonsParameters:
+
+    # NSIGHT parts: tuples (name, description, metric, name of parent part)
+    C_FRONT_STALL_REASONS_NSIGHT            : list      = [
+        (FrontFetchParameters.C_FRONT_FETCH_NAME + ".NO-INSTRUCTION", 
+            "Collects performance losses caused by misses of the instruction cache (or waits after a branch).",
+            "smsp__warp_issue_stalled_no_instruction_per_warp_active.pct", FrontFetchParameters.C_FRONT_FETCH_NAME),
+        (FrontFetchParameters.C_FRONT_FETCH_NAME + ".BRANCH-RESOLVING", 
+            "Collects performance losses caused by waits for the target of branches to be computed.",
+            "smsp__warp_issue_stalled_branch_resolving_per_warp_active.pct", FrontFetchParameters.C_FRONT_FETCH_NAME),
+        (FrontFetchParameters.C_FRONT_FETCH_NAME + ".BARRIER", 
+            "Collects performance losses caused by waits for the warps of the block in barriers (__syncthreads).",
+            "smsp__warp_issue_stalled_barrier_per_warp_active.pct", FrontFetchParameters.C_FRONT_FETCH_NAME),
+        (FrontFetchParameters.C_FRONT_FETCH_NAME + ".MEMBAR", 
+            "Collects performance losses caused by waits in memory barriers (__threadfence).",
+            "smsp__warp_issue_stalled_membar_per_warp_active.pct", FrontFetchParameters.C_FRONT_FETCH_NAME),
+        (FrontFetchParameters.C_FRONT_FETCH_NAME + ".SLEEPING", 
+            "Collects performance losses caused by warps which are sleeping (__nanosleep) or yielding.",
+            "smsp__warp_issue_stalled_sleeping_per_warp_active.pct", FrontFetchParameters.C_FRONT_FETCH_NAME),
+        (FrontDecodeParameters.C_FRONT_DECODE_NAME + ".DISPATCH-STALL", 
+            "Collects performance losses caused by the dispatcher, which cannot issue the instruction selected.",
+            "smsp__warp_issue_stalled_dispatch_stall_per_warp_active.pct", FrontDecodeParameters.C_FRONT_DECODE_NAME),
+        (FrontDecodeParameters.C_FRONT_DECODE_NAME + ".MISC", 
+            "Collects performance losses caused by miscellaneous hardware reasons.",
+            "smsp__warp_issue_stalled_misc_per_warp_active.pct", FrontDecodeParameters.C_FRONT_DECODE_NAME)]
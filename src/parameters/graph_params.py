@@ -0,0 +1,37 @@
+"""
+Class with all params of PieChart and StaticGraphRenderer classes
+
+@date:      Jul 2021
+@version:   1.0
+"""
+
+class GraphParameters:
+
+    # formats of the graphs (obtained from the extension of the file)
+    C_HTML_FILE_EXTENSIONS                      : list      = [".html", ".htm"]
+    C_STATIC_FILE_EXTENSIONS                    : list      = [".png", ".svg", ".pdf"]
+
+    # size (in pixels) of the static images
+    C_STATIC_IMAGE_WIDTH                        : int       = 1400
+    C_STATIC_IMAGE_HEIGHT                       : int       = 1000
+
+    # max number of processes which render graphs at the same time ('None' to use all CPUs)
+    C_MAX_RENDER_WORKERS                        : int       = None
+
+    # name of the graph of each kernel: <name of file>_<index of kernel>_<kernel><extension>
+    C_KERNEL_GRAPH_FILE_FORMAT                  : str       = "%s_%d_%s%s"
+    C_KERNEL_GRAPH_NAME_MAX_LENGTH              : int       = 64
+    C_KERNEL_GRAPH_NAME_INVALID_CHARS_REGEX     : str       = "[^A-Za-z0-9_.-]+"
+    C_KERNEL_GRAPH_TITLE                        : str       = "Description of Results (kernel %d: %s, %d launches)"
+
+    # hierarchical graph of the TopDown parts
+    C_HIERARCHY_CHART_TYPES                     : list      = ["sunburst", "treemap"]
+    C_HIERARCHY_CHART_TYPE_DEFAULT              : str       = "sunburst"
+    C_HIERARCHY_GRAPH_TITLE                     : str       = "TopDown Hierarchy (% of max IPC)"
+    C_HIERARCHY_PART_NAME_SEPARATOR             : str       = "."
+    C_HIERARCHY_ID_SEPARATOR                    : str       = "/"
+    C_HIERARCHY_HOVER_TEMPLATE                  : str       = "%{label}<br>%{customdata:.3f}%<extra></extra>"
+    # kernels out of the biggest ones (by % of cycles elapsed) are grouped in one node
+    C_HIERARCHY_MAX_KERNELS_DEFAULT             : int       = 0
+    C_HIERARCHY_OTHER_KERNELS_LABEL             : str       = "other kernels (%d)"
+    C_HIERARCHY_UNKNOWN_KERNEL_NAME             : str       = "unknown"
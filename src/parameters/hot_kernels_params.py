@@ -0,0 +1,28 @@
+"""
+Class with all params of HotKernels class
+and their subclasses
+
+@date:      Jul 2021
+@version:   1.0
+"""
+
+class HotKernelsParameters:
+
+    # percentage of the cycles of the execution covered by the hot kernels
+    C_SHARE_DEFAULT                             : float     = 95.0
+
+    # NSIGHT: kernels are filtered by their demangled name (as they are shown in results), and the
+    # scan tool stops measuring after the launches of the hot kernels of the cheap pass
+    C_KERNEL_NAME_BASE_OPTION_NSIGHT            : str       = "--kernel-name-base"
+    C_KERNEL_NAME_BASE_NSIGHT                   : str       = "demangled"
+    C_KERNEL_NAME_OPTION_NSIGHT                 : str       = "--kernel-name"
+    C_KERNEL_NAME_REGEX_FORMAT_NSIGHT           : str       = "regex:^(?:%s)$"
+    C_LAUNCH_COUNT_OPTION_NSIGHT                : str       = "--launch-count"
+
+    # NVPROF: scope of the measures ('<context>:<stream>:<kernel>:<invocation>') set before them. Kernels
+    # are filtered by their name without parameters, and ':' can't be used in the regex
+    C_KERNELS_OPTION_NVPROF                     : str       = "--kernels"
+    C_KERNELS_PATH_FORMAT_NVPROF                : str       = "::^(?:%s):"
+    C_KERNEL_PARAMETERS_SEPARATOR_NVPROF        : str       = "("
+    C_KERNEL_PATH_SEPARATOR_NVPROF              : str       = ":"
+    C_KERNEL_PATH_SEPARATOR_REGEX_NVPROF        : str       = "."
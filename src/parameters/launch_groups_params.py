@@ -0,0 +1,20 @@
+"""
+Class with all params of LaunchGroups class
+
+@date:      Jul 2021
+@version:   1.0
+"""
+
+class LaunchGroupsParameters:
+
+    # name of the group of launches without tag
+    C_UNTAGGED_GROUP_NAME                       : str       = "(untagged)"
+
+    # table of results per group
+    C_GROUP_COLUMN_TITLE                        : str       = "Group"
+    C_LAUNCHES_COLUMN_TITLE                     : str       = "Launches"
+    C_CYCLES_COLUMN_TITLE                       : str       = "% Cycles"
+    C_BOTTLENECK_COLUMN_TITLE                   : str       = "Bottleneck"
+    C_GROUP_NAME_MAX_LENGTH                     : int       = 40
+    C_VALUE_COLUMN_MIN_LENGTH                   : int       = 11
+    C_NOT_AVAILABLE_VALUE                       : str       = "-"
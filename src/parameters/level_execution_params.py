@@ -21,15 +21,76 @@ class LevelExecutionParameters:
     C_CYCLES_ELAPSED_EVENT_NAME_NVPROF                  : str       = "elapsed_cycles_sm"
     C_CYCLES_ELAPSED_METRIC_NAME_NSIGHT                 : str       = "sm__cycles_elapsed.sum"
 
+    # kernel (launch) line in results of NVIDIA scan tool
+    C_KERNEL_LINE_REGEX_NSIGHT                          : str       = (r"^\s*(?P<kernel>\S.*?)(?: \(\d+, \d+, \d+\)x\(\d+, \d+, \d+\))?" +
+                                                                    r"(?:, \d{4}-\w{3}-\d{1,2} \d{2}:\d{2}:\d{2})?, Context \d+, Stream \d+")
+    C_KERNEL_LINE_WORD_NVPROF                           : str       = "Kernel:"
+
+    # results of NSIGHT in CSV format ('--csv'): one row per metric of each launch, below a header
+    # with the name of the columns. They are converted to the text layout before parsing them
+    C_CSV_HEADER_PREFIX_NSIGHT                          : str       = '"ID",'
+    C_CSV_ID_COLUMN_NSIGHT                              : str       = "ID"
+    C_CSV_PID_COLUMN_NSIGHT                             : str       = "Process ID"
+    C_CSV_PROCESS_COLUMN_NSIGHT                         : str       = "Process Name"
+    C_CSV_HOST_COLUMN_NSIGHT                            : str       = "Host Name"
+    C_CSV_KERNEL_COLUMN_NSIGHT                          : str       = "Kernel Name"
+    C_CSV_CONTEXT_COLUMN_NSIGHT                         : str       = "Context"
+    C_CSV_STREAM_COLUMN_NSIGHT                          : str       = "Stream"
+    C_CSV_DEVICE_COLUMN_NSIGHT                          : str       = "Device"
+    C_CSV_METRIC_NAME_COLUMN_NSIGHT                     : str       = "Metric Name"
+    C_CSV_METRIC_UNIT_COLUMN_NSIGHT                     : str       = "Metric Unit"
+    C_CSV_METRIC_VALUE_COLUMN_NSIGHT                    : str       = "Metric Value"
+
+    # value of utilization metrics of NVPROF ('Low (2)'): level from 0 to 10, read as percentage
+    C_UTILIZATION_LEVEL_REGEX_NVPROF                    : str       = r"^\((?P<level>\d+)\)$"
+    C_UTILIZATION_LEVEL_PERCENTAGE_NVPROF               : float     = 10.0
+
+    # NVTX context of each launch in results of NSIGHT ('--nvtx'): header of the block, and domain and
+    # ranges (one per line, '<name>' or '<id,name>'). Launches are tagged with 'domain@range/subrange'
+    C_NVTX_TAG                                          : str       = "nvtx"
+    C_NVTX_BLOCK_REGEX_NSIGHT                           : str       = r"^\s*NVTX (?:Push/Pop Stack|Start/End Ranges)"
+    C_NVTX_NAME_REGEX_NSIGHT                            : str       = r"^\s*<(?:\d+,)?(?P<name>[^<>]*)>\s*$"
+    C_NVTX_SECTION_WORD_NSIGHT                          : str       = "Section:"
+    C_NVTX_DEFAULT_DOMAIN_NSIGHT                        : str       = "default domain"
+    C_NVTX_DOMAIN_SEPARATOR                             : str       = "@"
+    C_NVTX_RANGE_SEPARATOR                              : str       = "/"
+
+    # process and device of each launch. NSIGHT ('--target-processes all') writes the results of each process
+    # below '[pid] program@host' and the device in the kernel line (', Device 0'); NVPROF writes the process in
+    # '==pid== Profiling application: program' and the device of the kernels below 'Device "name (0)"'
+    C_PROCESS_TAG                                       : str       = "process"
+    C_PROCESS_TAG_FORMAT                                : str       = "[%s] %s"
+    C_DEVICE_TAG                                        : str       = "device"
+    C_DEVICE_TAG_FORMAT_NSIGHT                          : str       = "device %s"
+    C_PROCESS_LINE_REGEX_NSIGHT                         : str       = r"^\[(?P<pid>\d+)\] (?P<program>.*)@[^@]*$"
+    C_DEVICE_REGEX_NSIGHT                               : str       = r", Device (?P<device>\d+)"
+    C_PROCESS_LINE_REGEX_NVPROF                         : str       = r"^==(?P<pid>\d+)== Profiling application: (?P<program>.*)$"
+    C_DEVICE_LINE_REGEX_NVPROF                          : str       = r'^Device "(?P<device>.*)"$'
+    C_RESULT_LINE_REGEX_NVPROF                          : str       = r"^==\d+== (?:Event|Metric) result:"
+
+    # list of measures of an option of the command of NVIDIA scan tool ('--metrics a,b,c'), with the option
+    C_MEASURES_OPTION_REGEX_FORMAT                      : str       = r"(?<!\S)(%s\s+)(\S+)"
+
+    # profiled region (cudaProfilerStart/Stop) of each launch
+    C_REGION_TAG                                        : str       = "region"
+    C_REGION_TAG_FORMAT                                 : str       = "region %d"
+
+    # values of optional parts (Roofline...) of NSIGHT are printed in base units (byte, nsecond...),
+    # so they don't change between launches
+    C_BASE_UNITS_PROFILER_OPTIONS_NSIGHT                : list      = ["--print-units", "base"]
+    C_UNIT_MULTIPLIERS_NSIGHT                           : dict      = {"byte" : 1.0, "Kbyte" : 1e3, "Mbyte" : 1e6, "Gbyte" : 1e9, 
+                                                                    "Tbyte" : 1e12, "nsecond" : 1e-9, "usecond" : 1e-6, "msecond" : 1e-3, 
+                                                                    "second" : 1.0}
+
     C_MAX_NUM_RESULTS_DECIMALS                          : int       = 3 # recommended be same with same value definided in TopDownParameters
 
+    # locales used to read values of NSIGHT (first one installed). "" is the locale of the environment
+    C_NSIGHT_LOCALES                                    : list      = ["es_ES.utf8", "es_ES.UTF-8", ""]
+
     C_INFO_MESSAGE_EXECUTION                            : str       = "Making analysis... Wait to results."
 
-    # add here the events and metrics 
-    # that will be computed by adding in 
-    # each kernel, and not as a function 
-    # of the time executed
-    C_METRICS_AND_EVENTS_NOT_AVERAGE_COMPUTED           : str       = "inst_issued"
+    # strategies to combine the events and metrics of each kernel
+    # are declared in AggregationsParameters
     
     # level_one.py graph's description
     C_LEVEL_ONE_GRAPHS_TITLES                           : list      = ["IPC Degradation", "STALLS on TOTAL"]                   
@@ -0,0 +1,21 @@
+"""
+Class with all params of BackEnd.MemoryBound.L1Bound.Dram class
+and their subclasses
+
+@date:      Jul 2021
+@version:   1.0
+"""
+
+class MemoryDramParameters:
+
+    C_MEMORY_DRAM_NAME                        : str        = "BACK-END.MEMORY-BOUND.L1-BOUND.DRAM"
+    C_MEMORY_DRAM_DESCRIPTION                 : str        = ("Performance losses of BACK-END.MEMORY-BOUND.L1-BOUND due to the requests " +
+                                                            "which miss in L1 and L2 and are served by the device memory, with the bandwidth " +
+                                                            "utilization and the L2-to-DRAM traffic.")
+
+    # NSIGHT metrics
+    C_DRAM_THROUGHPUT_METRIC_NAME_NSIGHT      : str        = "dram__throughput.avg.pct_of_peak_sustained_elapsed"
+    C_DRAM_BYTES_READ_METRIC_NAME_NSIGHT      : str        = "dram__bytes_read.sum"
+    C_DRAM_BYTES_WRITE_METRIC_NAME_NSIGHT     : str        = "dram__bytes_write.sum"
+    C_MEMORY_DRAM_NSIGHT_METRICS              : str        = (C_DRAM_THROUGHPUT_METRIC_NAME_NSIGHT + "," + C_DRAM_BYTES_READ_METRIC_NAME_NSIGHT + 
+                                                            "," + C_DRAM_BYTES_WRITE_METRIC_NAME_NSIGHT)
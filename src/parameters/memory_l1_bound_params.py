@@ -11,6 +11,12 @@ class MemoryL1BoundParameters:
     C_MEMORY_L1_BOUND_NAME                    : str        = "BACK-END.MEMORY-BOUND.L1-BOUND"
     C_MEMORY_L1_BOUND_DESCRIPTION             : str        = ("Collect performance losses caused by some aspects of the L1 cache.")
     
+    # NVPROF metrics/arguments (stalls of the part, and hit rate of global accesses in the unified L1/texture cache)
+    C_MEMORY_L1_BOUND_NVPROF_STALL_METRICS    : str        = ("stall_memory_dependency")
+    C_GLOBAL_HIT_RATE_METRIC_NAME_NVPROF      : str        = "global_hit_rate"
+    C_MEMORY_L1_BOUND_NVPROF_METRICS          : str        = (C_MEMORY_L1_BOUND_NVPROF_STALL_METRICS + "," + C_GLOBAL_HIT_RATE_METRIC_NAME_NVPROF)
+    C_MEMORY_L1_BOUND_NVPROF_EVENTS           : str        = ("")
+
     # NSIGHT metrics
     C_MEMORY_L1_BOUND_NSIGHT_METRICS          : str        = ("smsp__warp_issue_stalled_long_scoreboard_per_warp_active.pct," +
                                                                 "smsp__warp_issue_stalled_lg_throttle_per_warp_active.pct," +
@@ -0,0 +1,18 @@
+"""
+Class with all params of BackEnd.MemoryBound.L1Bound.L1Cache class
+and their subclasses
+
+@date:      Jul 2021
+@version:   1.0
+"""
+
+class MemoryL1CacheParameters:
+
+    C_MEMORY_L1_CACHE_NAME                    : str        = "BACK-END.MEMORY-BOUND.L1-BOUND.L1-CACHE"
+    C_MEMORY_L1_CACHE_DESCRIPTION             : str        = ("Performance losses of BACK-END.MEMORY-BOUND.L1-BOUND due to the requests " +
+                                                            "served by the L1 cache (hits), with its hit rate and throughput.")
+
+    # NSIGHT metrics
+    C_L1_HIT_RATE_METRIC_NAME_NSIGHT          : str        = "l1tex__t_sector_hit_rate.pct"
+    C_L1_THROUGHPUT_METRIC_NAME_NSIGHT        : str        = "l1tex__throughput.avg.pct_of_peak_sustained_active"
+    C_MEMORY_L1_CACHE_NSIGHT_METRICS          : str        = (C_L1_HIT_RATE_METRIC_NAME_NSIGHT + "," + C_L1_THROUGHPUT_METRIC_NAME_NSIGHT)
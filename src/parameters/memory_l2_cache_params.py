@@ -0,0 +1,22 @@
+"""
+Class with all params of BackEnd.MemoryBound.L1Bound.L2Cache class
+and their subclasses
+
+@date:      Jul 2021
+@version:   1.0
+"""
+
+class MemoryL2CacheParameters:
+
+    C_MEMORY_L2_CACHE_NAME                    : str        = "BACK-END.MEMORY-BOUND.L1-BOUND.L2-CACHE"
+    C_MEMORY_L2_CACHE_DESCRIPTION             : str        = ("Performance losses of BACK-END.MEMORY-BOUND.L1-BOUND due to the requests " +
+                                                            "which miss in L1 and are served by the L2 cache, with its hit rate, throughput and " +
+                                                            "imbalance between partitions (sectors of the busiest partition on the mean, 1 is balanced).")
+
+    # NSIGHT metrics
+    C_L2_HIT_RATE_METRIC_NAME_NSIGHT          : str        = "lts__t_sector_hit_rate.pct"
+    C_L2_THROUGHPUT_METRIC_NAME_NSIGHT        : str        = "lts__throughput.avg.pct_of_peak_sustained_elapsed"
+    C_L2_SECTORS_MAX_METRIC_NAME_NSIGHT       : str        = "lts__t_sectors.max"
+    C_L2_SECTORS_AVG_METRIC_NAME_NSIGHT       : str        = "lts__t_sectors.avg"
+    C_MEMORY_L2_CACHE_NSIGHT_METRICS          : str        = (C_L2_HIT_RATE_METRIC_NAME_NSIGHT + "," + C_L2_THROUGHPUT_METRIC_NAME_NSIGHT + 
+                                                            "," + C_L2_SECTORS_MAX_METRIC_NAME_NSIGHT + "," + C_L2_SECTORS_AVG_METRIC_NAME_NSIGHT)
@@ -11,5 +11,14 @@ class MemoryMioThrottleParameters:
     C_MEMORY_MIO_THROTTLE_NAME                    : str        = "BACK-END.MEMORY-BOUND.MIO-THROTTLE"
     C_MEMORY_MIO_THROTTLE_DESCRIPTION             : str        = ("Collects performance losses caused by MIO (Memory Input/Output) memory system.")
     
+    # NVPROF metrics/arguments (stalls of the part, and transactions of shared memory per request: 1 without bank conflicts)
+    C_MEMORY_MIO_THROTTLE_NVPROF_STALL_METRICS    : str        = ("stall_memory_throttle")
+    C_SHARED_LOAD_TRANSACTIONS_PER_REQUEST_METRIC_NAME_NVPROF   : str   = "shared_load_transactions_per_request"
+    C_SHARED_STORE_TRANSACTIONS_PER_REQUEST_METRIC_NAME_NVPROF  : str   = "shared_store_transactions_per_request"
+    C_MEMORY_MIO_THROTTLE_NVPROF_METRICS          : str        = (C_MEMORY_MIO_THROTTLE_NVPROF_STALL_METRICS + "," + 
+                                                                C_SHARED_LOAD_TRANSACTIONS_PER_REQUEST_METRIC_NAME_NVPROF + "," +
+                                                                C_SHARED_STORE_TRANSACTIONS_PER_REQUEST_METRIC_NAME_NVPROF)
+    C_MEMORY_MIO_THROTTLE_NVPROF_EVENTS           : str        = ("")
+
     # NSIGHT metrics
     C_MEMORY_MIO_THROTTLE_NSIGHT_METRICS          : str        = ("smsp__warp_issue_stalled_mio_throttle_per_warp_active.pct")
@@ -0,0 +1,20 @@
+"""
+Class with all params of BackEnd.MemoryBound.MioThrottle.SharedBankConflicts class
+and their subclasses
+
+@date:      Jul 2021
+@version:   1.0
+"""
+
+class MemorySharedBankConflictsParameters:
+
+    C_MEMORY_SHARED_BANK_CONFLICTS_NAME           : str        = "BACK-END.MEMORY-BOUND.MIO-THROTTLE.SHARED-BANK-CONFLICTS"
+    C_MEMORY_SHARED_BANK_CONFLICTS_DESCRIPTION    : str        = ("Performance losses of BACK-END.MEMORY-BOUND.MIO-THROTTLE due to the bank " +
+                                                                "conflicts of shared memory: extra wavefronts (serialized accesses) on the total " +
+                                                                "wavefronts of shared memory.")
+
+    # NSIGHT metrics
+    C_SHARED_BANK_CONFLICTS_METRIC_NAME_NSIGHT    : str        = "l1tex__data_bank_conflicts_pipe_lsu_mem_shared.sum"
+    C_SHARED_WAVEFRONTS_METRIC_NAME_NSIGHT        : str        = "l1tex__data_pipe_lsu_wavefronts_mem_shared.sum"
+    C_MEMORY_SHARED_BANK_CONFLICTS_NSIGHT_METRICS : str        = (C_SHARED_BANK_CONFLICTS_METRIC_NAME_NSIGHT + "," + 
+                                                                C_SHARED_WAVEFRONTS_METRIC_NAME_NSIGHT)
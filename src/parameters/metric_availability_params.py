@@ -0,0 +1,45 @@
+"""
+Class with all params of MetricAvailability class
+and their subclasses
+
+@date:      Jul 2021
+@version:   1.0
+"""
+
+class MetricAvailabilityParameters:
+
+    # what is done with the measures not supported by the device before launching the scan tool
+    C_CHECK_MODE_REJECT                         : str       = "reject"
+    C_CHECK_MODE_PRUNE                          : str       = "prune"
+    C_CHECK_MODE_OFF                            : str       = "off"
+    C_CHECK_MODES                               : list      = ["reject", "prune", "off"]
+    C_CHECK_MODE_DEFAULT                        : str       = "reject"
+
+    # scan tools (name of cache files)
+    C_TOOL_NAME_NSIGHT                          : str       = "ncu"
+    C_TOOL_NAME_NVPROF                          : str       = "nvprof"
+
+    # options of the command of the scan tool with the measures (comma-separated)
+    C_METRICS_OPTION                            : str       = "--metrics"
+    C_EVENTS_OPTION                             : str       = "--events"
+
+    # NSIGHT: '--query-metrics' lists base names (without '.sum', '.avg.pct_of_peak_sustained_active'...),
+    # one per line followed by its description. Metrics of the launch/device are not listed
+    C_QUERY_METRICS_COMMAND_NSIGHT              : str       = "ncu --query-metrics"
+    C_QUERY_NAME_REGEX_NSIGHT                   : str       = r"^\s*(?P<name>[a-z0-9]+__\w+)(?:\s|$)"
+    C_METRIC_NAME_SEPARATOR_NSIGHT              : str       = "."
+    C_NOT_LISTED_METRIC_PREFIXES_NSIGHT         : list      = ["launch__", "device__", "profiler__"]
+
+    # NVPROF: '--query-metrics'/'--query-events' list '<name>: <description>', one per line
+    C_QUERY_METRICS_COMMAND_NVPROF              : str       = "nvprof --query-metrics"
+    C_QUERY_EVENTS_COMMAND_NVPROF               : str       = "nvprof --query-events"
+    C_QUERY_NAME_REGEX_NVPROF                   : str       = r"^\s*(?P<name>\w+):(?:\s|$)"
+
+    # cache on disk ('$XDG_CACHE_HOME/topdown' or '~/.cache/topdown'), one file per tool, compute capability and device
+    C_CACHE_DIRECTORY_ENVIRONMENT_VARIABLE      : str       = "XDG_CACHE_HOME"
+    C_CACHE_DEFAULT_DIRECTORY                   : str       = ".cache"
+    C_CACHE_DIRECTORY_NAME                      : str       = "topdown"
+    C_CACHE_FILE_FORMAT                         : str       = "measures_%s_%s_%s.json"
+    C_CACHE_FILE_INVALID_CHARS_REGEX            : str       = r"[^\w.-]+"
+
+    C_PRUNE_MESSAGE                             : str       = "Measures not supported by the device are not collected: "
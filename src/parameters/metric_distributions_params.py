@@ -0,0 +1,31 @@
+"""
+Class with all params of MetricDistributions class
+and their subclasses
+
+@date:      Jul 2021
+@version:   1.0
+"""
+
+class MetricDistributionsParameters:
+
+    # percentiles of each measure, weighted by the cycles of the launches
+    C_PERCENTILES                               : list      = [10, 50, 90]
+
+    # histogram of each measure: number of launches in each bin (between min and max), drawn with one
+    # character per bin (height proportional to the bin with most launches)
+    C_HISTOGRAM_BINS                            : int       = 10
+    C_HISTOGRAM_CHARACTERS                      : str       = " ▁▂▃▄▅▆▇█"
+
+    # kinds of measures
+    C_METRIC_KIND                               : str       = "metric"
+    C_EVENT_KIND                                : str       = "event"
+
+    # table of distributions
+    C_MEASURE_COLUMN_TITLE                      : str       = "Measure"
+    C_LAUNCHES_COLUMN_TITLE                     : str       = "Launches"
+    C_MIN_COLUMN_TITLE                          : str       = "Min"
+    C_PERCENTILE_COLUMN_TITLE_FORMAT            : str       = "P%d"
+    C_MAX_COLUMN_TITLE                          : str       = "Max"
+    C_HISTOGRAM_COLUMN_TITLE                    : str       = "Histogram"
+    C_VALUE_COLUMN_MIN_LENGTH                   : int       = 11
+    C_NOT_AVAILABLE_VALUE                       : str       = "-"
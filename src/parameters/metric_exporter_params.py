@@ -0,0 +1,39 @@
+"""
+Class with all params of MetricExporter class
+
+@date:      Jul 2021
+@version:   1.0
+"""
+
+class MetricExporterParameters:
+
+    # extensions of the supported formats
+    C_PARQUET_FILE_EXTENSIONS                   : list      = [".parquet", ".pq"]
+    C_ARROW_IPC_FILE_EXTENSIONS                 : list      = [".arrow", ".feather", ".ipc"]
+
+    C_PARQUET_COMPRESSION                       : str       = "zstd"
+
+    # launches written in each row group (Parquet) or record batch (Arrow IPC)
+    C_NUM_LAUNCHES_PER_CHUNK                    : int       = 65536
+
+    # columns
+    C_KERNEL_COLUMN_NAME                        : str       = "kernel"
+    C_LAUNCH_COLUMN_NAME                        : str       = "launch"
+    C_TOPDOWN_COLUMN_PREFIX                     : str       = "topdown."
+    C_TAG_COLUMN_PREFIX                         : str       = "tag."
+    # min and max of a metric in the invocations of each launch (NVPROF), with distributions
+    C_MIN_COLUMN_SUFFIX                         : str       = ".min"
+    C_MAX_COLUMN_SUFFIX                         : str       = ".max"
+
+    # metadata of columns and file
+    C_PART_METADATA_KEY                         : str       = "part"
+    C_KIND_METADATA_KEY                         : str       = "kind"
+    C_DESCRIPTION_METADATA_KEY                  : str       = "description"
+    C_METRIC_KIND                               : str       = "metric"
+    C_EVENT_KIND                                : str       = "event"
+    C_TOPDOWN_KIND                              : str       = "topdown"
+    C_LEVEL_METADATA_KEY                        : str       = "topdown.level"
+    C_PROGRAM_METADATA_KEY                      : str       = "topdown.program"
+    C_COMPUTE_CAPABILITY_METADATA_KEY           : str       = "topdown.compute_capability"
+    C_RESULTS_METADATA_KEY                      : str       = "topdown.results"
+    C_DISTRIBUTIONS_METADATA_KEY                : str       = "topdown.distributions"
@@ -0,0 +1,27 @@
+"""
+Class with all params of MpiRanks class
+and their subclasses
+
+@date:      Jul 2021
+@version:   1.0
+"""
+
+class MpiRanksParameters:
+
+    # environment variable with the rank of each process, set by the MPI launcher (Open MPI by default;
+    # 'PMI_RANK' with MPICH/Intel MPI, 'SLURM_PROCID' with srun)
+    C_RANK_VARIABLE_DEFAULT                     : str       = "OMPI_COMM_WORLD_RANK"
+    C_DIRECTORY_DEFAULT                         : str       = "topdown_mpi"
+
+    # each rank writes the results of the scan tool in its own file. '%q{VARIABLE}' is replaced by the
+    # scan tool (ncu and nvprof) with the value of the environment variable
+    C_LOG_FILE_OPTION                           : str       = "--log-file"
+    C_RANK_FILE_FORMAT                          : str       = "rank_%%q{%s}.txt"
+    C_RANK_FILE_REGEX                           : str       = r"^rank_(?P<rank>\d+)\.txt$"
+
+    # launches of each rank are tagged with 'rank N'
+    C_RANK_TAG                                  : str       = "rank"
+    C_RANK_TAG_FORMAT                           : str       = "rank %d"
+
+    # max number of processes which parse the results of the ranks ('None' to use all CPUs)
+    C_MAX_PARSE_WORKERS                         : int       = None
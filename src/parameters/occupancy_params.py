@@ -0,0 +1,65 @@
+"""
+Class with all params of Occupancy class
+and their subclasses
+
+@date:      Jul 2021
+@version:   1.0
+"""
+
+class OccupancyParameters:
+
+    C_OCCUPANCY_NAME                        : str       = "OCCUPANCY"
+    C_OCCUPANCY_DESCRIPTION                 : str       = ("Launch configuration (block and grid size, registers per thread and shared memory per " +
+                                                            "block) and occupancy (warps active on the max warps of the SM) of each kernel. It's not " +
+                                                            "part of the TopDown hierarchy: it shows if there are too few warps to hide the latency " +
+                                                            "of the stalls.")
+
+    # NVPROF metrics/arguments. NVPROF only gives the achieved occupancy (from 0 to 1) as metric
+    C_ACHIEVED_OCCUPANCY_METRIC_NAME_NVPROF : str       = "achieved_occupancy"
+    C_ACHIEVED_OCCUPANCY_MULTIPLIER_NVPROF  : float     = 100.0
+
+    C_OCCUPANCY_NVPROF_METRICS              : str       = (C_ACHIEVED_OCCUPANCY_METRIC_NAME_NVPROF)
+    C_OCCUPANCY_NVPROF_EVENTS               : str       = ("")
+
+    # NSIGHT metrics
+    C_BLOCK_SIZE_METRIC_NAME_NSIGHT         : str       = "launch__block_size"
+    C_GRID_SIZE_METRIC_NAME_NSIGHT          : str       = "launch__grid_size"
+    C_REGISTERS_METRIC_NAME_NSIGHT          : str       = "launch__registers_per_thread"
+    C_STATIC_SHARED_MEMORY_METRIC_NAME_NSIGHT   : str   = "launch__shared_mem_per_block_static"
+    C_DYNAMIC_SHARED_MEMORY_METRIC_NAME_NSIGHT  : str   = "launch__shared_mem_per_block_dynamic"
+    C_THEORETICAL_OCCUPANCY_METRIC_NAME_NSIGHT  : str   = "sm__maximum_warps_per_active_cycle_pct"
+    C_ACHIEVED_OCCUPANCY_METRIC_NAME_NSIGHT : str       = "sm__warps_active.avg.pct_of_peak_sustained_active"
+    # max blocks per SM allowed by each resource: the lowest one limits the theoretical occupancy
+    C_LIMIT_METRIC_NAMES_NSIGHT             : dict      = {"registers" : "launch__occupancy_limit_registers", 
+                                                            "shared memory" : "launch__occupancy_limit_shared_mem",
+                                                            "warps" : "launch__occupancy_limit_warps",
+                                                            "blocks" : "launch__occupancy_limit_blocks"}
+
+    C_OCCUPANCY_NSIGHT_METRICS              : str       = (C_BLOCK_SIZE_METRIC_NAME_NSIGHT + "," + C_GRID_SIZE_METRIC_NAME_NSIGHT + "," +
+                                                            C_REGISTERS_METRIC_NAME_NSIGHT + "," + C_STATIC_SHARED_MEMORY_METRIC_NAME_NSIGHT + "," +
+                                                            C_DYNAMIC_SHARED_MEMORY_METRIC_NAME_NSIGHT + "," + 
+                                                            C_THEORETICAL_OCCUPANCY_METRIC_NAME_NSIGHT + "," + C_ACHIEVED_OCCUPANCY_METRIC_NAME_NSIGHT + "," +
+                                                            ",".join(C_LIMIT_METRIC_NAMES_NSIGHT.values()))
+
+    # diagnosis of kernels whose stalls are explained by low occupancy (only when BackEnd is their bottleneck)
+    C_LOW_OCCUPANCY_THRESHOLD               : float     = 50.0 # % of achieved occupancy below which warps can't hide latency
+    C_ACHIEVED_THEORETICAL_RATIO_THRESHOLD  : float     = 0.8 # achieved/theoretical below which warps are lost (imbalance, tail...)
+    C_LOW_THEORETICAL_DIAGNOSIS             : str       = "low occupancy, limited by %s"
+    C_LOW_ACHIEVED_DIAGNOSIS                : str       = "low occupancy, achieved far from theoretical"
+    C_LOW_OCCUPANCY_DIAGNOSIS               : str       = "low occupancy"
+
+    # report
+    C_KERNEL_COLUMN_TITLE                   : str       = "Kernel"
+    C_LAUNCHES_COLUMN_TITLE                 : str       = "Launches"
+    C_CYCLES_COLUMN_TITLE                   : str       = "Cycles (%)"
+    C_BLOCK_SIZE_COLUMN_TITLE               : str       = "Block"
+    C_GRID_SIZE_COLUMN_TITLE                : str       = "Grid"
+    C_REGISTERS_COLUMN_TITLE                : str       = "Regs/Thread"
+    C_SHARED_MEMORY_COLUMN_TITLE            : str       = "Shared/Block (B)"
+    C_THEORETICAL_COLUMN_TITLE              : str       = "Theoretical (%)"
+    C_ACHIEVED_COLUMN_TITLE                 : str       = "Achieved (%)"
+    C_BOTTLENECK_COLUMN_TITLE               : str       = "Bottleneck"
+    C_DIAGNOSIS_COLUMN_TITLE                : str       = "Diagnosis"
+    C_KERNEL_NAME_MAX_LENGTH                : int       = 40
+    C_VALUE_COLUMN_MIN_LENGTH               : int       = 8
+    C_NOT_AVAILABLE_VALUE                   : str       = "-"
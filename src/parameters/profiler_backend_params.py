@@ -0,0 +1,19 @@
+"""
+Class with all params of ProfilerBackend classes
+
+@date:      Jul 2021
+@version:   1.0
+"""
+
+class ProfilerBackendParameters:
+
+    # shell (NVIDIA tools)
+    C_COMPUTE_CAPABILITY_COMMAND                : str       = "nvcc $DIR_UNTIL_TOPDOWN/TopDownNvidia/src/measure_parts/compute_capability.cu --run"
+    C_COMPUTE_CAPABILITY_CLEAN_COMMAND          : str       = "rm -f $DIR_UNTIL_TOPDOWN/TopDownNvidia/src/measure_parts/a.out"
+    C_DEVICE_ID_COMMAND                         : str       = "nvidia-smi --query-gpu=name,driver_version --format=csv,noheader"
+
+    # replay (stand-in of NVIDIA tools, without GPU)
+    C_REPLAY_COMPUTE_CAPABILITY                 : float     = 8.0
+    C_REPLAY_NUM_KERNELS                        : int       = 100
+    C_REPLAY_NUM_KERNEL_NAMES                   : int       = 10
+    C_REPLAY_LATENCY_SECONDS                    : float     = 0.0
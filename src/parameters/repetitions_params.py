@@ -0,0 +1,33 @@
+"""
+Class with all params of Repetitions class
+and their subclasses
+
+@date:      Jul 2021
+@version:   1.0
+"""
+
+class RepetitionsParameters:
+
+    # runs are stopped when the confidence interval of every value is narrower than the tolerance
+    # (percentage points), after a min number of runs
+    C_MIN_RUNS                                  : int       = 3
+    C_TOLERANCE_DEFAULT                         : float     = 1.0
+
+    # two-sided 95% quantiles of Student's t distribution by degrees of freedom (normal one above them)
+    C_CONFIDENCE_LEVEL                          : float     = 95.0
+    C_T_QUANTILES                               : list      = [12.706, 4.303, 3.182, 2.776, 2.571, 2.447, 2.365, 2.306, 2.262, 2.228,
+                                                                2.201, 2.179, 2.160, 2.145, 2.131, 2.120, 2.110, 2.101, 2.093, 2.086,
+                                                                2.080, 2.074, 2.069, 2.064, 2.060, 2.056, 2.052, 2.048, 2.045, 2.042]
+    C_NORMAL_QUANTILE                           : float     = 1.960
+
+    # each parallel run only sees its device
+    C_DEVICES_ENVIRONMENT_VARIABLE              : str       = "CUDA_VISIBLE_DEVICES"
+
+    # table of results of the runs
+    C_PART_COLUMN_TITLE                         : str       = "Part"
+    C_MEAN_COLUMN_TITLE                         : str       = "Mean"
+    C_STD_COLUMN_TITLE                          : str       = "Std"
+    C_CONFIDENCE_INTERVAL_COLUMN_TITLE          : str       = "CI 95%"
+    C_CONFIDENCE_INTERVAL_FORMAT                : str       = "[%s, %s]"
+    C_VALUE_COLUMN_MIN_LENGTH                   : int       = 11
+    C_NOT_AVAILABLE_VALUE                       : str       = "-"
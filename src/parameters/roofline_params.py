@@ -0,0 +1,96 @@
+"""
+Class with all params of Roofline class
+and their subclasses
+
+@date:      Jul 2021
+@version:   1.0
+"""
+
+class RooflineParameters:
+
+    C_ROOFLINE_NAME                         : str       = "ROOFLINE"
+    C_ROOFLINE_DESCRIPTION                  : str       = ("Achieved floating point operations (per precision) and memory traffic (DRAM and L2) " +
+                                                            "with respect to the peaks of the device. It's not part of the TopDown hierarchy: it shows " +
+                                                            "if a kernel is near the compute or the bandwidth ceiling, or if it's limited by latency.")
+
+    # NVPROF metrics/arguments
+    C_FLOP_COUNT_SP_METRIC_NAME_NVPROF      : str       = "flop_count_sp"
+    C_FLOP_COUNT_DP_METRIC_NAME_NVPROF      : str       = "flop_count_dp"
+    C_FLOP_COUNT_HP_METRIC_NAME_NVPROF      : str       = "flop_count_hp"
+    C_FLOP_SP_EFFICIENCY_METRIC_NAME_NVPROF : str       = "flop_sp_efficiency"
+    C_FLOP_DP_EFFICIENCY_METRIC_NAME_NVPROF : str       = "flop_dp_efficiency"
+    C_FLOP_HP_EFFICIENCY_METRIC_NAME_NVPROF : str       = "flop_hp_efficiency"
+    C_DRAM_READ_BYTES_METRIC_NAME_NVPROF    : str       = "dram_read_bytes"
+    C_DRAM_WRITE_BYTES_METRIC_NAME_NVPROF   : str       = "dram_write_bytes"
+    C_DRAM_UTILIZATION_METRIC_NAME_NVPROF   : str       = "dram_utilization"
+    C_L2_READ_TRANSACTIONS_METRIC_NAME_NVPROF : str     = "l2_read_transactions"
+    C_L2_WRITE_TRANSACTIONS_METRIC_NAME_NVPROF : str    = "l2_write_transactions"
+    C_L2_TRANSACTION_BYTES_NVPROF           : int       = 32
+
+    C_ROOFLINE_NVPROF_METRICS               : str       = (C_FLOP_COUNT_SP_METRIC_NAME_NVPROF + "," + C_FLOP_COUNT_DP_METRIC_NAME_NVPROF + "," +
+                                                            C_FLOP_COUNT_HP_METRIC_NAME_NVPROF + "," + C_FLOP_SP_EFFICIENCY_METRIC_NAME_NVPROF + "," +
+                                                            C_FLOP_DP_EFFICIENCY_METRIC_NAME_NVPROF + "," + C_FLOP_HP_EFFICIENCY_METRIC_NAME_NVPROF + "," +
+                                                            C_DRAM_READ_BYTES_METRIC_NAME_NVPROF + "," + C_DRAM_WRITE_BYTES_METRIC_NAME_NVPROF + "," +
+                                                            C_DRAM_UTILIZATION_METRIC_NAME_NVPROF + "," + C_L2_READ_TRANSACTIONS_METRIC_NAME_NVPROF + "," +
+                                                            C_L2_WRITE_TRANSACTIONS_METRIC_NAME_NVPROF)
+    C_ROOFLINE_NVPROF_EVENTS                : str       = ("")
+
+    # NSIGHT metrics. Operations of each precision: add, mul and fma (fma is two operations)
+    C_FLOP_SP_METRIC_NAMES_NSIGHT           : list      = ["sm__sass_thread_inst_executed_op_fadd_pred_on.sum",
+                                                            "sm__sass_thread_inst_executed_op_fmul_pred_on.sum",
+                                                            "sm__sass_thread_inst_executed_op_ffma_pred_on.sum"]
+    C_FLOP_DP_METRIC_NAMES_NSIGHT           : list      = ["sm__sass_thread_inst_executed_op_dadd_pred_on.sum",
+                                                            "sm__sass_thread_inst_executed_op_dmul_pred_on.sum",
+                                                            "sm__sass_thread_inst_executed_op_dfma_pred_on.sum"]
+    C_FLOP_HP_METRIC_NAMES_NSIGHT           : list      = ["sm__sass_thread_inst_executed_op_hadd_pred_on.sum",
+                                                            "sm__sass_thread_inst_executed_op_hmul_pred_on.sum",
+                                                            "sm__sass_thread_inst_executed_op_hfma_pred_on.sum"]
+    C_FLOP_SP_PEAK_METRIC_NAME_NSIGHT       : str       = "sm__sass_thread_inst_executed_op_ffma_pred_on.sum.peak_sustained"
+    C_FLOP_DP_PEAK_METRIC_NAME_NSIGHT       : str       = "sm__sass_thread_inst_executed_op_dfma_pred_on.sum.peak_sustained"
+    C_FLOP_HP_PEAK_METRIC_NAME_NSIGHT       : str       = "sm__sass_thread_inst_executed_op_hfma_pred_on.sum.peak_sustained"
+    C_SM_CYCLES_METRIC_NAME_NSIGHT          : str       = "sm__cycles_elapsed.avg"
+    C_DRAM_BYTES_METRIC_NAME_NSIGHT         : str       = "dram__bytes.sum"
+    C_DRAM_BYTES_PEAK_METRIC_NAME_NSIGHT    : str       = "dram__bytes.sum.peak_sustained"
+    C_DRAM_CYCLES_METRIC_NAME_NSIGHT        : str       = "dram__cycles_elapsed.avg"
+    C_L2_BYTES_METRIC_NAME_NSIGHT           : str       = "lts__t_bytes.sum"
+    C_DURATION_METRIC_NAME_NSIGHT           : str       = "gpu__time_duration.sum"
+
+    C_ROOFLINE_NSIGHT_METRICS               : str       = (",".join(C_FLOP_SP_METRIC_NAMES_NSIGHT + C_FLOP_DP_METRIC_NAMES_NSIGHT +
+                                                            C_FLOP_HP_METRIC_NAMES_NSIGHT) + "," + C_FLOP_SP_PEAK_METRIC_NAME_NSIGHT + "," +
+                                                            C_FLOP_DP_PEAK_METRIC_NAME_NSIGHT + "," + C_FLOP_HP_PEAK_METRIC_NAME_NSIGHT + "," +
+                                                            C_SM_CYCLES_METRIC_NAME_NSIGHT + "," + C_DRAM_BYTES_METRIC_NAME_NSIGHT + "," +
+                                                            C_DRAM_BYTES_PEAK_METRIC_NAME_NSIGHT + "," + C_DRAM_CYCLES_METRIC_NAME_NSIGHT + "," +
+                                                            C_L2_BYTES_METRIC_NAME_NSIGHT + "," + C_DURATION_METRIC_NAME_NSIGHT)
+
+    # precisions
+    C_PRECISIONS                            : list      = ["sp", "dp", "hp"]
+    C_PRECISION_TITLES                      : dict      = {"sp" : "FP32", "dp" : "FP64", "hp" : "FP16"}
+
+    # classification
+    C_MEMORY_BOUND_CLASS                    : str       = "memory-bound"
+    C_COMPUTE_BOUND_CLASS                   : str       = "compute-bound"
+    C_LATENCY_BOUND_CLASS                   : str       = "latency-bound"
+    C_LATENCY_BOUND_THRESHOLD               : float     = 60.0 # % of peak below which neither compute nor memory is the limit
+
+    # report
+    C_KERNEL_COLUMN_TITLE                   : str       = "Kernel"
+    C_LAUNCHES_COLUMN_TITLE                 : str       = "Launches"
+    C_CYCLES_COLUMN_TITLE                   : str       = "Cycles (%)"
+    C_GFLOPS_COLUMN_TITLE                   : str       = "%s GFLOP/s"
+    C_AI_DRAM_COLUMN_TITLE                  : str       = "FLOP/B DRAM"
+    C_AI_L2_COLUMN_TITLE                    : str       = "FLOP/B L2"
+    C_COMPUTE_COLUMN_TITLE                  : str       = "Compute (%)"
+    C_MEMORY_COLUMN_TITLE                   : str       = "Memory (%)"
+    C_CLASS_COLUMN_TITLE                    : str       = "Class"
+    C_KERNEL_NAME_MAX_LENGTH                : int       = 40
+    C_VALUE_COLUMN_MIN_LENGTH               : int       = 10
+    C_NOT_AVAILABLE_VALUE                   : str       = "-"
+
+    # graph
+    C_GRAPH_TITLE                           : str       = "Roofline: achieved percentage of the peaks of the device per kernel"
+    C_GRAPH_X_AXIS_TITLE                    : str       = "Memory (% of peak DRAM bandwidth)"
+    C_GRAPH_Y_AXIS_TITLE                    : str       = "Compute (% of peak FLOP/cycle)"
+    C_GRAPH_MIN_MARKER_SIZE                 : float     = 8.0
+    C_GRAPH_MAX_MARKER_SIZE                 : float     = 40.0
+    C_GRAPH_HOVER_TEMPLATE                  : str       = ("%{text}<br>Memory: %{x:.2f}%<br>Compute: %{y:.2f}%<br>" +
+                                                            "Cycles: %{customdata[0]:.2f}%<br>FLOP/B DRAM: %{customdata[1]}<extra></extra>")
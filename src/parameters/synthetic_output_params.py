@@ -0,0 +1,79 @@
+"""
+Class with all params of SyntheticOutput class
+
+@date:      Jul 2021
+@version:   1.0
+"""
+
+import os, sys, inspect
+currentdir = os.path.dirname(os.path.abspath(inspect.getfile(inspect.currentframe())))
+parentdir = os.path.dirname(currentdir)
+sys.path.insert(0, parentdir) 
+from parameters.memory_shared_bank_conflicts_params import MemorySharedBankConflictsParameters
+from parameters.memory_l2_cache_params import MemoryL2CacheParameters
+
+class SyntheticOutputParameters:
+
+    # formats of output generated
+    C_NSIGHT_FORMAT                             : str       = "nsight"
+    C_NSIGHT_CSV_FORMAT                         : str       = "nsight-csv"
+    C_NVPROF_FORMAT                             : str       = "nvprof"
+    C_FORMATS                                   : list      = ["nsight", "nsight-csv", "nvprof"]
+
+    # execution
+    C_PROGRAM                                   : str       = "./synthetic"
+    C_PID                                       : int       = 4242
+    C_HOST                                      : str       = "127.0.0.1"
+    C_DEVICE                                    : str       = "Synthetic GPU (0)"
+    C_KERNEL_NAME_FORMAT                        : str       = "kernel_%d(float const*, float*, int)"
+    C_KERNEL_GRID                               : str       = "(1024, 1, 1)x(256, 1, 1)"
+    C_CONTEXT                                   : int       = 1
+    C_STREAM                                    : int       = 7
+    C_SEED                                      : int       = 2021
+
+    # ranges of values (min, max) depending on the kind of measure
+    C_PERCENTAGE_RANGE                          : tuple     = (0.0, 30.0)
+    C_EFFICIENCY_RANGE                          : tuple     = (60.0, 100.0)
+    C_IPC_RANGE                                 : tuple     = (0.2, 2.0)
+    C_CYCLES_RANGE                              : tuple     = (10000, 5000000)
+    C_COUNT_RANGE                               : tuple     = (1000, 1000000)
+    C_PEAK_PER_CYCLE_RANGE                      : tuple     = (1, 8)
+    C_DURATION_RANGE                            : tuple     = (5000, 3000000) # nanoseconds
+    C_UTILIZATION_LEVEL_RANGE                   : tuple     = (0, 10)
+    C_OCCUPANCY_RANGE                           : tuple     = (10.0, 100.0)
+    C_TRANSACTIONS_PER_REQUEST_RANGE            : tuple     = (1.0, 8.0)
+    # measures bounded by another measure of the same launch: name as key and tuple (name of the bound, 
+    # range of the ratio on the bound) as value
+    C_BOUNDED_MEASURES                          : dict      = {
+        MemorySharedBankConflictsParameters.C_SHARED_BANK_CONFLICTS_METRIC_NAME_NSIGHT : 
+            (MemorySharedBankConflictsParameters.C_SHARED_WAVEFRONTS_METRIC_NAME_NSIGHT, (0.0, 1.0)),
+        MemoryL2CacheParameters.C_L2_SECTORS_MAX_METRIC_NAME_NSIGHT : 
+            (MemoryL2CacheParameters.C_L2_SECTORS_AVG_METRIC_NAME_NSIGHT, (1.0, 2.0))}
+    # launch configuration (NSIGHT): part of the name of the metric as key and tuple (range, unit) as value
+    C_LAUNCH_METRIC_PREFIX                      : str       = "launch__"
+    C_LAUNCH_METRIC_RANGES                      : dict      = {"block_size" : ((32, 1024), ""), "grid_size" : ((1, 65535), ""),
+                                                                "registers_per_thread" : ((16, 255), "register/thread"),
+                                                                "shared_mem_per_block" : ((0, 24576), "byte/block"),
+                                                                "occupancy_limit" : ((1, 32), "block")}
+
+    # Nsight
+    C_NSIGHT_SECTION                            : str       = "Command line profiler metrics"
+    C_NSIGHT_PERCENTAGE_UNIT                    : str       = "%"
+    C_NSIGHT_IPC_UNIT                           : str       = "inst/cycle"
+    C_NSIGHT_CYCLES_UNIT                        : str       = "cycle"
+    C_NSIGHT_BYTES_UNIT                         : str       = "byte"
+    C_NSIGHT_BYTES_PER_CYCLE_UNIT               : str       = "byte/cycle"
+    C_NSIGHT_DURATION_UNIT                      : str       = "nsecond"
+    C_NSIGHT_NAME_WIDTH                         : int       = 70
+    C_NSIGHT_UNIT_WIDTH                         : int       = 15
+    C_NSIGHT_CSV_HEADER                         : list      = ["ID", "Process ID", "Process Name", "Host Name", "Kernel Name", 
+                                                                "Context", "Stream", "Section Name", "Metric Name", "Metric Unit", 
+                                                                "Metric Value"]
+
+    # Nvprof
+    C_NVPROF_INVOCATIONS_WIDTH                  : int       = 11
+    C_NVPROF_NAME_WIDTH                         : int       = 41
+    C_NVPROF_DESCRIPTION_WIDTH                  : int       = 42
+    C_NVPROF_VALUE_WIDTH                        : int       = 12
+    C_NVPROF_UTILIZATION_SUFFIX                 : str       = "_utilization"
+    C_UTILIZATION_LEVEL_NAMES                   : list      = ["Idle", "Low", "Mid", "High", "Max"]
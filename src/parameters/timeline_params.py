@@ -0,0 +1,31 @@
+"""
+Class with all params of Timeline class
+
+@date:      Jul 2021
+@version:   1.0
+"""
+
+class TimelineParameters:
+
+    # sliding windows: number of windows (positions) and width of each one (% of the cycles of the execution)
+    C_NUM_WINDOWS_DEFAULT                       : int       = 20
+    C_WINDOW_WIDTH_PERCENTAGE_DEFAULT           : float     = 10.0
+
+    # formats of the series (obtained from the extension of the file)
+    C_CSV_FILE_EXTENSIONS                       : list      = [".csv"]
+    C_JSON_FILE_EXTENSIONS                      : list      = [".json"]
+
+    # columns of the series
+    C_WINDOW_COLUMN_NAME                        : str       = "window"
+    C_START_COLUMN_NAME                         : str       = "start_cycles_pct"
+    C_END_COLUMN_NAME                           : str       = "end_cycles_pct"
+    C_FIRST_LAUNCH_COLUMN_NAME                  : str       = "first_launch"
+    C_LAST_LAUNCH_COLUMN_NAME                   : str       = "last_launch"
+    C_BOTTLENECK_COLUMN_NAME                    : str       = "bottleneck"
+
+    # stacked-area graph
+    C_GRAPH_TITLE                               : str       = "TopDown Timeline (% of max IPC, in launch order)"
+    C_GRAPH_X_AXIS_TITLE                        : str       = "% of cycles elapsed"
+    C_GRAPH_LEVEL_TITLE                         : str       = "Level %d"
+    C_GRAPH_HOVER_TEMPLATE                      : str       = ("%{fullData.name}: %{y:.3f}%<br>launches %{customdata[0]}-" +
+                                                               "%{customdata[1]}<extra></extra>")
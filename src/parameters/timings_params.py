@@ -0,0 +1,43 @@
+"""
+Class with all params of Timings class
+
+@date:      Jul 2021
+@version:   1.0
+"""
+
+class TimingsParameters:
+
+    # separator of the names of nested spans
+    C_SPAN_PATH_SEPARATOR                       : str       = "/"
+
+    # breakdown of timings
+    C_REPORT_TITLE                              : str       = "Timings of TopDown (self-profiling)"
+    C_REPORT_HEADER_FORMAT                      : str       = "%-*s%12s%12s%10s"
+    C_REPORT_LINE_FORMAT                        : str       = "%-*s%12.4f%12d%9.1f%%"
+    C_REPORT_INDENT                             : str       = "  "
+    C_REPORT_NAME_MIN_LENGTH                    : int       = 40
+
+    # names of the spans
+    C_SPAN_TOPDOWN                              : str       = "topdown"
+    C_SPAN_DEVICE_PROBE                         : str       = "device_probe"
+    C_SPAN_METRICS_CHECK                        : str       = "metrics_check"
+    C_SPAN_HOT_KERNELS_PASS                     : str       = "hot_kernels.pass"
+    C_SPAN_ADAPTIVE_LEVEL_ONE                   : str       = "adaptive.level_one"
+    C_SPAN_PROFILER                             : str       = "profiler"
+    C_SPAN_READ_INPUT                           : str       = "read_input"
+    C_SPAN_PARSE_LEVEL_ONE                      : str       = "parse.level_one"
+    C_SPAN_PARSE_LEVEL_TWO                      : str       = "parse.level_two"
+    C_SPAN_PARSE_LEVEL_THREE                    : str       = "parse.level_three"
+    C_SPAN_PARSE_LEVEL_FOUR                     : str       = "parse.level_four"
+    C_SPAN_PARSE_MPI_RANKS                      : str       = "parse.mpi_ranks"
+    C_SPAN_MEASURES_TABLE                       : str       = "measures_table"
+    C_SPAN_REPETITIONS                          : str       = "repetitions"
+    C_SPAN_RESULTS                              : str       = "results"
+    C_SPAN_EXPORT                               : str       = "export"
+    C_SPAN_GRAPH_SHOW                           : str       = "graph.show"
+    C_SPAN_GRAPH_SAVE                           : str       = "graph.save"
+    C_SPAN_GRAPH_KERNELS                        : str       = "graph.kernels"
+    C_SPAN_GRAPH_HIERARCHY                      : str       = "graph.hierarchy"
+    C_SPAN_GRAPH_ROOFLINE                       : str       = "graph.roofline"
+    C_SPAN_TIMELINE                             : str       = "timeline"
+    C_SPAN_REPORT_FLUSH                         : str       = "report.flush"
@@ -32,7 +32,8 @@ class TopDownParameters:
     # Output file
     C_OUTPUT_GRAPH_FILE_ARGUMENT_SHORT_OPTION               : str       = "-og"
     C_OUTPUT_GRAPH_FILE_ARGUMENT_LONG_OPTION                : str       = "--output-graph"
-    C_OUTPUT_GRAPH_FILE_ARGUMENT_DESCRIPTION                : str       = "output graph file. Path to file."
+    C_OUTPUT_GRAPH_FILE_ARGUMENT_DESCRIPTION                : str       = ("output graph file. Path to file. Format by extension: " + 
+                                                                                ".html, .png, .svg or .pdf.")
 
 
     # Program file
@@ -50,7 +51,8 @@ class TopDownParameters:
     C_SHOW_DESCRIPTION_ARGUMENT_DESCRIPTION                 : str       = "don't show description of results." 
 
     C_MIN_LEVEL_EXECUTION                                   : int       = 1
-    C_MAX_LEVEL_EXECUTION                                   : int       = 3
+    C_MAX_LEVEL_EXECUTION                                   : int       = 4
+    C_MAX_LEVEL_EXECUTION_NVPROF                            : int       = 3 # level four is only supported by NSIGHT
 
     # collect metrics
     C_METRICS_ARGUMENT_SHORT_OPTION                         : str       = "-m"
@@ -81,6 +83,192 @@ class TopDownParameters:
     C_OUTPUT_SCAN_FILE_ARGUMENT_SHORT_OPTION               : str       = "-os"
     C_OUTPUT_SCAN_FILE_ARGUMENT_LONG_OPTION                : str       = "--output-scan"
     C_OUTPUT_SCAN_FILE_ARGUMENT_DESCRIPTION                : str       = "output scan file. Path to file."
+
+    # Export file
+    C_EXPORT_FILE_ARGUMENT_SHORT_OPTION                    : str       = "-ex"
+    C_EXPORT_FILE_ARGUMENT_LONG_OPTION                     : str       = "--export"
+    C_EXPORT_FILE_ARGUMENT_DESCRIPTION                     : str       = ("export file with metrics/events and results of each launch. " +
+                                                                            "Path to Parquet (.parquet) or Arrow IPC (.arrow) file.")
+
+    # Output kernel graphs
+    C_OUTPUT_KERNEL_GRAPHS_ARGUMENT_SHORT_OPTION           : str       = "-okg"
+    C_OUTPUT_KERNEL_GRAPHS_ARGUMENT_LONG_OPTION            : str       = "--output-kernel-graphs"
+    C_OUTPUT_KERNEL_GRAPHS_ARGUMENT_DESCRIPTION            : str       = ("output graph of each kernel (its launches together), rendered in parallel. " +
+                                                                            "Path to file used as template (kernel's rank by cycles and name are appended). Format by extension: " + 
+                                                                            ".html, .png, .svg or .pdf.")
+
+    # Output hierarchy graph
+    C_OUTPUT_HIERARCHY_GRAPH_ARGUMENT_SHORT_OPTION         : str       = "-ohg"
+    C_OUTPUT_HIERARCHY_GRAPH_ARGUMENT_LONG_OPTION          : str       = "--output-hierarchy-graph"
+    C_OUTPUT_HIERARCHY_GRAPH_ARGUMENT_DESCRIPTION          : str       = ("output hierarchical graph (sunburst/treemap) of TopDown parts. Path to file. " + 
+                                                                            "Format by extension: .html, .png, .svg or .pdf.")
+
+    # Kernels in hierarchy graph
+    C_HIERARCHY_KERNELS_ARGUMENT_SHORT_OPTION              : str       = "-hk"
+    C_HIERARCHY_KERNELS_ARGUMENT_LONG_OPTION               : str       = "--hierarchy-kernels"
+    C_HIERARCHY_KERNELS_ARGUMENT_DESCRIPTION               : str       = ("max number of kernels drawn in hierarchical graph (the rest are " + 
+                                                                            "grouped in one node). 0 to draw the whole execution (default).")
+
+    # Type of hierarchy graph
+    C_HIERARCHY_TYPE_ARGUMENT_SHORT_OPTION                 : str       = "-ht"
+    C_HIERARCHY_TYPE_ARGUMENT_LONG_OPTION                  : str       = "--hierarchy-type"
+    C_HIERARCHY_TYPE_ARGUMENT_DESCRIPTION                  : str       = "type of hierarchical graph: sunburst (default) or treemap."
+
+    # Timings
+    C_TIMINGS_ARGUMENT_SHORT_OPTION                        : str       = "-ti"
+    C_TIMINGS_ARGUMENT_LONG_OPTION                         : str       = "--timings"
+    C_TIMINGS_ARGUMENT_DESCRIPTION                         : str       = ("show time spent in each stage of the analysis. Optionally, " + 
+                                                                            "path to JSON file where timings are written.")
+
+    # Timeline
+    C_TIMELINE_ARGUMENT_SHORT_OPTION                       : str       = "-tl"
+    C_TIMELINE_ARGUMENT_LONG_OPTION                        : str       = "--timeline"
+    C_TIMELINE_ARGUMENT_DESCRIPTION                        : str       = ("output results of level one and two in sliding windows of cycles " + 
+                                                                            "(launch order). Path to file. Format by extension: .csv or .json.")
+    C_OUTPUT_TIMELINE_GRAPH_ARGUMENT_SHORT_OPTION          : str       = "-otg"
+    C_OUTPUT_TIMELINE_GRAPH_ARGUMENT_LONG_OPTION           : str       = "--output-timeline-graph"
+    C_OUTPUT_TIMELINE_GRAPH_ARGUMENT_DESCRIPTION           : str       = ("output stacked-area graph of the timeline. Path to file. " + 
+                                                                            "Format by extension: .html, .png, .svg or .pdf.")
+    C_TIMELINE_WINDOWS_ARGUMENT_SHORT_OPTION               : str       = "-tlw"
+    C_TIMELINE_WINDOWS_ARGUMENT_LONG_OPTION                : str       = "--timeline-windows"
+    C_TIMELINE_WINDOWS_ARGUMENT_DESCRIPTION                : str       = "number of windows (positions of the sliding window) of the timeline."
+    C_TIMELINE_WIDTH_ARGUMENT_SHORT_OPTION                 : str       = "-tlp"
+    C_TIMELINE_WIDTH_ARGUMENT_LONG_OPTION                  : str       = "--timeline-width"
+    C_TIMELINE_WIDTH_ARGUMENT_DESCRIPTION                  : str       = "width of each window of the timeline (percentage of the cycles of the execution)."
+
+    # NVTX ranges (NSIGHT only)
+    C_NVTX_INCLUDE_ARGUMENT_SHORT_OPTION                   : str       = "-nvi"
+    C_NVTX_INCLUDE_ARGUMENT_LONG_OPTION                    : str       = "--nvtx-include"
+    C_NVTX_INCLUDE_ARGUMENT_DESCRIPTION                    : str       = ("only profile kernels in NVTX ranges indicated (ncu's '--nvtx-include' " + 
+                                                                            "syntax, e.g. 'forward/' or 'domain@range/'). Results are also shown per NVTX range.")
+    C_NVTX_EXCLUDE_ARGUMENT_SHORT_OPTION                   : str       = "-nve"
+    C_NVTX_EXCLUDE_ARGUMENT_LONG_OPTION                    : str       = "--nvtx-exclude"
+    C_NVTX_EXCLUDE_ARGUMENT_DESCRIPTION                    : str       = ("don't profile kernels in NVTX ranges indicated (ncu's '--nvtx-exclude' " + 
+                                                                            "syntax). Results are also shown per NVTX range.")
+    C_NVTX_PROFILER_OPTION                                 : str       = "--nvtx"
+    C_NVTX_INCLUDE_PROFILER_OPTION                         : str       = "--nvtx-include"
+    C_NVTX_EXCLUDE_PROFILER_OPTION                         : str       = "--nvtx-exclude"
+
+    # Profiled regions (cudaProfilerStart/Stop)
+    C_PROFILER_REGIONS_ARGUMENT_SHORT_OPTION               : str       = "-pr"
+    C_PROFILER_REGIONS_ARGUMENT_LONG_OPTION                : str       = "--profiler-regions"
+    C_PROFILER_REGIONS_ARGUMENT_DESCRIPTION                : str       = ("only profile kernels between cudaProfilerStart() and cudaProfilerStop() " + 
+                                                                            "(scan tool is launched with '--profile-from-start off').")
+    C_PROFILER_REGION_LAUNCHES_ARGUMENT_SHORT_OPTION       : str       = "-prl"
+    C_PROFILER_REGION_LAUNCHES_ARGUMENT_LONG_OPTION        : str       = "--profiler-region-launches"
+    C_PROFILER_REGION_LAUNCHES_ARGUMENT_DESCRIPTION        : str       = ("number of kernels launched in each profiled region. Results are also " + 
+                                                                            "shown per region (NSIGHT only).")
+    C_PROFILE_FROM_START_PROFILER_OPTION                   : str       = "--profile-from-start"
+    C_PROFILE_FROM_START_OFF_VALUE                         : str       = "off"
+
+    # Roofline
+    C_ROOFLINE_ARGUMENT_SHORT_OPTION                       : str       = "-rf"
+    C_ROOFLINE_ARGUMENT_LONG_OPTION                        : str       = "--roofline"
+    C_ROOFLINE_ARGUMENT_DESCRIPTION                        : str       = ("measure FLOPs and memory traffic and show the roofline of each kernel " + 
+                                                                            "(memory-bound, compute-bound or latency-bound).")
+    C_OUTPUT_ROOFLINE_GRAPH_ARGUMENT_SHORT_OPTION          : str       = "-org"
+    C_OUTPUT_ROOFLINE_GRAPH_ARGUMENT_LONG_OPTION           : str       = "--output-roofline-graph"
+    C_OUTPUT_ROOFLINE_GRAPH_ARGUMENT_DESCRIPTION           : str       = ("output roofline graph (percentage of the peaks of the device per kernel). " + 
+                                                                            "Implies '-rf'. Path to file. Format by extension: .html, .png, .svg or .pdf.")
+
+    # Occupancy
+    C_OCCUPANCY_ARGUMENT_SHORT_OPTION                      : str       = "-oc"
+    C_OCCUPANCY_ARGUMENT_LONG_OPTION                       : str       = "--occupancy"
+    C_OCCUPANCY_ARGUMENT_DESCRIPTION                       : str       = ("measure launch configuration and occupancy and show them per kernel with its " + 
+                                                                            "bottleneck, flagging kernels whose stalls are explained by low occupancy.")
+
+    # Architecture database
+    C_ARCHITECTURE_DATABASE_ARGUMENT_SHORT_OPTION          : str       = "-adb"
+    C_ARCHITECTURE_DATABASE_ARGUMENT_LONG_OPTION           : str       = "--architecture-database"
+    C_ARCHITECTURE_DATABASE_ARGUMENT_DESCRIPTION           : str       = ("path to JSON file with the architectures of the devices (warp schedulers per SM, " + 
+                                                                            "issue width, aliases of metrics...) used instead of the one bundled with the program.")
+
+    # Processes
+    C_PROCESSES_ARGUMENT_SHORT_OPTION                      : str       = "-ps"
+    C_PROCESSES_ARGUMENT_LONG_OPTION                       : str       = "--processes"
+    C_PROCESSES_ARGUMENT_DESCRIPTION                       : str       = ("only analyse kernels launched by processes indicated (PID, if it is only " + 
+                                                                            "digits, or part of the command, e.g. 'train.py'). Results are also shown per process and device " +
+                                                                            "if kernels are launched by several ones.")
+
+    # Check of the measures supported by the device
+    C_METRICS_CHECK_ARGUMENT_SHORT_OPTION                  : str       = "-mc"
+    C_METRICS_CHECK_ARGUMENT_LONG_OPTION                   : str       = "--metrics-check"
+    C_METRICS_CHECK_ARGUMENT_DESCRIPTION                   : str       = ("what is done, before launching scan tool, with the metrics/events not supported " + 
+                                                                            "by the device (list of supported ones is cached per device and driver): 'reject' " +
+                                                                            "(error), 'prune' (they are not collected) or 'off' (not checked).")
+
+    # MPI job
+    C_MPI_ARGUMENT_SHORT_OPTION                            : str       = "-mpi"
+    C_MPI_ARGUMENT_LONG_OPTION                             : str       = "--mpi"
+    C_MPI_ARGUMENT_DESCRIPTION                             : str       = ("program is an MPI job launched with the command indicated (e.g. 'mpirun -np 64'). " + 
+                                                                            "Each rank is measured by its own scan tool, which writes its results in its own file, " +
+                                                                            "and results are also shown per rank with the load imbalance between ranks. Rank files " +
+                                                                            "can be analysed again with '-is DIRECTORY'.")
+    C_MPI_RANK_VARIABLE_ARGUMENT_SHORT_OPTION              : str       = "-mpv"
+    C_MPI_RANK_VARIABLE_ARGUMENT_LONG_OPTION               : str       = "--mpi-rank-variable"
+    C_MPI_RANK_VARIABLE_ARGUMENT_DESCRIPTION               : str       = ("environment variable with the rank of each process of '-mpi/--mpi' (e.g. 'PMI_RANK' " +
+                                                                            "with MPICH or 'SLURM_PROCID' with srun).")
+    C_MPI_DIRECTORY_ARGUMENT_SHORT_OPTION                  : str       = "-mpd"
+    C_MPI_DIRECTORY_ARGUMENT_LONG_OPTION                   : str       = "--mpi-directory"
+    C_MPI_DIRECTORY_ARGUMENT_DESCRIPTION                   : str       = ("directory where each rank of '-mpi/--mpi' writes its results ('rank_<N>.txt'). " +
+                                                                            "Results of previous executions are removed.")
+
+    # Adaptive drill-down
+    C_ADAPTIVE_ARGUMENT_SHORT_OPTION                       : str       = "-ad"
+    C_ADAPTIVE_ARGUMENT_LONG_OPTION                        : str       = "--adaptive"
+    C_ADAPTIVE_ARGUMENT_DESCRIPTION                        : str       = ("run level one first and, in the level indicated, only measure the parts below the " + 
+                                                                            "parts of level one whose IPC degradation is at least the threshold (percentage, 5 by " +
+                                                                            "default). The rest of parts are shown as not measured.")
+    C_ADAPTIVE_THRESHOLD_DEFAULT                           : float     = 5.0
+    C_ADAPTIVE_MESSAGE                                     : str       = "Parts below the following ones are not measured (IPC degradation lower than %s%%): "
+    C_NOT_MEASURED_VALUE                                   : str       = "not measured"
+
+    # Hot kernels
+    C_HOT_KERNELS_ARGUMENT_SHORT_OPTION                    : str       = "-hot"
+    C_HOT_KERNELS_ARGUMENT_LONG_OPTION                     : str       = "--hot-kernels"
+    C_HOT_KERNELS_ARGUMENT_DESCRIPTION                     : str       = ("run a cheap pass first (only cycles and IPC of each launch) and only " +
+                                                                            "measure the kernels with most cycles which cover the percentage of the " +
+                                                                            "cycles indicated (95 by default), with the kernel filters of the scan tool.")
+    C_HOT_KERNELS_MESSAGE                                  : str       = "Only the hot kernels are measured (%.2f%% of cycles, %d of %d kernels, %d of %d launches):"
+    C_HOT_KERNEL_FORMAT                                    : str       = "    %6.2f%% of cycles, IPC %s: %s"
+
+    # Repeated runs
+    C_REPEAT_ARGUMENT_SHORT_OPTION                         : str       = "-rep"
+    C_REPEAT_ARGUMENT_LONG_OPTION                          : str       = "--repeat"
+    C_REPEAT_ARGUMENT_DESCRIPTION                          : str       = ("run the execution up to the number of times indicated and show mean, standard " +
+                                                                            "deviation and 95%% confidence interval of each value. Runs are stopped when the " +
+                                                                            "half-width of all the intervals is within the tolerance (after 3 runs).")
+    C_REPEAT_TOLERANCE_ARGUMENT_SHORT_OPTION               : str       = "-rept"
+    C_REPEAT_TOLERANCE_ARGUMENT_LONG_OPTION                : str       = "--repeat-tolerance"
+    C_REPEAT_TOLERANCE_ARGUMENT_DESCRIPTION                : str       = ("max half-width (percentage points) of the confidence intervals of '-rep/--repeat' " +
+                                                                            "to stop the runs (1 by default).")
+    C_REPEAT_DEVICES_ARGUMENT_SHORT_OPTION                 : str       = "-repd"
+    C_REPEAT_DEVICES_ARGUMENT_LONG_OPTION                  : str       = "--repeat-devices"
+    C_REPEAT_DEVICES_ARGUMENT_DESCRIPTION                  : str       = ("devices (indexes or UUIDs) where the runs of '-rep/--repeat' after the first one " +
+                                                                            "are done in parallel, one per device.")
+    C_REPEAT_RUNS_MESSAGE                                  : str       = "Runs: %d of %d"
+    C_REPEAT_CONVERGED_MESSAGE                             : str       = " (stopped: half-width of all the confidence intervals lower or equal than %s percentage points)"
+
+    # Distributions of measures
+    C_DISTRIBUTIONS_ARGUMENT_SHORT_OPTION                  : str       = "-dis"
+    C_DISTRIBUTIONS_ARGUMENT_LONG_OPTION                   : str       = "--distributions"
+    C_DISTRIBUTIONS_ARGUMENT_DESCRIPTION                   : str       = ("show min, max, percentiles weighted by the cycles and histogram of each " +
+                                                                            "measure across the launches (also exported with '-ex/--export').")
+
+    # Replay (stand-in of NVIDIA tools)
+    C_REPLAY_ARGUMENT_SHORT_OPTION                         : str       = "-rp"
+    C_REPLAY_ARGUMENT_LONG_OPTION                          : str       = "--replay"
+    C_REPLAY_ARGUMENT_DESCRIPTION                          : str       = ("don't use NVIDIA tools (nor GPU): replay results of scan tool " + 
+                                                                            "recorded in file indicated, or synthetic results if no file is indicated.")
+    C_REPLAY_COMPUTE_CAPABILITY_ARGUMENT_SHORT_OPTION      : str       = "-rcc"
+    C_REPLAY_COMPUTE_CAPABILITY_ARGUMENT_LONG_OPTION       : str       = "--replay-compute-capability"
+    C_REPLAY_COMPUTE_CAPABILITY_ARGUMENT_DESCRIPTION       : str       = "compute capability of the device simulated with '-rp/--replay'."
+    C_REPLAY_KERNELS_ARGUMENT_SHORT_OPTION                 : str       = "-rk"
+    C_REPLAY_KERNELS_ARGUMENT_LONG_OPTION                  : str       = "--replay-kernels"
+    C_REPLAY_KERNELS_ARGUMENT_DESCRIPTION                  : str       = "number of kernels of synthetic results of '-rp/--replay'."
+    C_REPLAY_LATENCY_ARGUMENT_SHORT_OPTION                 : str       = "-rl"
+    C_REPLAY_LATENCY_ARGUMENT_LONG_OPTION                  : str       = "--replay-latency"
+    C_REPLAY_LATENCY_ARGUMENT_DESCRIPTION                  : str       = "seconds waited in each launch of scan tool with '-rp/--replay'."
     
 
     C_NUM_MAX_CHARACTERS_PER_LINE                       : int       = 129
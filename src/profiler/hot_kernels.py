@@ -0,0 +1,181 @@
+"""
+Kernels which cover most of the cycles of the execution (hot kernels).
+
+@date:      Jul 2021
+@version:   1.0
+"""
+
+import re
+import os, sys, inspect
+currentdir = os.path.dirname(os.path.abspath(inspect.getfile(inspect.currentframe())))
+parentdir = os.path.dirname(currentdir)
+sys.path.insert(0, parentdir)
+from measure_levels.level_one import LevelOne
+from parameters.hot_kernels_params import HotKernelsParameters
+from parameters.level_execution_params import LevelExecutionParameters
+from errors.hot_kernels_errors import *
+
+class HotKernels:
+    """
+    Class with the kernels which cover a share of the cycles of the execution (the hot ones, with
+    most cycles first). They are found with a cheap pass of the NVIDIA scan tool which only collects
+    the cycles and IPC of each launch, so the measures of a deeper level are only collected in their
+    launches (with the kernel filters of the scan tool) instead of in hundreds of tiny kernels.
+
+    Attributes:
+        __share         : float ; percentage of the cycles of the execution covered by the hot kernels
+
+        __kernels       : list  ; dictionaries with the name, launches, cycles (% of the execution) and
+                                  IPC of each hot kernel (most cycles first)
+
+        __num_kernels   : int   ; number of different kernels of the execution
+
+        __num_launches  : int   ; number of launches of the execution
+    """
+
+    def __init__(self, share : float = HotKernelsParameters.C_SHARE_DEFAULT):
+        """
+        Set attributes with argument values.
+
+        Args:
+            share   : float ; percentage of the cycles of the execution covered by the hot kernels
+
+        Raises:
+            HotKernelsShareError    ; raised if percentage is not greater than 0 and lower or equal than 100
+        """
+
+        if share <= 0.0 or share > 100.0:
+            raise HotKernelsShareError(share)
+        self.__share : float = share
+        self.__kernels : list = list()
+        self.__num_kernels : int = 0
+        self.__num_launches : int = 0
+
+
+    @staticmethod
+    def measures(nvprof : bool) -> set:
+        """
+        Get the measures collected by the cheap pass.
+
+        Args:
+            nvprof  : bool  ; True if scan tool is nvprof or False if it's nsight
+
+        Returns:
+            Set with the names of the metric/event with the cycles elapsed and the metric with the IPC
+        """
+
+        if nvprof:
+            return {LevelExecutionParameters.C_CYCLES_ELAPSED_EVENT_NAME_NVPROF, LevelExecutionParameters.C_IPC_METRIC_NAME_NVPROF}
+        return {LevelExecutionParameters.C_CYCLES_ELAPSED_METRIC_NAME_NSIGHT, LevelExecutionParameters.C_IPC_METRIC_NAME_NSIGHT}
+
+
+    def share(self) -> float:
+        """ Returns percentage of the cycles of the execution covered by the hot kernels."""
+
+        return self.__share
+
+
+    def set_results(self, level_one : LevelOne):
+        """
+        Find the hot kernels in the results of the cheap pass: kernels with most cycles are taken until
+        they cover the share of the cycles of the execution.
+
+        Args:
+            level_one   : LevelOne  ; level one ALREADY DONE with (at least) the measures of the cheap pass
+        """
+
+        cycles : list = level_one.cycles_elapsed()
+        launches_of_kernel : dict = dict()
+        i : int
+        for i, name in enumerate(level_one.kernels()[:len(cycles)]):
+            launches_of_kernel.setdefault(name, list()).append(i)
+        total_cycles : float = sum(cycles)
+        self.__kernels = list()
+        self.__num_kernels = len(launches_of_kernel)
+        self.__num_launches = len(cycles)
+        if total_cycles <= 0:
+            return
+        selected_launches : list = level_one.selected_launches()
+        covered : float = 0.0
+        kernel_cycles : float
+        ipc : float
+        try:
+            for name, launches in sorted(launches_of_kernel.items(), key = lambda item: -sum(cycles[i] for i in item[1])):
+                if covered >= self.__share:
+                    break
+                kernel_cycles = (sum(cycles[i] for i in launches)/total_cycles)*100.0
+                level_one.select_launches(launches)
+                try:
+                    ipc = level_one.ipc()
+                except ZeroDivisionError: # kernel without cycles
+                    ipc = None
+                self.__kernels.append({"name" : name, "launches" : len(launches), "cycles" : kernel_cycles, "ipc" : ipc})
+                covered += kernel_cycles
+        finally:
+            level_one.select_launches(selected_launches)
+
+
+    def kernels(self) -> list:
+        """
+        Returns the hot kernels.
+
+        Returns:
+            List of dictionaries with the keys 'name', 'launches' (number of launches), 'cycles' (% of the
+            cycles of the execution) and 'ipc' ('None' if it cannot be computed), most cycles first
+        """
+
+        return self.__kernels
+
+
+    def num_kernels(self) -> int:
+        """ Returns number of different kernels of the execution."""
+
+        return self.__num_kernels
+
+
+    def num_launches(self) -> int:
+        """ Returns number of launches of the execution."""
+
+        return self.__num_launches
+
+
+    def launches(self) -> int:
+        """ Returns number of launches of the hot kernels."""
+
+        return sum(kernel["launches"] for kernel in self.__kernels)
+
+
+    def cycles(self) -> float:
+        """ Returns percentage of the cycles of the execution covered by the hot kernels."""
+
+        return sum(kernel["cycles"] for kernel in self.__kernels)
+
+
+    def profiler_options(self, nvprof : bool) -> list:
+        """
+        Get options of the NVIDIA scan tool so only the launches of the hot kernels are measured.
+
+        Args:
+            nvprof  : bool  ; True if scan tool is nvprof or False if it's nsight
+
+        Returns:
+            List with the arguments of the scan tool (empty if there are no hot kernels)
+        """
+
+        if not self.__kernels:
+            return list()
+        names : list
+        name : str
+        if nvprof:
+            names = list()
+            for kernel in self.__kernels:
+                name = kernel["name"].split(HotKernelsParameters.C_KERNEL_PARAMETERS_SEPARATOR_NVPROF)[0].strip()
+                if not name in names:
+                    names.append(name)
+            return [HotKernelsParameters.C_KERNELS_OPTION_NVPROF, HotKernelsParameters.C_KERNELS_PATH_FORMAT_NVPROF % "|".join(
+                re.escape(name).replace(HotKernelsParameters.C_KERNEL_PATH_SEPARATOR_NVPROF,
+                HotKernelsParameters.C_KERNEL_PATH_SEPARATOR_REGEX_NVPROF) for name in names)]
+        return [HotKernelsParameters.C_KERNEL_NAME_BASE_OPTION_NSIGHT, HotKernelsParameters.C_KERNEL_NAME_BASE_NSIGHT,
+            HotKernelsParameters.C_KERNEL_NAME_OPTION_NSIGHT, HotKernelsParameters.C_KERNEL_NAME_REGEX_FORMAT_NSIGHT % "|".join(
+            re.escape(kernel["name"]) for kernel in self.__kernels), HotKernelsParameters.C_LAUNCH_COUNT_OPTION_NSIGHT,
+            str(self.launches())]
@@ -0,0 +1,259 @@
+"""
+Measures (metrics/events) supported by the device with the NVIDIA scan tools.
+
+@date:      Jul 2021
+@version:   1.0
+"""
+
+import json
+import re
+from abc import ABC, abstractmethod # abstract class
+import os, sys, inspect
+currentdir = os.path.dirname(os.path.abspath(inspect.getfile(inspect.currentframe())))
+parentdir = os.path.dirname(currentdir)
+sys.path.insert(0, parentdir)
+from profiler.profiler_backend import ProfilerBackend
+from parameters.metric_availability_params import MetricAvailabilityParameters
+
+class MetricAvailability(ABC):
+    """
+    Class with the measures supported by the device with the NVIDIA scan tool, so the command can be
+    checked before launching it: with an unsupported measure, the scan tool fails after running the
+    whole application. They are obtained with the query options of the scan tool and cached on disk
+    per compute capability, device and driver, so the scan tool is only queried the first time.
+
+    Attributes:
+        __cache_file    : str   ; path to file where supported measures are cached, or 'None' if
+                                  device cannot be identified (measures are not cached)
+
+        __supported     : dict  ; option of the command with measures ('--metrics'...) as key and set with
+                                  the names supported as value. Options without names are not checked
+    """
+
+    def __init__(self, level_execution):
+        """
+        Get measures supported by the device (from cache, or querying the scan tool).
+
+        Args:
+            level_execution : LevelExecution    ; level of the execution whose command is checked
+        """
+
+        device_id : str = ProfilerBackend.current().device_id()
+        self.__cache_file : str = None
+        if device_id is not None:
+            self.__cache_file = self.__cache_file_path(level_execution.compute_capability(), device_id)
+        self.__supported : dict = self.__read_cache()
+        if self.__supported is None:
+            self.__supported = self.__query(level_execution)
+            if self.__supported:
+                self.__write_cache()
+
+
+    @abstractmethod
+    def _tool_name(self) -> str:
+        """ Returns name of the scan tool."""
+
+        pass
+
+
+    @abstractmethod
+    def _query_commands(self) -> dict:
+        """ Returns dictionary with the option of the command with measures as key and the command
+        which lists the measures supported as value."""
+
+        pass
+
+
+    @abstractmethod
+    def _query_name_regex(self) -> str:
+        """ Returns regex which finds the name of a measure in a line of the output of the query commands."""
+
+        pass
+
+
+    def _listed_name(self, name : str) -> str:
+        """
+        Get the name of the measure as it's listed by the query commands.
+
+        Args:
+            name    : str   ; name of the measure in the command
+
+        Returns:
+            String with the name listed, or 'None' if the measure is never listed (so it's not checked)
+        """
+
+        return name
+
+
+    def __cache_file_path(self, compute_capability : float, device_id : str) -> str:
+        """ Get path to cache file of the scan tool, compute capability and device indicated."""
+
+        directory : str = os.environ.get(MetricAvailabilityParameters.C_CACHE_DIRECTORY_ENVIRONMENT_VARIABLE)
+        if not directory:
+            directory = os.path.join(os.path.expanduser("~"), MetricAvailabilityParameters.C_CACHE_DEFAULT_DIRECTORY)
+        return os.path.join(directory, MetricAvailabilityParameters.C_CACHE_DIRECTORY_NAME,
+            MetricAvailabilityParameters.C_CACHE_FILE_FORMAT % (self._tool_name(), compute_capability,
+            re.sub(MetricAvailabilityParameters.C_CACHE_FILE_INVALID_CHARS_REGEX, "_", device_id).strip("_")))
+
+
+    def __read_cache(self) -> dict:
+        """ Read supported measures from cache file, or 'None' if they are not cached (or it cannot be read)."""
+
+        if self.__cache_file is None:
+            return None
+        try:
+            with open(self.__cache_file, "r") as f:
+                return {option : set(names) for option, names in json.load(f).items()}
+        except (OSError, ValueError, TypeError, AttributeError):
+            return None
+
+
+    def __write_cache(self):
+        """ Write supported measures in cache file. Nothing is done if it cannot be written."""
+
+        if self.__cache_file is None:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.__cache_file), exist_ok = True)
+            with open(self.__cache_file, "w") as f:
+                json.dump({option : sorted(names) for option, names in self.__supported.items()}, f)
+        except OSError:
+            pass # cache is an optimization, next execution queries the scan tool again
+
+
+    def __query(self, level_execution) -> dict:
+        """ Query the measures supported to the scan tool."""
+
+        supported : dict = dict()
+        output_str : str
+        names : set
+        for option, command in self._query_commands().items():
+            output_str = ProfilerBackend.current().query(level_execution, command)
+            if output_str is None:
+                continue
+            names = {match.group("name") for match in re.finditer(self._query_name_regex(), output_str, re.MULTILINE)}
+            if names:
+                supported[option] = names
+        return supported
+
+
+    def cache_file(self) -> str:
+        """
+        Returns path to file where supported measures are cached.
+
+        Returns:
+            String with the path, or 'None' if they are not cached
+        """
+
+        return self.__cache_file
+
+
+    def __option_regex(self, option : str) -> str:
+        """ Get regex which finds the list of measures of the option of the command."""
+
+        return r"(?<!\S)(" + re.escape(option) + r"\s+)(\S+)"
+
+
+    def __is_supported(self, option : str, name : str) -> bool:
+        """ Check if measure of the option is supported (or it cannot be checked)."""
+
+        listed_name : str = self._listed_name(name)
+        return name == "" or listed_name is None or listed_name in self.__supported[option]
+
+
+    def unsupported(self, command : str) -> list:
+        """
+        Get measures of the command not supported by the device.
+
+        Args:
+            command : str   ; command of the scan tool
+
+        Returns:
+            List with the names of the measures not supported (in order of the command, without repetitions)
+        """
+
+        names : list = list()
+        for option in self.__supported:
+            for match in re.finditer(self.__option_regex(option), command):
+                names += [name for name in match.group(2).split(",") if not self.__is_supported(option, name)
+                    and not name in names]
+        return names
+
+
+    def prune(self, command : str) -> str:
+        """
+        Remove measures not supported by the device from the command.
+
+        Args:
+            command : str   ; command of the scan tool
+
+        Returns:
+            String with the command without the measures not supported
+        """
+
+        for option in self.__supported:
+            command = re.sub(self.__option_regex(option), lambda match: match.group(1) + ",".join(name for name in
+                match.group(2).split(",") if self.__is_supported(option, name)), command)
+        return command
+
+
+class MetricAvailabilityNsight(MetricAvailability):
+    """Class with the metrics supported by the device with nsight scan tool."""
+
+    def _tool_name(self) -> str:
+        """ Returns name of the scan tool."""
+
+        return MetricAvailabilityParameters.C_TOOL_NAME_NSIGHT
+
+
+    def _query_commands(self) -> dict:
+        """ Returns dictionary with the option of the command with measures as key and the command
+        which lists the measures supported as value."""
+
+        return {MetricAvailabilityParameters.C_METRICS_OPTION : MetricAvailabilityParameters.C_QUERY_METRICS_COMMAND_NSIGHT}
+
+
+    def _query_name_regex(self) -> str:
+        """ Returns regex which finds the name of a measure in a line of the output of the query commands."""
+
+        return MetricAvailabilityParameters.C_QUERY_NAME_REGEX_NSIGHT
+
+
+    def _listed_name(self, name : str) -> str:
+        """
+        Get the name of the metric as it's listed by the query commands (base name, without rollup
+        and submetric).
+
+        Args:
+            name    : str   ; name of the metric in the command
+
+        Returns:
+            String with the name listed, or 'None' if the metric is never listed (launch__...)
+        """
+
+        if any(name.startswith(prefix) for prefix in MetricAvailabilityParameters.C_NOT_LISTED_METRIC_PREFIXES_NSIGHT):
+            return None
+        return name.split(MetricAvailabilityParameters.C_METRIC_NAME_SEPARATOR_NSIGHT)[0]
+
+
+class MetricAvailabilityNvprof(MetricAvailability):
+    """Class with the metrics and events supported by the device with nvprof scan tool."""
+
+    def _tool_name(self) -> str:
+        """ Returns name of the scan tool."""
+
+        return MetricAvailabilityParameters.C_TOOL_NAME_NVPROF
+
+
+    def _query_commands(self) -> dict:
+        """ Returns dictionary with the option of the command with measures as key and the command
+        which lists the measures supported as value."""
+
+        return {MetricAvailabilityParameters.C_METRICS_OPTION : MetricAvailabilityParameters.C_QUERY_METRICS_COMMAND_NVPROF,
+            MetricAvailabilityParameters.C_EVENTS_OPTION : MetricAvailabilityParameters.C_QUERY_EVENTS_COMMAND_NVPROF}
+
+
+    def _query_name_regex(self) -> str:
+        """ Returns regex which finds the name of a measure in a line of the output of the query commands."""
+
+        return MetricAvailabilityParameters.C_QUERY_NAME_REGEX_NVPROF
@@ -0,0 +1,168 @@
+"""
+Results of the ranks of an MPI job, each one measured by its own NVIDIA scan tool.
+
+@date:      Jul 2021
+@version:   1.0
+"""
+
+import pickle
+import re
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+import os, sys, inspect
+currentdir = os.path.dirname(os.path.abspath(inspect.getfile(inspect.currentframe())))
+parentdir = os.path.dirname(currentdir)
+sys.path.insert(0, parentdir)
+from parameters.mpi_ranks_params import MpiRanksParameters
+from errors.mpi_ranks_errors import *
+
+def _parse_rank_file(level_execution_pickle : bytes, file_str : str):
+    """
+    Parse results of a rank in a copy of the level (not run). It's run in a process of the pool, so
+    it must be a module-level function.
+
+    Args:
+        level_execution_pickle  : bytes ; level of the execution (not run) serialized with pickle
+
+        file_str                : str   ; path to file with the results of the rank
+
+    Returns:
+        Reference to the copy of the level with the results of the rank
+    """
+
+    level_execution = pickle.loads(level_execution_pickle)
+    level_execution.parse_results(Path(file_str).read_text())
+    return level_execution
+
+
+class MpiRanks:
+    """
+    Class with the ranks of an MPI job. The MPI launcher runs one NVIDIA scan tool per rank, which
+    writes its results in its own file ('rank_<N>.txt'), so results of the ranks are not interleaved
+    in one output. Files are parsed concurrently in a pool of processes and the launches of all the
+    ranks are merged in the level (in rank order), each one tagged with its rank.
+
+    Attributes:
+        __launcher          : str   ; command which launches the ranks ('mpirun -np 64'...), or 'None' if
+                                      results of the ranks were already recorded
+
+        __rank_variable     : str   ; environment variable with the rank of each process
+
+        __directory         : str   ; path to directory with the results of each rank
+
+        __max_workers       : int   ; max number of processes which parse results ('None' to use all CPUs)
+    """
+
+    def __init__(self, launcher : str, rank_variable : str, directory : str,
+        max_workers : int = MpiRanksParameters.C_MAX_PARSE_WORKERS):
+        """
+        Set attributes with argument values.
+
+        Args:
+            launcher        : str   ; command which launches the ranks ('mpirun -np 64'...), or 'None' if
+                                      results of the ranks were already recorded
+
+            rank_variable   : str   ; environment variable with the rank of each process
+
+            directory       : str   ; path to directory with the results of each rank
+
+            max_workers     : int   ; max number of processes which parse results ('None' to use all CPUs)
+        """
+
+        self.__launcher : str = launcher
+        self.__rank_variable : str = rank_variable
+        self.__directory : str = directory
+        self.__max_workers : int = max_workers
+
+
+    def launcher(self) -> str:
+        """ Returns command which launches the ranks, or 'None' if results were already recorded."""
+
+        return self.__launcher
+
+
+    def directory(self) -> str:
+        """ Returns path to directory with the results of each rank."""
+
+        return self.__directory
+
+
+    def profiler_options(self) -> list:
+        """
+        Get options of the NVIDIA scan tool so each rank writes its results in its own file.
+
+        Returns:
+            List with the arguments of the scan tool
+        """
+
+        return [MpiRanksParameters.C_LOG_FILE_OPTION, os.path.join(self.__directory,
+            MpiRanksParameters.C_RANK_FILE_FORMAT % self.__rank_variable)]
+
+
+    def command(self, command : str) -> str:
+        """
+        Get command which launches the NVIDIA scan tool in each rank.
+
+        Args:
+            command : str   ; command of the scan tool
+
+        Returns:
+            String with the command preceded by the MPI launcher
+        """
+
+        if self.__launcher is None:
+            return command
+        return self.__launcher + " " + command
+
+
+    def rank_files(self) -> list:
+        """
+        Get files with the results of the ranks.
+
+        Returns:
+            List of tuples (rank, path to file), in rank order
+        """
+
+        if not os.path.isdir(self.__directory):
+            return list()
+        files : list = list()
+        match : re.Match
+        for name in os.listdir(self.__directory):
+            match = re.match(MpiRanksParameters.C_RANK_FILE_REGEX, name)
+            if match is not None:
+                files.append((int(match.group("rank")), os.path.join(self.__directory, name)))
+        return sorted(files)
+
+
+    def clean(self):
+        """ Create directory of the results of the ranks, removing results of previous executions."""
+
+        os.makedirs(self.__directory, exist_ok = True)
+        for rank, file_str in self.rank_files():
+            os.remove(file_str)
+
+
+    def set_results(self, level_execution):
+        """
+        Parse results of the ranks and merge them in the level (not run).
+
+        Args:
+            level_execution : LevelExecution    ; level of the execution
+
+        Raises:
+            RankFilesNotFoundError  ; raised if there are no results of ranks in the directory
+        """
+
+        files : list = self.rank_files()
+        if not files:
+            raise RankFilesNotFoundError(self.__directory)
+        level_pickle : bytes = pickle.dumps(level_execution)
+        rank_levels : list
+        if len(files) <= 1 or self.__max_workers == 1:
+            rank_levels = [_parse_rank_file(level_pickle, file_str) for rank, file_str in files]
+        else:
+            with ProcessPoolExecutor(max_workers = self.__max_workers) as executor:
+                rank_levels = list(executor.map(_parse_rank_file, [level_pickle]*len(files),
+                    [file_str for rank, file_str in files]))
+        for (rank, file_str), rank_level in zip(files, rank_levels):
+            level_execution.add_launches(rank_level, {MpiRanksParameters.C_RANK_TAG : MpiRanksParameters.C_RANK_TAG_FORMAT % rank})
@@ -0,0 +1,201 @@
+"""
+Backends which obtain the compute capability of the device and launch the NVIDIA scan tools.
+
+@date:      Jul 2021
+@version:   1.0
+"""
+
+from abc import ABC, abstractmethod # abstract class
+import os, sys, inspect
+currentdir = os.path.dirname(os.path.abspath(inspect.getfile(inspect.currentframe())))
+parentdir = os.path.dirname(currentdir)
+sys.path.insert(0, parentdir)
+from shell.shell import Shell # launch shell arguments
+from parameters.profiler_backend_params import ProfilerBackendParameters
+from parameters.level_execution_params import LevelExecutionParameters
+
+class ProfilerBackend(ABC):
+    """
+    Class that represents the backend used to obtain the compute capability of the device
+    and to launch the NVIDIA scan tool. The backend in use is shared by all the program
+    ('ShellProfilerBackend' by default).
+
+    Attributes:
+        __current   : ProfilerBackend   ; backend in use, or 'None' if it has not been set yet
+    """
+
+    __current = None
+
+    @staticmethod
+    def current():
+        """
+        Returns backend in use.
+
+        Returns:
+            Reference to ProfilerBackend in use
+        """
+
+        if ProfilerBackend.__current is None:
+            ProfilerBackend.__current = ShellProfilerBackend()
+        return ProfilerBackend.__current
+
+
+    @staticmethod
+    def use(backend):
+        """
+        Set backend used by all the program.
+
+        Args:
+            backend : ProfilerBackend   ; backend to use
+        """
+
+        ProfilerBackend.__current = backend
+
+
+    @abstractmethod
+    def compute_capability(self) -> float:
+        """
+        Get compute capability of the device.
+
+        Returns:
+            Float with the compute capability, or 'None' if it cannot be obtained
+        """
+
+        pass
+
+
+    @abstractmethod
+    def device_id(self) -> str:
+        """
+        Get identifier of the device and its driver, used to cache information of the device.
+
+        Returns:
+            String with the identifier, or 'None' if it cannot be obtained
+        """
+
+        pass
+
+
+    @abstractmethod
+    def query(self, level_execution, command : str) -> str:
+        """
+        Launch query command of NVIDIA scan tool (measures supported by the device...).
+
+        Args:
+            level_execution     : LevelExecution    ; level of the execution which launches the query
+
+            command             : str               ; query command of the scan tool
+
+        Returns:
+            String with the output of the query, or 'None' if an error ocurred
+        """
+
+        pass
+
+
+    @abstractmethod
+    def launch(self, level_execution, command : str, output_scan_file : str) -> str:
+        """
+        Launch NVIDIA scan tool.
+
+        Args:
+            level_execution     : LevelExecution    ; level of the execution which launches the scan tool
+
+            command             : str               ; command of the scan tool
+
+            output_scan_file    : str               ; path to file where results are added, or 'None'
+
+        Returns:
+            String with the results of the scan tool, or 'None' if an error ocurred
+        """
+
+        pass
+
+
+class ShellProfilerBackend(ProfilerBackend):
+    """
+    Backend that launches the NVIDIA tools (nvcc, nvidia-smi, ncu and nvprof) in the shell. The 
+    compute capability and the identifier of the device are only obtained the first time they're needed.
+
+    Attributes:
+        __compute_capability    : float ; compute capability of the device, or 'None' if it has
+                                          not been obtained yet
+
+        __device_id             : str   ; name and driver version of the device, or 'None' if it
+                                          has not been obtained yet
+    """
+
+    def __init__(self):
+        """Set attributes."""
+
+        self.__compute_capability : float = None
+        self.__device_id : str = None
+
+
+    def compute_capability(self) -> float:
+        """
+        Get compute capability of the device.
+
+        Returns:
+            Float with the compute capability, or 'None' if it cannot be obtained
+        """
+
+        if self.__compute_capability is None:
+            shell : Shell = Shell()
+            compute_capability_str : str = shell.launch_command_show_all(ProfilerBackendParameters.C_COMPUTE_CAPABILITY_COMMAND, None)
+            shell.launch_command(ProfilerBackendParameters.C_COMPUTE_CAPABILITY_CLEAN_COMMAND, None) # delete 'a.out' generated
+            try:
+                self.__compute_capability = float(compute_capability_str)
+            except (TypeError, ValueError): # nvcc not found or device not available
+                return None
+        return self.__compute_capability
+
+
+    def device_id(self) -> str:
+        """
+        Get name and driver version of the (first) device.
+
+        Returns:
+            String with the name and driver version, or 'None' if they cannot be obtained
+        """
+
+        if self.__device_id is None:
+            output_str : str = Shell().launch_command(ProfilerBackendParameters.C_DEVICE_ID_COMMAND, None)
+            if output_str is None or output_str.strip() == "": # nvidia-smi not found
+                return None
+            self.__device_id = output_str.strip().splitlines()[0]
+        return self.__device_id
+
+
+    def query(self, level_execution, command : str) -> str:
+        """
+        Launch query command of NVIDIA scan tool in the shell.
+
+        Args:
+            level_execution     : LevelExecution    ; level of the execution which launches the query
+
+            command             : str               ; query command of the scan tool
+
+        Returns:
+            String with the output of the query, or 'None' if an error ocurred
+        """
+
+        return Shell().launch_command(command, None)
+
+
+    def launch(self, level_execution, command : str, output_scan_file : str) -> str:
+        """
+        Launch NVIDIA scan tool in the shell.
+
+        Args:
+            level_execution     : LevelExecution    ; level of the execution which launches the scan tool
+
+            command             : str               ; command of the scan tool
+
+            output_scan_file    : str               ; path to file where results are added, or 'None'
+
+        Returns:
+            String with the results of the scan tool, or 'None' if an error ocurred
+        """
+
+        return Shell().launch_command_redirect(command, LevelExecutionParameters.C_INFO_MESSAGE_EXECUTION, output_scan_file, True)
@@ -0,0 +1,144 @@
+"""
+Backend which replays results of the NVIDIA scan tools without GPU.
+
+@date:      Jul 2021
+@version:   1.0
+"""
+
+import time
+from pathlib import Path
+import os, sys, inspect
+currentdir = os.path.dirname(os.path.abspath(inspect.getfile(inspect.currentframe())))
+parentdir = os.path.dirname(currentdir)
+sys.path.insert(0, parentdir)
+from profiler.profiler_backend import ProfilerBackend
+from profiler.synthetic_output import SyntheticOutput
+from parameters.profiler_backend_params import ProfilerBackendParameters
+from parameters.synthetic_output_params import SyntheticOutputParameters
+from parameters.topdown_params import TopDownParameters
+from parameters.metric_availability_params import MetricAvailabilityParameters
+from errors.profiler_backend_errors import *
+
+class ReplayProfilerBackend(ProfilerBackend):
+    """
+    Backend that stands in for the NVIDIA tools: the compute capability is the one indicated and
+    the scan tool is not launched, its results are read from a file recorded previously or generated
+    synthetically (with the measures of the level). So the whole pipeline can be run without GPU.
+
+    Attributes:
+        __compute_capability    : float ; compute capability of the (simulated) device
+
+        __replay_file           : str   ; path to file with the results to replay, or 'None' to
+                                          generate them synthetically
+
+        __num_kernels           : int   ; number of launches (kernels) of synthetic results
+
+        __num_kernel_names      : int   ; number of different kernels of synthetic results
+
+        __latency               : float ; seconds waited in each launch of the scan tool
+    """
+
+    def __init__(self, compute_capability : float = ProfilerBackendParameters.C_REPLAY_COMPUTE_CAPABILITY,
+        replay_file : str = None, num_kernels : int = ProfilerBackendParameters.C_REPLAY_NUM_KERNELS,
+        num_kernel_names : int = ProfilerBackendParameters.C_REPLAY_NUM_KERNEL_NAMES,
+        latency : float = ProfilerBackendParameters.C_REPLAY_LATENCY_SECONDS):
+        """
+        Set attributes with argument values.
+
+        Args:
+            compute_capability  : float ; compute capability of the (simulated) device
+
+            replay_file         : str   ; path to file with the results to replay, or 'None' to
+                                          generate them synthetically
+
+            num_kernels         : int   ; number of launches (kernels) of synthetic results
+
+            num_kernel_names    : int   ; number of different kernels of synthetic results
+
+            latency             : float ; seconds waited in each launch of the scan tool
+        """
+
+        self.__compute_capability : float = compute_capability
+        self.__replay_file : str = replay_file
+        self.__num_kernels : int = num_kernels
+        self.__num_kernel_names : int = num_kernel_names
+        self.__latency : float = latency
+
+
+    def compute_capability(self) -> float:
+        """
+        Get compute capability of the (simulated) device.
+
+        Returns:
+            Float with the compute capability
+        """
+
+        return self.__compute_capability
+
+
+    def device_id(self) -> str:
+        """
+        Get identifier of the (simulated) device. There is none: measures supported by the device
+        are generated with the measures of each level, so they must not be cached.
+
+        Returns:
+            'None'
+        """
+
+        return None
+
+
+    def query(self, level_execution, command : str) -> str:
+        """
+        Get synthetic output of query command of the scan tool: all the measures of the level are supported.
+
+        Args:
+            level_execution     : LevelExecution    ; level of the execution which launches the query
+
+            command             : str               ; query command of the scan tool (not launched)
+
+        Returns:
+            String with the output of the query
+        """
+
+        output_format : str = SyntheticOutputParameters.C_NSIGHT_FORMAT
+        if self.__compute_capability <= TopDownParameters.C_COMPUTE_CAPABILITY_NVPROF_MAX_VALUE:
+            output_format = SyntheticOutputParameters.C_NVPROF_FORMAT
+        return SyntheticOutput(level_execution).query(output_format, command == MetricAvailabilityParameters.C_QUERY_EVENTS_COMMAND_NVPROF)
+
+
+    def launch(self, level_execution, command : str, output_scan_file : str) -> str:
+        """
+        Get results of the scan tool (recorded or synthetic) after waiting the latency.
+
+        Args:
+            level_execution     : LevelExecution    ; level of the execution which launches the scan tool
+
+            command             : str               ; command of the scan tool (not launched)
+
+            output_scan_file    : str               ; path to file where results are added, or 'None'
+
+        Returns:
+            String with the results of the scan tool
+
+        Raises:
+            ReplayFileError     ; raised if the file with the results to replay cannot be read
+        """
+
+        if self.__latency > 0:
+            time.sleep(self.__latency)
+        output_str : str
+        if self.__replay_file is None:
+            output_format : str = SyntheticOutputParameters.C_NSIGHT_FORMAT
+            if self.__compute_capability <= TopDownParameters.C_COMPUTE_CAPABILITY_NVPROF_MAX_VALUE:
+                output_format = SyntheticOutputParameters.C_NVPROF_FORMAT
+            output_str = SyntheticOutput(level_execution).generate(output_format, self.__num_kernels, self.__num_kernel_names)
+        else:
+            try:
+                output_str = Path(self.__replay_file).read_text()
+            except OSError:
+                raise ReplayFileError(self.__replay_file)
+        if output_scan_file is not None:
+            with open(output_scan_file, "a+") as f:
+                f.write(output_str)
+        return output_str
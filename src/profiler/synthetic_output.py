@@ -0,0 +1,343 @@
+"""
+Program that generates synthetic results of the NVIDIA scan tools.
+
+@date:      Jul 2021
+@version:   1.0
+"""
+
+import csv
+import io
+import locale
+import random
+import os, sys, inspect
+currentdir = os.path.dirname(os.path.abspath(inspect.getfile(inspect.currentframe())))
+parentdir = os.path.dirname(currentdir)
+sys.path.insert(0, parentdir)
+from measure_levels.level_execution import LevelExecution
+from measure_parts.metric_measure import MetricMeasure, MetricMeasureNvprof
+from parameters.synthetic_output_params import SyntheticOutputParameters
+from parameters.level_execution_params import LevelExecutionParameters
+from parameters.aggregations_params import AggregationsParameters
+from aggregation.aggregations import Aggregations
+from errors.synthetic_output_errors import *
+
+class SyntheticOutput:
+    """
+    Class that generates synthetic (random but realistic) results of the NVIDIA scan tools
+    (ncu text and CSV, and nvprof) with the metrics and events measured by a level of the execution,
+    in the layout expected by the parsers of the levels.
+
+    Attributes:
+        __metrics   : list          ; names of the metrics measured by the level
+
+        __events    : list          ; names of the events measured by the level (NVPROF only)
+
+        __random    : random.Random ; generator of the values
+    """
+
+    def __init__(self, level_execution : LevelExecution, seed : int = SyntheticOutputParameters.C_SEED):
+        """
+        Set attributes with the measures of the level indicated (measures not collected by the level are
+        left out, as in the command of the scan tool).
+
+        Args:
+            level_execution : LevelExecution    ; level of the execution whose results are generated
+
+            seed            : int               ; seed of the values generated
+        """
+
+        self.__metrics : list = list()
+        self.__events : list = list()
+        not_collected_names : set = level_execution.not_collected_measures()
+        part : MetricMeasure
+        for part in level_execution.measure_parts():
+            self.__metrics += [name for name in part.metrics() if not name in self.__metrics and not name in not_collected_names]
+            if isinstance(part, MetricMeasureNvprof):
+                self.__events += [name for name in part.events() if not name in self.__events and not name in not_collected_names]
+        self.__random : random.Random = random.Random(seed)
+
+
+    def __value(self, name : str) -> tuple:
+        """
+        Get random value of measure depending on its kind (guessed by its name).
+
+        Args:
+            name    : str   ; name of the measure
+
+        Returns:
+            Tuple (value, True if value is a percentage or False if not, unit of NSIGHT)
+        """
+
+        if "efficiency" in name or name == LevelExecutionParameters.C_WARP_EXECUTION_EFFICIENCY_METRIC_NAME_NSIGHT:
+            return (self.__random.uniform(*SyntheticOutputParameters.C_EFFICIENCY_RANGE), True,
+                SyntheticOutputParameters.C_NSIGHT_PERCENTAGE_UNIT)
+        if name.endswith(".pct") or (name.startswith("stall_") and Aggregations.strategy(name,
+            AggregationsParameters.C_METRIC_DEFAULT_STRATEGY_NVPROF) != AggregationsParameters.C_SUM_STRATEGY):
+            return (self.__random.uniform(*SyntheticOutputParameters.C_PERCENTAGE_RANGE), True,
+                SyntheticOutputParameters.C_NSIGHT_PERCENTAGE_UNIT)
+        if name.startswith(SyntheticOutputParameters.C_LAUNCH_METRIC_PREFIX):
+            for key, (value_range, unit) in SyntheticOutputParameters.C_LAUNCH_METRIC_RANGES.items():
+                if key in name:
+                    return (self.__random.randint(*value_range), False, unit)
+        if "occupancy" in name:
+            return (self.__random.uniform(*SyntheticOutputParameters.C_OCCUPANCY_RANGE)/100.0, False, "")
+        if name.endswith("_pct") or "pct_of_peak" in name or name.endswith("_hit_rate"):
+            return (self.__random.uniform(*SyntheticOutputParameters.C_OCCUPANCY_RANGE), True,
+                SyntheticOutputParameters.C_NSIGHT_PERCENTAGE_UNIT)
+        if name.endswith(".peak_sustained"):
+            return (self.__random.randint(*SyntheticOutputParameters.C_PEAK_PER_CYCLE_RANGE), False,
+                SyntheticOutputParameters.C_NSIGHT_BYTES_PER_CYCLE_UNIT if "bytes" in name else SyntheticOutputParameters.C_NSIGHT_IPC_UNIT)
+        if name.endswith("_per_request"):
+            return (self.__random.uniform(*SyntheticOutputParameters.C_TRANSACTIONS_PER_REQUEST_RANGE), False, "")
+        if "time_duration" in name:
+            return (self.__random.randint(*SyntheticOutputParameters.C_DURATION_RANGE), False, SyntheticOutputParameters.C_NSIGHT_DURATION_UNIT)
+        if "ipc" in name or "per_cycle" in name:
+            return (self.__random.uniform(*SyntheticOutputParameters.C_IPC_RANGE), False, SyntheticOutputParameters.C_NSIGHT_IPC_UNIT)
+        if "cycles" in name:
+            return (self.__random.randint(*SyntheticOutputParameters.C_CYCLES_RANGE), False, SyntheticOutputParameters.C_NSIGHT_CYCLES_UNIT)
+        if "bytes" in name:
+            return (self.__random.randint(*SyntheticOutputParameters.C_COUNT_RANGE), False, SyntheticOutputParameters.C_NSIGHT_BYTES_UNIT)
+        return (self.__random.randint(*SyntheticOutputParameters.C_COUNT_RANGE), False, "inst" if "inst" in name else "")
+
+
+    def __launch_values(self) -> dict:
+        """
+        Get random values of the metrics in a launch. Measures bounded by another one of the launch
+        (see 'SyntheticOutputParameters.C_BOUNDED_MEASURES') are a ratio of the value of their bound,
+        so results are consistent (no more bank conflicts than wavefronts...).
+
+        Returns:
+            Dictionary with the name of the metric as key and tuple (value, True if value is a percentage 
+            or False if not, unit of NSIGHT) as value
+        """
+
+        values : dict = dict()
+        bounded_names : list = list()
+        name : str
+        for name in self.__metrics:
+            if name in SyntheticOutputParameters.C_BOUNDED_MEASURES and SyntheticOutputParameters.C_BOUNDED_MEASURES[name][0] in self.__metrics:
+                bounded_names.append(name)
+            else:
+                values[name] = self.__value(name)
+        for name in bounded_names:
+            bound_name, ratio_range = SyntheticOutputParameters.C_BOUNDED_MEASURES[name]
+            bound_value, is_percentage, unit = values[bound_name]
+            value = bound_value*self.__random.uniform(*ratio_range)
+            values[name] = (int(value) if isinstance(bound_value, int) else value, is_percentage, unit)
+        return values
+
+
+    def __kernel_name(self, launch : int, num_kernel_names : int) -> str:
+        """ Get name of the kernel of the launch indicated."""
+
+        return SyntheticOutputParameters.C_KERNEL_NAME_FORMAT % (launch % num_kernel_names)
+
+
+    def __nsight_value_str(self, value) -> str:
+        """ Get value as it's written by NSIGHT (with the separators of the current locale)."""
+
+        if isinstance(value, int):
+            return locale.format_string("%d", value, grouping = True)
+        return locale.format_string("%.2f", value, grouping = True)
+
+
+    def nsight(self, num_kernels : int, num_kernel_names : int = None) -> str:
+        """
+        Generate results of ncu (text).
+
+        Args:
+            num_kernels         : int   ; number of launches (kernels)
+
+            num_kernel_names    : int   ; number of different kernels ('None' if all are different)
+
+        Returns:
+            String with the results
+        """
+
+        if num_kernel_names is None:
+            num_kernel_names = num_kernels
+        pid : int = SyntheticOutputParameters.C_PID
+        program : str = SyntheticOutputParameters.C_PROGRAM
+        separator : str = "    " + "-"*SyntheticOutputParameters.C_NSIGHT_NAME_WIDTH + " " + "-"*SyntheticOutputParameters.C_NSIGHT_UNIT_WIDTH + " " + "-"*30
+        lines : list = ["==PROF== Connected to process %d (%s)" % (pid, program)]
+        i : int
+        for i in range(0, num_kernels):
+            lines.append("==PROF== Profiling \"%s\" - %d: 0%%....50%%....100%% - 1 pass"
+                % (self.__kernel_name(i, num_kernel_names).split("(")[0], i))
+        lines.append("==PROF== Disconnected from process %d" % pid)
+        lines.append("[%d] %s@%s" % (pid, program, SyntheticOutputParameters.C_HOST))
+        name : str
+        values : dict
+        for i in range(0, num_kernels):
+            lines.append("  %s %s, Context %d, Stream %d" % (self.__kernel_name(i, num_kernel_names), SyntheticOutputParameters.C_KERNEL_GRID,
+                SyntheticOutputParameters.C_CONTEXT, SyntheticOutputParameters.C_STREAM))
+            lines.append("    Section: " + SyntheticOutputParameters.C_NSIGHT_SECTION)
+            lines.append(separator)
+            values = self.__launch_values()
+            for name in self.__metrics:
+                value, is_percentage, unit = values[name]
+                lines.append("    %-*s %-*s %s" % (SyntheticOutputParameters.C_NSIGHT_NAME_WIDTH, name,
+                    SyntheticOutputParameters.C_NSIGHT_UNIT_WIDTH, unit, self.__nsight_value_str(value)))
+            lines.append(separator)
+            lines.append("")
+        return "\n".join(lines)
+
+
+    def nsight_csv(self, num_kernels : int, num_kernel_names : int = None) -> str:
+        """
+        Generate results of ncu in CSV format ('--csv' option).
+
+        Args:
+            num_kernels         : int   ; number of launches (kernels)
+
+            num_kernel_names    : int   ; number of different kernels ('None' if all are different)
+
+        Returns:
+            String with the results
+        """
+
+        if num_kernel_names is None:
+            num_kernel_names = num_kernels
+        output : io.StringIO = io.StringIO()
+        writer = csv.writer(output, quoting = csv.QUOTE_ALL, lineterminator = "\n")
+        writer.writerow(SyntheticOutputParameters.C_NSIGHT_CSV_HEADER)
+        i : int
+        name : str
+        values : dict
+        for i in range(0, num_kernels):
+            values = self.__launch_values()
+            for name in self.__metrics:
+                value, is_percentage, unit = values[name]
+                writer.writerow([i, SyntheticOutputParameters.C_PID, SyntheticOutputParameters.C_PROGRAM, SyntheticOutputParameters.C_HOST,
+                    self.__kernel_name(i, num_kernel_names), SyntheticOutputParameters.C_CONTEXT, SyntheticOutputParameters.C_STREAM,
+                    SyntheticOutputParameters.C_NSIGHT_SECTION, name, unit, self.__nsight_value_str(value)])
+        return output.getvalue()
+
+
+    def nvprof(self, num_kernels : int) -> str:
+        """
+        Generate results of nvprof (events and metrics). NVPROF groups the launches of the same
+        kernel, so each kernel generated is different.
+
+        Args:
+            num_kernels         : int   ; number of kernels
+
+        Returns:
+            String with the results
+        """
+
+        pid_str : str = "==%d==" % SyntheticOutputParameters.C_PID
+        program : str = SyntheticOutputParameters.C_PROGRAM
+        invocations_width : int = SyntheticOutputParameters.C_NVPROF_INVOCATIONS_WIDTH
+        name_width : int = SyntheticOutputParameters.C_NVPROF_NAME_WIDTH
+        description_width : int = SyntheticOutputParameters.C_NVPROF_DESCRIPTION_WIDTH
+        value_width : int = SyntheticOutputParameters.C_NVPROF_VALUE_WIDTH
+        lines : list = ["%s NVPROF is profiling process %d, command: %s" % (pid_str, SyntheticOutputParameters.C_PID, program),
+            "%s Some kernel(s) will be replayed on device 0 in order to collect all events/metrics." % pid_str,
+            "%s Profiling application: %s" % (pid_str, program), "%s Profiling result:" % pid_str]
+        value_str : str
+        i : int
+        name : str
+        if self.__events:
+            lines.append("%s Event result:" % pid_str)
+            lines.append("%*s%*s%*s%*s%*s%*s" % (invocations_width, "Invocations", name_width, "Event Name", value_width, "Min",
+                value_width, "Max", value_width, "Avg", value_width, "Total"))
+            lines.append("Device \"%s\"" % SyntheticOutputParameters.C_DEVICE)
+            for i in range(0, num_kernels):
+                lines.append("    %s %s" % (LevelExecutionParameters.C_KERNEL_LINE_WORD_NVPROF, self.__kernel_name(i, num_kernels)))
+                for name in self.__events:
+                    value_str = str(self.__random.randint(*SyntheticOutputParameters.C_COUNT_RANGE))
+                    lines.append("%*d%*s%*s%*s%*s%*s" % (invocations_width, 1, name_width, name, value_width, value_str,
+                        value_width, value_str, value_width, value_str, value_width, value_str))
+        if self.__metrics:
+            lines.append("%s Metric result:" % pid_str)
+            lines.append("%*s%*s%*s%*s%*s%*s" % (invocations_width, "Invocations", name_width, "Metric Name", description_width,
+                "Metric Description", value_width, "Min", value_width, "Max", value_width, "Avg"))
+            lines.append("Device \"%s\"" % SyntheticOutputParameters.C_DEVICE)
+            for i in range(0, num_kernels):
+                lines.append("    %s %s" % (LevelExecutionParameters.C_KERNEL_LINE_WORD_NVPROF, self.__kernel_name(i, num_kernels)))
+                for name in self.__metrics:
+                    if name.endswith(SyntheticOutputParameters.C_NVPROF_UTILIZATION_SUFFIX):
+                        value_str = self.__nvprof_utilization_str(self.__random.randint(*SyntheticOutputParameters.C_UTILIZATION_LEVEL_RANGE))
+                    else:
+                        value, is_percentage, unit = self.__value(name)
+                        value_str = ("%.6f" % value) if isinstance(value, float) else str(value)
+                        if is_percentage:
+                            value_str += "%"
+                    lines.append("%*d%*s%*s%*s%*s%*s" % (invocations_width, 1, name_width, name, description_width,
+                        name.replace("_", " ").title(), value_width, value_str, value_width, value_str, value_width, value_str))
+        return "\n".join(lines) + "\n"
+
+
+    def __nvprof_utilization_str(self, level : int) -> str:
+        """ Get utilization level (from 0 to 10) in NVPROF format, e.g. 'Mid (5)'."""
+
+        name : str = SyntheticOutputParameters.C_UTILIZATION_LEVEL_NAMES[min(level*len(SyntheticOutputParameters.C_UTILIZATION_LEVEL_NAMES)
+            // (SyntheticOutputParameters.C_UTILIZATION_LEVEL_RANGE[1] + 1), len(SyntheticOutputParameters.C_UTILIZATION_LEVEL_NAMES) - 1)]
+        return "%s (%d)" % (name, level)
+
+
+    def query(self, output_format : str, events : bool = False) -> str:
+        """
+        Generate output of the query of the measures supported by the device ('--query-metrics' or
+        '--query-events'), with the measures of the level.
+
+        Args:
+            output_format   : str   ; format of the scan tool ('nsight', 'nsight-csv' or 'nvprof')
+
+            events          : bool  ; True to list the events or False to list the metrics (NVPROF only)
+
+        Returns:
+            String with the output
+
+        Raises:
+            SyntheticOutputFormatError  ; raised if format is not supported
+        """
+
+        name : str
+        if output_format in (SyntheticOutputParameters.C_NSIGHT_FORMAT, SyntheticOutputParameters.C_NSIGHT_CSV_FORMAT):
+            names : list = list()
+            for name in self.__metrics:
+                name = name.split(".")[0]
+                if not name in names:
+                    names.append(name)
+            return "\n".join(["Device " + SyntheticOutputParameters.C_DEVICE, "-"*SyntheticOutputParameters.C_NSIGHT_NAME_WIDTH,
+                "%-*s %s" % (SyntheticOutputParameters.C_NSIGHT_NAME_WIDTH, "Metric Name", "Metric Description")] +
+                ["%-*s %s" % (SyntheticOutputParameters.C_NSIGHT_NAME_WIDTH, name, name.replace("_", " ")) for name in names]) + "\n"
+        if output_format == SyntheticOutputParameters.C_NVPROF_FORMAT:
+            lines : list = ["Available %s:" % ("Events" if events else "Metrics"), "%*s   Description" % 
+                (SyntheticOutputParameters.C_NVPROF_NAME_WIDTH, "Name"), "Device \"%s\":" % SyntheticOutputParameters.C_DEVICE]
+            if events:
+                lines.append("\tDomain domain_a:")
+            lines += ["%*s:  %s" % (SyntheticOutputParameters.C_NVPROF_NAME_WIDTH, name, name.replace("_", " ").title())
+                for name in (self.__events if events else self.__metrics)]
+            return "\n".join(lines) + "\n"
+        raise SyntheticOutputFormatError(output_format)
+
+
+    def generate(self, output_format : str, num_kernels : int, num_kernel_names : int = None) -> str:
+        """
+        Generate results in the format indicated.
+
+        Args:
+            output_format       : str   ; format of results ('nsight', 'nsight-csv' or 'nvprof')
+
+            num_kernels         : int   ; number of launches (kernels)
+
+            num_kernel_names    : int   ; number of different kernels ('None' if all are different).
+                                          Not used in 'nvprof' format
+
+        Returns:
+            String with the results
+
+        Raises:
+            SyntheticOutputFormatError  ; raised if format is not supported
+        """
+
+        if output_format == SyntheticOutputParameters.C_NSIGHT_FORMAT:
+            return self.nsight(num_kernels, num_kernel_names)
+        if output_format == SyntheticOutputParameters.C_NSIGHT_CSV_FORMAT:
+            return self.nsight_csv(num_kernels, num_kernel_names)
+        if output_format == SyntheticOutputParameters.C_NVPROF_FORMAT:
+            return self.nvprof(num_kernels)
+        raise SyntheticOutputFormatError(output_format)
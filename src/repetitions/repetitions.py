@@ -0,0 +1,238 @@
+"""
+Program that repeats the execution and computes statistics of the results of the TopDown methodology.
+
+@date:      Jul 2021
+@version:   1.0
+"""
+
+import math
+import pickle
+import statistics
+from concurrent.futures import ProcessPoolExecutor
+import os, sys, inspect
+currentdir = os.path.dirname(os.path.abspath(inspect.getfile(inspect.currentframe())))
+parentdir = os.path.dirname(currentdir)
+sys.path.insert(0, parentdir)
+from measure_levels.level_execution import LevelExecution
+from parameters.repetitions_params import RepetitionsParameters
+from parameters.timings_params import TimingsParameters
+from timings.timings import Timings
+from errors.repetitions_errors import *
+
+def _run_level(level_execution_pickle : bytes, device : str, selected_launches : list) -> list:
+    """
+    Run a copy of the level (not run) and get its TopDown hierarchy. It can be run in a process of the
+    pool, so it must be a module-level function.
+
+    Args:
+        level_execution_pickle  : bytes ; level of the execution (not run) serialized with pickle
+
+        device                  : str   ; device where the copy is run, or 'None' to use the visible ones
+
+        selected_launches       : list  ; indexes of the launches taken into account, or 'None' to use all of them
+
+    Returns:
+        List of tuples (name of part, name of parent part or "" if it's a root part, value)
+    """
+
+    if device is not None:
+        os.environ[RepetitionsParameters.C_DEVICES_ENVIRONMENT_VARIABLE] = device
+    level_execution : LevelExecution = pickle.loads(level_execution_pickle)
+    level_execution.run(list())
+    level_execution.select_launches(selected_launches)
+    return level_execution.topdown_tree()
+
+
+class Repetitions:
+    """
+    Class that repeats the execution of a level and computes the mean, standard deviation and
+    confidence interval of each value of the TopDown hierarchy, because measures of the scan tool vary
+    from run to run. Runs are stopped early when the confidence intervals of all the values are
+    within the tolerance. With several devices, copies of the level are run in parallel in a
+    pool of processes, one per device.
+
+    Attributes:
+        __level_execution_pickle    : bytes ; level of the execution (not run) serialized with pickle
+
+        __max_runs                  : int   ; max number of runs (the first one included)
+
+        __tolerance                 : float ; max half-width of the confidence intervals (percentage points)
+
+        __devices                   : list  ; devices where the runs are done in parallel, or 'None' to run
+                                              them one after another in the visible devices
+
+        __tree                      : list  ; tuples (name of part, name of parent part) of the hierarchy,
+                                              in order of the first run
+
+        __values                    : dict  ; name of part as key and list with its value in each run as
+                                              value (runs where it's not measured are not added)
+
+        __num_runs                  : int   ; number of runs done
+    """
+
+    def __init__(self, level_execution : LevelExecution, max_runs : int,
+        tolerance : float = RepetitionsParameters.C_TOLERANCE_DEFAULT, devices : list = None):
+        """
+        Set attributes with argument values.
+
+        Args:
+            level_execution     : LevelExecution    ; level of the execution (NOT run yet)
+
+            max_runs            : int               ; max number of runs (the first one included)
+
+            tolerance           : float             ; max half-width of the confidence intervals (percentage points)
+
+            devices             : list              ; devices where the runs are done in parallel, or 'None'
+
+        Raises:
+            RepetitionsNumberError  ; raised if number of runs is lower than 1
+        """
+
+        if max_runs < 1:
+            raise RepetitionsNumberError(max_runs)
+        output_scan_file : str = level_execution.output_scan_file()
+        level_execution.set_output_scan_file(None) # only results of the first run are saved
+        self.__level_execution_pickle : bytes = pickle.dumps(level_execution)
+        level_execution.set_output_scan_file(output_scan_file)
+        self.__max_runs : int = max_runs
+        self.__tolerance : float = tolerance
+        self.__devices : list = devices
+        self.__tree : list = list()
+        self.__values : dict = dict()
+        self.__num_runs : int = 0
+
+
+    def __add_run(self, tree : list):
+        """ Add values of the TopDown hierarchy of a run."""
+
+        for name, parent_name, value in tree:
+            if not name in self.__values:
+                self.__tree.append((name, parent_name))
+                self.__values[name] = list()
+            if value is not None:
+                self.__values[name].append(value)
+        self.__num_runs += 1
+
+
+    def __half_width(self, values : list) -> float:
+        """ Get half-width of the confidence interval of the mean of the values, or 'None' if there are less than two."""
+
+        if len(values) < 2:
+            return None
+        quantile : float = RepetitionsParameters.C_NORMAL_QUANTILE
+        if len(values) - 1 <= len(RepetitionsParameters.C_T_QUANTILES):
+            quantile = RepetitionsParameters.C_T_QUANTILES[len(values) - 2]
+        return quantile*statistics.stdev(values)/math.sqrt(len(values))
+
+
+    def has_converged(self) -> bool:
+        """
+        Check if the half-width of the confidence intervals of all the values is within the tolerance,
+        after the min number of runs.
+
+        Returns:
+            True if runs can be stopped or False if not
+        """
+
+        if self.__num_runs < RepetitionsParameters.C_MIN_RUNS:
+            return False
+        half_width : float
+        for values in self.__values.values():
+            half_width = self.__half_width(values)
+            if half_width is not None and half_width > self.__tolerance:
+                return False
+        return True
+
+
+    def run(self, level_execution : LevelExecution):
+        """
+        Repeat the execution until the max number of runs or until the values converge.
+
+        Args:
+            level_execution : LevelExecution    ; level of the execution ALREADY DONE (first run). Its
+                                                  selected launches are also used in the rest of runs
+        """
+
+        self.__add_run(level_execution.topdown_tree())
+        selected_launches : list = level_execution.selected_launches()
+        num_workers : int = 1
+        if self.__devices is not None and level_execution.mpi_ranks() is None: # files of ranks are shared by the runs
+            num_workers = len(self.__devices)
+        devices : list = [None] if self.__devices is None else self.__devices
+        batch : int
+        with Timings.span(TimingsParameters.C_SPAN_REPETITIONS):
+            if num_workers <= 1:
+                while self.__num_runs < self.__max_runs and not self.has_converged():
+                    self.__add_run(_run_level(self.__level_execution_pickle, devices[0], selected_launches))
+                return
+            with ProcessPoolExecutor(max_workers = num_workers) as executor:
+                while self.__num_runs < self.__max_runs and not self.has_converged():
+                    batch = min(num_workers, self.__max_runs - self.__num_runs)
+                    for tree in executor.map(_run_level, [self.__level_execution_pickle]*batch, devices[:batch],
+                        [selected_launches]*batch):
+                        self.__add_run(tree)
+
+
+    def num_runs(self) -> int:
+        """ Returns number of runs done."""
+
+        return self.__num_runs
+
+
+    def statistics(self) -> list:
+        """
+        Get the statistics of each value of the TopDown hierarchy.
+
+        Returns:
+            List of dictionaries with the keys 'name', 'parent' ("" if it's a root part), 'runs' (number of
+            runs where it's measured), 'mean', 'std' and 'confidence_interval' (tuple (low, high)). Values
+            which cannot be computed are 'None'
+        """
+
+        results : list = list()
+        values : list
+        mean : float
+        half_width : float
+        for name, parent_name in self.__tree:
+            values = self.__values[name]
+            mean = statistics.mean(values) if values else None
+            half_width = self.__half_width(values)
+            results.append({"name" : name, "parent" : parent_name, "runs" : len(values), "mean" : mean,
+                "std" : statistics.stdev(values) if len(values) > 1 else None,
+                "confidence_interval" : None if half_width is None else (mean - half_width, mean + half_width)})
+        return results
+
+
+    def __value_str(self, value : float, decimals : int) -> str:
+        """ Get value rounded, or 'C_NOT_AVAILABLE_VALUE' if it's 'None'."""
+
+        if value is None:
+            return RepetitionsParameters.C_NOT_AVAILABLE_VALUE
+        return str(round(value, decimals))
+
+
+    def report_str(self, decimals : int) -> str:
+        """
+        Get table with the statistics of each value of the TopDown hierarchy.
+
+        Args:
+            decimals    : int   ; number of decimals of the values
+
+        Returns:
+            String with the table
+        """
+
+        titles : list = [RepetitionsParameters.C_PART_COLUMN_TITLE, RepetitionsParameters.C_MEAN_COLUMN_TITLE,
+            RepetitionsParameters.C_STD_COLUMN_TITLE, RepetitionsParameters.C_CONFIDENCE_INTERVAL_COLUMN_TITLE]
+        rows : list = list()
+        for result in self.statistics():
+            rows.append([result["name"], self.__value_str(result["mean"], decimals), self.__value_str(result["std"], decimals),
+                RepetitionsParameters.C_NOT_AVAILABLE_VALUE if result["confidence_interval"] is None else
+                RepetitionsParameters.C_CONFIDENCE_INTERVAL_FORMAT % (self.__value_str(result["confidence_interval"][0], decimals),
+                self.__value_str(result["confidence_interval"][1], decimals))])
+        lengths : list = [max([len(title) + 2, RepetitionsParameters.C_VALUE_COLUMN_MIN_LENGTH] + [len(row[i]) + 2 for row in rows])
+            for i, title in enumerate(titles)]
+        lines : list = ["".join("%-*s" % (lengths[i], title) for i, title in enumerate(titles))]
+        lines.append("-"*len(lines[0]))
+        lines += ["".join("%-*s" % (lengths[i], value) for i, value in enumerate(row)) for row in rows]
+        return "\n".join(lines)
@@ -13,7 +13,33 @@ sys.path.insert(0, parentdir)
 from errors.message_format_errors import *
 
 class MessageFormat:
-    """Class with different methods to show messages."""
+    """
+    Class with different methods to show messages.
+    
+    Attributes:
+        __buffered      : bool  ; True if strings written to files are kept in memory until 'flush' is called
+                                  or False if each string is written to file when it's printed
+
+        __buffers       : dict  ; dictionary with path to file as key and list of strings (in order) to write
+                                  in it as value (only used if '__buffered' is True)
+
+        __truncate      : dict  ; dictionary with path to file as key and True as value if file content must be
+                                  deleted before write buffer (only used if '__buffered' is True)
+    """
+
+    def __init__(self, buffered : bool = False):
+        """
+        Set attributes with argument values.
+
+        Args:
+            buffered    : bool  ; True to keep strings written to files in memory until 'flush' is called
+                                  (one open per file) or False to write each string when it's printed
+        """
+
+        self.__buffered : bool = buffered
+        self.__buffers : dict = dict()
+        self.__truncate : dict = dict()
+        
     
     def __write_str_in_file(self, str_to_write : str, output_file : str, delete_content_file : bool):
         """ Write string ((if it's correct) in file.
@@ -26,6 +52,12 @@ class MessageFormat:
         """
         
         if not output_file is None:
+            if self.__buffered:
+                if delete_content_file or not output_file in self.__buffers:
+                    self.__buffers[output_file] = list()
+                    self.__truncate[output_file] = delete_content_file or self.__truncate.get(output_file, False)
+                self.__buffers[output_file].append(str_to_write)
+                return
             try:
                 option : str = "w" # by default
                 if not delete_content_file:
@@ -41,6 +73,32 @@ class MessageFormat:
                 raise WriteInOutPutFileError
         
 
+    def flush(self):
+        """
+        Write strings kept in memory to their files (one open per file). Only used if
+        strings are buffered.
+
+        Raises:
+            WriteInOutPutFileError  ; error when opening or write in file. Operation not performed
+        """
+
+        output_file : str
+        for output_file in self.__buffers:
+            try:
+                option : str = "a"
+                if self.__truncate.get(output_file, False):
+                    option = "w"
+                f : _io.TextIOWrapper = open(output_file, option)
+                try:
+                    f.write("".join(self.__buffers[output_file]))
+                finally:
+                    f.close()
+            except:
+                raise WriteInOutPutFileError
+        self.__buffers = dict()
+        self.__truncate = dict()
+        
+
     def print_msg_box(self, msg, indent, width, title, output_file : str, delete_content_file : bool):
         """Print message-box with optional title."""
 
@@ -253,6 +311,14 @@ class MessageFormat:
             self.__write_str_in_file(message, output_file, delete_content_file)
         
 
+    def print_str(self, message : str, output_file : str, delete_content_file : bool):
+        """Print Message as it is (without wrapping its lines), e.g. a table."""
+
+        print(message)
+        if not output_file is None:
+            self.__write_str_in_file(message, output_file, delete_content_file)
+        
+
     def write_in_file_at_end(self, file : str, message : list):
         """
         Write 'message' at the end of file with path 'file'
@@ -267,6 +333,9 @@ class MessageFormat:
             WriteInOutPutFileError  ; error when opening or write in file. Operation not performed
         """
 
+        if self.__buffered:
+            self.__write_str_in_file("\n".join(str(item) for item in message), file, False)
+            return
         try:
             f : _io.TextIOWrapper = open(file, "a")
             try:
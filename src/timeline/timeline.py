@@ -0,0 +1,250 @@
+"""
+Program that computes the results of the TopDown methodology along the execution.
+
+@date:      Jul 2021
+@version:   1.0
+"""
+
+import bisect
+import csv
+import json
+import os, sys, inspect
+currentdir = os.path.dirname(os.path.abspath(inspect.getfile(inspect.currentframe())))
+parentdir = os.path.dirname(currentdir)
+sys.path.insert(0, parentdir)
+from measure_levels.level_one import LevelOne
+from graph.stacked_area_chart import StackedAreaChart
+from parameters.timeline_params import TimelineParameters
+from errors.timeline_errors import *
+
+class Timeline:
+    """
+    Class that computes the parts of level one and two of the TopDown methodology (percentage of
+    IPC degradation or retired) in sliding windows of cycles, keeping the launch order, so the
+    shifts of the bottleneck between the phases of the application are not hidden by the average
+    of the whole execution. Each window takes the launches whose cycles overlap it. NVPROF groups
+    the launches of each kernel, so in that mode the order is the order of the kernels.
+
+    Attributes:
+        __level_execution       : LevelOne          ; level of the execution ALREADY DONE
+
+        __num_windows           : int               ; number of windows (positions of the sliding window)
+
+        __window_width          : float             ; width of each window (% of the cycles of the execution)
+
+        __windows               : list              ; results of each window, or 'None' if they have not
+                                                      been computed yet
+    """
+
+    def __init__(self, level_execution : LevelOne, num_windows : int = TimelineParameters.C_NUM_WINDOWS_DEFAULT,
+        window_width : float = TimelineParameters.C_WINDOW_WIDTH_PERCENTAGE_DEFAULT):
+        """
+        Set attributes with argument values.
+
+        Args:
+            level_execution     : LevelOne          ; level of the execution ALREADY DONE
+
+            num_windows         : int               ; number of windows (positions of the sliding window)
+
+            window_width        : float             ; width of each window (% of the cycles of the execution)
+
+        Raises:
+            TimelineWindowsError    ; raised if number of windows or their width are not valid
+        """
+
+        if num_windows <= 0 or window_width <= 0.0 or window_width > 100.0:
+            raise TimelineWindowsError
+        self.__level_execution : LevelOne = level_execution
+        self.__num_windows : int = num_windows
+        self.__window_width : float = window_width
+        self.__windows : list = None
+
+
+    def __parts(self, tree : list) -> list:
+        """
+        Get the parts of level one and two of the TopDown hierarchy.
+
+        Args:
+            tree    : list  ; list of tuples (name of part, name of parent part or "", value)
+
+        Returns:
+            List of tuples (name of part, level of part, value)
+        """
+
+        level_of_part : dict = dict()
+        parts : list = list()
+        for name, parent_name, value in tree:
+            level_of_part[name] = 1 if parent_name == "" else level_of_part.get(parent_name, 0) + 1
+            if level_of_part[name] <= 2:
+                parts.append((name, level_of_part[name], value))
+        return parts
+
+
+    def __compute(self) -> list:
+        """
+        Compute the results of each window. A window without stalls/cycles has no results.
+
+        Returns:
+            List of dictionaries with the bounds, launches, parts and bottleneck of each window
+        """
+
+        cycles : list = self.__level_execution.cycles_elapsed()
+        total_cycles : float = sum(cycles)
+        windows : list = list()
+        if total_cycles <= 0.0:
+            return windows
+        starts : list = list()
+        ends : list = list()
+        end : float = 0.0
+        for value in cycles:
+            starts.append(end)
+            end += value
+            ends.append(end)
+        width : float = total_cycles*(self.__window_width/100.0)
+        step : float = (total_cycles - width)/(self.__num_windows - 1) if self.__num_windows > 1 else 0.0
+        selected_launches : list = self.__level_execution.selected_launches()
+        start : float
+        first_launch : int
+        launches : list
+        parts : list
+        try:
+            for i in range(0, self.__num_windows):
+                start = i*step
+                first_launch = min(bisect.bisect_right(ends, start), len(cycles) - 1)
+                launches = list(range(first_launch, max(bisect.bisect_left(starts, start + width), first_launch + 1)))
+                self.__level_execution.select_launches(launches)
+                try:
+                    parts = self.__parts(self.__level_execution.topdown_tree())
+                except ZeroDivisionError: # window without stalls/cycles
+                    parts = list()
+                windows.append({"window" : i, "start" : (start/total_cycles)*100.0, "end" : ((start + width)/total_cycles)*100.0,
+                    "first_launch" : launches[0], "last_launch" : launches[-1], "parts" : parts,
+                    "bottleneck" : self.__bottleneck(parts)})
+        finally:
+            self.__level_execution.select_launches(selected_launches)
+        return windows
+
+
+    def __bottleneck(self, parts : list) -> str:
+        """ Get the part of level one with the highest IPC degradation, or 'None' if there are no parts."""
+
+        retire_name : str = self.__level_execution.retire().name()
+        degradations : list = [(value, name) for name, level, value in parts if level == 1 and name != retire_name
+            and not value is None]
+        if not degradations:
+            return None
+        return max(degradations)[1]
+
+
+    def windows(self) -> list:
+        """
+        Get the results of each window. They are only computed the first time.
+
+        Returns:
+            List of dictionaries with the keys 'window', 'start' and 'end' (% of the cycles of the execution),
+            'first_launch', 'last_launch', 'parts' (list of tuples (name, level, value)) and 'bottleneck'
+        """
+
+        if self.__windows is None:
+            self.__windows = self.__compute()
+        return self.__windows
+
+
+    def phases(self) -> list:
+        """
+        Get the phases of the execution: consecutive windows with the same bottleneck.
+
+        Returns:
+            List of dictionaries with the keys 'first_window', 'last_window', 'first_launch',
+            'last_launch' and 'bottleneck'
+        """
+
+        phases : list = list()
+        for window in self.windows():
+            if phases and phases[-1]["bottleneck"] == window["bottleneck"]:
+                phases[-1]["last_window"] = window["window"]
+                phases[-1]["last_launch"] = window["last_launch"]
+            else:
+                phases.append({"first_window" : window["window"], "last_window" : window["window"],
+                    "first_launch" : window["first_launch"], "last_launch" : window["last_launch"],
+                    "bottleneck" : window["bottleneck"]})
+        return phases
+
+
+    def save(self, file_str : str):
+        """
+        Save the series of windows in file indicated as argument. Format is obtained from the
+        extension of the file: CSV (one row per window) or JSON (windows and phases).
+
+        Args:
+            file_str    : str   ; path to output file
+
+        Raises:
+            TimelineFormatError     ; format of the file is not supported
+        """
+
+        extension : str = os.path.splitext(file_str)[1].lower()
+        if extension in TimelineParameters.C_JSON_FILE_EXTENSIONS:
+            with open(file_str, "w") as f:
+                json.dump({"num_windows" : self.__num_windows, "window_width" : self.__window_width,
+                    "windows" : [dict(window, parts = {name : value for name, level, value in window["parts"]})
+                    for window in self.windows()], "phases" : self.phases()}, f, indent = 2)
+        elif extension in TimelineParameters.C_CSV_FILE_EXTENSIONS:
+            names : list = list()
+            for window in self.windows():
+                names += [name for name, level, value in window["parts"] if not name in names]
+            with open(file_str, "w", newline = "") as f:
+                writer = csv.writer(f)
+                writer.writerow([TimelineParameters.C_WINDOW_COLUMN_NAME, TimelineParameters.C_START_COLUMN_NAME,
+                    TimelineParameters.C_END_COLUMN_NAME, TimelineParameters.C_FIRST_LAUNCH_COLUMN_NAME,
+                    TimelineParameters.C_LAST_LAUNCH_COLUMN_NAME] + names + [TimelineParameters.C_BOTTLENECK_COLUMN_NAME])
+                for window in self.windows():
+                    values : dict = {name : value for name, level, value in window["parts"]}
+                    writer.writerow([window["window"], "%.3f" % window["start"], "%.3f" % window["end"], window["first_launch"],
+                        window["last_launch"]] + ["" if values.get(name) is None else "%.3f" % values[name] for name in names] +
+                        ["" if window["bottleneck"] is None else window["bottleneck"]])
+        else:
+            raise TimelineFormatError(file_str)
+
+
+    def _create_graph(self) -> StackedAreaChart:
+        """
+        Create stacked-area graph with one row per level of the TopDown hierarchy. X axis is
+        the center of each window.
+
+        Returns:
+            Reference to StackedAreaChart with graph
+        """
+
+        windows : list = self.windows()
+        levels : list = sorted(set(level for window in windows for name, level, value in window["parts"]))
+        graph : StackedAreaChart = StackedAreaChart(TimelineParameters.C_GRAPH_TITLE, TimelineParameters.C_GRAPH_X_AXIS_TITLE,
+            [TimelineParameters.C_GRAPH_LEVEL_TITLE % level for level in levels], TimelineParameters.C_GRAPH_HOVER_TEMPLATE)
+        x_values : list = [(window["start"] + window["end"])/2.0 for window in windows]
+        customdata : list = [[window["first_launch"], window["last_launch"]] for window in windows]
+        names : list = list()
+        for window in windows:
+            names += [(name, level) for name, level, value in window["parts"] if not (name, level) in names]
+        values : dict
+        for name, level in names:
+            values = [{part_name : value for part_name, part_level, value in window["parts"]}.get(name) for window in windows]
+            graph.add_series(levels.index(level), name, x_values, values, customdata)
+        return graph
+
+
+    def showGraph(self):
+        """Show stacked-area graph of the windows."""
+
+        self._create_graph().show()
+
+
+    def saveGraph(self, file_str : str):
+        """
+        Save stacked-area graph of the windows in file indicated as argument. Format
+        (html, png, svg or pdf) is obtained from the extension of the file.
+
+        Args:
+            file_str    : str   ; path to output file where save fig
+        """
+
+        self._create_graph().save(file_str)
@@ -0,0 +1,156 @@
+"""
+Program that measures the time spent by TopDown in each stage of the analysis.
+
+@date:      Jul 2021
+@version:   1.0
+"""
+
+import json
+import time
+from contextlib import contextmanager, nullcontext
+import os, sys, inspect
+currentdir = os.path.dirname(os.path.abspath(inspect.getfile(inspect.currentframe())))
+parentdir = os.path.dirname(currentdir)
+sys.path.insert(0, parentdir)
+from parameters.timings_params import TimingsParameters
+
+class Timings:
+    """
+    Class with the registry of spans (stages) of the execution of TopDown. Spans can be nested,
+    so each span is identified by its path (names of the spans which contain it). Registry is
+    shared by all the program and is disabled by default (spans cost nothing).
+
+    Attributes:
+        __enabled   : bool  ; True if spans are measured or False if not
+
+        __spans     : dict  ; path of the span as key and list [number of calls, seconds] as value
+                              (in order of first call)
+
+        __stack     : list  ; paths of the spans which are being measured
+    """
+
+    __enabled   : bool = False
+    __spans     : dict = dict()
+    __stack     : list = list()
+    __null_span = nullcontext()
+
+    @staticmethod
+    def enable(enabled : bool = True):
+        """
+        Enable (or disable) the measure of spans.
+
+        Args:
+            enabled : bool  ; True to measure spans or False to not measure them
+        """
+
+        Timings.__enabled = enabled
+
+
+    @staticmethod
+    def is_enabled() -> bool:
+        """
+        Check if spans are measured.
+
+        Returns:
+            True if spans are measured or False if not
+        """
+
+        return Timings.__enabled
+
+
+    @staticmethod
+    def reset():
+        """ Delete all spans measured."""
+
+        Timings.__spans = dict()
+        Timings.__stack = list()
+
+
+    @staticmethod
+    def span(name : str):
+        """
+        Get context manager which measures the time spent in its block.
+
+        Args:
+            name    : str   ; name of the span
+
+        Returns:
+            Context manager of the span
+        """
+
+        if not Timings.__enabled:
+            return Timings.__null_span
+        return Timings.__measure(name)
+
+
+    @staticmethod
+    @contextmanager
+    def __measure(name : str):
+        """ Measure the time spent in block of the span indicated as argument."""
+
+        path : str = name
+        if Timings.__stack:
+            path = Timings.__stack[-1] + TimingsParameters.C_SPAN_PATH_SEPARATOR + name
+        span : list = Timings.__spans.setdefault(path, [0, 0.0])
+        Timings.__stack.append(path)
+        start : float = time.perf_counter()
+        try:
+            yield
+        finally:
+            span[0] += 1
+            span[1] += time.perf_counter() - start
+            Timings.__stack.pop()
+
+
+    @staticmethod
+    def results() -> list:
+        """
+        Get spans measured.
+
+        Returns:
+            List of dictionaries with the path, number of calls and seconds of each span
+        """
+
+        return [{"span" : path, "calls" : span[0], "seconds" : span[1]} for path, span in Timings.__spans.items()]
+
+
+    @staticmethod
+    def report_str() -> str:
+        """
+        Get breakdown of the spans measured. Nested spans are indented below their parent
+        and their percentage is computed on the time of the root spans.
+
+        Returns:
+            String with the breakdown
+        """
+
+        total_seconds : float = sum(span[1] for path, span in Timings.__spans.items()
+            if not TimingsParameters.C_SPAN_PATH_SEPARATOR in path)
+        name_length : int = TimingsParameters.C_REPORT_NAME_MIN_LENGTH
+        rows : list = list()
+        depth : int
+        name : str
+        for path, span in Timings.__spans.items():
+            depth = path.count(TimingsParameters.C_SPAN_PATH_SEPARATOR)
+            name = TimingsParameters.C_REPORT_INDENT*depth + path.split(TimingsParameters.C_SPAN_PATH_SEPARATOR)[-1]
+            if len(name) + 2 > name_length:
+                name_length = len(name) + 2
+            rows.append((name, span[1], span[0], (span[1]/total_seconds)*100.0 if total_seconds > 0 else 0.0))
+        lines : list = [TimingsParameters.C_REPORT_TITLE,
+            TimingsParameters.C_REPORT_HEADER_FORMAT % (name_length, "Span", "Seconds", "Calls", "%")]
+        lines += [TimingsParameters.C_REPORT_LINE_FORMAT % (name_length, name, seconds, calls, percentage)
+            for name, seconds, calls, percentage in rows]
+        return "\n".join(lines)
+
+
+    @staticmethod
+    def dump(file_str : str):
+        """
+        Write spans measured in JSON file.
+
+        Args:
+            file_str    : str   ; path to JSON file
+        """
+
+        with open(file_str, "w") as f:
+            json.dump({"spans" : Timings.results()}, f, indent = 2)
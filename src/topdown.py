@@ -8,38 +8,42 @@ Program that implements the Top Down methodology over NVIDIA GPUs.
 
 import argparse
 import sys
+import os
 from errors.topdown_errors import *
 from parameters.topdown_params import TopDownParameters # parameters of program
-from measure_levels.level_one_nvprof import LevelOneNvprof
-from measure_levels.level_one_nsight import LevelOneNsight
+from measure_levels.level_execution import LevelExecution
+from measure_levels.level_factory import LevelFactory
 from measure_levels.level_two_nvprof import LevelTwoNvprof
 from measure_levels.level_two_nsight import LevelTwoNsight
 from measure_levels.level_three_nsight import LevelThreeNsight
 from measure_levels.level_three_nvprof import LevelThreeNvprof
-from measure_parts.front_end import FrontEndNsight, FrontEndNvprof
-from measure_parts.back_end import BackEndNsight, BackEndNvprof
-from measure_parts.divergence import DivergenceNsight, DivergenceNvprof
-from measure_parts.retire import RetireNsight, RetireNvprof
-from measure_parts.extra_measure import ExtraMeasureNsight, ExtraMeasureNvprof
 from measure_levels.level_three import LevelThree
+from measure_levels.level_four_nsight import LevelFourNsight
 from measure_levels.level_one import LevelOne
 from measure_levels.level_two import LevelTwo
-from measure_parts.front_decode import  FrontDecodeNsight, FrontDecodeNvprof
-from measure_parts.front_fetch import FrontFetchNsight, FrontFetchNvprof
-from measure_parts.back_core_bound import BackCoreBoundNsight, BackCoreBoundNvprof
-from measure_parts.back_memory_bound import BackMemoryBoundNsight, BackMemoryBoundNvprof
 from show_messages.message_format import MessageFormat
 from args.unique_argument import DontRepeat
-from shell.shell import Shell
-from parameters.front_end_params import FrontEndParameters
-from parameters.back_end_params import BackEndParameters
-from parameters.divergence_params import DivergenceParameters
-from parameters.retire_params import RetireParameters
-from parameters.extra_measure_params import ExtraMeasureParameters
-from parameters.front_fetch_params import FrontFetchParameters
-from parameters.front_decode_params import FrontDecodeParameters
-from parameters.back_memory_bound_params import BackMemoryBoundParameters
-from parameters.back_core_bound_params import BackCoreBoundParameters
+from profiler.profiler_backend import ProfilerBackend
+from parameters.metric_availability_params import MetricAvailabilityParameters
+from profiler.mpi_ranks import MpiRanks
+from profiler.hot_kernels import HotKernels
+from repetitions.repetitions import Repetitions
+from parameters.repetitions_params import RepetitionsParameters
+from parameters.hot_kernels_params import HotKernelsParameters
+from parameters.core_pipe_utilization_params import CorePipeUtilizationParameters
+from parameters.mpi_ranks_params import MpiRanksParameters
+from profiler.replay_profiler_backend import ReplayProfilerBackend
+from parameters.profiler_backend_params import ProfilerBackendParameters
+from export.metric_exporter import MetricExporter
+from distributions.metric_distributions import MetricDistributions
+from parameters.graph_params import GraphParameters
+from parameters.timings_params import TimingsParameters
+from timings.timings import Timings
+from timeline.timeline import Timeline
+from architecture.architecture_database import ArchitectureDatabase
+from groups.launch_groups import LaunchGroups
+from parameters.level_execution_params import LevelExecutionParameters
+from parameters.timeline_params import TimelineParameters
 
 class TopDown:
     """
@@ -78,6 +82,89 @@ class TopDown:
         __output_graph_file             : str                       ;   path to graph file or 'None' if option is not specified
 
         __output_output_scan_file       : str                       ;   path to scan file or 'None' if option is not specified
+
+        __export_file                   : str                       ;   path to export file or 'None' if option is not specified
+
+        __output_kernel_graphs_file     : str                       ;   path to template of kernel graph files or 'None' if option 
+                                                                        is not specified
+
+        __output_hierarchy_graph_file   : str                       ;   path to hierarchical graph file or 'None' if option is not specified
+
+        __hierarchy_kernels             : int                       ;   max number of kernels drawn in hierarchical graph
+
+        __hierarchy_type                : str                       ;   type of hierarchical graph
+
+        __timings_file                  : str                       ;   path to JSON file with timings, "" to only show them or 'None' 
+                                                                        if option is not specified
+
+        __timeline_file                 : str                       ;   path to timeline file or 'None' if option is not specified
+
+        __output_timeline_graph_file    : str                       ;   path to timeline graph file or 'None' if option is not specified
+
+        __timeline_windows              : int                       ;   number of windows of the timeline
+
+        __timeline_width                : float                     ;   width of each window of the timeline (% of cycles)
+
+        __nvtx_include                  : list                      ;   NVTX ranges whose kernels are profiled or 'None' if option
+                                                                        is not specified
+
+        __nvtx_exclude                  : list                      ;   NVTX ranges whose kernels are not profiled or 'None' if option
+                                                                        is not specified
+
+        __profiler_regions              : bool                      ;   True if only regions between cudaProfilerStart/Stop are
+                                                                        profiled or False if not
+
+        __profiler_region_launches      : int                       ;   number of kernels launched in each profiled region or 'None' 
+                                                                        if option is not specified
+
+        __roofline                      : bool                      ;   True if roofline of each kernel is shown or False if not
+
+        __output_roofline_graph_file    : str                       ;   path to roofline graph file or 'None' if option is not specified
+
+        __occupancy                     : bool                      ;   True if occupancy of each kernel is shown or False if not
+
+        __architecture_database_file    : str                       ;   path to architecture database or 'None' to use the one bundled 
+                                                                        with the program
+
+        __processes                     : list                      ;   PID or part of the command of the processes whose kernels are 
+                                                                        analysed or 'None' if option is not specified
+
+        __metrics_check                 : str                       ;   what is done with the measures not supported by the device
+                                                                        ('reject', 'prune' or 'off')
+
+        __mpi_launcher                  : str                       ;   command which launches the ranks of the MPI job or 'None' if 
+                                                                        option is not specified
+
+        __mpi_rank_variable             : str                       ;   environment variable with the rank of each process of the MPI job
+
+        __mpi_directory                 : str                       ;   directory where each rank of the MPI job writes its results
+
+        __adaptive_threshold            : float                     ;   min IPC degradation (%) of a part of level one to measure the
+                                                                        parts below it, or 'None' if option is not specified
+
+        __hot_kernels_share             : float                     ;   percentage of the cycles covered by the kernels measured, or
+                                                                        'None' if option is not specified
+
+        __hot_kernels                   : HotKernels                ;   kernels measured (found with a cheap pass of the scan tool), or
+                                                                        'None' if all the kernels are measured
+
+        __repeat_runs                   : int                       ;   max number of runs of the execution, or 'None' if option
+                                                                        is not specified
+
+        __repeat_tolerance              : float                     ;   max half-width (percentage points) of the confidence intervals
+                                                                        of the values to stop the runs
+
+        __repeat_devices                : list                      ;   devices where the runs are done in parallel, or 'None' if
+                                                                        option is not specified
+
+        __distributions                 : bool                      ;   True to show the distribution of each measure across the
+                                                                        launches or False if not
+
+        __replay_file                   : str                       ;   path to file with results to replay, "" to replay synthetic 
+                                                                        results or 'None' to use NVIDIA tools
+
+        __printer                       : MessageFormat             ;   printer of the report. Output file is written once,
+                                                                        at the end of the execution
     """
     
     def __init__(self):
@@ -112,6 +199,44 @@ class TopDown:
         self.__output_graph_file : str = args.output_graph_file
         self.__output_scan_file : str = args.output_scan_file
         self.__input_scan_file : str = args.input_scan_file
+        self.__export_file : str = args.export_file
+        self.__output_kernel_graphs_file : str = args.output_kernel_graphs_file
+        self.__output_hierarchy_graph_file : str = args.output_hierarchy_graph_file
+        self.__hierarchy_kernels : int = args.hierarchy_kernels
+        self.__hierarchy_type : str = args.hierarchy_type
+        self.__timings_file : str = args.timings_file
+        self.__timeline_file : str = args.timeline_file
+        self.__output_timeline_graph_file : str = args.output_timeline_graph_file
+        self.__timeline_windows : int = args.timeline_windows
+        self.__timeline_width : float = args.timeline_width
+        self.__nvtx_include : list = args.nvtx_include
+        self.__nvtx_exclude : list = args.nvtx_exclude
+        self.__profiler_regions : bool = args.profiler_regions
+        self.__profiler_region_launches : int = args.profiler_region_launches
+        self.__output_roofline_graph_file : str = args.output_roofline_graph_file
+        self.__roofline : bool = args.roofline or not self.__output_roofline_graph_file is None
+        self.__occupancy : bool = args.occupancy
+        self.__architecture_database_file : str = args.architecture_database_file
+        ArchitectureDatabase.use(self.__architecture_database_file)
+        self.__processes : list = args.processes
+        self.__metrics_check : str = args.metrics_check
+        self.__mpi_launcher : str = args.mpi_launcher
+        self.__mpi_rank_variable : str = args.mpi_rank_variable
+        self.__mpi_directory : str = args.mpi_directory
+        self.__adaptive_threshold : float = args.adaptive_threshold
+        self.__hot_kernels_share : float = args.hot_kernels_share
+        self.__hot_kernels : HotKernels = None
+        self.__repeat_runs : int = args.repeat_runs
+        self.__repeat_tolerance : float = args.repeat_tolerance
+        self.__repeat_devices : list = args.repeat_devices
+        self.__distributions : bool = args.distributions
+        Timings.enable(not self.__timings_file is None)
+        self.__replay_file : str = args.replay_file
+        if not self.__replay_file is None:
+            ProfilerBackend.use(ReplayProfilerBackend(args.replay_compute_capability, 
+                None if self.__replay_file == "" else self.__replay_file, args.replay_kernels, 
+                ProfilerBackendParameters.C_REPLAY_NUM_KERNEL_NAMES, args.replay_latency))
+        self.__printer : MessageFormat = MessageFormat(buffered = True)
         
     
     def __add_show_desc_argument(self, parser : argparse.ArgumentParser):
@@ -236,7 +361,7 @@ class TopDown:
             type = int,
             action = DontRepeat,
             nargs = 1,
-            choices = range(TopDownParameters.C_MIN_LEVEL_EXECUTION, TopDownParameters.C_MAX_LEVEL_EXECUTION + 1), # range [1,3], produces error, 
+            choices = range(TopDownParameters.C_MIN_LEVEL_EXECUTION, TopDownParameters.C_MAX_LEVEL_EXECUTION + 1), # range [1,4], produces error, 
             metavar = '[NUM]',
             dest = 'level')
         
@@ -262,199 +387,1118 @@ class TopDown:
             dest = 'file')
         
 
-    def __add_verbose_argument(self, parser : argparse.ArgumentParser):
-        """ 
-        Add verbose argument. 'C_VERBOSE_ARGUMENT_SHORT_OPTION' is the short 
-        option of argument and 'C_VERBOSE_ARGUMENT_LONG_OPTION' is the long version of argument.
+    def __add_verbose_argument(self, parser : argparse.ArgumentParser):
+        """ 
+        Add verbose argument. 'C_VERBOSE_ARGUMENT_SHORT_OPTION' is the short 
+        option of argument and 'C_VERBOSE_ARGUMENT_LONG_OPTION' is the long version of argument.
+
+        Args:
+            parser : argparse.ArgumentParser ; group of the argument.
+        """
+
+        parser.add_argument (
+            TopDownParameters.C_VERBOSE_ARGUMENT_SHORT_OPTION, 
+            TopDownParameters.C_VERBOSE_ARGUMENT_LONG_OPTION, 
+            help = TopDownParameters.C_VERBOSE_ARGUMENT_DESCRIPTION,
+            action = 'store_true',
+            dest = 'verbose')
+        
+    
+    def __add_delete_output_file_content(self, parser : argparse.ArgumentParser):
+        """ 
+        Add output's file delete content argument. 'C_DELETE_CONTENT_ARGUMENT_SHORT_OPTION' is the short 
+        option of argument and 'C_DELETE_CONTENT_ARGUMENT_LONG_OPTION' is the long version of argument.
+
+        Args:
+            parser : argparse.ArgumentParser ; group of the argument.
+        """
+
+        parser.add_argument (
+            TopDownParameters.C_DELETE_CONTENT_ARGUMENT_SHORT_OPTION, 
+            TopDownParameters.C_DELETE_CONTENT_ARGUMENT_LONG_OPTION, 
+            help = TopDownParameters.C_DELETE_CONTENT_ARGUMENT_DESCRIPTION,
+            action = 'store_true',
+            dest = 'delete_output_file_content')
+        
+
+    def __add_ouput_graph_file_argument(self, parser : argparse.ArgumentParser):
+        """ 
+        Add output graph file argument. 'C_OUTPUT_GRAPH_FILE_ARGUMENT_SHORT_OPTION' is the short option of argument
+        and 'C_OUTPUT_GRAPH_FILE_ARGUMENT_LONG_OPTION' is the long version of argument.
+
+        Args:
+            parser : argparse.ArgumentParser ; group of the argument.
+        """
+        
+        parser.add_argument (
+            TopDownParameters.C_OUTPUT_GRAPH_FILE_ARGUMENT_SHORT_OPTION, 
+            TopDownParameters.C_OUTPUT_GRAPH_FILE_ARGUMENT_LONG_OPTION, 
+            help = TopDownParameters.C_OUTPUT_GRAPH_FILE_ARGUMENT_DESCRIPTION,
+            default = None,
+            action = DontRepeat,
+            nargs = '?', 
+            type = str, 
+            #metavar='/path/to/file',
+            dest = 'output_graph_file')
+        
+
+    def __add_input_scan_file_argument(self, parser : argparse.ArgumentParser):
+        """ 
+        Add input scan file argument. 'C_INPUT_SCAN_FILE_ARGUMENT_SHORT_OPTION' is the short option of argument
+        and 'C_INPUT_SCAN_FILE_ARGUMENT_LONG_OPTION' is the long version of argument.
+
+        Args:
+            parser : argparse.ArgumentParser ; group of the argument.
+        """
+        
+        parser.add_argument (
+            TopDownParameters.C_INPUT_SCAN_FILE_ARGUMENT_SHORT_OPTION, 
+            TopDownParameters.C_INPUT_SCAN_FILE_ARGUMENT_LONG_OPTION, 
+            help = TopDownParameters.C_INPUT_SCAN_FILE_ARGUMENT_DESCRIPTION,
+            default = None,
+            action = DontRepeat,
+            nargs = '?', 
+            type = str, 
+            #metavar='/path/to/file',
+            dest = 'input_scan_file')
+        
+
+    def __add_output_scan_file_argument(self, parser : argparse.ArgumentParser):
+        """ 
+        Add output scan file argument. 'C_OUTPUT_SCAN_FILE_ARGUMENT_SHORT_OPTION' is the short option of argument
+        and 'C_OUTPUT_SCAN_FILE_ARGUMENT_LONG_OPTION' is the long version of argument.
+
+        Args:
+            parser : argparse.ArgumentParser ; group of the argument.
+        """
+        
+        parser.add_argument (
+            TopDownParameters.C_OUTPUT_SCAN_FILE_ARGUMENT_SHORT_OPTION, 
+            TopDownParameters.C_OUTPUT_SCAN_FILE_ARGUMENT_LONG_OPTION, 
+            help = TopDownParameters.C_OUTPUT_SCAN_FILE_ARGUMENT_DESCRIPTION,
+            default = None,
+            #action = DontRepeat,
+            nargs = '?', 
+            type = str, 
+            #metavar='/path/to/file',
+            dest = 'output_scan_file')
+        
+
+    def __add_export_file_argument(self, parser : argparse.ArgumentParser):
+        """ 
+        Add export file argument. 'C_EXPORT_FILE_ARGUMENT_SHORT_OPTION' is the short option of argument
+        and 'C_EXPORT_FILE_ARGUMENT_LONG_OPTION' is the long version of argument.
+
+        Args:
+            parser : argparse.ArgumentParser ; group of the argument.
+        """
+        
+        parser.add_argument (
+            TopDownParameters.C_EXPORT_FILE_ARGUMENT_SHORT_OPTION, 
+            TopDownParameters.C_EXPORT_FILE_ARGUMENT_LONG_OPTION, 
+            help = TopDownParameters.C_EXPORT_FILE_ARGUMENT_DESCRIPTION,
+            default = None,
+            action = DontRepeat,
+            nargs = '?', 
+            type = str, 
+            #metavar='/path/to/file',
+            dest = 'export_file')
+        
+
+    def __add_output_kernel_graphs_argument(self, parser : argparse.ArgumentParser):
+        """ 
+        Add output kernel graphs argument. 'C_OUTPUT_KERNEL_GRAPHS_ARGUMENT_SHORT_OPTION' is the short option of argument
+        and 'C_OUTPUT_KERNEL_GRAPHS_ARGUMENT_LONG_OPTION' is the long version of argument.
+
+        Args:
+            parser : argparse.ArgumentParser ; group of the argument.
+        """
+        
+        parser.add_argument (
+            TopDownParameters.C_OUTPUT_KERNEL_GRAPHS_ARGUMENT_SHORT_OPTION, 
+            TopDownParameters.C_OUTPUT_KERNEL_GRAPHS_ARGUMENT_LONG_OPTION, 
+            help = TopDownParameters.C_OUTPUT_KERNEL_GRAPHS_ARGUMENT_DESCRIPTION,
+            default = None,
+            action = DontRepeat,
+            nargs = '?', 
+            type = str, 
+            #metavar='/path/to/file',
+            dest = 'output_kernel_graphs_file')
+        
+
+    def __add_output_hierarchy_graph_argument(self, parser : argparse.ArgumentParser):
+        """ 
+        Add output hierarchy graph argument. 'C_OUTPUT_HIERARCHY_GRAPH_ARGUMENT_SHORT_OPTION' is the short option of argument
+        and 'C_OUTPUT_HIERARCHY_GRAPH_ARGUMENT_LONG_OPTION' is the long version of argument.
+
+        Args:
+            parser : argparse.ArgumentParser ; group of the argument.
+        """
+        
+        parser.add_argument (
+            TopDownParameters.C_OUTPUT_HIERARCHY_GRAPH_ARGUMENT_SHORT_OPTION, 
+            TopDownParameters.C_OUTPUT_HIERARCHY_GRAPH_ARGUMENT_LONG_OPTION, 
+            help = TopDownParameters.C_OUTPUT_HIERARCHY_GRAPH_ARGUMENT_DESCRIPTION,
+            default = None,
+            action = DontRepeat,
+            nargs = '?', 
+            type = str, 
+            #metavar='/path/to/file',
+            dest = 'output_hierarchy_graph_file')
+        
+
+    def __add_hierarchy_kernels_argument(self, parser : argparse.ArgumentParser):
+        """ 
+        Add hierarchy kernels argument. 'C_HIERARCHY_KERNELS_ARGUMENT_SHORT_OPTION' is the short option of argument
+        and 'C_HIERARCHY_KERNELS_ARGUMENT_LONG_OPTION' is the long version of argument.
+
+        Args:
+            parser : argparse.ArgumentParser ; group of the argument.
+        """
+        
+        parser.add_argument (
+            TopDownParameters.C_HIERARCHY_KERNELS_ARGUMENT_SHORT_OPTION, 
+            TopDownParameters.C_HIERARCHY_KERNELS_ARGUMENT_LONG_OPTION, 
+            help = TopDownParameters.C_HIERARCHY_KERNELS_ARGUMENT_DESCRIPTION,
+            default = GraphParameters.C_HIERARCHY_MAX_KERNELS_DEFAULT,
+            action = DontRepeat,
+            type = int, 
+            metavar = '[NUM]',
+            dest = 'hierarchy_kernels')
+        
+
+    def __add_hierarchy_type_argument(self, parser : argparse.ArgumentParser):
+        """ 
+        Add hierarchy type argument. 'C_HIERARCHY_TYPE_ARGUMENT_SHORT_OPTION' is the short option of argument
+        and 'C_HIERARCHY_TYPE_ARGUMENT_LONG_OPTION' is the long version of argument.
+
+        Args:
+            parser : argparse.ArgumentParser ; group of the argument.
+        """
+        
+        parser.add_argument (
+            TopDownParameters.C_HIERARCHY_TYPE_ARGUMENT_SHORT_OPTION, 
+            TopDownParameters.C_HIERARCHY_TYPE_ARGUMENT_LONG_OPTION, 
+            help = TopDownParameters.C_HIERARCHY_TYPE_ARGUMENT_DESCRIPTION,
+            default = GraphParameters.C_HIERARCHY_CHART_TYPE_DEFAULT,
+            action = DontRepeat,
+            type = str, 
+            choices = GraphParameters.C_HIERARCHY_CHART_TYPES,
+            dest = 'hierarchy_type')
+        
+
+    def __add_timings_argument(self, parser : argparse.ArgumentParser):
+        """ 
+        Add timings argument. 'C_TIMINGS_ARGUMENT_SHORT_OPTION' is the short option of argument
+        and 'C_TIMINGS_ARGUMENT_LONG_OPTION' is the long version of argument.
+
+        Args:
+            parser : argparse.ArgumentParser ; group of the argument.
+        """
+        
+        parser.add_argument (
+            TopDownParameters.C_TIMINGS_ARGUMENT_SHORT_OPTION, 
+            TopDownParameters.C_TIMINGS_ARGUMENT_LONG_OPTION, 
+            help = TopDownParameters.C_TIMINGS_ARGUMENT_DESCRIPTION,
+            default = None,
+            const = "",
+            action = DontRepeat,
+            nargs = '?', 
+            type = str, 
+            metavar = 'JSON_FILE',
+            dest = 'timings_file')
+        
+
+    def __add_timeline_arguments(self, parser : argparse.ArgumentParser):
+        """ 
+        Add timeline arguments. 'C_TIMELINE_ARGUMENT_SHORT_OPTION' is the short option of argument
+        and 'C_TIMELINE_ARGUMENT_LONG_OPTION' is the long version of argument. The rest of arguments
+        configure the timeline.
+
+        Args:
+            parser : argparse.ArgumentParser ; group of the arguments.
+        """
+        
+        parser.add_argument (
+            TopDownParameters.C_TIMELINE_ARGUMENT_SHORT_OPTION, 
+            TopDownParameters.C_TIMELINE_ARGUMENT_LONG_OPTION, 
+            help = TopDownParameters.C_TIMELINE_ARGUMENT_DESCRIPTION,
+            default = None,
+            action = DontRepeat,
+            nargs = '?', 
+            type = str, 
+            #metavar='/path/to/file',
+            dest = 'timeline_file')
+        parser.add_argument (
+            TopDownParameters.C_OUTPUT_TIMELINE_GRAPH_ARGUMENT_SHORT_OPTION, 
+            TopDownParameters.C_OUTPUT_TIMELINE_GRAPH_ARGUMENT_LONG_OPTION, 
+            help = TopDownParameters.C_OUTPUT_TIMELINE_GRAPH_ARGUMENT_DESCRIPTION,
+            default = None,
+            action = DontRepeat,
+            nargs = '?', 
+            type = str, 
+            #metavar='/path/to/file',
+            dest = 'output_timeline_graph_file')
+        parser.add_argument (
+            TopDownParameters.C_TIMELINE_WINDOWS_ARGUMENT_SHORT_OPTION, 
+            TopDownParameters.C_TIMELINE_WINDOWS_ARGUMENT_LONG_OPTION, 
+            help = TopDownParameters.C_TIMELINE_WINDOWS_ARGUMENT_DESCRIPTION,
+            default = TimelineParameters.C_NUM_WINDOWS_DEFAULT,
+            action = DontRepeat,
+            type = int, 
+            metavar = '[NUM]',
+            dest = 'timeline_windows')
+        parser.add_argument (
+            TopDownParameters.C_TIMELINE_WIDTH_ARGUMENT_SHORT_OPTION, 
+            TopDownParameters.C_TIMELINE_WIDTH_ARGUMENT_LONG_OPTION, 
+            help = TopDownParameters.C_TIMELINE_WIDTH_ARGUMENT_DESCRIPTION,
+            default = TimelineParameters.C_WINDOW_WIDTH_PERCENTAGE_DEFAULT,
+            action = DontRepeat,
+            type = float, 
+            metavar = '[PERCENTAGE]',
+            dest = 'timeline_width')
+        
+
+    def __add_nvtx_arguments(self, parser : argparse.ArgumentParser):
+        """ 
+        Add NVTX arguments. 'C_NVTX_INCLUDE_ARGUMENT_SHORT_OPTION' and 'C_NVTX_EXCLUDE_ARGUMENT_SHORT_OPTION' are 
+        the short options of arguments and 'C_NVTX_INCLUDE_ARGUMENT_LONG_OPTION' and 'C_NVTX_EXCLUDE_ARGUMENT_LONG_OPTION'
+        are the long versions of arguments.
+
+        Args:
+            parser : argparse.ArgumentParser ; group of the arguments.
+        """
+        
+        parser.add_argument (
+            TopDownParameters.C_NVTX_INCLUDE_ARGUMENT_SHORT_OPTION, 
+            TopDownParameters.C_NVTX_INCLUDE_ARGUMENT_LONG_OPTION, 
+            help = TopDownParameters.C_NVTX_INCLUDE_ARGUMENT_DESCRIPTION,
+            default = None,
+            action = DontRepeat,
+            nargs = '+', 
+            type = str, 
+            metavar = 'RANGE',
+            dest = 'nvtx_include')
+        parser.add_argument (
+            TopDownParameters.C_NVTX_EXCLUDE_ARGUMENT_SHORT_OPTION, 
+            TopDownParameters.C_NVTX_EXCLUDE_ARGUMENT_LONG_OPTION, 
+            help = TopDownParameters.C_NVTX_EXCLUDE_ARGUMENT_DESCRIPTION,
+            default = None,
+            action = DontRepeat,
+            nargs = '+', 
+            type = str, 
+            metavar = 'RANGE',
+            dest = 'nvtx_exclude')
+        
+
+    def __add_profiler_regions_arguments(self, parser : argparse.ArgumentParser):
+        """ 
+        Add profiler regions arguments. 'C_PROFILER_REGIONS_ARGUMENT_SHORT_OPTION' is the short option of argument
+        and 'C_PROFILER_REGIONS_ARGUMENT_LONG_OPTION' is the long version of argument. The rest of arguments
+        configure the regions.
+
+        Args:
+            parser : argparse.ArgumentParser ; group of the arguments.
+        """
+        
+        parser.add_argument (
+            TopDownParameters.C_PROFILER_REGIONS_ARGUMENT_SHORT_OPTION, 
+            TopDownParameters.C_PROFILER_REGIONS_ARGUMENT_LONG_OPTION, 
+            help = TopDownParameters.C_PROFILER_REGIONS_ARGUMENT_DESCRIPTION,
+            action = 'store_true',
+            dest = 'profiler_regions')
+        parser.add_argument (
+            TopDownParameters.C_PROFILER_REGION_LAUNCHES_ARGUMENT_SHORT_OPTION, 
+            TopDownParameters.C_PROFILER_REGION_LAUNCHES_ARGUMENT_LONG_OPTION, 
+            help = TopDownParameters.C_PROFILER_REGION_LAUNCHES_ARGUMENT_DESCRIPTION,
+            default = None,
+            action = DontRepeat,
+            type = int, 
+            metavar = '[NUM]',
+            dest = 'profiler_region_launches')
+        
+
+    def __add_roofline_arguments(self, parser : argparse.ArgumentParser):
+        """ 
+        Add roofline arguments. 'C_ROOFLINE_ARGUMENT_SHORT_OPTION' is the short option of argument
+        and 'C_ROOFLINE_ARGUMENT_LONG_OPTION' is the long version of argument. The rest of arguments
+        configure the output of the roofline.
+
+        Args:
+            parser : argparse.ArgumentParser ; group of the arguments.
+        """
+        
+        parser.add_argument (
+            TopDownParameters.C_ROOFLINE_ARGUMENT_SHORT_OPTION, 
+            TopDownParameters.C_ROOFLINE_ARGUMENT_LONG_OPTION, 
+            help = TopDownParameters.C_ROOFLINE_ARGUMENT_DESCRIPTION,
+            action = 'store_true',
+            dest = 'roofline')
+        parser.add_argument (
+            TopDownParameters.C_OUTPUT_ROOFLINE_GRAPH_ARGUMENT_SHORT_OPTION, 
+            TopDownParameters.C_OUTPUT_ROOFLINE_GRAPH_ARGUMENT_LONG_OPTION, 
+            help = TopDownParameters.C_OUTPUT_ROOFLINE_GRAPH_ARGUMENT_DESCRIPTION,
+            default = None,
+            action = DontRepeat,
+            nargs = '?',
+            type = str, 
+            dest = 'output_roofline_graph_file')
+        
+
+    def __add_occupancy_argument(self, parser : argparse.ArgumentParser):
+        """ 
+        Add occupancy argument. 'C_OCCUPANCY_ARGUMENT_SHORT_OPTION' is the short option of argument
+        and 'C_OCCUPANCY_ARGUMENT_LONG_OPTION' is the long version of argument.
+
+        Args:
+            parser : argparse.ArgumentParser ; group of the arguments.
+        """
+        
+        parser.add_argument (
+            TopDownParameters.C_OCCUPANCY_ARGUMENT_SHORT_OPTION, 
+            TopDownParameters.C_OCCUPANCY_ARGUMENT_LONG_OPTION, 
+            help = TopDownParameters.C_OCCUPANCY_ARGUMENT_DESCRIPTION,
+            action = 'store_true',
+            dest = 'occupancy')
+        
+
+    def __add_architecture_database_argument(self, parser : argparse.ArgumentParser):
+        """ 
+        Add architecture database argument. 'C_ARCHITECTURE_DATABASE_ARGUMENT_SHORT_OPTION' is the short option of argument
+        and 'C_ARCHITECTURE_DATABASE_ARGUMENT_LONG_OPTION' is the long version of argument.
+
+        Args:
+            parser : argparse.ArgumentParser ; group of the arguments.
+        """
+        
+        parser.add_argument (
+            TopDownParameters.C_ARCHITECTURE_DATABASE_ARGUMENT_SHORT_OPTION, 
+            TopDownParameters.C_ARCHITECTURE_DATABASE_ARGUMENT_LONG_OPTION, 
+            help = TopDownParameters.C_ARCHITECTURE_DATABASE_ARGUMENT_DESCRIPTION,
+            default = None,
+            action = DontRepeat,
+            type = str, 
+            metavar = '[JSON_FILE]',
+            dest = 'architecture_database_file')
+        
+
+    def __add_processes_argument(self, parser : argparse.ArgumentParser):
+        """ 
+        Add processes argument. 'C_PROCESSES_ARGUMENT_SHORT_OPTION' is the short option of argument
+        and 'C_PROCESSES_ARGUMENT_LONG_OPTION' is the long version of argument.
+
+        Args:
+            parser : argparse.ArgumentParser ; group of the arguments.
+        """
+        
+        parser.add_argument (
+            TopDownParameters.C_PROCESSES_ARGUMENT_SHORT_OPTION, 
+            TopDownParameters.C_PROCESSES_ARGUMENT_LONG_OPTION, 
+            help = TopDownParameters.C_PROCESSES_ARGUMENT_DESCRIPTION,
+            default = None,
+            action = DontRepeat,
+            nargs = '+', 
+            type = str, 
+            metavar = 'PROCESS',
+            dest = 'processes')
+        
+
+    def __add_metrics_check_argument(self, parser : argparse.ArgumentParser):
+        """ 
+        Add metrics check argument. 'C_METRICS_CHECK_ARGUMENT_SHORT_OPTION' is the short option of argument
+        and 'C_METRICS_CHECK_ARGUMENT_LONG_OPTION' is the long version of argument.
+
+        Args:
+            parser : argparse.ArgumentParser ; group of the arguments.
+        """
+        
+        parser.add_argument (
+            TopDownParameters.C_METRICS_CHECK_ARGUMENT_SHORT_OPTION, 
+            TopDownParameters.C_METRICS_CHECK_ARGUMENT_LONG_OPTION, 
+            help = TopDownParameters.C_METRICS_CHECK_ARGUMENT_DESCRIPTION,
+            default = MetricAvailabilityParameters.C_CHECK_MODE_DEFAULT,
+            action = DontRepeat,
+            type = str, 
+            choices = MetricAvailabilityParameters.C_CHECK_MODES,
+            dest = 'metrics_check')
+        
+
+    def __add_mpi_arguments(self, parser : argparse.ArgumentParser):
+        """ 
+        Add MPI arguments. 'C_MPI_ARGUMENT_SHORT_OPTION' is the short option of argument
+        and 'C_MPI_ARGUMENT_LONG_OPTION' is the long version of argument. The rest of arguments
+        configure the ranks.
+
+        Args:
+            parser : argparse.ArgumentParser ; group of the arguments.
+        """
+        
+        parser.add_argument (
+            TopDownParameters.C_MPI_ARGUMENT_SHORT_OPTION, 
+            TopDownParameters.C_MPI_ARGUMENT_LONG_OPTION, 
+            help = TopDownParameters.C_MPI_ARGUMENT_DESCRIPTION,
+            default = None,
+            action = DontRepeat,
+            type = str, 
+            metavar = 'LAUNCHER',
+            dest = 'mpi_launcher')
+        parser.add_argument (
+            TopDownParameters.C_MPI_RANK_VARIABLE_ARGUMENT_SHORT_OPTION, 
+            TopDownParameters.C_MPI_RANK_VARIABLE_ARGUMENT_LONG_OPTION, 
+            help = TopDownParameters.C_MPI_RANK_VARIABLE_ARGUMENT_DESCRIPTION,
+            default = MpiRanksParameters.C_RANK_VARIABLE_DEFAULT,
+            action = DontRepeat,
+            type = str, 
+            metavar = 'VARIABLE',
+            dest = 'mpi_rank_variable')
+        parser.add_argument (
+            TopDownParameters.C_MPI_DIRECTORY_ARGUMENT_SHORT_OPTION, 
+            TopDownParameters.C_MPI_DIRECTORY_ARGUMENT_LONG_OPTION, 
+            help = TopDownParameters.C_MPI_DIRECTORY_ARGUMENT_DESCRIPTION,
+            default = MpiRanksParameters.C_DIRECTORY_DEFAULT,
+            action = DontRepeat,
+            type = str, 
+            metavar = 'DIRECTORY',
+            dest = 'mpi_directory')
+        
+
+    def __add_adaptive_argument(self, parser : argparse.ArgumentParser):
+        """ 
+        Add adaptive argument. 'C_ADAPTIVE_ARGUMENT_SHORT_OPTION' is the short option of argument
+        and 'C_ADAPTIVE_ARGUMENT_LONG_OPTION' is the long version of argument.
+
+        Args:
+            parser : argparse.ArgumentParser ; group of the arguments.
+        """
+        
+        parser.add_argument (
+            TopDownParameters.C_ADAPTIVE_ARGUMENT_SHORT_OPTION, 
+            TopDownParameters.C_ADAPTIVE_ARGUMENT_LONG_OPTION, 
+            help = TopDownParameters.C_ADAPTIVE_ARGUMENT_DESCRIPTION,
+            default = None,
+            const = TopDownParameters.C_ADAPTIVE_THRESHOLD_DEFAULT,
+            action = DontRepeat,
+            nargs = '?', 
+            type = float, 
+            metavar = 'THRESHOLD',
+            dest = 'adaptive_threshold')
+        
+
+    def __add_hot_kernels_argument(self, parser : argparse.ArgumentParser):
+        """ 
+        Add hot-kernels argument. 'C_HOT_KERNELS_ARGUMENT_SHORT_OPTION' is the short option of argument
+        and 'C_HOT_KERNELS_ARGUMENT_LONG_OPTION' is the long version of argument.
+
+        Args:
+            parser : argparse.ArgumentParser ; group of the arguments.
+        """
+        
+        parser.add_argument (
+            TopDownParameters.C_HOT_KERNELS_ARGUMENT_SHORT_OPTION, 
+            TopDownParameters.C_HOT_KERNELS_ARGUMENT_LONG_OPTION, 
+            help = TopDownParameters.C_HOT_KERNELS_ARGUMENT_DESCRIPTION,
+            default = None,
+            const = HotKernelsParameters.C_SHARE_DEFAULT,
+            action = DontRepeat,
+            nargs = '?', 
+            type = float, 
+            metavar = 'SHARE',
+            dest = 'hot_kernels_share')
+        
+
+    def __add_repeat_arguments(self, parser : argparse.ArgumentParser):
+        """ 
+        Add repeat arguments. 'C_REPEAT_ARGUMENT_SHORT_OPTION' is the short option of argument
+        and 'C_REPEAT_ARGUMENT_LONG_OPTION' is the long version of argument. The rest of arguments
+        configure the runs.
+
+        Args:
+            parser : argparse.ArgumentParser ; group of the arguments.
+        """
+        
+        parser.add_argument (
+            TopDownParameters.C_REPEAT_ARGUMENT_SHORT_OPTION, 
+            TopDownParameters.C_REPEAT_ARGUMENT_LONG_OPTION, 
+            help = TopDownParameters.C_REPEAT_ARGUMENT_DESCRIPTION,
+            default = None,
+            action = DontRepeat,
+            type = int, 
+            metavar = 'NUM',
+            dest = 'repeat_runs')
+        parser.add_argument (
+            TopDownParameters.C_REPEAT_TOLERANCE_ARGUMENT_SHORT_OPTION, 
+            TopDownParameters.C_REPEAT_TOLERANCE_ARGUMENT_LONG_OPTION, 
+            help = TopDownParameters.C_REPEAT_TOLERANCE_ARGUMENT_DESCRIPTION,
+            default = RepetitionsParameters.C_TOLERANCE_DEFAULT,
+            action = DontRepeat,
+            type = float, 
+            metavar = 'TOLERANCE',
+            dest = 'repeat_tolerance')
+        parser.add_argument (
+            TopDownParameters.C_REPEAT_DEVICES_ARGUMENT_SHORT_OPTION, 
+            TopDownParameters.C_REPEAT_DEVICES_ARGUMENT_LONG_OPTION, 
+            help = TopDownParameters.C_REPEAT_DEVICES_ARGUMENT_DESCRIPTION,
+            default = None,
+            action = DontRepeat,
+            nargs = '+', 
+            type = str, 
+            metavar = 'DEVICE',
+            dest = 'repeat_devices')
+        
+
+    def __add_distributions_argument(self, parser : argparse.ArgumentParser):
+        """ 
+        Add distributions argument. 'C_DISTRIBUTIONS_ARGUMENT_SHORT_OPTION' is the short option of argument
+        and 'C_DISTRIBUTIONS_ARGUMENT_LONG_OPTION' is the long version of argument.
+
+        Args:
+            parser : argparse.ArgumentParser ; group of the arguments.
+        """
+        
+        parser.add_argument (
+            TopDownParameters.C_DISTRIBUTIONS_ARGUMENT_SHORT_OPTION, 
+            TopDownParameters.C_DISTRIBUTIONS_ARGUMENT_LONG_OPTION, 
+            help = TopDownParameters.C_DISTRIBUTIONS_ARGUMENT_DESCRIPTION,
+            action = 'store_true',
+            dest = 'distributions')
+        
+
+    def __add_replay_arguments(self, parser : argparse.ArgumentParser):
+        """ 
+        Add replay arguments. 'C_REPLAY_ARGUMENT_SHORT_OPTION' is the short option of argument
+        and 'C_REPLAY_ARGUMENT_LONG_OPTION' is the long version of argument. The rest of arguments
+        configure the replay.
+
+        Args:
+            parser : argparse.ArgumentParser ; group of the arguments.
+        """
+        
+        parser.add_argument (
+            TopDownParameters.C_REPLAY_ARGUMENT_SHORT_OPTION, 
+            TopDownParameters.C_REPLAY_ARGUMENT_LONG_OPTION, 
+            help = TopDownParameters.C_REPLAY_ARGUMENT_DESCRIPTION,
+            default = None,
+            const = "",
+            action = DontRepeat,
+            nargs = '?', 
+            type = str, 
+            metavar = 'SCAN_FILE',
+            dest = 'replay_file')
+        parser.add_argument (
+            TopDownParameters.C_REPLAY_COMPUTE_CAPABILITY_ARGUMENT_SHORT_OPTION, 
+            TopDownParameters.C_REPLAY_COMPUTE_CAPABILITY_ARGUMENT_LONG_OPTION, 
+            help = TopDownParameters.C_REPLAY_COMPUTE_CAPABILITY_ARGUMENT_DESCRIPTION,
+            default = ProfilerBackendParameters.C_REPLAY_COMPUTE_CAPABILITY,
+            action = DontRepeat,
+            type = float, 
+            metavar = '[CC]',
+            dest = 'replay_compute_capability')
+        parser.add_argument (
+            TopDownParameters.C_REPLAY_KERNELS_ARGUMENT_SHORT_OPTION, 
+            TopDownParameters.C_REPLAY_KERNELS_ARGUMENT_LONG_OPTION, 
+            help = TopDownParameters.C_REPLAY_KERNELS_ARGUMENT_DESCRIPTION,
+            default = ProfilerBackendParameters.C_REPLAY_NUM_KERNELS,
+            action = DontRepeat,
+            type = int, 
+            metavar = '[NUM]',
+            dest = 'replay_kernels')
+        parser.add_argument (
+            TopDownParameters.C_REPLAY_LATENCY_ARGUMENT_SHORT_OPTION, 
+            TopDownParameters.C_REPLAY_LATENCY_ARGUMENT_LONG_OPTION, 
+            help = TopDownParameters.C_REPLAY_LATENCY_ARGUMENT_DESCRIPTION,
+            default = ProfilerBackendParameters.C_REPLAY_LATENCY_SECONDS,
+            action = DontRepeat,
+            type = float, 
+            metavar = '[SECONDS]',
+            dest = 'replay_latency')
+        
+
+    def __add_arguments(self, parser : argparse.ArgumentParser):
+        """ 
+        Add arguments of the pogram.
+
+        Args:
+            parser : argparse.ArgumentParser ; group of the arguments.
+        """
+
+        # Create group for required arguments
+        requiredGroup : argparse._ArgumentGroup = parser.add_argument_group("Required arguments")
+
+        self.__add_program_argument(parser)
+        self.__add_level_argument(requiredGroup)
+        self.__add_ouput_file_argument(parser)
+        self.__add_verbose_argument(parser)
+        self.__add_delete_output_file_content(parser)
+        self.__add_show_desc_argument(parser)
+        self.__add_metrics_argument(parser)
+        self.__add_events_argument(parser)
+        self.__add_all_measures_argument(parser)
+        self.__add_show_graph_argument(parser)
+        self.__add_ouput_graph_file_argument(parser)
+        self.__add_output_scan_file_argument(parser)
+        self.__add_input_scan_file_argument(parser)
+        self.__add_export_file_argument(parser)
+        self.__add_output_kernel_graphs_argument(parser)
+        self.__add_output_hierarchy_graph_argument(parser)
+        self.__add_hierarchy_kernels_argument(parser)
+        self.__add_hierarchy_type_argument(parser)
+        self.__add_timings_argument(parser)
+        self.__add_timeline_arguments(parser)
+        self.__add_nvtx_arguments(parser)
+        self.__add_profiler_regions_arguments(parser)
+        self.__add_roofline_arguments(parser)
+        self.__add_occupancy_argument(parser)
+        self.__add_architecture_database_argument(parser)
+        self.__add_processes_argument(parser)
+        self.__add_metrics_check_argument(parser)
+        self.__add_mpi_arguments(parser)
+        self.__add_adaptive_argument(parser)
+        self.__add_hot_kernels_argument(parser)
+        self.__add_repeat_arguments(parser)
+        self.__add_distributions_argument(parser)
+        self.__add_replay_arguments(parser)
+        
+
+    def program(self) -> str:
+        """
+        Returns path to runnable program.
+
+        Returns:
+            str with path to program to be executed
+        """
+
+        return self.__program
+        
+    
+    def level(self) -> int:
+        """ 
+        Find the TopDown run level.
+
+        Returns:
+            the level of the execution.
+        """ 
+
+        return self.__level
+        
+
+    def output_file(self) -> str:
+        """
+        Find path to output file.
+
+        Returns:
+            path to file to write, or None if 
+            option '-o' or '--output' has not been indicated
+        """
+
+        return self.__output_file # descriptor to file or None
+        
+
+    def output_graph_file(self) -> str:
+        """
+        Find path to output graph file.
+
+        Returns:
+            path to graph file to write, or None if 
+            option '-o' or '--output' has not been indicated
+        """
+
+        return self.__output_graph_file # descriptor to file or None
+        
+
+    def output_scan_file(self) -> str:
+        """
+        Find path to output scan file.
+
+        Returns:
+            path to scan file to write, or None if 
+            option '-o' or '--output' has not been indicated
+        """
+
+        return self.__output_scan_file # descriptor to file or None
+        
+    
+    def input_scan_file(self) -> str:
+        """
+        Find path to input scan file.
+
+        Returns:
+            path to scan file to write, or None if 
+            option '-is' or '--input-scan' has not been indicated
+        """
+
+        return self.__input_scan_file # descriptor to file or None
+        
+    
+    def export_file(self) -> str:
+        """
+        Find path to export file.
+
+        Returns:
+            path to export file to write, or None if 
+            option '-ex' or '--export' has not been indicated
+        """
+
+        return self.__export_file # descriptor to file or None
+        
+
+    def output_kernel_graphs_file(self) -> str:
+        """
+        Find path to template of kernel graph files.
+
+        Returns:
+            path to template of kernel graph files, or None if 
+            option '-okg' or '--output-kernel-graphs' has not been indicated
+        """
+
+        return self.__output_kernel_graphs_file # descriptor to file or None
+        
+
+    def output_hierarchy_graph_file(self) -> str:
+        """
+        Find path to hierarchical graph file.
+
+        Returns:
+            path to hierarchical graph file, or None if 
+            option '-ohg' or '--output-hierarchy-graph' has not been indicated
+        """
+
+        return self.__output_hierarchy_graph_file # descriptor to file or None
+        
+
+    def hierarchy_kernels(self) -> int:
+        """
+        Returns max number of kernels drawn in hierarchical graph.
+
+        Returns:
+            Integer with the max number of kernels, or 0 to draw the whole execution
+        """
+
+        return self.__hierarchy_kernels
+        
+
+    def hierarchy_type(self) -> str:
+        """
+        Returns type of hierarchical graph.
+
+        Returns:
+            String with the type of graph ('sunburst' or 'treemap')
+        """
+
+        return self.__hierarchy_type
+        
+
+    def timings_file(self) -> str:
+        """
+        Find path to JSON file with timings.
+
+        Returns:
+            path to JSON file with timings, "" if timings are only shown or None if 
+            option '-ti' or '--timings' has not been indicated
+        """
+
+        return self.__timings_file # descriptor to file or None
+        
+    
+    def timeline_file(self) -> str:
+        """
+        Find path to timeline file.
+
+        Returns:
+            path to timeline file, or None if 
+            option '-tl' or '--timeline' has not been indicated
+        """
+
+        return self.__timeline_file # descriptor to file or None
+        
+
+    def output_timeline_graph_file(self) -> str:
+        """
+        Find path to timeline graph file.
+
+        Returns:
+            path to timeline graph file, or None if 
+            option '-otg' or '--output-timeline-graph' has not been indicated
+        """
+
+        return self.__output_timeline_graph_file # descriptor to file or None
+        
+
+    def timeline_windows(self) -> int:
+        """
+        Returns number of windows of the timeline.
+
+        Returns:
+            Integer with the number of windows
+        """
+
+        return self.__timeline_windows
+        
+
+    def timeline_width(self) -> float:
+        """
+        Returns width of each window of the timeline.
+
+        Returns:
+            Float with the width (% of the cycles of the execution)
+        """
+
+        return self.__timeline_width
+        
+
+    def nvtx_include(self) -> list:
+        """
+        Returns NVTX ranges whose kernels are profiled.
+
+        Returns:
+            List with the NVTX ranges (ncu's syntax), or None if 
+            option '-nvi' or '--nvtx-include' has not been indicated
+        """
+
+        return self.__nvtx_include
+        
+
+    def nvtx_exclude(self) -> list:
+        """
+        Returns NVTX ranges whose kernels are not profiled.
+
+        Returns:
+            List with the NVTX ranges (ncu's syntax), or None if 
+            option '-nve' or '--nvtx-exclude' has not been indicated
+        """
+
+        return self.__nvtx_exclude
+        
+
+    def profiler_regions(self) -> bool:
+        """
+        Check if only regions between cudaProfilerStart() and cudaProfilerStop() are profiled.
+
+        Returns:
+            Boolean with True if only regions are profiled or False if not
+        """
+
+        return self.__profiler_regions
+        
+
+    def profiler_region_launches(self) -> int:
+        """
+        Returns number of kernels launched in each profiled region.
+
+        Returns:
+            Integer with the number of kernels, or None if 
+            option '-prl' or '--profiler-region-launches' has not been indicated
+        """
+
+        return self.__profiler_region_launches
+        
+
+    def roofline(self) -> bool:
+        """
+        Check if roofline of each kernel has to be shown.
+
+        Returns:
+            Boolean with True if roofline has to be shown or False if not
+        """
+
+        return self.__roofline
+        
+
+    def output_roofline_graph_file(self) -> str:
+        """
+        Find path to roofline graph file.
+
+        Returns:
+            path to roofline graph file, or None if 
+            option '-org' or '--output-roofline-graph' has not been indicated
+        """
+
+        return self.__output_roofline_graph_file # descriptor to file or None
+        
+
+    def occupancy(self) -> bool:
+        """
+        Check if launch configuration and occupancy of each kernel have to be shown.
+
+        Returns:
+            Boolean with True if occupancy has to be shown or False if not
+        """
+
+        return self.__occupancy
+        
+
+    def architecture_database_file(self) -> str:
+        """
+        Find path to architecture database.
+
+        Returns:
+            path to architecture database, or None if 
+            option '-adb' or '--architecture-database' has not been indicated
+        """
+
+        return self.__architecture_database_file
+        
+
+    def processes(self) -> list:
+        """
+        Find processes whose kernels are analysed.
 
-        Args:
-            parser : argparse.ArgumentParser ; group of the argument.
+        Returns:
+            List with the PID or part of the command of each process, or None if 
+            option '-ps' or '--processes' has not been indicated
         """
 
-        parser.add_argument (
-            TopDownParameters.C_VERBOSE_ARGUMENT_SHORT_OPTION, 
-            TopDownParameters.C_VERBOSE_ARGUMENT_LONG_OPTION, 
-            help = TopDownParameters.C_VERBOSE_ARGUMENT_DESCRIPTION,
-            action = 'store_true',
-            dest = 'verbose')
+        return self.__processes
         
-    
-    def __add_delete_output_file_content(self, parser : argparse.ArgumentParser):
-        """ 
-        Add output's file delete content argument. 'C_DELETE_CONTENT_ARGUMENT_SHORT_OPTION' is the short 
-        option of argument and 'C_DELETE_CONTENT_ARGUMENT_LONG_OPTION' is the long version of argument.
 
-        Args:
-            parser : argparse.ArgumentParser ; group of the argument.
+    def metrics_check(self) -> str:
         """
+        Find what is done with the measures not supported by the device.
 
-        parser.add_argument (
-            TopDownParameters.C_DELETE_CONTENT_ARGUMENT_SHORT_OPTION, 
-            TopDownParameters.C_DELETE_CONTENT_ARGUMENT_LONG_OPTION, 
-            help = TopDownParameters.C_DELETE_CONTENT_ARGUMENT_DESCRIPTION,
-            action = 'store_true',
-            dest = 'delete_output_file_content')
+        Returns:
+            'reject', 'prune' or 'off' (option '-mc' or '--metrics-check')
+        """
+
+        return self.__metrics_check
         
 
-    def __add_ouput_graph_file_argument(self, parser : argparse.ArgumentParser):
-        """ 
-        Add output graph file argument. 'C_OUTPUT_GRAPH_FILE_ARGUMENT_SHORT_OPTION' is the short option of argument
-        and 'C_OUTPUT_GRAPH_FILE_ARGUMENT_LONG_OPTION' is the long version of argument.
+    def mpi_launcher(self) -> str:
+        """
+        Find command which launches the ranks of the MPI job.
 
-        Args:
-            parser : argparse.ArgumentParser ; group of the argument.
+        Returns:
+            String with the command, or None if 
+            option '-mpi' or '--mpi' has not been indicated
         """
-        
-        parser.add_argument (
-            TopDownParameters.C_OUTPUT_GRAPH_FILE_ARGUMENT_SHORT_OPTION, 
-            TopDownParameters.C_OUTPUT_GRAPH_FILE_ARGUMENT_LONG_OPTION, 
-            help = TopDownParameters.C_OUTPUT_GRAPH_FILE_ARGUMENT_DESCRIPTION,
-            default = None,
-            action = DontRepeat,
-            nargs = '?', 
-            type = str, 
-            #metavar='/path/to/file',
-            dest = 'output_graph_file')
+
+        return self.__mpi_launcher
         
 
-    def __add_input_scan_file_argument(self, parser : argparse.ArgumentParser):
-        """ 
-        Add input scan file argument. 'C_INPUT_SCAN_FILE_ARGUMENT_SHORT_OPTION' is the short option of argument
-        and 'C_INPUT_SCAN_FILE_ARGUMENT_LONG_OPTION' is the long version of argument.
+    def mpi_rank_variable(self) -> str:
+        """
+        Find environment variable with the rank of each process of the MPI job.
 
-        Args:
-            parser : argparse.ArgumentParser ; group of the argument.
+        Returns:
+            String with the name of the variable (option '-mpv' or '--mpi-rank-variable')
         """
-        
-        parser.add_argument (
-            TopDownParameters.C_INPUT_SCAN_FILE_ARGUMENT_SHORT_OPTION, 
-            TopDownParameters.C_INPUT_SCAN_FILE_ARGUMENT_LONG_OPTION, 
-            help = TopDownParameters.C_INPUT_SCAN_FILE_ARGUMENT_DESCRIPTION,
-            default = None,
-            action = DontRepeat,
-            nargs = '?', 
-            type = str, 
-            #metavar='/path/to/file',
-            dest = 'input_scan_file')
+
+        return self.__mpi_rank_variable
         
 
-    def __add_output_scan_file_argument(self, parser : argparse.ArgumentParser):
-        """ 
-        Add output scan file argument. 'C_OUTPUT_SCAN_FILE_ARGUMENT_SHORT_OPTION' is the short option of argument
-        and 'C_OUTPUT_SCAN_FILE_ARGUMENT_LONG_OPTION' is the long version of argument.
+    def mpi_directory(self) -> str:
+        """
+        Find directory where each rank of the MPI job writes its results.
 
-        Args:
-            parser : argparse.ArgumentParser ; group of the argument.
+        Returns:
+            Path to directory (option '-mpd' or '--mpi-directory')
         """
-        
-        parser.add_argument (
-            TopDownParameters.C_OUTPUT_SCAN_FILE_ARGUMENT_SHORT_OPTION, 
-            TopDownParameters.C_OUTPUT_SCAN_FILE_ARGUMENT_LONG_OPTION, 
-            help = TopDownParameters.C_OUTPUT_SCAN_FILE_ARGUMENT_DESCRIPTION,
-            default = None,
-            #action = DontRepeat,
-            nargs = '?', 
-            type = str, 
-            #metavar='/path/to/file',
-            dest = 'output_scan_file')
+
+        return self.__mpi_directory
         
 
-    def __add_arguments(self, parser : argparse.ArgumentParser):
-        """ 
-        Add arguments of the pogram.
+    def adaptive_threshold(self) -> float:
+        """
+        Find min IPC degradation of a part of level one to measure the parts below it.
 
-        Args:
-            parser : argparse.ArgumentParser ; group of the arguments.
+        Returns:
+            Float with the percentage, or None if 
+            option '-ad' or '--adaptive' has not been indicated
         """
 
-        # Create group for required arguments
-        requiredGroup : argparse._ArgumentGroup = parser.add_argument_group("Required arguments")
+        return self.__adaptive_threshold
+        
 
-        self.__add_program_argument(parser)
-        self.__add_level_argument(requiredGroup)
-        self.__add_ouput_file_argument(parser)
-        self.__add_verbose_argument(parser)
-        self.__add_delete_output_file_content(parser)
-        self.__add_show_desc_argument(parser)
-        self.__add_metrics_argument(parser)
-        self.__add_events_argument(parser)
-        self.__add_all_measures_argument(parser)
-        self.__add_show_graph_argument(parser)
-        self.__add_ouput_graph_file_argument(parser)
-        self.__add_output_scan_file_argument(parser)
-        self.__add_input_scan_file_argument(parser)
+    def hot_kernels_share(self) -> float:
+        """
+        Find percentage of the cycles of the execution covered by the kernels measured.
+
+        Returns:
+            Float with the percentage, or None if 
+            option '-hot' or '--hot-kernels' has not been indicated
+        """
+
+        return self.__hot_kernels_share
         
 
-    def program(self) -> str:
+    def repeat_runs(self) -> int:
         """
-        Returns path to runnable program.
+        Find max number of runs of the execution.
 
         Returns:
-            str with path to program to be executed
+            Integer with the number of runs, or None if 
+            option '-rep' or '--repeat' has not been indicated
         """
 
-        return self.__program
+        return self.__repeat_runs
         
-    
-    def level(self) -> int:
-        """ 
-        Find the TopDown run level.
+
+    def repeat_tolerance(self) -> float:
+        """
+        Find max half-width of the confidence intervals of the values to stop the runs.
 
         Returns:
-            the level of the execution.
-        """ 
+            Float with the percentage points
+        """
 
-        return self.__level
+        return self.__repeat_tolerance
         
 
-    def output_file(self) -> str:
+    def repeat_devices(self) -> list:
         """
-        Find path to output file.
+        Find devices where the runs are done in parallel.
 
         Returns:
-            path to file to write, or None if 
-            option '-o' or '--output' has not been indicated
+            List with the devices, or None if 
+            option '-repd' or '--repeat-devices' has not been indicated
         """
 
-        return self.__output_file # descriptor to file or None
+        return self.__repeat_devices
         
 
-    def output_graph_file(self) -> str:
+    def distributions(self) -> bool:
         """
-        Find path to output graph file.
+        Check if the distribution of each measure across the launches has to be shown.
 
         Returns:
-            path to graph file to write, or None if 
-            option '-o' or '--output' has not been indicated
+            Boolean with True if option '-dis' or '--distributions' has been indicated, or False if not
         """
 
-        return self.__output_graph_file # descriptor to file or None
+        return self.__distributions
         
 
-    def output_scan_file(self) -> str:
+    def __mpi_ranks(self) -> MpiRanks:
         """
-        Find path to output scan file.
+        Get ranks of the MPI job: launched with '-mpi', or already recorded in the directory of '-is'.
 
         Returns:
-            path to scan file to write, or None if 
-            option '-o' or '--output' has not been indicated
+            Reference to MpiRanks, or 'None' if the program is not an MPI job
         """
 
-        return self.__output_scan_file # descriptor to file or None
+        if not self.input_file() is None and os.path.isdir(self.input_file()):
+            return MpiRanks(None, self.mpi_rank_variable(), self.input_file())
+        if self.mpi_launcher() is None or not self.input_file() is None:
+            return None
+        return MpiRanks(self.mpi_launcher(), self.mpi_rank_variable(), self.mpi_directory())
         
-    
-    def input_scan_file(self) -> str:
+
+    def __nvtx_profiler_options(self) -> list:
         """
-        Find path to input scan file.
+        Get options of ncu which filter the kernels profiled by NVTX range.
 
         Returns:
-            path to scan file to write, or None if 
-            option '-is' or '--input-scan' has not been indicated
+            List with the options, or empty list if no NVTX filter has been indicated
         """
 
-        return self.__input_scan_file # descriptor to file or None
+        options : list = list()
+        nvtx_range : str
+        for nvtx_range in (self.nvtx_include() or list()):
+            options += [TopDownParameters.C_NVTX_INCLUDE_PROFILER_OPTION, nvtx_range]
+        for nvtx_range in (self.nvtx_exclude() or list()):
+            options += [TopDownParameters.C_NVTX_EXCLUDE_PROFILER_OPTION, nvtx_range]
+        if options:
+            options.insert(0, TopDownParameters.C_NVTX_PROFILER_OPTION)
+        return options
         
-    
+
     def show_verbose(self) -> bool:
         """
         Check if program has to show verbose.
@@ -550,7 +1594,7 @@ class TopDown:
     def __intro_message(self): 
         """ Intro message with information."""
 
-        printer : MessageFormat = MessageFormat()
+        printer : MessageFormat = self.__printer
         message : str = "TopDown Metholodgy over NVIDIA's GPUs"
         #printer.print_center_msg_box(msg = "TopDown Metholodgy over NVIDIA's GPUs", indent = 1, title = "", output_file = self.output_file(), 
         #        width = None, delete_content_file = self.delete_output_file_content())
@@ -573,7 +1617,31 @@ class TopDown:
                    "- Output Graph File:                " + str(self.output_graph_file()) + "\n" + 
                    "- Show Graph:                       " + str(self.show_graph()) + "\n" +
                    "- Input Scan File:                  " + str(self.input_scan_file()) + "\n" + 
-                   "- Output Scan File:                 " + str(self.output_scan_file()))
+                   "- Output Scan File:                 " + str(self.output_scan_file()) + "\n" +
+                   "- Export File:                      " + str(self.export_file()) + "\n" +
+                   "- Output Kernel Graphs File:        " + str(self.output_kernel_graphs_file()) + "\n" +
+                   "- Output Hierarchy Graph File:      " + str(self.output_hierarchy_graph_file()) + "\n" +
+                   "- Timeline File:                    " + str(self.timeline_file()) + "\n" +
+                   "- Output Timeline Graph File:       " + str(self.output_timeline_graph_file()) + "\n" +
+                   "- NVTX Include:                     " + str(self.nvtx_include()) + "\n" +
+                   "- NVTX Exclude:                     " + str(self.nvtx_exclude()) + "\n" +
+                   "- Profiler Regions:                 " + str(self.profiler_regions()) + "\n" +
+                   "- Launches per Profiler Region:     " + str(self.profiler_region_launches()) + "\n" +
+                   "- Roofline:                         " + str(self.roofline()) + "\n" +
+                   "- Output Roofline Graph File:       " + str(self.output_roofline_graph_file()) + "\n" +
+                   "- Occupancy:                        " + str(self.occupancy()) + "\n" +
+                   "- Architecture Database:            " + ArchitectureDatabase.file() + "\n" +
+                   "- Processes:                        " + str(self.processes()) + "\n" +
+                   "- Metrics Check:                    " + self.metrics_check() + "\n" +
+                   "- MPI Launcher:                     " + str(self.mpi_launcher()) + "\n" +
+                   "- MPI Directory:                    " + self.mpi_directory() + "\n" +
+                   "- Adaptive Threshold:               " + str(self.adaptive_threshold()) + "\n" +
+                   "- Hot Kernels Share:                " + str(self.hot_kernels_share()) + "\n" +
+                   "- Repeat Runs:                      " + str(self.repeat_runs()) + "\n" +
+                   "- Repeat Tolerance:                 " + str(self.repeat_tolerance()) + "\n" +
+                   "- Repeat Devices:                   " + str(self.repeat_devices()) + "\n" +
+                   "- Distributions:                    " + str(self.distributions()) + "\n" +
+                   "- Replay File:                      " + str(self.__replay_file))
         execute_with_nvprof : bool = self.__is_nvprof_mode()
         show_events : bool = self.show_events()
         show_events_with_nsight : str = "\n"
@@ -616,36 +1684,44 @@ class TopDown:
         ipc_retire_message], [ipc_degradation_front_message, ipc_degradation_back_message, " ", " "]]
         titles : list[str] = [level_execution.front_end().name(), level_execution.back_end().name(),
             level_execution.divergence().name(),level_execution.retire().name()]
-        MessageFormat().print_four_msg_box(messages, titles, 1, self.output_file(), False)
+        self.__printer.print_four_msg_box(messages, titles, 1, self.output_file(), False)
+        
+
+    def __percentage_str(self, value : float) -> str:
+        """ Get percentage rounded as string, or not measured mark if it's 'None' (part skipped by '-ad')."""
+
+        if value is None:
+            return TopDownParameters.C_NOT_MEASURED_VALUE
+        return str(round(value, TopDownParameters.C_MAX_NUM_RESULTS_DECIMALS)) + '%'
         
 
     def __show_level_two_results(self, level_execution : LevelTwo):
         """Show results of level two."""
 
         stalls_front_decode_on_total_message : str = ("{:<20} {:<6}".format('STALLS, on the total (%): ', 
-            str(round(level_execution.front_decode_stall(), TopDownParameters.C_MAX_NUM_RESULTS_DECIMALS)) + '%'))
+            self.__percentage_str(level_execution.front_decode_stall())))
         stalls_front_fetch_on_total_message : str = ("{:<20} {:<6}".format('STALLS, on the total (%): ', 
-            str(round(level_execution.front_fetch_stall(), TopDownParameters.C_MAX_NUM_RESULTS_DECIMALS)) + '%'))
+            self.__percentage_str(level_execution.front_fetch_stall())))
         stalls_back_core_bound_on_total_message : str = ("{:<20} {:<6}".format('STALLS, on the total (%): ', 
-            str(round(level_execution.back_core_bound_stall(), TopDownParameters.C_MAX_NUM_RESULTS_DECIMALS)) + '%'))
+            self.__percentage_str(level_execution.back_core_bound_stall())))
         stalls_back_memory_bound_on_total_message : str = ("{:<20} {:<6}".format('STALLS, on the total (%): ', 
-            str(round(level_execution.back_memory_bound_stall(), TopDownParameters.C_MAX_NUM_RESULTS_DECIMALS)) + '%'))
+            self.__percentage_str(level_execution.back_memory_bound_stall())))
         stalls_front_decode_on_front_message : str = ("{:<22} {:<6}".format('STALLS, on FrontEnd  (%): ', 
-            str(round(level_execution.front_decode_stall_on_front(), TopDownParameters.C_MAX_NUM_RESULTS_DECIMALS)) + '%'))
+            self.__percentage_str(level_execution.front_decode_stall_on_front())))
         stalls_front_fetch_on_front_message : str = ("{:<20} {:<6}".format('STALLS, on FrontEnd  (%): ', 
-            str(round(level_execution.front_fetch_stall_on_front(), TopDownParameters.C_MAX_NUM_RESULTS_DECIMALS)) + '%'))
+            self.__percentage_str(level_execution.front_fetch_stall_on_front())))
         stalls_back_core_bound_on_back_message : str = ("{:<20} {:<6}".format('STALLS, on BackEnd   (%): ', 
-            str(round(level_execution.back_core_bound_stall_on_back(), TopDownParameters.C_MAX_NUM_RESULTS_DECIMALS)) + '%'))
+            self.__percentage_str(level_execution.back_core_bound_stall_on_back())))
         stalls_back_memory_bound_on_back_message : str = ("{:<20} {:<6}".format('STALLS, on BackEnd   (%): ', 
-            str(round(level_execution.back_memory_bound_stall_on_back(), TopDownParameters.C_MAX_NUM_RESULTS_DECIMALS)) + '%'))
+            self.__percentage_str(level_execution.back_memory_bound_stall_on_back())))
         ipc_degradation_front_decode_message : str = ("{:<26} {:<5}".format('IPC DEGRADATION      (%): ', 
-            str(round(level_execution.front_decode_percentage_ipc_degradation(), TopDownParameters.C_MAX_NUM_RESULTS_DECIMALS)) + '%'))
+            self.__percentage_str(level_execution.front_decode_percentage_ipc_degradation())))
         ipc_degradation_front_fetch_message : str = ("{:<26} {:<5}".format('IPC DEGRADATION      (%): ', 
-            str(round(level_execution.front_fetch_percentage_ipc_degradation(), TopDownParameters.C_MAX_NUM_RESULTS_DECIMALS)) + '%'))
+            self.__percentage_str(level_execution.front_fetch_percentage_ipc_degradation())))
         ipc_degradation_back_core_bound_message : str = ("{:<26} {:<5}".format('IPC DEGRADATION      (%): ', 
-            str(round(level_execution.back_core_bound_percentage_ipc_degradation(), TopDownParameters.C_MAX_NUM_RESULTS_DECIMALS)) + '%'))
+            self.__percentage_str(level_execution.back_core_bound_percentage_ipc_degradation())))
         ipc_degradation_back_memory_bound_message : str = ("{:<26} {:<5}".format('IPC DEGRADATION      (%): ', 
-            str(round(level_execution.back_memory_bound_percentage_ipc_degradation(), TopDownParameters.C_MAX_NUM_RESULTS_DECIMALS)) + '%'))
+            self.__percentage_str(level_execution.back_memory_bound_percentage_ipc_degradation())))
         messages : list[list[str]] = [["","","",""] , [stalls_front_decode_on_total_message, 
             stalls_front_fetch_on_total_message,  stalls_back_core_bound_on_total_message, 
             stalls_back_memory_bound_on_total_message], [stalls_front_decode_on_front_message, 
@@ -656,14 +1732,14 @@ class TopDown:
         titles : list[str] = [level_execution.front_decode().name(), level_execution.front_fetch().name(),
             level_execution.back_core_bound().name(),level_execution.back_memory_bound().name()]
     
-        printer : MessageFormat = MessageFormat()
+        printer : MessageFormat = self.__printer
         printer.print_four_msg_box(messages, titles, 1, self.output_file(), False)
         printer.print_max_line_length_message(message = "\n", max_length = TopDownParameters.C_NUM_MAX_CHARACTERS_PER_LINE, 
                 output_file = self.output_file(), delete_content_file = False)
         ipc_degradation_branch_divergence_message : str = ("{:<20} {:<6}".format("IPC DEGRADATION (%): ", 
-            str(round(level_execution.branch_divergence_percentage_ipc_degradation(), TopDownParameters.C_MAX_NUM_RESULTS_DECIMALS)) + '%'))   
+            self.__percentage_str(level_execution.branch_divergence_percentage_ipc_degradation())))   
         ipc_degradation_replay_divergence_message : str = ("{:<20} {:<6}".format("IPC DEGRADATION (%): ", 
-            str(round(level_execution.replay_divergence_percentage_ipc_degradation(), TopDownParameters.C_MAX_NUM_RESULTS_DECIMALS)) + '%'))   
+            self.__percentage_str(level_execution.replay_divergence_percentage_ipc_degradation())))   
         titles = [level_execution.divergence_branch().name(), level_execution.divergence_replay().name()]
         messages = [[ipc_degradation_branch_divergence_message, ipc_degradation_replay_divergence_message]]
         printer.print_two_msg_box(messages, titles, 1, self.output_file(), False)
@@ -673,46 +1749,130 @@ class TopDown:
         """Show results of level three."""
 
         stalls_memory_constant_memory_bound_on_total_message : str = ("STALLS, on the total             (%): " +
-            str(round(level_execution.memory_constant_memory_bound_stall(), TopDownParameters.C_MAX_NUM_RESULTS_DECIMALS)) + '%')
+            self.__percentage_str(level_execution.memory_constant_memory_bound_stall()))
         stalls_memory_constant_memory_bound_on_memory_bound_message : str = ("STALLS, on " + level_execution.back_memory_bound().name() + " (%): " +  
-            str(round(level_execution.memory_constant_memory_bound_stall_on_memory_bound(), TopDownParameters.C_MAX_NUM_RESULTS_DECIMALS)) + '%')
+            self.__percentage_str(level_execution.memory_constant_memory_bound_stall_on_memory_bound()))
         stalls_memory_constant_memory_bound_on_back_message : str = ("STALLS, on " + level_execution.back_end().name() + "              (%): " +
-            str(round(level_execution.memory_constant_memory_bound_stall_on_back(), TopDownParameters.C_MAX_NUM_RESULTS_DECIMALS)) + '%')
+            self.__percentage_str(level_execution.memory_constant_memory_bound_stall_on_back()))
         ipc_degradation_memory_constant_memory_bound_message : str = ("IPC DEGRADATION                  (%): " +  
-            str(round(level_execution.memory_constant_memory_bound_percentage_ipc_degradation(), TopDownParameters.C_MAX_NUM_RESULTS_DECIMALS)) + '%')
-        if type(level_execution) is LevelThreeNsight:
-            stalls_memory_mio_throttle_on_total_message : str = ("STALLS, on the total             (%): " +  
-                str(round(level_execution.memory_mio_throttle_stall(), TopDownParameters.C_MAX_NUM_RESULTS_DECIMALS)) + '%')
-            stalls_memory_l1_bound_on_total_message : str = ("STALLS, on the total             (%): " +
-                str(round(level_execution.memory_l1_bound_stall(), TopDownParameters.C_MAX_NUM_RESULTS_DECIMALS)) + '%')
-            stalls_memory_mio_throttle_on_memory_bound_message : str = ("STALLS, on " + level_execution.back_memory_bound().name() + " (%): " +  
-                str(round(level_execution.memory_mio_throttle_stall_on_memory_bound(), TopDownParameters.C_MAX_NUM_RESULTS_DECIMALS)) + '%')
-            stalls_memory_l1_bound_on_memory_bound_message : str = ("STALLS, on " + level_execution.back_memory_bound().name() + " (%): " +  
-                str(round(level_execution.memory_l1_bound_stall_on_memory_bound(), TopDownParameters.C_MAX_NUM_RESULTS_DECIMALS)) + '%')
-            stalls_memory_mio_throttle_on_back_message : str = ("STALLS, on " + level_execution.back_end().name() + "              (%): " +
-                str(round(level_execution.memory_mio_throttle_stall_on_back(), TopDownParameters.C_MAX_NUM_RESULTS_DECIMALS)) + '%')
-            stalls_memory_l1_bound_on_back_message : str = ("STALLS, on " + level_execution.back_end().name() + "              (%): " +
-                str(round(level_execution.memory_l1_bound_stall_on_back(), TopDownParameters.C_MAX_NUM_RESULTS_DECIMALS)) + '%')
-            ipc_degradation_memory_mio_throttle_message : str = ("IPC DEGRADATION                  (%): " +  
-                str(round(level_execution.memory_mio_throttle_percentage_ipc_degradation(), TopDownParameters.C_MAX_NUM_RESULTS_DECIMALS)) + '%')
-            ipc_degradation_memory_l1_bound_message : str = ("IPC DEGRADATION                  (%): " +  
-                str(round(level_execution.memory_l1_bound_percentage_ipc_degradation(), TopDownParameters.C_MAX_NUM_RESULTS_DECIMALS)) + '%')
-            titles : list[str] = [level_execution.memory_constant_memory_bound().name(), level_execution.memory_mio_throttle().name(), 
-                level_execution.memory_l1_bound().name()]
-            messages : list[list[str]] = [[stalls_memory_constant_memory_bound_on_total_message, stalls_memory_mio_throttle_on_total_message, 
-            stalls_memory_l1_bound_on_total_message], [stalls_memory_constant_memory_bound_on_memory_bound_message, 
-            stalls_memory_mio_throttle_on_memory_bound_message, stalls_memory_l1_bound_on_memory_bound_message], [stalls_memory_constant_memory_bound_on_back_message, 
-            stalls_memory_mio_throttle_on_back_message, stalls_memory_l1_bound_on_back_message], ["","","",""], 
-            [ipc_degradation_memory_constant_memory_bound_message, ipc_degradation_memory_mio_throttle_message, ipc_degradation_memory_l1_bound_message]]
-            MessageFormat().print_three_msg_box(messages, titles, 1, self.output_file(), False)
-        else:
-            messages : str = ("\n" + stalls_memory_constant_memory_bound_on_total_message + "\n" + 
-            stalls_memory_constant_memory_bound_on_memory_bound_message + "\n" + stalls_memory_constant_memory_bound_on_back_message 
-            + "\n\n" + ipc_degradation_memory_constant_memory_bound_message)
-            MessageFormat().print_msg_box(messages, 1, None, level_execution.memory_constant_memory_bound().name(), self.output_file(),
-            False)
+            self.__percentage_str(level_execution.memory_constant_memory_bound_percentage_ipc_degradation()))
+        stalls_memory_mio_throttle_on_total_message : str = ("STALLS, on the total             (%): " +  
+            self.__percentage_str(level_execution.memory_mio_throttle_stall()))
+        stalls_memory_l1_bound_on_total_message : str = ("STALLS, on the total             (%): " +
+            self.__percentage_str(level_execution.memory_l1_bound_stall()))
+        stalls_memory_mio_throttle_on_memory_bound_message : str = ("STALLS, on " + level_execution.back_memory_bound().name() + " (%): " +  
+            self.__percentage_str(level_execution.memory_mio_throttle_stall_on_memory_bound()))
+        stalls_memory_l1_bound_on_memory_bound_message : str = ("STALLS, on " + level_execution.back_memory_bound().name() + " (%): " +  
+            self.__percentage_str(level_execution.memory_l1_bound_stall_on_memory_bound()))
+        stalls_memory_mio_throttle_on_back_message : str = ("STALLS, on " + level_execution.back_end().name() + "              (%): " +
+            self.__percentage_str(level_execution.memory_mio_throttle_stall_on_back()))
+        stalls_memory_l1_bound_on_back_message : str = ("STALLS, on " + level_execution.back_end().name() + "              (%): " +
+            self.__percentage_str(level_execution.memory_l1_bound_stall_on_back()))
+        ipc_degradation_memory_mio_throttle_message : str = ("IPC DEGRADATION                  (%): " +  
+            self.__percentage_str(level_execution.memory_mio_throttle_percentage_ipc_degradation()))
+        ipc_degradation_memory_l1_bound_message : str = ("IPC DEGRADATION                  (%): " +  
+            self.__percentage_str(level_execution.memory_l1_bound_percentage_ipc_degradation()))
+        titles : list[str] = [level_execution.memory_constant_memory_bound().name(), level_execution.memory_mio_throttle().name(), 
+            level_execution.memory_l1_bound().name()]
+        messages : list[list[str]] = [[stalls_memory_constant_memory_bound_on_total_message, stalls_memory_mio_throttle_on_total_message, 
+        stalls_memory_l1_bound_on_total_message], [stalls_memory_constant_memory_bound_on_memory_bound_message, 
+        stalls_memory_mio_throttle_on_memory_bound_message, stalls_memory_l1_bound_on_memory_bound_message], [stalls_memory_constant_memory_bound_on_back_message, 
+        stalls_memory_mio_throttle_on_back_message, stalls_memory_l1_bound_on_back_message], ["","","",""], 
+        [ipc_degradation_memory_constant_memory_bound_message, ipc_degradation_memory_mio_throttle_message, ipc_degradation_memory_l1_bound_message]]
+        if isinstance(level_execution, LevelThreeNvprof):
+            shared_load_transactions : float = level_execution.memory_mio_throttle_shared_load_transactions_per_request()
+            shared_store_transactions : float = level_execution.memory_mio_throttle_shared_store_transactions_per_request()
+            messages += [["", "", ""], ["", "{:<33}   : ".format("SHARED LOAD TRANS. PER REQUEST") + (TopDownParameters.C_NOT_MEASURED_VALUE 
+                if shared_load_transactions is None else str(round(shared_load_transactions, TopDownParameters.C_MAX_NUM_RESULTS_DECIMALS))),
+                "{:<33}(%): ".format("GLOBAL HIT RATE") + self.__percentage_str(level_execution.memory_l1_bound_global_hit_rate())],
+                ["", "{:<33}   : ".format("SHARED STORE TRANS. PER REQUEST") + (TopDownParameters.C_NOT_MEASURED_VALUE 
+                if shared_store_transactions is None else str(round(shared_store_transactions, TopDownParameters.C_MAX_NUM_RESULTS_DECIMALS))), ""]]
+        self.__printer.print_three_msg_box(messages, titles, 1, self.output_file(), False)
+        if isinstance(level_execution, LevelThreeNsight):
+            self.__show_level_three_core_results(level_execution)
+            self.__show_level_three_front_results(level_execution)
         
     
+    def __show_level_three_core_results(self, level_execution : LevelThreeNsight):
+        """Show results of the parts of level three below BackEnd.CoreBound (NSIGHT only)."""
+
+        parts_messages : list = list()
+        for stall, stall_on_core_bound, stall_on_back, ipc_degradation in [(level_execution.core_math_pipe_throttle_stall(), 
+            level_execution.core_math_pipe_throttle_stall_on_core_bound(), level_execution.core_math_pipe_throttle_stall_on_back(),
+            level_execution.core_math_pipe_throttle_percentage_ipc_degradation()), (level_execution.core_wait_stall(), 
+            level_execution.core_wait_stall_on_core_bound(), level_execution.core_wait_stall_on_back(), 
+            level_execution.core_wait_percentage_ipc_degradation())]:
+            parts_messages.append(["STALLS, on the total           (%): " + self.__percentage_str(stall),
+                "STALLS, on " + level_execution.back_core_bound().name() + " (%): " + self.__percentage_str(stall_on_core_bound),
+                "STALLS, on " + level_execution.back_end().name() + "            (%): " + self.__percentage_str(stall_on_back), "",
+                "IPC DEGRADATION                (%): " + self.__percentage_str(ipc_degradation)])
+        pipes_messages : list = ["{:<7}UTILIZATION (%): {:<9} IPC DEGRADATION (%): {}".format(pipe, 
+            self.__percentage_str(level_execution.core_pipe_utilization_value(pipe)),
+            self.__percentage_str(level_execution.core_pipe_percentage_ipc_degradation(pipe))) 
+            for pipe in CorePipeUtilizationParameters.C_CORE_PIPES_NSIGHT]
+        pipes_messages += [""]*(len(parts_messages[0]) - len(pipes_messages))
+        titles : list[str] = [level_execution.core_math_pipe_throttle().name(), level_execution.core_wait().name(), 
+            level_execution.core_pipe_utilization().name()]
+        messages : list[list[str]] = [[parts_messages[0][i], parts_messages[1][i], pipes_messages[i]] for i in range(0, len(parts_messages[0]))]
+        self.__printer.print_three_msg_box(messages, titles, 1, self.output_file(), False)
+        
+
+    def __show_level_three_front_results(self, level_execution : LevelThreeNsight):
+        """Show results of the stall reasons of level three below FrontEnd.Fetch and FrontEnd.Decode (NSIGHT only)."""
+
+        titles : list = list()
+        parts_messages : list = list()
+        for part in level_execution.front_stall_reasons():
+            titles.append(part.name())
+            parts_messages.append(["{:<28}(%): ".format("STALLS, on the total") + self.__percentage_str(level_execution.front_stall_reason_stall(part)),
+                "{:<28}(%): ".format("STALLS, on " + part.parent_name()) + self.__percentage_str(level_execution.front_stall_reason_stall_on_parent(part)),
+                "{:<28}(%): ".format("STALLS, on " + level_execution.front_end().name()) + 
+                self.__percentage_str(level_execution.front_stall_reason_stall_on_front(part)), "",
+                "{:<28}(%): ".format("IPC DEGRADATION") + self.__percentage_str(level_execution.front_stall_reason_percentage_ipc_degradation(part))])
+        messages : list
+        for first in range(0, len(parts_messages), 3): # three boxes per line
+            messages = [[part_messages[i] for part_messages in parts_messages[first:first + 3]] for i in range(0, len(parts_messages[first]))]
+            if len(messages[0]) == 3:
+                self.__printer.print_three_msg_box(messages, titles[first:first + 3], 1, self.output_file(), False)
+            elif len(messages[0]) == 2:
+                self.__printer.print_two_msg_box(messages, titles[first:first + 2], 1, self.output_file(), False)
+            else:
+                self.__printer.print_msg_box("\n".join(message[0] for message in messages), 1, None, titles[first], self.output_file(), False)
+        
+
+    def __show_level_four_results(self, level_execution : LevelFourNsight):
+        """Show results of level four (NSIGHT only)."""
+
+        l1_bound_name : str = level_execution.memory_l1_bound().name()
+        l1_cache_messages : list = ["{:<28}(%): ".format("HIT RATE") + self.__percentage_str(level_execution.memory_l1_cache_hit_rate()),
+            "{:<28}(%): ".format("THROUGHPUT, on the peak") + self.__percentage_str(level_execution.memory_l1_cache_throughput()), "", "",
+            "{:<28}(%): ".format("STALLS, on L1-BOUND") + self.__percentage_str(level_execution.memory_l1_cache_stall_on_l1_bound()),
+            "{:<28}(%): ".format("IPC DEGRADATION") + self.__percentage_str(level_execution.memory_l1_cache_percentage_ipc_degradation())]
+        l2_cache_imbalance : float = level_execution.memory_l2_cache_partition_imbalance()
+        l2_cache_messages : list = ["{:<28}(%): ".format("HIT RATE") + self.__percentage_str(level_execution.memory_l2_cache_hit_rate()),
+            "{:<28}(%): ".format("THROUGHPUT, on the peak") + self.__percentage_str(level_execution.memory_l2_cache_throughput()),
+            "{:<28}   : ".format("PARTITION IMBALANCE") + (TopDownParameters.C_NOT_MEASURED_VALUE if l2_cache_imbalance is None else 
+            str(round(l2_cache_imbalance, TopDownParameters.C_MAX_NUM_RESULTS_DECIMALS))), "",
+            "{:<28}(%): ".format("STALLS, on L1-BOUND") + self.__percentage_str(level_execution.memory_l2_cache_stall_on_l1_bound()),
+            "{:<28}(%): ".format("IPC DEGRADATION") + self.__percentage_str(level_execution.memory_l2_cache_percentage_ipc_degradation())]
+        dram_bytes : float = level_execution.memory_dram_bytes()
+        dram_messages : list = ["{:<28}(%): ".format("THROUGHPUT, on the peak") + self.__percentage_str(level_execution.memory_dram_throughput()),
+            "{:<28}   : ".format("TRAFFIC WITH L2 (bytes)") + (TopDownParameters.C_NOT_MEASURED_VALUE if dram_bytes is None else 
+            str(round(dram_bytes))), "", "",
+            "{:<28}(%): ".format("STALLS, on L1-BOUND") + self.__percentage_str(level_execution.memory_dram_stall_on_l1_bound()),
+            "{:<28}(%): ".format("IPC DEGRADATION") + self.__percentage_str(level_execution.memory_dram_percentage_ipc_degradation())]
+        titles : list[str] = [level_execution.memory_l1_cache().name().replace(l1_bound_name, "L1-BOUND"), 
+            level_execution.memory_l2_cache().name().replace(l1_bound_name, "L1-BOUND"), 
+            level_execution.memory_dram().name().replace(l1_bound_name, "L1-BOUND")]
+        messages : list[list[str]] = [[l1_cache_messages[i], l2_cache_messages[i], dram_messages[i]] for i in range(0, len(l1_cache_messages))]
+        self.__printer.print_three_msg_box(messages, titles, 1, self.output_file(), False)
+        message : str = ("{:<28}(%): ".format("WAVEFRONTS OF CONFLICTS") + self.__percentage_str(level_execution.memory_shared_bank_conflicts_rate()) + 
+            "\n\n" + "{:<28}(%): ".format("IPC DEGRADATION") + 
+            self.__percentage_str(level_execution.memory_shared_bank_conflicts_percentage_ipc_degradation()))
+        self.__printer.print_msg_box(message, 1, None, level_execution.memory_shared_bank_conflicts().name().replace(
+            level_execution.memory_mio_throttle().name(), "MIO-THROTTLE"), self.output_file(), False)
+        
+
     def __show_results(self, level_execution):
         """ Show Results of execution indicated by argument.
 
@@ -726,7 +1886,7 @@ class TopDown:
         else:
             delete_content = self.delete_output_file_content()
 
-        printer : MessageFormat = MessageFormat()
+        printer : MessageFormat = self.__printer
         message : str = "The results have been obtained correctly. General results of IPC are the following:\n\n"
         printer.print_max_line_length_message(message = message, max_length = TopDownParameters.C_NUM_MAX_CHARACTERS_PER_LINE, 
             output_file = self.output_file(), delete_content_file = delete_content)
@@ -753,7 +1913,7 @@ class TopDown:
         printer.print_desplazed_underlined_str(message = message, output_file = self.output_file(), delete_content_file = False)
         print()
         if (type(level_execution) is LevelTwoNsight or type(level_execution) is LevelTwoNvprof or type(level_execution) is LevelThreeNvprof or 
-            type(level_execution) is LevelThreeNsight):
+            type(level_execution) is LevelThreeNsight or type(level_execution) is LevelFourNsight):
             message = "\nLEVEL ONE RESULTS"
             printer.print_underlined_str(message = message, output_file = self.output_file(), delete_content_file = False)
             printer.print_max_line_length_message("\n", TopDownParameters.C_NUM_MAX_CHARACTERS_PER_LINE, self.output_file(), False) 
@@ -807,7 +1967,7 @@ class TopDown:
                 print()
             self.__show_level_two_results(level_execution)
             print()
-            if type(level_execution) is LevelThreeNsight or type(level_execution) is LevelThreeNvprof:
+            if isinstance(level_execution, LevelThreeNsight) or type(level_execution) is LevelThreeNvprof:
                 message = "\n\nLEVEL THREE RESULTS"
                 printer.print_underlined_str(message = message, output_file = self.output_file(), delete_content_file = False)
                 print()
@@ -816,17 +1976,29 @@ class TopDown:
                     printer.print_max_line_length_message(message = message, max_length = TopDownParameters.C_NUM_MAX_CHARACTERS_PER_LINE, 
                     output_file = self.output_file(), delete_content_file = False)
                     print()
-                    if type(level_execution) is LevelThreeNsight:
-                        message = "\n" + level_execution.memory_l1_bound().name() + ": " + level_execution.memory_l1_bound().description() + "\n\n"
-                        printer.print_max_line_length_message(message = message, max_length = TopDownParameters.C_NUM_MAX_CHARACTERS_PER_LINE, 
-                        output_file = self.output_file(), delete_content_file = False)
-                        print()
-                        message = "\n" + level_execution.memory_mio_throttle().name() + ": " + level_execution.memory_mio_throttle().description() + "\n\n"
-                        printer.print_max_line_length_message(message = message, max_length = TopDownParameters.C_NUM_MAX_CHARACTERS_PER_LINE, 
-                        output_file = self.output_file(), delete_content_file = False)
-                        print()
+                    message = "\n" + level_execution.memory_l1_bound().name() + ": " + level_execution.memory_l1_bound().description() + "\n\n"
+                    printer.print_max_line_length_message(message = message, max_length = TopDownParameters.C_NUM_MAX_CHARACTERS_PER_LINE, 
+                    output_file = self.output_file(), delete_content_file = False)
+                    print()
+                    message = "\n" + level_execution.memory_mio_throttle().name() + ": " + level_execution.memory_mio_throttle().description() + "\n\n"
+                    printer.print_max_line_length_message(message = message, max_length = TopDownParameters.C_NUM_MAX_CHARACTERS_PER_LINE, 
+                    output_file = self.output_file(), delete_content_file = False)
+                    print()
                 self.__show_level_three_results(level_execution)
                 print()
+                if type(level_execution) is LevelFourNsight:
+                    message = "\n\nLEVEL FOUR RESULTS"
+                    printer.print_underlined_str(message = message, output_file = self.output_file(), delete_content_file = False)
+                    print()
+                    if self.show_desc():
+                        for part in [level_execution.memory_l1_cache(), level_execution.memory_l2_cache(), level_execution.memory_dram(),
+                            level_execution.memory_shared_bank_conflicts()]:
+                            message = "\n" + part.name() + ": " + part.description() + "\n\n"
+                            printer.print_max_line_length_message(message = message, max_length = TopDownParameters.C_NUM_MAX_CHARACTERS_PER_LINE, 
+                            output_file = self.output_file(), delete_content_file = False)
+                            print()
+                    self.__show_level_four_results(level_execution)
+                    print()
         else: # levelr one
             message = "RESULTS"
             printer.print_underlined_str(message = message, output_file = self.output_file(), delete_content_file = False)
@@ -855,6 +2027,100 @@ class TopDown:
             print()
         
 
+    def __show_groups_results(self, groups : LaunchGroups, title : str, min_tags : int = 1):
+        """ Show table with the results of each group of launches, if launches are grouped.
+
+        Args:
+            groups      : LaunchGroups  ; groups of launches of the execution ALREADY DONE
+
+            title       : str           ; title of the table
+
+            min_tags    : int           ; min number of different tags of the selected launches to show the table
+        """
+
+        if groups.is_empty() or groups.num_tags() < min_tags:
+            return
+        printer : MessageFormat = self.__printer
+        printer.print_max_line_length_message("\n", TopDownParameters.C_NUM_MAX_CHARACTERS_PER_LINE, self.output_file(), False)
+        printer.print_underlined_str(message = "\n" + title, output_file = self.output_file(), delete_content_file = False)
+        printer.print_str(groups.report_str(TopDownParameters.C_MAX_NUM_RESULTS_DECIMALS) + "\n", self.output_file(), False)
+        
+
+    def __show_rank_results(self, groups : LaunchGroups):
+        """ Show table with the results of each rank of the MPI job and the load imbalance between ranks.
+
+        Args:
+            groups      : LaunchGroups  ; launches of the execution ALREADY DONE grouped by rank
+        """
+
+        if groups.is_empty():
+            return
+        self.__show_groups_results(groups, "RESULTS PER RANK")
+        imbalance : tuple = groups.imbalance()
+        if imbalance is None:
+            return
+        self.__printer.print_str("Load imbalance (cycles of the slowest rank over the mean of ranks): " + 
+            str(round(imbalance[0], TopDownParameters.C_MAX_NUM_RESULTS_DECIMALS)) + "% (" + imbalance[1] + ")\n", 
+            self.output_file(), False)
+        
+
+    def __show_repetitions_results(self, repetitions : Repetitions):
+        """ Show table with the statistics of the values of the runs of the execution.
+
+        Args:
+            repetitions : Repetitions   ; runs of the execution ALREADY DONE
+        """
+
+        printer : MessageFormat = self.__printer
+        printer.print_max_line_length_message("\n", TopDownParameters.C_NUM_MAX_CHARACTERS_PER_LINE, self.output_file(), False)
+        printer.print_underlined_str(message = "\nRESULTS OF REPEATED RUNS", output_file = self.output_file(), delete_content_file = False)
+        printer.print_str(repetitions.report_str(TopDownParameters.C_MAX_NUM_RESULTS_DECIMALS) + "\n", self.output_file(), False)
+        message : str = TopDownParameters.C_REPEAT_RUNS_MESSAGE % (repetitions.num_runs(), self.repeat_runs())
+        if repetitions.num_runs() < self.repeat_runs():
+            message += TopDownParameters.C_REPEAT_CONVERGED_MESSAGE % self.repeat_tolerance()
+        printer.print_str(message + "\n", self.output_file(), False)
+        
+
+    def __show_distributions_results(self, level : LevelExecution):
+        """ Show table with the distribution of each measure across the launches.
+
+        Args:
+            level   : LevelExecution    ; level of the execution ALREADY DONE
+        """
+
+        printer : MessageFormat = self.__printer
+        printer.print_max_line_length_message("\n", TopDownParameters.C_NUM_MAX_CHARACTERS_PER_LINE, self.output_file(), False)
+        printer.print_underlined_str(message = "\nDISTRIBUTIONS OF MEASURES", output_file = self.output_file(), delete_content_file = False)
+        printer.print_str(MetricDistributions(level).report_str(TopDownParameters.C_MAX_NUM_RESULTS_DECIMALS) + "\n", 
+            self.output_file(), False)
+        
+
+    def __show_roofline_results(self, level : LevelExecution):
+        """ Show table with the roofline of each kernel.
+
+        Args:
+            level   : LevelExecution    ; level of the execution ALREADY DONE
+        """
+
+        printer : MessageFormat = self.__printer
+        printer.print_max_line_length_message("\n", TopDownParameters.C_NUM_MAX_CHARACTERS_PER_LINE, self.output_file(), False)
+        printer.print_underlined_str(message = "\nROOFLINE PER KERNEL", output_file = self.output_file(), delete_content_file = False)
+        printer.print_str(level.roofline_report_str(TopDownParameters.C_MAX_NUM_RESULTS_DECIMALS) + "\n", self.output_file(), False)
+        
+
+    def __show_occupancy_results(self, level : LevelExecution):
+        """ Show table with the launch configuration, occupancy and bottleneck of each kernel.
+
+        Args:
+            level   : LevelExecution    ; level of the execution ALREADY DONE
+        """
+
+        printer : MessageFormat = self.__printer
+        printer.print_max_line_length_message("\n", TopDownParameters.C_NUM_MAX_CHARACTERS_PER_LINE, self.output_file(), False)
+        printer.print_underlined_str(message = "\nOCCUPANCY PER KERNEL", output_file = self.output_file(), delete_content_file = False)
+        printer.print_str(level.occupancy_report_str(TopDownParameters.C_MAX_NUM_RESULTS_DECIMALS) + "\n", self.output_file(), False)
+        
+
     def __is_nvprof_mode(self) -> bool:
         """
         Check if the execution must be done with NVPROF scan tool.
@@ -864,12 +2130,9 @@ class TopDown:
             if not (NSIGHT).
         """
         
-        shell : Shell = Shell()
-        compute_capability : str = shell.launch_command_show_all("nvcc $DIR_UNTIL_TOPDOWN/TopDownNvidia/src/measure_parts/compute_capability.cu --run", None)
-        shell.launch_command("rm -f $DIR_UNTIL_TOPDOWN/TopDownNvidia/src/measure_parts/a.out", None) # delete file
-        if not compute_capability:
+        compute_capability_float : float = ProfilerBackend.current().compute_capability()
+        if compute_capability_float is None:
             raise ModeExecutionError
-        compute_capability_float : float = float(compute_capability)
         if compute_capability_float < 0.0:
             raise ComputeCapabilityNumberError
         if compute_capability_float > TopDownParameters.C_COMPUTE_CAPABILITY_NVPROF_MAX_VALUE:
@@ -877,7 +2140,123 @@ class TopDown:
         return True
         
 
+    def __configure_level(self, level : LevelExecution):
+        """
+        Configure level of the execution (not run) with the options of the scan tool indicated.
+
+        Args:
+            level   : LevelExecution    ; level of the execution
+        """
+
+        level.set_metrics_check(self.metrics_check())
+        mpi_ranks : MpiRanks = self.__mpi_ranks()
+        if not mpi_ranks is None:
+            if not mpi_ranks.launcher() is None:
+                level.add_profiler_options(mpi_ranks.profiler_options())
+            level.set_mpi_ranks(mpi_ranks)
+        nvtx_options : list = self.__nvtx_profiler_options()
+        if nvtx_options:
+            if self.__is_nvprof_mode():
+                raise NvtxNvprofError
+            level.add_profiler_options(nvtx_options)
+        if not self.profiler_region_launches() is None:
+            if self.profiler_region_launches() <= 0:
+                raise ProfilerRegionLaunchesError
+            if self.__is_nvprof_mode():
+                raise RegionNvprofError
+        if self.profiler_regions():
+            level.add_profiler_options([TopDownParameters.C_PROFILE_FROM_START_PROFILER_OPTION, 
+                TopDownParameters.C_PROFILE_FROM_START_OFF_VALUE])
+        if not self.__hot_kernels is None:
+            level.add_profiler_options(self.__hot_kernels.profiler_options(self.__is_nvprof_mode()))
+        
+
+    def __show_pruned_measures(self, level_execution : LevelExecution):
+        """
+        Show the measures of the execution not collected because they are not supported by the device.
+
+        Args:
+            level_execution : LevelExecution    ; level of the execution ALREADY DONE
+        """
+
+        if level_execution.pruned_measures():
+            self.__printer.print_str(MetricAvailabilityParameters.C_PRUNE_MESSAGE + ", ".join(level_execution.pruned_measures()) + "\n", 
+                self.output_file(), False)
+        
+
+    def __find_hot_kernels(self, program : str) -> HotKernels:
+        """
+        Run a cheap pass of the scan tool (only cycles and IPC of each launch) and get the kernels which
+        cover the share of the cycles of '-hot', so only their launches are measured.
+
+        Args:
+            program : str   ; program of the execution
+
+        Returns:
+            Reference to HotKernels
+        """
+
+        hot_kernels : HotKernels = HotKernels(self.hot_kernels_share())
+        level_one : LevelExecution = LevelFactory.create(1, self.__is_nvprof_mode(), program, None, None, None, False, False)
+        self.__configure_level(level_one)
+        level_one.collect_only(HotKernels.measures(self.__is_nvprof_mode()))
+        with Timings.span(TimingsParameters.C_SPAN_HOT_KERNELS_PASS):
+            level_one.run(list())
+        self.__show_pruned_measures(level_one)
+        hot_kernels.set_results(level_one)
+        if hot_kernels.kernels():
+            self.__printer.print_str(TopDownParameters.C_HOT_KERNELS_MESSAGE % (hot_kernels.cycles(), len(hot_kernels.kernels()),
+                hot_kernels.num_kernels(), hot_kernels.launches(), hot_kernels.num_launches()) + "\n" + "\n".join(
+                TopDownParameters.C_HOT_KERNEL_FORMAT % (kernel["cycles"], TopDownParameters.C_NOT_MEASURED_VALUE if kernel["ipc"] is None
+                else str(round(kernel["ipc"], 3)), kernel["name"]) for kernel in hot_kernels.kernels()) + "\n", self.output_file(), False)
+        return hot_kernels
+        
+
+    def __adaptive_branches(self, program : str) -> list:
+        """
+        Run level one and get the parts of level one whose branch of the TopDown hierarchy doesn't matter
+        (IPC degradation below the threshold of '-ad'), so the parts below them are not measured.
+
+        Args:
+            program : str   ; program of the execution
+
+        Returns:
+            List with the names of the parts of level one
+        """
+
+        level_one : LevelExecution = LevelFactory.create(1, self.__is_nvprof_mode(), program, None, None, None, False, False)
+        self.__configure_level(level_one)
+        with Timings.span(TimingsParameters.C_SPAN_ADAPTIVE_LEVEL_ONE):
+            level_one.run(list())
+        self.__show_pruned_measures(level_one)
+        branches : list = [name for name, parent_name, value in level_one.topdown_tree() if parent_name == "" 
+            and not value is None and value < self.adaptive_threshold()]
+        if branches:
+            self.__printer.print_str(TopDownParameters.C_ADAPTIVE_MESSAGE % self.adaptive_threshold() + ", ".join(branches) + "\n", 
+                self.output_file(), False)
+        return branches
+        
+
     def launch(self):
+        """ Launch execution. Report is written to output file at the end."""
+
+        try:
+            with Timings.span(TimingsParameters.C_SPAN_TOPDOWN):
+                try:
+                    self.__launch()
+                    self.__printer.print_max_line_length_message(message = "\nAnalysis performed correctly!\n", 
+                        max_length = TopDownParameters.C_NUM_MAX_CHARACTERS_PER_LINE, output_file = self.output_file(), delete_content_file = False)
+                finally:
+                    with Timings.span(TimingsParameters.C_SPAN_REPORT_FLUSH):
+                        self.__printer.flush()
+        finally:
+            if not self.timings_file() is None:
+                print("\n" + Timings.report_str())
+                if self.timings_file() != "":
+                    Timings.dump(self.timings_file())
+        
+
+    def __launch(self):
         """ Launch execution."""
 
         if self.show_verbose():
@@ -894,142 +2273,53 @@ class TopDown:
         if (program is not None and len(program) > 3 and program[len(program) - 3] == '.' and program[len(program) - 2] == 'p' 
             and program[len(program) - 1] == 'y'):
             program = "python3 " + program
-        if self.__is_nvprof_mode():
-            front_end : FrontEndNvprof
-            back_end : BackEndNvprof
-            divergence : DivergenceNvprof
-            retire : RetireNvprof
-            extra_measure : ExtraMeasureNvprof
-            if self.level() == 1:
-                front_end = FrontEndNvprof(FrontEndParameters.C_FRONT_END_NAME, FrontEndParameters.C_FRONT_END_DESCRIPTION,
-                    FrontEndParameters.C_FRONT_END_NVPROF_L1_METRICS, FrontEndParameters.C_FRONT_END_NVPROF_L1_EVENTS)
-                back_end = BackEndNvprof(BackEndParameters.C_BACK_END_NAME, BackEndParameters.C_BACK_END_DESCRIPTION, 
-                    BackEndParameters.C_BACK_END_NVPROF_L1_METRICS, BackEndParameters.C_BACK_END_NVPROF_L1_EVENTS)
-                divergence = DivergenceNvprof(DivergenceParameters.C_DIVERGENCE_NAME, DivergenceParameters.C_DIVERGENCE_DESCRIPTION,
-                    DivergenceParameters.C_DIVERGENCE_NVPROF_L1_METRICS, DivergenceParameters.C_DIVERGENCE_NVPROF_L1_EVENTS)
-                retire = RetireNvprof(RetireParameters.C_RETIRE_NAME, RetireParameters.C_RETIRE_DESCRIPTION,
-                    RetireParameters.C_RETIRE_NVPROF_L1_METRICS, RetireParameters.C_RETIRE_NVPROF_L1_EVENTS)
-                extra_measure = ExtraMeasureNvprof(ExtraMeasureParameters.C_EXTRA_MEASURE_NAME, ExtraMeasureParameters.C_EXTRA_MEASURE_DESCRIPTION,
-                    ExtraMeasureParameters.C_EXTRA_MEASURE_NVPROF_L1_METRICS, ExtraMeasureParameters.C_EXTRA_MEASURE_NVPROF_L1_EVENTS)
-                level : LevelOneNvprof = LevelOneNvprof(program, self.input_file(), self.output_file(), self.output_scan_file(), show_metrics, show_events, 
-                front_end, back_end, divergence, retire, extra_measure)
-            elif self.level() == 2:
-                front_end = FrontEndNvprof(FrontEndParameters.C_FRONT_END_NAME, FrontEndParameters.C_FRONT_END_DESCRIPTION,
-                    FrontEndParameters.C_FRONT_END_NVPROF_L2_METRICS, FrontEndParameters.C_FRONT_END_NVPROF_L2_EVENTS)
-                back_end = BackEndNvprof(BackEndParameters.C_BACK_END_NAME, BackEndParameters.C_BACK_END_DESCRIPTION, 
-                    BackEndParameters.C_BACK_END_NVPROF_L2_METRICS, BackEndParameters.C_BACK_END_NVPROF_L2_EVENTS)
-                divergence = DivergenceNvprof(DivergenceParameters.C_DIVERGENCE_NAME, DivergenceParameters.C_DIVERGENCE_DESCRIPTION,
-                    DivergenceParameters.C_DIVERGENCE_NVPROF_L2_METRICS, DivergenceParameters.C_DIVERGENCE_NVPROF_L2_EVENTS)
-                retire = RetireNvprof(RetireParameters.C_RETIRE_NAME, RetireParameters.C_RETIRE_DESCRIPTION,
-                    RetireParameters.C_RETIRE_NVPROF_L2_METRICS, RetireParameters.C_RETIRE_NVPROF_L2_EVENTS)
-                extra_measure = ExtraMeasureNvprof(ExtraMeasureParameters.C_EXTRA_MEASURE_NAME, ExtraMeasureParameters.C_EXTRA_MEASURE_DESCRIPTION,
-                    ExtraMeasureParameters.C_EXTRA_MEASURE_NVPROF_L2_METRICS, ExtraMeasureParameters.C_EXTRA_MEASURE_NVPROF_L2_EVENTS)
-                front_decode : FrontDecodeNvprof = FrontDecodeNvprof(FrontDecodeParameters.C_FRONT_DECODE_NAME, 
-                    FrontDecodeParameters.C_FRONT_DECODE_DESCRIPTION, FrontDecodeParameters.C_FRONT_DECODE_NVPROF_L2_METRICS, 
-                    FrontDecodeParameters.C_FRONT_DECODE_NVPROF_L2_EVENTS)
-                front_fetch : FrontFetchNvprof = FrontFetchNvprof(FrontFetchParameters.C_FRONT_FETCH_NAME, 
-                    FrontFetchParameters.C_FRONT_FETCH_DESCRIPTION, FrontFetchParameters.C_FRONT_FETCH_NVPROF_L2_METRICS, 
-                    FrontFetchParameters.C_FRONT_FETCH_NVPROF_L2_EVENTS)
-                back_memory_bound : BackMemoryBoundNvprof = BackMemoryBoundNvprof(BackMemoryBoundParameters.C_BACK_MEMORY_BOUND_NAME, 
-                    BackMemoryBoundParameters.C_BACK_MEMORY_BOUND_DESCRIPTION, BackMemoryBoundParameters.C_BACK_MEMORY_BOUND_NVPROF_L2_METRICS, 
-                    BackMemoryBoundParameters.C_BACK_MEMORY_BOUND_NVPROF_L2_EVENTS)
-                back_core_bound : BackCoreBoundNvprof = BackCoreBoundNvprof(BackCoreBoundParameters.C_BACK_CORE_BOUND_NAME, 
-                    BackCoreBoundParameters.C_BACK_CORE_BOUND_DESCRIPTION, BackCoreBoundParameters.C_BACK_CORE_BOUND_NVPROF_L2_METRICS, 
-                    BackCoreBoundParameters.C_BACK_CORE_BOUND_NVPROF_L2_EVENTS)
-                level : LevelTwoNvprof = LevelTwoNvprof(program, self.input_file(), self.output_file(), self.output_scan_file(), show_metrics, show_events, 
-                front_end, back_end, divergence, retire, extra_measure, front_fetch, front_decode, back_core_bound, back_memory_bound) 
-            elif self.level() == 3:
-                front_end = FrontEndNvprof(FrontEndParameters.C_FRONT_END_NAME, FrontEndParameters.C_FRONT_END_DESCRIPTION,
-                    FrontEndParameters.C_FRONT_END_NVPROF_L3_METRICS, FrontEndParameters.C_FRONT_END_NVPROF_L3_EVENTS)
-                back_end = BackEndNvprof(BackEndParameters.C_BACK_END_NAME, BackEndParameters.C_BACK_END_DESCRIPTION, 
-                    BackEndParameters.C_BACK_END_NVPROF_L3_METRICS, BackEndParameters.C_BACK_END_NVPROF_L3_EVENTS)
-                divergence = DivergenceNvprof(DivergenceParameters.C_DIVERGENCE_NAME, DivergenceParameters.C_DIVERGENCE_DESCRIPTION,
-                    DivergenceParameters.C_DIVERGENCE_NVPROF_L3_METRICS, DivergenceParameters.C_DIVERGENCE_NVPROF_L3_EVENTS)
-                retire = RetireNvprof(RetireParameters.C_RETIRE_NAME, RetireParameters.C_RETIRE_DESCRIPTION,
-                    RetireParameters.C_RETIRE_NVPROF_L3_METRICS, RetireParameters.C_RETIRE_NVPROF_L3_EVENTS)
-                extra_measure = ExtraMeasureNvprof(ExtraMeasureParameters.C_EXTRA_MEASURE_NAME, ExtraMeasureParameters.C_EXTRA_MEASURE_DESCRIPTION,
-                    ExtraMeasureParameters.C_EXTRA_MEASURE_NVPROF_L3_METRICS, ExtraMeasureParameters.C_EXTRA_MEASURE_NVPROF_L3_EVENTS)
-                front_decode : FrontDecodeNvprof = FrontDecodeNvprof(FrontDecodeParameters.C_FRONT_DECODE_NAME, 
-                    FrontDecodeParameters.C_FRONT_DECODE_DESCRIPTION, FrontDecodeParameters.C_FRONT_DECODE_NVPROF_L3_METRICS, 
-                    FrontDecodeParameters.C_FRONT_DECODE_NVPROF_L3_EVENTS)
-                front_fetch : FrontFetchNvprof = FrontFetchNvprof(FrontFetchParameters.C_FRONT_FETCH_NAME, 
-                    FrontFetchParameters.C_FRONT_FETCH_DESCRIPTION, FrontFetchParameters.C_FRONT_FETCH_NVPROF_L3_METRICS, 
-                    FrontFetchParameters.C_FRONT_FETCH_NVPROF_L3_EVENTS)
-                back_memory_bound : BackMemoryBoundNvprof = BackMemoryBoundNvprof(BackMemoryBoundParameters.C_BACK_MEMORY_BOUND_NAME, 
-                    BackMemoryBoundParameters.C_BACK_MEMORY_BOUND_DESCRIPTION, BackMemoryBoundParameters.C_BACK_MEMORY_BOUND_NVPROF_L3_METRICS, 
-                    BackMemoryBoundParameters.C_BACK_MEMORY_BOUND_NVPROF_L3_EVENTS)
-                back_core_bound : BackCoreBoundNvprof = BackCoreBoundNvprof(BackCoreBoundParameters.C_BACK_CORE_BOUND_NAME, 
-                    BackCoreBoundParameters.C_BACK_CORE_BOUND_DESCRIPTION, BackCoreBoundParameters.C_BACK_CORE_BOUND_NVPROF_L3_METRICS, 
-                    BackCoreBoundParameters.C_BACK_CORE_BOUND_NVPROF_L3_EVENTS)
-                level : LevelThreeNvprof = LevelThreeNvprof(program, self.input_file(), self.output_file(), self.output_scan_file(), show_metrics, show_events, 
-                front_end, back_end, divergence, retire, extra_measure, front_fetch, front_decode, back_core_bound, back_memory_bound)        
-        else:
-            front_end : FrontEndNsight
-            back_end : BackEndNsight
-            divergence : DivergenceNsight
-            retire : RetireNsight
-            extra_measure : ExtraMeasureNsight
-            if self.level() == 1:
-                front_end = FrontEndNsight(FrontEndParameters.C_FRONT_END_NAME, FrontEndParameters.C_FRONT_END_DESCRIPTION,
-                    FrontEndParameters.C_FRONT_END_NSIGHT_L1_METRICS)
-                back_end = BackEndNsight(BackEndParameters.C_BACK_END_NAME, BackEndParameters.C_BACK_END_DESCRIPTION,
-                    BackEndParameters.C_BACK_END_NSIGHT_L1_METRICS)
-                divergence = DivergenceNsight(DivergenceParameters.C_DIVERGENCE_NAME, DivergenceParameters.C_DIVERGENCE_DESCRIPTION,
-                    DivergenceParameters.C_DIVERGENCE_NSIGHT_L1_METRICS)
-                retire = RetireNsight(RetireParameters.C_RETIRE_NAME, RetireParameters.C_RETIRE_DESCRIPTION,
-                    RetireParameters.C_RETIRE_NSIGHT_L1_METRICS)
-                extra_measure = ExtraMeasureNsight(ExtraMeasureParameters.C_EXTRA_MEASURE_NAME, ExtraMeasureParameters.C_EXTRA_MEASURE_DESCRIPTION,
-                    ExtraMeasureParameters.C_EXTRA_MEASURE_NSIGHT_L1_METRICS)
-                level : LevelOneNsight = LevelOneNsight(program, self.input_file(), self.output_file(), self.output_scan_file(), show_metrics, front_end, 
-                back_end, divergence, retire, extra_measure)
-            elif self.level() == 2:
-                front_end = FrontEndNsight(FrontEndParameters.C_FRONT_END_NAME, FrontEndParameters.C_FRONT_END_DESCRIPTION,
-                    FrontEndParameters.C_FRONT_END_NSIGHT_L2_METRICS)
-                back_end = BackEndNsight(BackEndParameters.C_BACK_END_NAME, BackEndParameters.C_BACK_END_DESCRIPTION,
-                    BackEndParameters.C_BACK_END_NSIGHT_L2_METRICS)
-                divergence = DivergenceNsight(DivergenceParameters.C_DIVERGENCE_NAME, DivergenceParameters.C_DIVERGENCE_DESCRIPTION,
-                    DivergenceParameters.C_DIVERGENCE_NSIGHT_L2_METRICS)
-                retire = RetireNsight(RetireParameters.C_RETIRE_NAME, RetireParameters.C_RETIRE_DESCRIPTION,
-                    RetireParameters.C_RETIRE_NSIGHT_L2_METRICS)
-                extra_measure = ExtraMeasureNsight(ExtraMeasureParameters.C_EXTRA_MEASURE_NAME, ExtraMeasureParameters.C_EXTRA_MEASURE_DESCRIPTION,
-                    ExtraMeasureParameters.C_EXTRA_MEASURE_NSIGHT_L2_METRICS)
-                front_decode : FrontDecodeNsight =  FrontDecodeNsight(FrontDecodeParameters.C_FRONT_DECODE_NAME, 
-                    FrontDecodeParameters.C_FRONT_DECODE_DESCRIPTION, FrontDecodeParameters.C_FRONT_DECODE_NSIGHT_L2_METRICS)
-                front_fetch : FrontFetchNsight =  FrontFetchNsight(FrontFetchParameters.C_FRONT_FETCH_NAME, 
-                    FrontFetchParameters.C_FRONT_FETCH_DESCRIPTION, FrontFetchParameters.C_FRONT_FETCH_NSIGHT_L2_METRICS)
-                back_memory_bound : BackMemoryBoundNsight =  BackMemoryBoundNsight(BackMemoryBoundParameters.C_BACK_MEMORY_BOUND_NAME, 
-                    BackMemoryBoundParameters.C_BACK_MEMORY_BOUND_DESCRIPTION, BackMemoryBoundParameters.C_BACK_MEMORY_BOUND_NSIGHT_L2_METRICS)
-                back_core_bound : BackCoreBoundNsight = BackCoreBoundNsight (BackCoreBoundParameters.C_BACK_CORE_BOUND_NAME, 
-                    BackCoreBoundParameters.C_BACK_CORE_BOUND_DESCRIPTION, BackCoreBoundParameters.C_BACK_CORE_BOUND_NSIGHT_L2_METRICS) 
-                level : LevelTwoNsight = LevelTwoNsight(program, self.input_file(), self.output_file(), self.output_scan_file(), show_metrics, front_end, 
-                back_end, divergence, retire, extra_measure, front_decode, front_fetch, back_core_bound, back_memory_bound) 
-            elif self.level() == 3:
-                front_end = FrontEndNsight(FrontEndParameters.C_FRONT_END_NAME, FrontEndParameters.C_FRONT_END_DESCRIPTION,
-                    FrontEndParameters.C_FRONT_END_NSIGHT_L3_METRICS)
-                back_end = BackEndNsight(BackEndParameters.C_BACK_END_NAME, BackEndParameters.C_BACK_END_DESCRIPTION,
-                    BackEndParameters.C_BACK_END_NSIGHT_L3_METRICS)
-                divergence = DivergenceNsight(DivergenceParameters.C_DIVERGENCE_NAME, DivergenceParameters.C_DIVERGENCE_DESCRIPTION,
-                    DivergenceParameters.C_DIVERGENCE_NSIGHT_L3_METRICS)
-                retire = RetireNsight(RetireParameters.C_RETIRE_NAME, RetireParameters.C_RETIRE_DESCRIPTION,
-                    RetireParameters.C_RETIRE_NSIGHT_L3_METRICS)
-                extra_measure = ExtraMeasureNsight(ExtraMeasureParameters.C_EXTRA_MEASURE_NAME, ExtraMeasureParameters.C_EXTRA_MEASURE_DESCRIPTION,
-                    ExtraMeasureParameters.C_EXTRA_MEASURE_NSIGHT_L3_METRICS)
-                front_decode : FrontDecodeNsight = FrontDecodeNsight(FrontDecodeParameters.C_FRONT_DECODE_NAME, 
-                    FrontDecodeParameters.C_FRONT_DECODE_DESCRIPTION, FrontDecodeParameters.C_FRONT_DECODE_NSIGHT_L3_METRICS)
-                front_fetch : FrontFetchNsight =  FrontFetchNsight(FrontFetchParameters.C_FRONT_FETCH_NAME, 
-                    FrontFetchParameters.C_FRONT_FETCH_DESCRIPTION, FrontFetchParameters.C_FRONT_FETCH_NSIGHT_L3_METRICS)
-                back_memory_bound : BackMemoryBoundNsight = BackMemoryBoundNsight(BackMemoryBoundParameters.C_BACK_MEMORY_BOUND_NAME, 
-                    BackMemoryBoundParameters.C_BACK_MEMORY_BOUND_DESCRIPTION, BackMemoryBoundParameters.C_BACK_MEMORY_BOUND_NSIGHT_L3_METRICS)
-                back_core_bound : BackCoreBoundNsight = BackCoreBoundNsight(BackCoreBoundParameters.C_BACK_CORE_BOUND_NAME, 
-                    BackCoreBoundParameters.C_BACK_CORE_BOUND_DESCRIPTION, BackCoreBoundParameters.C_BACK_CORE_BOUND_NSIGHT_L3_METRICS) 
-                level : LevelThreeNsight = LevelThreeNsight(program, self.input_file(), self.output_file(), self.output_scan_file(), show_metrics, front_end, 
-                back_end, divergence, retire, extra_measure, front_decode, front_fetch, back_core_bound, back_memory_bound) 
+        if self.__is_nvprof_mode() and self.level() > TopDownParameters.C_MAX_LEVEL_EXECUTION_NVPROF:
+            raise LevelNvprofError(self.level())
+        level : LevelExecution = LevelFactory.create(self.level(), self.__is_nvprof_mode(), program, self.input_file(), 
+            self.output_file(), self.output_scan_file(), show_metrics, show_events, self.roofline(), 
+            self.occupancy())
+        if not self.hot_kernels_share() is None and self.input_file() is None:
+            self.__hot_kernels = self.__find_hot_kernels(program)
+        self.__configure_level(level)
+        if not self.adaptive_threshold() is None and self.level() > 1 and self.input_file() is None:
+            level.skip_branches(self.__adaptive_branches(program))
+        repetitions : Repetitions = None
+        if not self.repeat_runs() is None and self.input_file() is None:
+            repetitions = Repetitions(level, self.repeat_runs(), self.repeat_tolerance(), self.repeat_devices())
         lst_output : list[str] = list() # for extra information
         level.run(lst_output)
-        self.__show_results(level)
+        if not self.profiler_region_launches() is None:
+            level.set_launch_tags(LevelExecutionParameters.C_REGION_TAG, [LevelExecutionParameters.C_REGION_TAG_FORMAT % 
+                (i // self.profiler_region_launches()) for i in range(0, level.num_launches())])
+        if not self.processes() is None:
+            process_launches : list = level.process_launches(self.processes())
+            if not process_launches:
+                raise ProcessesNotFoundError(self.processes())
+            level.select_launches(process_launches)
+            lst_output = list() # tables of measures of the selected processes
+            with Timings.span(TimingsParameters.C_SPAN_MEASURES_TABLE):
+                level.measures_table(lst_output)
+        if not repetitions is None:
+            repetitions.run(level)
+        self.__show_pruned_measures(level)
+        with Timings.span(TimingsParameters.C_SPAN_RESULTS):
+            self.__show_results(level)
+            self.__show_groups_results(LaunchGroups(level, LevelExecutionParameters.C_PROCESS_TAG), "RESULTS PER PROCESS", 2)
+            self.__show_groups_results(LaunchGroups(level, LevelExecutionParameters.C_DEVICE_TAG), "RESULTS PER DEVICE", 2)
+            self.__show_rank_results(LaunchGroups(level, MpiRanksParameters.C_RANK_TAG))
+            if not repetitions is None:
+                self.__show_repetitions_results(repetitions)
+            if self.distributions():
+                self.__show_distributions_results(level)
+            self.__show_groups_results(LaunchGroups(level, LevelExecutionParameters.C_NVTX_TAG), "RESULTS PER NVTX RANGE")
+            self.__show_groups_results(LaunchGroups(level, LevelExecutionParameters.C_REGION_TAG), "RESULTS PER PROFILED REGION")
+            if self.roofline():
+                self.__show_roofline_results(level)
+            if self.occupancy():
+                self.__show_occupancy_results(level)
         if self.show_all_measures() or self.show_metrics() or self.show_events():
             # Write results in output-file if has been specified
-            printer : MessageFormat = MessageFormat()
+            printer : MessageFormat = self.__printer
             printer.print_max_line_length_message("\n\n", TopDownParameters.C_NUM_MAX_CHARACTERS_PER_LINE, self.output_file(), False)
             message : str = "List of measurements computed by NVIDIA scan tool"
             printer.print_desplazed_underlined_str(message = message, output_file = self.output_file(), delete_content_file = False)
@@ -1038,14 +2328,28 @@ class TopDown:
             element : str
             for element in lst_output:
                 print(element)
+        if not self.export_file() is None:
+            with Timings.span(TimingsParameters.C_SPAN_EXPORT):
+                MetricExporter(level, distributions = self.distributions()).export(self.export_file())
         if self.show_graph():
             level.showGraph()
         if not self.output_graph_file() is None:
             level.saveGraph(self.output_graph_file())
+        if not self.output_kernel_graphs_file() is None:
+            level.saveKernelGraphs(self.output_kernel_graphs_file())
+        if not self.output_hierarchy_graph_file() is None:
+            level.saveHierarchyGraph(self.output_hierarchy_graph_file(), self.hierarchy_kernels(), self.hierarchy_type())
+        if not self.output_roofline_graph_file() is None:
+            level.saveRooflineGraph(self.output_roofline_graph_file())
+        if not self.timeline_file() is None or not self.output_timeline_graph_file() is None:
+            with Timings.span(TimingsParameters.C_SPAN_TIMELINE):
+                timeline : Timeline = Timeline(level, self.timeline_windows(), self.timeline_width())
+                if not self.timeline_file() is None:
+                    timeline.save(self.timeline_file())
+                if not self.output_timeline_graph_file() is None:
+                    timeline.saveGraph(self.output_timeline_graph_file())
      
 
 if __name__ == '__main__':
     td = TopDown()
     td.launch()
-    MessageFormat().print_max_line_length_message(message = "\nAnalysis performed correctly!\n", 
-    max_length = TopDownParameters.C_NUM_MAX_CHARACTERS_PER_LINE, output_file = td.output_file(), delete_content_file = False)